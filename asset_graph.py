@@ -0,0 +1,519 @@
+"""에셋 의존성 그래프 + 예열(preload) 목록 생성기
+
+colored_dice.gd는 주사위를 만들 때 load(model_path)로 모델을 동기 로드하고, dice_3d_icon.gd는
+아이콘마다 모델 전체를 불러옵니다. 그래서 첫 굴림/첫 상점 방문에서 glTF 파싱으로 멈칫합니다.
+이 스크립트는 프로젝트의 .tscn/.tres/.gd/.gltf를 훑어 에셋 의존성 그래프를 만들고, 씬마다
+실제로 필요한 에셋을 단계별 예열 목록으로 씁니다. 게임은 시작 화면 동안 이 목록을
+백그라운드 스레드로 미리 불러옵니다 (scripts/utils/asset_preloader.gd, 오토로드 AssetPreloader).
+Godot 없이 일반 파이썬으로 실행합니다.
+
+의존성 종류
+  정적 (씬을 불러올 때 같이 로드)  .tscn/.tres ext_resource, preload(), extends (경로/class_name),
+                                   class_name 인스턴스 생성(X.new()), .gltf → .bin/이미지
+  런타임 (코드가 필요할 때 load)   그 밖의 "res://..." 문자열 리터럴
+                                   경로 조립 패턴 "res://assets/models/0_dice_" + color_name + ".gltf"
+                                     → 0_dice_*.gltf 로 실제 파일과 매칭 ("...%s.ogg" % x 도 같음)
+                                   사이드카 path.get_basename() + "_collision.tres"
+                                     → 같은 스크립트의 런타임 에셋 옆에 있는 파일
+
+예열 단계 (앞 단계부터 차례로 불러옴)
+  boot        메인 씬/오토로드의 정적 의존성 - 시작할 때 이미 로드되므로 목록에만 표시
+  start       시작 화면 씬이 런타임에 쓰는 에셋
+  first_roll  굴림 화면(rolling_world, game_hud)과 그 하위 씬이 런타임에 쓰는 에셋
+  shop        상점 씬이 런타임에 쓰는 에셋
+  deferred    나머지 (도감, 팝업, 오토로드 등)
+  단계 안에서는 참조가 소스에 나오는 순서 (match 0: 기본 주사위가 먼저)
+
+    python asset_graph.py                              # 요약 + assets/preload_manifest.json
+    python asset_graph.py --graph asset_graph.json     # 씬별 의존성 그래프도 저장
+    python asset_graph.py --scene res://scenes/shop_dice.tscn -v
+    python asset_graph.py --dry-run                    # 예열 목록을 쓰지 않고 요약만
+"""
+import argparse
+import configparser
+import fnmatch
+import json
+import os
+import re
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(PROJECT_DIR, "assets", "preload_manifest.json")
+
+# 씬 → 예열 단계. 목록에 없는 씬은 자신을 포함하는 씬의 단계를 따르고, 없으면 deferred
+PRELOAD_TIERS = (
+    ("start", ("res://scenes/components/start_screen.tscn",)),
+    ("first_roll", ("res://scenes/rolling_world.tscn", "res://scenes/components/game_hud.tscn")),
+    ("shop", ("res://scenes/components/shop_hud.tscn", "res://scenes/shop_dice.tscn")),
+)
+BOOT_TIER = "boot"
+DEFERRED_TIER = "deferred"
+
+# ResourceLoader로 불러올 수 있는 (예열 대상) 확장자
+LOADABLE_EXTENSIONS = {".tscn", ".scn", ".tres", ".res", ".gltf", ".glb", ".png", ".jpg", ".jpeg", ".webp",
+                       ".svg", ".ogg", ".wav", ".mp3", ".gdshader", ".material", ".mesh"}
+SCAN_EXTENSIONS = (".tscn", ".tres", ".gd", ".gltf")
+SKIP_DIRS = {".godot", ".git", "__pycache__", ".import"}
+
+STATIC_KINDS = {"ext_resource", "preload", "extends", "class", "buffer", "image"}
+RUNTIME_KINDS = {"load", "pattern", "sidecar"}
+
+_EXT_RESOURCE = re.compile(r'^\[ext_resource\b[^\]]*?\bpath="(res://[^"]+)"', re.M)
+_CLASS_NAME = re.compile(r"^\s*class_name\s+(\w+)", re.M)
+_EXTENDS_PATH = re.compile(r'^\s*extends\s+"(res://[^"]+)"', re.M)
+_SIDECAR = re.compile(r'get_basename\(\)\s*\+\s*"([^"]+)"')
+_FORMAT_SPEC = re.compile(r"%[-+ 0#]*\d*(?:\.\d+)?[sdif]")
+
+
+# ============================================================================
+# 경로
+# ============================================================================
+def to_res(path):
+    return "res://" + os.path.relpath(path, PROJECT_DIR).replace(os.sep, "/")
+
+
+def to_file(res_path):
+    return os.path.join(PROJECT_DIR, *res_path[len("res://"):].split("/"))
+
+
+def project_files():
+    """프로젝트의 모든 파일 (res:// 경로, .godot 등 제외)"""
+    files = []
+    for folder, dirs, names in os.walk(PROJECT_DIR):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+        for name in names:
+            if not name.endswith((".import", ".uid", ".tmp")):
+                files.append(to_res(os.path.join(folder, name)))
+    return sorted(files)
+
+
+def file_bytes(res_path):
+    try:
+        return os.path.getsize(to_file(res_path))
+    except OSError:
+        return 0
+
+
+def imported_bytes(res_path):
+    """<파일>.import의 dest_files 크기 합 (.godot/imported가 없으면 0)"""
+    parser = configparser.RawConfigParser()
+    try:
+        parser.read(to_file(res_path) + ".import", encoding="utf-8")
+        dest_files = json.loads(parser.get("deps", "dest_files", fallback="[]"))
+    except (OSError, ValueError, configparser.Error):
+        return 0
+    return sum(file_bytes(p) for p in dest_files if p.startswith("res://"))
+
+
+# ============================================================================
+# 파서
+# ============================================================================
+def strip_gd_comments(source):
+    """GDScript 주석 제거 (문자열 안의 #은 유지, 줄 번호는 그대로)"""
+    out, quote, i = [], None, 0
+    while i < len(source):
+        ch = source[i]
+        if quote:
+            out.append(ch)
+            if ch == "\\" and i + 1 < len(source):
+                out.append(source[i + 1])
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+            out.append(ch)
+        elif ch == "#":
+            while i < len(source) and source[i] != "\n":
+                i += 1
+            continue
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _string_at(text, i):
+    """text[i]가 따옴표면 (문자열 내용, 끝 다음 위치), 아니면 None"""
+    quote = text[i]
+    j = i + 1
+    while j < len(text) and text[j] != quote:
+        j += 2 if text[j] == "\\" else 1
+    return text[i + 1:j], j + 1
+
+
+def _skip_expression(text, i):
+    """'+' 다음의 비문자열 식을 같은 괄호 깊이의 다음 '+' / 식 끝까지 건너뜀"""
+    depth = 0
+    while i < len(text):
+        ch = text[i]
+        if ch in "\"'":
+            i = _string_at(text, i)[1]
+            continue
+        if ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            if depth == 0:
+                return i
+            depth -= 1
+        elif depth == 0 and (ch in "+,\n" or text.startswith(" if ", i)):
+            return i
+        i += 1
+    return i
+
+
+def gd_path_literals(source):
+    """"res://" 리터럴 → [(경로 또는 glob 패턴, 줄 번호, preload 여부)]"""
+    results = []
+    for match in re.finditer(r"[\"']res://", source):
+        start = match.start()
+        if start and source[start - 1] in "\"'":
+            continue
+        text, end = _string_at(source, start)
+        line = source.count("\n", 0, start) + 1
+        preload = bool(re.search(r"preload\s*\(\s*$", source[max(0, start - 32):start]))
+        pattern = text
+        # "..." + 식 + "..." 경로 조립 → 식 자리는 와일드카드
+        i = end
+        while True:
+            j = i
+            while j < len(source) and source[j] in " \t":
+                j += 1
+            if j >= len(source) or source[j] != "+":
+                break
+            j += 1
+            while j < len(source) and source[j] in " \t":
+                j += 1
+            if j < len(source) and source[j] in "\"'":
+                piece, i = _string_at(source, j)
+                pattern += piece
+            else:
+                i = _skip_expression(source, j)
+                pattern += "*"
+        # "...%s.ogg" % 값 → 포맷 자리는 와일드카드
+        if re.match(r"\s*%", source[i:]):
+            pattern = _FORMAT_SPEC.sub("*", pattern)
+        results.append((pattern, line, preload))
+    return results
+
+
+def parse_gd(res_path, source, class_scripts):
+    source = strip_gd_comments(source)
+    edges = []
+    for match in _EXTENDS_PATH.finditer(source):
+        edges.append(("extends", match.group(1), source.count("\n", 0, match.start()) + 1))
+    for text, line, preload in gd_path_literals(source):
+        kind = "preload" if preload else ("pattern" if "*" in text else "load")
+        edges.append((kind, text, line))
+    for match in re.finditer(r"^\s*extends\s+(\w+)", source, re.M):
+        if match.group(1) in class_scripts:
+            edges.append(("extends", class_scripts[match.group(1)], source.count("\n", 0, match.start()) + 1))
+    own = set(_CLASS_NAME.findall(source))
+    for name, script in class_scripts.items():
+        if name not in own and script != res_path:
+            # 타입 힌트/정적 호출은 스크립트만 불러오므로 인스턴스를 만드는 곳만 의존성으로 봄
+            found = re.search(r"\b" + re.escape(name) + r"\.new\s*\(", source)
+            if found:
+                edges.append(("class", script, source.count("\n", 0, found.start()) + 1))
+    sidecars = _SIDECAR.findall(source)
+    return edges, sidecars
+
+
+def parse_resource_text(source):
+    return [("ext_resource", m.group(1), source.count("\n", 0, m.start()) + 1) for m in _EXT_RESOURCE.finditer(source)]
+
+
+def parse_gltf(res_path, source):
+    try:
+        gltf = json.loads(source)
+    except ValueError:
+        return []
+    base = res_path.rsplit("/", 1)[0]
+    edges = []
+    for buffer in gltf.get("buffers", []):
+        if buffer.get("uri") and not buffer["uri"].startswith("data:"):
+            edges.append(("buffer", _join(base, buffer["uri"]), 0))
+    for image in gltf.get("images", []):
+        if image.get("uri") and not image["uri"].startswith("data:"):
+            edges.append(("image", _join(base, image["uri"]), 0))
+    return edges
+
+
+def _join(base, uri):
+    parts = []
+    for part in (base[len("res://"):] + "/" + uri).split("/"):
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part and part != ".":
+            parts.append(part)
+    return "res://" + "/".join(parts)
+
+
+def read_project():
+    """project.godot → (메인 씬, 오토로드 스크립트 목록)"""
+    main_scene, autoloads = None, []
+    section = None
+    try:
+        with open(os.path.join(PROJECT_DIR, "project.godot"), encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    section = line.strip("[]")
+                elif section == "application" and line.startswith("run/main_scene="):
+                    main_scene = line.split("=", 1)[1].strip('"')
+                elif section == "autoload" and "=" in line:
+                    autoloads.append(line.split("=", 1)[1].strip('"').lstrip("*"))
+    except OSError:
+        pass
+    return main_scene, autoloads
+
+
+# ============================================================================
+# 그래프
+# ============================================================================
+def build_graph():
+    """{노드: [(종류, 대상, 줄)]}, 누락 참조, 패턴 매칭 결과"""
+    files = project_files()
+    existing = set(files)
+    sources = {}
+    for path in files:
+        if path.endswith(SCAN_EXTENSIONS):
+            try:
+                with open(to_file(path), encoding="utf-8") as f:
+                    sources[path] = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+
+    class_scripts = {}
+    for path, source in sources.items():
+        if path.endswith(".gd"):
+            for name in _CLASS_NAME.findall(strip_gd_comments(source)):
+                class_scripts[name] = path
+
+    graph, missing, patterns = {}, [], {}
+    for path, source in sources.items():
+        sidecars = []
+        if path.endswith(".gd"):
+            raw_edges, sidecars = parse_gd(path, source, class_scripts)
+        elif path.endswith(".gltf"):
+            raw_edges = parse_gltf(path, source)
+        else:
+            raw_edges = parse_resource_text(source)
+        edges = []
+        for kind, target, line in raw_edges:
+            if kind == "pattern":
+                matched = sorted(p for p in files if _glob_match(p, target))
+                patterns[(path, target)] = matched
+                edges.extend((kind, p, line) for p in matched)
+                if not matched:
+                    missing.append((path, line, target))
+            elif target in existing:
+                edges.append((kind, target, line))
+            else:
+                missing.append((path, line, target))
+        # 사이드카: 이 스크립트가 런타임에 부르는 파일 옆의 <이름><접미사>
+        for suffix in sidecars:
+            for kind, target, line in list(edges):
+                if kind in RUNTIME_KINDS and kind != "sidecar":
+                    candidate = target.rsplit(".", 1)[0] + suffix
+                    if candidate in existing:
+                        edges.append(("sidecar", candidate, line))
+        graph[path] = edges
+    return graph, missing, patterns
+
+
+def _glob_match(path, pattern):
+    # 와일드카드는 폴더 경계를 넘지 않음
+    return path.count("/") == pattern.count("/") and fnmatch.fnmatchcase(path, pattern)
+
+
+def static_closure(graph, roots, stop=()):
+    """roots에서 정적 의존성으로 닿는 노드 (stop의 씬은 그 안으로 들어가지 않음)"""
+    seen, stack = set(), list(roots)
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        if node in stop and node not in roots:
+            continue
+        stack.extend(target for kind, target, _ in graph.get(node, ()) if kind in STATIC_KINDS)
+    return seen
+
+
+def runtime_assets(graph, roots, stop=()):
+    """roots의 정적 의존성 안의 스크립트들이 런타임에 부르는 에셋 → {경로: (소스 순서 키)}"""
+    loaded = static_closure(graph, roots, stop)
+    found = {}
+    frontier = set(loaded)
+    while frontier:
+        new = set()
+        for node in sorted(frontier):
+            for kind, target, line in graph.get(node, ()):
+                if kind in RUNTIME_KINDS and target not in loaded and target not in found:
+                    found[target] = (node, line, len(found))
+                    new |= static_closure(graph, [target]) - loaded
+        loaded |= new
+        frontier = new
+    # 런타임 에셋이 끌고 오는 정적 의존성 (.gltf → .bin 등)도 포함
+    for target in list(found):
+        source, line, order = found[target]
+        for dep in sorted(static_closure(graph, [target]) - {target}):
+            if dep not in found and dep not in static_closure(graph, roots):
+                found[dep] = (source, line, order + 0.5)
+    return found
+
+
+def scene_tiers(graph):
+    """씬 → 예열 단계 번호 (목록에 없으면 그 씬을 정적으로 포함하는 목록 씬 중 가장 이른 단계)"""
+    listed = {scene: index for index, (_, members) in enumerate(PRELOAD_TIERS) for scene in members}
+    tiers = dict(listed)
+    for scene, index in listed.items():
+        for node in static_closure(graph, [scene], listed):
+            if node.endswith(".tscn") and node not in listed:
+                tiers[node] = min(tiers.get(node, index), index)
+    return tiers
+
+
+# ============================================================================
+# 예열 목록
+# ============================================================================
+def build_manifest(graph):
+    main_scene, autoloads = read_project()
+    scenes = sorted(node for node in graph if node.endswith(".tscn"))
+    boot = static_closure(graph, ([main_scene] if main_scene else []) + autoloads)
+    tier_names = [name for name, _ in PRELOAD_TIERS] + [DEFERRED_TIER]
+    tier_of = scene_tiers(graph)
+    deferred = len(PRELOAD_TIERS)
+
+    per_scene = {}
+    for scene in scenes:
+        static = static_closure(graph, [scene])
+        runtime = runtime_assets(graph, [scene])
+        per_scene[scene] = {
+            "tier": tier_names[tier_of.get(scene, deferred)],
+            "static": sorted(static - {scene}),
+            "runtime": sorted(runtime),
+            "static_bytes": sum(file_bytes(p) for p in static),
+            "runtime_bytes": sum(file_bytes(p) for p in runtime),
+        }
+
+    # 에셋 → 가장 이른 단계 (메인 씬 자신과 오토로드가 직접 부르는 것은 deferred)
+    placement = {}
+    # 목록에 있는 다른 씬이 정적으로 포함돼 있어도 그 씬의 에셋은 그 씬의 단계로
+    listed = {scene for _, members in PRELOAD_TIERS for scene in members}
+    owners = [(scene, tier_of.get(scene, deferred)) for scene in scenes if scene != main_scene]
+    owners += [(root, deferred) for root in ([main_scene] if main_scene else []) + autoloads]
+    for owner, tier in owners:
+        for path, order in runtime_assets(graph, [owner], listed).items():
+            if path in boot or os.path.splitext(path)[1] not in LOADABLE_EXTENSIONS:
+                continue
+            key = (tier, order[2], path)
+            if path not in placement or key < placement[path]:
+                placement[path] = key
+
+    tiers = [{"name": BOOT_TIER, "warm": False,
+              "assets": [_asset_entry(graph, p) for p in sorted(boot) if os.path.splitext(p)[1] in LOADABLE_EXTENSIONS]}]
+    for index, name in enumerate(tier_names):
+        members = sorted((key, path) for path, key in placement.items() if key[0] == index)
+        tiers.append({"name": name, "warm": True, "assets": [_asset_entry(graph, path) for _, path in members]})
+    for tier in tiers:
+        tier["bytes"] = sum(asset["bytes"] for asset in tier["assets"])
+    return {
+        "version": 1,
+        "main_scene": main_scene,
+        "autoloads": autoloads,
+        "tiers": tiers,
+    }, per_scene
+
+
+def _asset_entry(graph, path):
+    """에셋 하나 - bytes는 원본 + 함께 읽히는 버퍼/이미지 (.gltf → .bin)"""
+    companions = sorted(target for kind, target, _ in graph.get(path, ()) if kind in ("buffer", "image"))
+    entry = {"path": path, "bytes": file_bytes(path) + sum(file_bytes(p) for p in companions)}
+    imported = imported_bytes(path)
+    if imported:
+        entry["imported_bytes"] = imported
+    return entry
+
+
+def graph_report(graph, per_scene, missing, patterns):
+    return {
+        "nodes": {node: [{"kind": kind, "target": target, "line": line} for kind, target, line in edges]
+                  for node, edges in sorted(graph.items()) if edges},
+        "scenes": per_scene,
+        "patterns": [{"script": script, "pattern": pattern, "matches": matches}
+                     for (script, pattern), matches in sorted(patterns.items())],
+        "missing": [{"source": source, "line": line, "target": target} for source, line, target in missing],
+    }
+
+
+def save_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+def print_summary(manifest, per_scene, missing, patterns, scene=None, verbose=False):
+    print(f"{'씬':<52} {'단계':<11} {'정적':>5} {'정적 크기':>10} {'런타임':>6} {'런타임 크기':>11}")
+    for path, info in per_scene.items():
+        if scene and path != scene:
+            continue
+        print(f"{path[len('res://'):]:<52} {info['tier']:<11} {len(info['static']):>5} "
+              f"{info['static_bytes'] / 1048576:>9.1f}M {len(info['runtime']):>6} {info['runtime_bytes'] / 1048576:>10.1f}M")
+        if verbose:
+            for dep in info["runtime"]:
+                print(f"    ↳ {dep}")
+
+    print(f"\n경로 조립 패턴 {len(patterns)}개:")
+    for (script, pattern), matches in sorted(patterns.items()):
+        mark = "✅" if matches else "⚠️"
+        print(f"  {mark} {script[len('res://'):]}: {pattern} → {len(matches)}개")
+    if missing:
+        print(f"\n⚠️ 없는 파일을 가리키는 참조 {len(missing)}개 (생성 전 에셋이면 정상):")
+        for source, line, target in missing:
+            print(f"  {source[len('res://'):]}:{line} → {target}")
+
+    print(f"\n{'예열 단계':<12} {'에셋':>5} {'크기':>9}")
+    for tier in manifest["tiers"]:
+        note = "" if tier["warm"] else "  (시작할 때 이미 로드)"
+        print(f"{tier['name']:<12} {len(tier['assets']):>5} {tier['bytes'] / 1048576:>8.1f}M{note}")
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="에셋 의존성 그래프 + 단계별 예열 목록 생성")
+    parser.add_argument("--output", default=MANIFEST_PATH, help="예열 목록 JSON 경로")
+    parser.add_argument("--graph", default=None, help="씬별 의존성 그래프 JSON 저장 경로")
+    parser.add_argument("--scene", default=None, help="이 씬만 요약 (res:// 경로)")
+    parser.add_argument("--dry-run", action="store_true", help="예열 목록을 쓰지 않고 요약만")
+    parser.add_argument("-v", "--verbose", action="store_true", help="씬별 런타임 에셋 목록 출력")
+    args = parser.parse_args(argv)
+
+    graph, missing, patterns = build_graph()
+    if not any(node.endswith(".tscn") for node in graph):
+        print(f"❌ .tscn 씬이 없습니다: {PROJECT_DIR}")
+        return 1
+    manifest, per_scene = build_manifest(graph)
+    print_summary(manifest, per_scene, missing, patterns, args.scene, args.verbose)
+
+    if args.graph:
+        save_json(args.graph, graph_report(graph, per_scene, missing, patterns))
+        print(f"\n그래프: {args.graph}")
+    if not args.dry_run:
+        save_json(args.output, manifest)
+        warm = sum(len(t["assets"]) for t in manifest["tiers"] if t["warm"])
+        print(f"✅ 예열 목록 {warm}개: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
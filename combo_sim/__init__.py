@@ -0,0 +1,20 @@
+"""조합 점수 오프라인 시뮬레이션 패키지
+
+scripts/core/combo_rules.gd의 규칙을 combo_definitions.csv 기준으로 다시 구현해서
+게임 밖에서 손 평가와 라운드 점수 분포를 계산합니다. 일반 파이썬 + NumPy로 실행합니다.
+
+    python -m combo_sim.simulate --games 20000
+
+  rules      CSV 읽기, 한 손씩 평가하는 참조 구현
+  evaluator  (N, k) 배열을 한 번에 평가하는 벡터화 평가기
+  bag        DiceBag과 같은 구성의 가방 모델
+  simulate   라운드 몬테카를로 시뮬레이션 + 스테이지별 리포트
+  lookup     게임용 조합 룩업 테이블(완전 해시) 생성 + 전수 검증
+  jokers     jokers.csv 효과 문장 파서 + 제출 기록 기반 효과 계산
+  loadout    조커 슬롯 조합 탐색 (분기 한정) + 시너지/이상치 리포트
+  solver     투자/제출 최적 전략 expectimax 솔버 (기대 점수, 목표 달성 확률)
+  draws      가방 상태별 뽑기 확률 정확 계산 (다변량 초기하 × 균등 눈)
+  balance    스테이지 목표 달성 확률에 맞춘 조합 점수 상수 최적화 (공통 난수 + 프로세스 풀)
+"""
+from .evaluator import compile_definitions, evaluate
+from .rules import eval_combo, load_definitions, load_stages
@@ -0,0 +1,46 @@
+"""주사위 가방 모델 (scripts/core/dice_bag.gd와 같은 구성, 게임 N개를 한 번에)
+
+DiceBag.draw_one_data()는 남은 주사위 중 하나를 균등하게 뽑아 빼므로, 게임마다
+가방을 한 번 섞어 두고 앞에서부터 꺼내는 것과 분포가 같습니다.
+"""
+import numpy as np
+
+from . import rules
+
+PER_COLOR = 8
+
+
+def standard_bag(per_color=PER_COLOR, extra=()):
+    """(colors, types) - 색상별 일반 주사위 per_color개 + extra [(색상 키, 타입), ...]"""
+    colors = [c for c in range(len(rules.COLOR_KEYS)) for _ in range(per_color)]
+    types = [rules.TYPE_NORMAL] * len(colors)
+    for color_key, type_index in extra:
+        colors.append(rules.COLOR_KEYS.index(color_key))
+        types.append(type_index)
+    return np.array(colors, dtype=np.int8), np.array(types, dtype=np.int8)
+
+
+class BagBatch:
+    """게임 N개의 가방 (모든 게임이 같은 순서로 같은 개수를 뽑음)"""
+
+    def __init__(self, rng, games, colors, types):
+        self.rng = rng
+        order = np.argsort(rng.random((games, len(colors))), axis=1)
+        self.colors = colors[order]
+        self.types = types[order]
+        self.drawn = 0
+
+    def total_left(self):
+        return self.colors.shape[1] - self.drawn
+
+    def can_draw(self, n):
+        return self.total_left() >= n
+
+    def draw(self, n):
+        """(colors, types) (N, n) - 남은 것보다 많이 뽑으면 남은 만큼만"""
+        n = min(n, self.total_left())
+        start, self.drawn = self.drawn, self.drawn + n
+        return self.colors[:, start:self.drawn], self.types[:, start:self.drawn]
+
+    def roll(self, shape):
+        return self.rng.integers(1, 7, size=shape, dtype=np.int8)
@@ -0,0 +1,446 @@
+"""조합 점수 상수 밸런스 최적화
+
+combo_definitions.csv의 16개 (기본 점수, 배율)을 파라미터로 보고, stages.csv 라운드별
+목표 점수 달성 확률이 디자이너가 정한 값(--targets)에 가까워지는 정수 값을 찾습니다.
+
+  1. 공통 난수: 게임 묶음(chunk)마다 (seed, 묶음 번호)로 가방 순서와 눈을 한 번만 뽑아
+     워커에 캐시해 두고(simulate.draw_chunk), 모든 후보를 같은 주사위로 평가합니다.
+     후보 간 차이에 표본 잡음이 섞이지 않아 적은 게임 수로도 비교가 안정적입니다.
+  2. 점수 모델: 정책이 고른 제출을 고정하면 라운드 점수는
+         Σ 정의 i  기본_i × 배율_i × Σ 2^multiply  +  배율_i × Σ (50·plus + 눈 합) × 2^multiply
+     이므로 게임별 정의별 계수 두 개(N, 16)로 정확히 다시 계산됩니다. 탐색은 이 모델 위에서
+     정수 패턴 탐색(좌표별 ±보폭, 개선이 없으면 보폭 절반)으로 합니다.
+  3. 정책 보정: 점수가 바뀌면 greedy 정책의 선택도 바뀌므로, 모델로 찾은 후보를 실제로 다시
+     시뮬레이션해 계수를 새로 뽑고 반복합니다. 실제 목적 함수가 나빠지면 신뢰 구간(현재 값
+     대비 변경 폭)을 줄여 다시 찾습니다.
+  4. 민감도: 최종 값에서 파라미터마다 ±보폭을 준 후보를 실제 시뮬레이션해 스테이지별 달성
+     확률 변화를 리포트합니다.
+  후보 × 게임 묶음 단위의 시뮬레이션은 프로세스 풀로 나눠 실행합니다.
+
+순서 제약: 현재 CSV에서 성립하는 순서(같은 조합의 싱글컬러 ≥ 레인보우, 같은 타입 안에서
+평가 우선순위가 높은 조합 ≥ 낮은 조합)는 기본 점수와 배율 각각에 대해 그대로 유지합니다.
+
+    python -m combo_sim.balance --targets 0.95 0.8 0.5 0.15
+    python -m combo_sim.balance --targets 0.95 0.8 0.5 0.15 --games 40000 --json balance.json
+
+결과 CSV를 적용한 뒤에는 combo_rules.gd의 COMBO_DEFINITIONS를 맞추고
+python -m combo_sim.lookup 으로 combo_table.gd를 다시 생성해야 합니다.
+"""
+import argparse
+import copy
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import bag as dice_bag
+from . import evaluator
+from . import rules
+from . import simulate
+
+DEFAULT_GAMES = 20000
+DEFAULT_SENSITIVITY_GAMES = 4000
+DEFAULT_CHUNK = 1000
+DEFAULT_ROUNDS = 8
+# 한 번의 모델 탐색에서 현재 값 대비 바꿀 수 있는 비율
+DEFAULT_TRUST = 0.5
+# 현재 값에서 멀어지는 것에 대한 벌점 가중치 (log 비율 제곱 평균)
+DEFAULT_STAY = 0.002
+# 민감도 보폭 (현재 값 대비 비율, 최소 1)
+SENSITIVITY_STEP = 0.1
+
+_COLUMNS = ("base_score", "multiplier")
+_CSV_COLUMNS = ("Base Score", "Multiplier")
+
+
+# ============================================================================
+# 파라미터
+# ============================================================================
+def params_of(definitions):
+    """정의 목록 → (D, 2) 정수 배열 [기본 점수, 배율] (평가 순서)"""
+    return np.array([[d["base_score"], d["multiplier"]] for d in definitions], dtype=np.int64)
+
+
+def with_params(definitions, theta):
+    """정의 목록의 점수만 theta로 바꾼 복사본"""
+    result = []
+    for d, (base_score, multiplier) in zip(definitions, theta):
+        d = copy.deepcopy(d)
+        d["base_score"], d["multiplier"] = int(base_score), int(multiplier)
+        result.append(d)
+    return result
+
+
+def order_constraints(definitions, theta0):
+    """[(a, b, 열)] - theta[a, 열] ≥ theta[b, 열]을 유지할 쌍 (현재 값에서 성립하는 것만)"""
+    pairs = []
+    by_name = {}
+    for i, d in enumerate(definitions):
+        by_name.setdefault(d["name"], {})[d["is_color"]] = i
+    for same in by_name.values():
+        if True in same and False in same:
+            pairs.append((same[True], same[False]))
+    for is_color in (True, False):
+        chain = [i for i, d in enumerate(definitions) if d["is_color"] == is_color]
+        pairs += list(zip(chain, chain[1:]))
+    return [(a, b, k) for a, b in pairs for k in range(len(_COLUMNS)) if theta0[a, k] >= theta0[b, k]]
+
+
+def feasible(theta, constraints):
+    if (theta < 1).any():
+        return False
+    return all(theta[a, k] >= theta[b, k] for a, b, k in constraints)
+
+
+# ============================================================================
+# 시뮬레이션 (워커)
+# ============================================================================
+_worker_state = {}
+
+
+def _init_worker(definitions, seed, extra, turns, invests):
+    _worker_state.clear()
+    _worker_state.update(definitions=definitions, seed=seed, bag=dice_bag.standard_bag(extra=extra),
+                         turns=turns, invests=invests, draws={})
+
+
+def _chunk_draws(chunk):
+    """(묶음 번호, 게임 수) → 캐시된 뽑기 (워커가 달라도 같은 주사위)"""
+    draws = _worker_state["draws"]
+    if chunk not in draws:
+        rng = np.random.default_rng([_worker_state["seed"], chunk[0]])
+        draws[chunk] = simulate.draw_chunk(rng, chunk[1], *_worker_state["bag"], _worker_state["turns"])
+    return draws[chunk]
+
+
+def _run_task(task):
+    theta, chunk, with_features = task
+    definitions = with_params(_worker_state["definitions"], theta)
+    compiled = evaluator.compile_definitions(definitions)
+    log = [] if with_features else None
+    scores, counts = simulate.play_chunk(_chunk_draws(chunk), compiled, _worker_state["invests"], log)
+    features = submission_features(log, chunk[1], len(definitions)) if with_features else None
+    return scores, counts, features
+
+
+def submission_features(log, games, size):
+    """제출 기록 → 게임별 정의별 (Σ 2^multiply, Σ (50·plus + 눈 합) × 2^multiply) 각 (games, D)"""
+    scale = np.zeros(games * size)
+    bonus = np.zeros(games * size)
+    for row in log:
+        used = row["used"]
+        types = row["types"]
+        doubling = 2.0 ** (used & (types == rules.TYPE_MULTIPLY)).sum(axis=1)
+        extra = (rules.PLUS_BONUS * (used & (types == rules.TYPE_PLUS)).sum(axis=1)
+                 + np.where(used, row["values"], 0).sum(axis=1))
+        cell = row["game"] * size + row["index"]
+        scale += np.bincount(cell, weights=doubling, minlength=games * size)
+        bonus += np.bincount(cell, weights=extra * doubling, minlength=games * size)
+    return scale.reshape(games, size), bonus.reshape(games, size)
+
+
+class Simulator:
+    """후보 여러 개를 게임 묶음 단위 작업으로 풀에 나눠 평가 (pool이 None이면 현재 프로세스)"""
+
+    def __init__(self, pool, games, chunk):
+        self.pool = pool
+        self.chunks = [(i, min(chunk, games - start)) for i, start in enumerate(range(0, games, chunk))]
+        self.runs = 0
+
+    def run(self, thetas, games=None, with_features=False):
+        """[(점수 (games,), 조합별 제출 횟수, 계수 또는 None)] - 후보 순서대로"""
+        chunks = self.chunks
+        if games is not None:
+            chunks = chunks[:max(1, -(-games // chunks[0][1]))]
+        tasks = [(theta, chunk, with_features) for theta in thetas for chunk in chunks]
+        results = list(self.pool.map(_run_task, tasks) if self.pool else map(_run_task, tasks))
+        self.runs += len(thetas)
+
+        grouped = []
+        for t in range(len(thetas)):
+            part = results[t * len(chunks):(t + 1) * len(chunks)]
+            scores = np.concatenate([p[0] for p in part])
+            counts = np.sum([p[1] for p in part], axis=0)
+            features = None
+            if with_features:
+                features = tuple(np.vstack([p[2][j] for p in part]) for j in range(2))
+            grouped.append((scores, counts, features))
+        return grouped
+
+
+# ============================================================================
+# 목적 함수 / 모델 탐색
+# ============================================================================
+class Objective:
+    def __init__(self, stages, targets, theta0, stay):
+        self.thresholds = np.array([s["target_score"] for s in stages], dtype=np.float64)
+        self.targets = np.asarray(targets, dtype=np.float64)
+        self.log0 = np.log(theta0)
+        self.stay = stay
+
+    def rates(self, scores):
+        return (scores[:, None] >= self.thresholds[None, :]).mean(axis=0)
+
+    def __call__(self, rates, theta):
+        miss = ((rates - self.targets) ** 2).sum()
+        drift = ((np.log(theta) - self.log0) ** 2).mean()
+        return float(miss + self.stay * drift)
+
+
+def model_scores(features, theta):
+    """고정된 제출에 대한 점수 (점수 모델)"""
+    scale, bonus = features
+    base = theta[:, 0].astype(np.float64)
+    multiplier = theta[:, 1].astype(np.float64)
+    return scale @ (base * multiplier) + bonus @ multiplier
+
+
+def fit_model(features, center, objective, constraints, trust):
+    """점수 모델 위 정수 패턴 탐색 → (theta, 모델 목적 값)
+
+    보폭은 파라미터마다 현재 값의 1/4에서 시작해 개선이 없으면 절반으로 줄이고,
+    center 대비 ±trust 비율(최소 1) 안에서만 움직입니다.
+    """
+    theta = center.copy()
+    low = np.maximum(1, np.minimum(center - 1, np.floor(center * (1 - trust)))).astype(np.int64)
+    high = np.maximum(center + 1, np.ceil(center * (1 + trust))).astype(np.int64)
+    step = np.maximum(1, center // 4)
+    best = objective(objective.rates(model_scores(features, theta)), theta)
+    evaluations = 1
+    while True:
+        improved = False
+        for index in np.ndindex(theta.shape):
+            for sign in (1, -1):
+                value = theta[index] + sign * step[index]
+                if value < low[index] or value > high[index]:
+                    continue
+                trial = theta.copy()
+                trial[index] = value
+                if not feasible(trial, constraints):
+                    continue
+                evaluations += 1
+                score = objective(objective.rates(model_scores(features, trial)), trial)
+                if score < best - 1e-12:
+                    theta, best, improved = trial, score, True
+                    break
+        if not improved:
+            if (step == 1).all():
+                return theta, best, evaluations
+            step = np.maximum(1, step // 2)
+
+
+def optimize(simulator, theta0, objective, constraints, rounds, trust, verbose=False):
+    """모델 탐색 + 실제 시뮬레이션 반복 → (최종 theta, 실제 달성 확률, 반복 기록)"""
+    best_theta = theta0
+    (scores, _, features), = simulator.run([theta0], with_features=True)
+    best_rates = objective.rates(scores)
+    best_value = objective(best_rates, theta0)
+    best_features = features
+    history = [{"round": 0, "objective": best_value, "rates": best_rates.tolist(), "trust": trust}]
+    print(f"  시작: 목적 {best_value:.5f}, 달성 확률 {_format_rates(best_rates)}")
+
+    for round_index in range(1, rounds + 1):
+        theta, predicted, evaluations = fit_model(best_features, best_theta, objective, constraints, trust)
+        if (theta == best_theta).all():
+            print(f"  {round_index}: 모델에서 더 나은 값이 없음 - 종료")
+            break
+        (scores, _, features), = simulator.run([theta], with_features=True)
+        rates = objective.rates(scores)
+        value = objective(rates, theta)
+        accepted = value < best_value
+        history.append({"round": round_index, "objective": value, "predicted": predicted, "rates": rates.tolist(),
+                        "trust": trust, "model_evaluations": evaluations, "accepted": bool(accepted)})
+        mark = "✅" if accepted else "⚠️"
+        print(f"  {mark} {round_index}: 목적 {value:.5f} (모델 예측 {predicted:.5f}), "
+              f"달성 확률 {_format_rates(rates)}, 신뢰 구간 ±{trust:.0%}, 모델 평가 {evaluations}회")
+        if verbose:
+            for i, k in zip(*np.nonzero(theta != best_theta)):
+                print(f"      {i:>2} {_COLUMNS[k]}: {best_theta[i, k]} → {theta[i, k]}")
+        if accepted:
+            best_theta, best_rates, best_value, best_features = theta, rates, value, features
+        else:
+            # 정책이 바뀌어 모델이 빗나감 - 변경 폭을 줄여서 다시
+            trust /= 2
+            if trust < 0.02:
+                print(f"  {round_index}: 신뢰 구간이 너무 작아짐 - 종료")
+                break
+    return best_theta, best_rates, history
+
+
+def _format_rates(rates):
+    return " / ".join(f"{r:.1%}" for r in rates)
+
+
+# ============================================================================
+# 민감도
+# ============================================================================
+def sensitivity(simulator, theta, objective, games):
+    """파라미터마다 ±보폭 → [{"index", "column", "value", "down", "up", "rates_down", "rates_up"}]
+
+    같은 주사위(공통 난수)로 기준값과 함께 평가하므로 차이는 파라미터 변화만 반영합니다.
+    """
+    thetas = [theta]
+    cells = []
+    for index in np.ndindex(theta.shape):
+        value = int(theta[index])
+        step = max(1, int(round(value * SENSITIVITY_STEP)))
+        up, down = theta.copy(), theta.copy()
+        up[index] = value + step
+        down[index] = max(1, value - step)
+        cells.append((index, value, int(down[index]), int(up[index])))
+        thetas += [down, up]
+
+    results = simulator.run(thetas, games=games)
+    base_rates = objective.rates(results[0][0])
+    rows = []
+    for n, (index, value, down, up) in enumerate(cells):
+        rates_down = objective.rates(results[1 + 2 * n][0])
+        rates_up = objective.rates(results[2 + 2 * n][0])
+        rows.append({"index": int(index[0]), "column": _COLUMNS[index[1]], "value": value, "down": down, "up": up,
+                     "rates_down": (rates_down - base_rates).tolist(), "rates_up": (rates_up - base_rates).tolist()})
+    return base_rates, rows
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+def write_csv(source, output, definitions, theta):
+    """source CSV와 같은 행 순서/열로 점수만 바꿔 저장"""
+    values = {(d["name"], d["is_color"]): row for d, row in zip(definitions, theta)}
+    with open(source, encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames
+        rows = list(reader)
+    for row in rows:
+        key = (row["Combination"].strip(), rules.COLOR_TYPES[row["Type"].strip()])
+        for column, value in zip(_CSV_COLUMNS, values[key]):
+            row[column] = str(int(value))
+
+    tmp = output + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp, output)
+
+
+def gd_line(definition):
+    """combo_rules.gd COMBO_DEFINITIONS 한 줄 (키 순서가 같아서 JSON 표기와 같음)"""
+    return "\t" + json.dumps(definition, ensure_ascii=False) + ","
+
+
+def print_report(definitions, theta0, theta, stages, targets, rates0, rates, sensitivity_rows):
+    print(f"\n{'조합':<24} {'현재':>10} {'제안':>10}")
+    for d, before, after in zip(definitions, theta0, theta):
+        mark = "  *" if (before != after).any() else ""
+        print(f"  {rules.combo_label(d):<22} {before[0]:>5}×{before[1]:<4} {after[0]:>5}×{after[1]:<4}{mark}")
+
+    print(f"\n{'스테이지':>6} {'라운드':>4} {'목표 점수':>8} {'목표 확률':>8} {'현재':>7} {'제안':>7}")
+    for stage, target, before, after in zip(stages, targets, rates0, rates):
+        print(f"{stage['stage']:>6} {stage['round']:>6} {stage['target_score']:>10} "
+              f"{target:>10.1%} {before:>8.1%} {after:>8.1%}")
+
+    print(f"\n민감도 (제안 값 기준, 파라미터 -보폭 / +보폭 시 달성 확률 변화 %p, 영향이 큰 순)")
+    print(f"  {'조합':<22} {'항목':<10} {'값':>5} {'보폭':>4}  " + "  ".join(f"R{s['round']}(-/+)" for s in stages))
+    ranked = sorted(sensitivity_rows, key=lambda r: -max(np.abs(r["rates_up"]).max(), np.abs(r["rates_down"]).max()))
+    for row in ranked:
+        label = rules.combo_label(definitions[row["index"]])
+        cells = "  ".join(f"{down * 100:+5.1f}/{up * 100:+5.1f}" for down, up in zip(row["rates_down"], row["rates_up"]))
+        print(f"  {label:<22} {row['column']:<10} {row['value']:>5} {row['up'] - row['value']:>4}  {cells}")
+
+
+# ============================================================================
+# 메인
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.balance", description="조합 점수 상수 밸런스 최적화")
+    parser.add_argument("--targets", type=float, nargs="+", required=True,
+                        help="stages.csv 행 순서대로 목표 달성 확률 (예: 0.95 0.8 0.5 0.15)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="후보당 시뮬레이션할 라운드 수")
+    parser.add_argument("--sensitivity-games", type=int, default=DEFAULT_SENSITIVITY_GAMES,
+                        help="민감도 후보당 라운드 수 (같은 주사위의 앞부분)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="모델 탐색 + 재시뮬레이션 반복 횟수")
+    parser.add_argument("--trust", type=float, default=DEFAULT_TRUST, help="한 번에 바꿀 수 있는 비율 (0.5 = ±50%%)")
+    parser.add_argument("--stay", type=float, default=DEFAULT_STAY, help="현재 값에서 멀어지는 것에 대한 벌점 가중치")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="작업 하나의 게임 수")
+    parser.add_argument("--turns", type=int, default=simulate.TURNS, help="턴 종료 횟수 (굴림 = turns + 1)")
+    parser.add_argument("--invests", type=int, default=simulate.INVESTS, help="라운드당 투자 횟수")
+    parser.add_argument("--extra", nargs="*", metavar="COLOR:TYPE", help="가방에 추가할 특수 주사위 (예: W:4 R:8)")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    parser.add_argument("--stages", default=rules.STAGES_CSV, help="stages.csv 경로")
+    parser.add_argument("--output", default=None, help="제안 CSV 경로 (기본: <combos>.proposed.csv)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 1이면 풀 없이)")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("-v", "--verbose", action="store_true", help="반복마다 바뀐 값 출력")
+    args = parser.parse_args(argv)
+
+    definitions = rules.load_definitions(args.combos)
+    stages = rules.load_stages(args.stages)
+    if len(args.targets) != len(stages):
+        print(f"❌ 목표 확률 {len(args.targets)}개 / 스테이지 라운드 {len(stages)}개 - 개수가 같아야 합니다")
+        return 1
+    if not all(0.0 <= t <= 1.0 for t in args.targets):
+        print("❌ 목표 확률은 0~1 사이여야 합니다")
+        return 1
+    output = args.output or os.path.splitext(args.combos)[0] + ".proposed.csv"
+
+    theta0 = params_of(definitions)
+    constraints = order_constraints(definitions, theta0)
+    objective = Objective(stages, args.targets, theta0, args.stay)
+    initargs = (definitions, args.seed, simulate.parse_extra(args.extra), args.turns, args.invests)
+    workers = args.workers or os.cpu_count() or 1
+    print(f"파라미터 {theta0.size}개, 순서 제약 {len(constraints)}개, 후보당 {args.games}게임, 워커 {workers}개")
+
+    started = time.perf_counter()
+    if workers == 1:
+        _init_worker(*initargs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+    try:
+        simulator = Simulator(pool, args.games, args.chunk)
+        theta, rates, history = optimize(simulator, theta0, objective, constraints, args.rounds, args.trust,
+                                         args.verbose)
+        print(f"\n민감도 계산: 후보 {2 * theta.size + 1}개 × {min(args.sensitivity_games, args.games)}게임")
+        _, sensitivity_rows = sensitivity(simulator, theta, objective, min(args.sensitivity_games, args.games))
+    finally:
+        if pool:
+            pool.shutdown()
+    elapsed = time.perf_counter() - started
+
+    rates0 = np.array(history[0]["rates"])
+    print_report(definitions, theta0, theta, stages, args.targets, rates0, rates, sensitivity_rows)
+
+    proposed = with_params(definitions, theta)
+    write_csv(args.combos, output, definitions, theta)
+    changed = [d for d, before in zip(proposed, theta0) if (before != [d["base_score"], d["multiplier"]]).any()]
+    print(f"\n✅ 제안 CSV: {output} (바뀐 정의 {len(changed)}개, 시뮬레이션 {simulator.runs}회, {elapsed:.1f}초)")
+    if changed:
+        print("적용하려면 CSV를 바꾸고 combo_rules.gd COMBO_DEFINITIONS의 해당 줄을 맞춘 뒤 python -m combo_sim.lookup 을 실행하세요:")
+        for d in changed:
+            print(gd_line(d))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": {k: getattr(args, k) for k in ("targets", "games", "sensitivity_games", "rounds", "trust",
+                                                          "stay", "seed", "turns", "invests", "extra")},
+                "definitions": [{"label": rules.combo_label(d), "current": before.tolist(), "proposed": after.tolist()}
+                                for d, before, after in zip(definitions, theta0, theta)],
+                "stages": [dict(stage, target=target, current=float(before), proposed=float(after))
+                           for stage, target, before, after in zip(stages, args.targets, rates0, rates)],
+                "history": history,
+                "sensitivity": [dict(row, label=rules.combo_label(definitions[row["index"]]))
+                                for row in sensitivity_rows],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"결과: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
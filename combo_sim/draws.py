@@ -0,0 +1,366 @@
+"""주사위 가방 뽑기 확률 (정확한 계산)
+
+DiceBag.draw_many_data()는 남은 주사위 중에서 복원 없이 뽑고, 눈은 굴린 뒤 1~6 균등입니다.
+그래서 이번 턴 손(기본 5개)의 분포는
+  (색상, 타입) 구성: 다변량 초기하 분포  Π C(N_k, m_k) / C(N, n)
+  눈: 주사위마다 독립 균등
+으로 나뉩니다. 조합 성립 여부는 구성과 눈에만 달려 있으므로
+
+  1. 손 구성(종류별 개수 m)마다 눈 6^n가지를 전부 평가해 "이 구성일 때의 조건부 확률"을 구해 둠
+     - 규칙은 색상 이름과 무관하므로 색상을 바꾼 구성은 같은 패턴으로 모아 한 번만 계산 (메모)
+     - Prism은 색상 조건에서 빠지므로 색상 없이 묶음
+  2. 가방 상태 G개 × 구성 C개의 초기하 확률 행렬을 이항계수 표에서 한 번에 만들고
+  3. (G, C) @ (C, 열) 행렬곱 한 번으로 모든 가방 상태의 확률을 얻음
+
+열: 정의별 "손 안에 이 조합이 있음", 정의별 "가장 높은 점수 조합이 이것", 조합 있음, 최고 점수 기대값
+
+    python -m combo_sim.draws
+    python -m combo_sim.draws --bag W=8 K=8 R=3 G=8 B=8 W:4=1
+    python -m combo_sim.draws --sweep R --verify 200000
+"""
+import argparse
+import itertools
+import math
+import sys
+import time
+
+import numpy as np
+
+from . import bag as dice_bag
+from . import evaluator
+from . import rules
+from . import simulate
+
+_FACE_COUNT = 6
+PATTERNS_SHOWN = 12
+
+
+# ============================================================================
+# 조합 수
+# ============================================================================
+_binomials = {}
+
+
+def binomial_table(max_n, max_k):
+    """C(n, k) 표 (max_n+1, max_k+1) float64 - n < k면 0"""
+    key = (max_n, max_k)
+    if key not in _binomials:
+        table = np.zeros((max_n + 1, max_k + 1))
+        for n in range(max_n + 1):
+            for k in range(min(n, max_k) + 1):
+                table[n, k] = math.comb(n, k)
+        _binomials[key] = table
+    return _binomials[key]
+
+
+def compositions(kind_count, hand):
+    """종류 kind_count개에서 hand개를 뽑는 모든 구성 (C, kind_count)"""
+    rows = []
+    for picked in itertools.combinations_with_replacement(range(kind_count), hand):
+        rows.append(np.bincount(picked, minlength=kind_count))
+    return np.array(rows, dtype=np.intp).reshape(-1, kind_count)
+
+
+# ============================================================================
+# 색상/타입 패턴
+# ============================================================================
+def pattern_of(dice):
+    """[(색상, 타입)] → 색상 이름을 지운 정규 패턴
+
+    패턴 = (색상별 정렬된 타입 튜플을 정렬한 것, Prism 타입 튜플)
+    """
+    groups = {}
+    prisms = []
+    for color, type_index in dice:
+        if type_index == rules.TYPE_PRISM:
+            prisms.append(type_index)
+        else:
+            groups.setdefault(color, []).append(type_index)
+    return tuple(sorted(tuple(sorted(types)) for types in groups.values())), tuple(prisms)
+
+
+def pattern_dice(pattern):
+    """정규 패턴 → 대표 [(색상, 타입)] (색상은 0부터 다시 붙임, Prism은 색상 0)"""
+    groups, prisms = pattern
+    dice = [(color, t) for color, types in enumerate(groups) for t in types]
+    return dice + [(0, t) for t in prisms]
+
+
+def pattern_label(pattern):
+    """(((0, 0, 0), (0,), (0,)), ()) → "3-1-1" (특수 타입은 괄호, Prism은 +P)"""
+    groups, prisms = pattern
+    parts = []
+    for types in sorted(groups, key=lambda g: (-len(g), g)):
+        special = [str(t) for t in types if t != rules.TYPE_NORMAL]
+        parts.append(f"{len(types)}" + (f"({','.join(special)})" if special else ""))
+    return "-".join(parts) + ("+P" * len(prisms))
+
+
+# ============================================================================
+# 패턴 하나의 눈 분포 평가
+# ============================================================================
+class PatternTable:
+    """패턴별 조건부 확률 행 (메모)
+
+    행 = [정의별 있음 D개, 정의별 최고 D개, 조합 있음, 최고 점수 기대값]
+    """
+
+    def __init__(self, definitions):
+        self.compiled = evaluator.compile_definitions(definitions)
+        self.definition_count = len(self.compiled.definitions)
+        self.rows = {}
+
+    @property
+    def columns(self):
+        return 2 * self.definition_count + 2
+
+    def row(self, pattern):
+        if pattern not in self.rows:
+            self.rows[pattern] = self._evaluate(pattern_dice(pattern))
+        return self.rows[pattern]
+
+    def _evaluate(self, dice):
+        compiled = self.compiled
+        n = len(dice)
+        d = self.definition_count
+        row = np.zeros(self.columns)
+        if n < simulate.MIN_COMBO_DICE:
+            return row
+        # 눈 6^n가지 (F, n) - 모두 같은 확률
+        values = np.array(list(itertools.product(range(1, _FACE_COUNT + 1), repeat=n)), dtype=np.intp)
+        colors = np.broadcast_to(np.array([c for c, _ in dice], dtype=np.intp), values.shape)
+        types = np.broadcast_to(np.array([t for _, t in dice], dtype=np.intp), values.shape)
+        face_code, color_code, extra_code = evaluator.die_codes(values, colors, types)
+
+        available = np.zeros((len(values), d), dtype=bool)
+        best_points = np.zeros(len(values), dtype=np.int64)
+        best_index = np.full(len(values), -1, dtype=np.int64)
+        for k in range(simulate.MIN_COMBO_DICE, min(rules.HAND_SIZE, n) + 1):
+            for subset in simulate.subset_table(n, k):
+                face_key = face_code[:, subset].sum(axis=1)
+                color_key = color_code[:, subset].sum(axis=1)
+                extra = extra_code[:, subset].sum(axis=1)
+                condition_bits = compiled.condition_table[face_key]
+                color_bits = compiled.color_table[color_key]
+                available |= ((condition_bits[:, None] >> compiled.condition_bit) & 1).astype(bool) \
+                    & ((color_bits[:, None] & compiled.color_bit) != 0)
+                index, points = evaluator.evaluate_keys(face_key, color_key, extra, compiled)
+                better = points > best_points
+                best_points[better] = points[better]
+                best_index[better] = index[better]
+
+        row[:d] = available.mean(axis=0)
+        hit = best_index >= 0
+        row[d:2 * d] = np.bincount(best_index[hit], minlength=d) / len(values)
+        row[2 * d] = hit.mean()
+        row[2 * d + 1] = best_points.mean()
+        return row
+
+
+def kind_label(kind):
+    """(0, 0) → "W", (0, 4) → "W:4" (--bag 형식)"""
+    color, type_index = kind
+    return rules.COLOR_KEYS[color] + ("" if type_index == rules.TYPE_NORMAL else f":{type_index}")
+
+
+# ============================================================================
+# 엔진
+# ============================================================================
+class DrawEngine:
+    """가방 종류 목록 [(색상, 타입)]에 대해 hand개 뽑기 확률을 계산
+
+    구성 표와 구성별 조건부 확률 행렬은 한 번만 만들고, 가방 상태는 (G, K) 개수 배열로
+    여러 개를 한꺼번에 넣습니다.
+    """
+
+    def __init__(self, definitions, kinds, hand=rules.HAND_SIZE, max_per_kind=64):
+        self.definitions = definitions
+        self.kinds = list(kinds)
+        self.hand = hand
+        self.patterns = PatternTable(definitions)
+        self.compositions = compositions(len(self.kinds), hand)
+        self.composition_patterns = []
+        for row in self.compositions:
+            dice = [self.kinds[k] for k, count in enumerate(row) for _ in range(count)]
+            self.composition_patterns.append(pattern_of(dice))
+        self.unique_patterns = sorted(set(self.composition_patterns))
+        pattern_index = {p: i for i, p in enumerate(self.unique_patterns)}
+        # 구성 → 패턴 (C, P) 0/1 행렬
+        self.pattern_matrix = np.zeros((len(self.compositions), len(self.unique_patterns)))
+        for c, pattern in enumerate(self.composition_patterns):
+            self.pattern_matrix[c, pattern_index[pattern]] = 1.0
+        self.table = np.array([self.patterns.row(p) for p in self.unique_patterns])
+        self.composition_table = self.pattern_matrix @ self.table
+        self.binomials = binomial_table(max_per_kind, hand)
+        # 종류별 (hand+1, C) 원핫: C(N_k, ·) 행을 구성별 m_k 칸으로 옮기는 행렬곱용
+        self.selectors = np.zeros((len(self.kinds), hand + 1, len(self.compositions)))
+        for k in range(len(self.kinds)):
+            self.selectors[k, self.compositions[:, k], np.arange(len(self.compositions))] = 1.0
+
+    @classmethod
+    def standard(cls, definitions, extra=(), hand=rules.HAND_SIZE):
+        """DiceBag.setup_full 구성 (색상별 일반 8개 + extra)의 종류로 엔진 만들기"""
+        colors, types = dice_bag.standard_bag(extra=extra)
+        kinds = sorted(set(zip(colors.tolist(), types.tolist())))
+        return cls(definitions, kinds, hand)
+
+    def counts_of(self, bag_counts):
+        """{(색상, 타입): 개수} → (K,) 배열"""
+        unknown = set(k for k, v in bag_counts.items() if v) - set(self.kinds)
+        if unknown:
+            raise ValueError(f"엔진에 없는 주사위 종류: {sorted(unknown)}")
+        return np.array([bag_counts.get(kind, 0) for kind in self.kinds], dtype=np.intp)
+
+    def composition_probabilities(self, counts):
+        """(G, K) 가방 상태 → (G, C) 손 구성 확률 (남은 주사위가 hand개 미만이면 0)"""
+        counts = np.atleast_2d(np.asarray(counts, dtype=np.intp))
+        if counts.max(initial=0) >= self.binomials.shape[0]:
+            self.binomials = binomial_table(int(counts.max()), self.hand)
+        # Π_k C(N_k, m_k): 종류마다 (G, hand+1) 이항계수 행 @ 원핫 (hand+1, C)을 곱해 나감
+        ways = np.ones((len(counts), len(self.compositions)))
+        for k in range(len(self.kinds)):
+            ways *= self.binomials[counts[:, k]] @ self.selectors[k]
+        totals = self.binomials[counts.sum(axis=1), self.hand]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(totals[:, None] > 0, ways / totals[:, None], 0.0)
+
+    def query(self, counts):
+        """(G, K) 가방 상태 → (G, 열) 확률 표"""
+        return self.composition_probabilities(counts) @ self.composition_table
+
+    def pattern_distribution(self, counts):
+        """(G, K) → (G, P) 색상/타입 패턴 확률 (열 순서 = unique_patterns)"""
+        return self.composition_probabilities(counts) @ self.pattern_matrix
+
+    def report(self, bag_counts):
+        """가방 상태 하나 → dict (정의 라벨별 있음/최고 확률, 조합 있음, 최고 점수 기대값, 패턴 분포)"""
+        counts = self.counts_of(bag_counts)
+        row = self.query(counts)[0]
+        d = len(self.definitions)
+        patterns = self.pattern_distribution(counts)[0]
+        return {
+            "bag": {kind_label(kind): int(n) for kind, n in zip(self.kinds, counts) if n},
+            "hand": self.hand,
+            "combos": [{"combo": rules.combo_label(definition), "available": float(row[i]), "best": float(row[d + i])}
+                       for i, definition in enumerate(self.definitions)],
+            "any": float(row[2 * d]),
+            "expected_best_points": float(row[2 * d + 1]),
+            "patterns": {pattern_label(p): float(patterns[i]) for i, p in enumerate(self.unique_patterns)
+                         if patterns[i] > 0},
+        }
+
+
+# ============================================================================
+# 검증 (몬테카를로와 비교)
+# ============================================================================
+def monte_carlo(engine, bag_counts, games, seed=0):
+    """표본 games개로 정의별 있음 확률과 최고 점수 기대값을 추정"""
+    compiled = engine.patterns.compiled
+    rng = np.random.default_rng(seed)
+    colors = np.array([c for (c, t), n in bag_counts.items() for _ in range(n)], dtype=np.int8)
+    types = np.array([t for (c, t), n in bag_counts.items() for _ in range(n)], dtype=np.int8)
+    bag = dice_bag.BagBatch(rng, games, colors, types)
+    c, t = bag.draw(engine.hand)
+    v = bag.roll(c.shape)
+    available = np.zeros((games, len(engine.definitions)), dtype=bool)
+    best = np.zeros(games, dtype=np.int64)
+    codes = evaluator.die_codes(v, c, t)
+    for k in range(simulate.MIN_COMBO_DICE, min(rules.HAND_SIZE, engine.hand) + 1):
+        for subset in simulate.subset_table(engine.hand, k):
+            face_key, color_key, extra = (code[:, subset].sum(axis=1) for code in codes)
+            condition_bits = compiled.condition_table[face_key]
+            color_bits = compiled.color_table[color_key]
+            available |= ((condition_bits[:, None] >> compiled.condition_bit) & 1).astype(bool) \
+                & ((color_bits[:, None] & compiled.color_bit) != 0)
+            best = np.maximum(best, evaluator.evaluate_keys(face_key, color_key, extra, compiled)[1])
+    return available.mean(axis=0), best.mean()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+def parse_bag(items, extra):
+    """["W=8", "W:4=1"] → {(색상, 타입): 개수} (지정 안 한 종류는 DiceBag.setup_full 기본값)"""
+    colors, types = dice_bag.standard_bag(extra=extra)
+    bag_counts = {}
+    for kind in zip(colors.tolist(), types.tolist()):
+        bag_counts[kind] = bag_counts.get(kind, 0) + 1
+    for item in items or []:
+        spec, _, count = item.partition("=")
+        color_key, _, type_index = spec.partition(":")
+        if color_key not in rules.COLOR_KEYS or not count.isdigit() or (type_index and not type_index.isdigit()):
+            raise SystemExit(f"❌ 잘못된 가방 항목: {item} (예: W=8, W:4=1)")
+        bag_counts[(rules.COLOR_KEYS.index(color_key), int(type_index or 0))] = int(count)
+    return bag_counts
+
+
+def print_report(report):
+    bag = " ".join(f"{k}={v}" for k, v in report["bag"].items())
+    print(f"\n가방: {bag}  (손 {report['hand']}개)")
+    print(f"  {'조합':<24} {'손에 있음':>9} {'최고 조합':>9}")
+    for row in report["combos"]:
+        print(f"  {row['combo']:<24} {row['available']:>9.3%} {row['best']:>9.3%}")
+    print(f"  {'조합 있음':<24} {report['any']:>9.3%}")
+    print(f"  최고 조합 점수 기대값: {report['expected_best_points']:.2f}")
+    patterns = sorted(report["patterns"].items(), key=lambda item: -item[1])
+    shown = ", ".join(f"{label} {p:.2%}" for label, p in patterns[:PATTERNS_SHOWN])
+    rest = f" 외 {len(patterns) - PATTERNS_SHOWN}개" if len(patterns) > PATTERNS_SHOWN else ""
+    print(f"  색상 패턴: {shown}{rest}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.draws", description="가방 뽑기 정확 확률")
+    parser.add_argument("--bag", nargs="*", metavar="COLOR[:TYPE]=N", help="가방 상태 (지정 안 한 종류는 기본값)")
+    parser.add_argument("--extra", nargs="*", metavar="COLOR:TYPE", help="기본 가방에 추가할 특수 주사위 (예: W:4)")
+    parser.add_argument("--hand", type=int, default=rules.HAND_SIZE, help="한 번에 뽑는 주사위 수")
+    parser.add_argument("--sweep", choices=rules.COLOR_KEYS, default=None,
+                        help="이 색상 일반 주사위 개수를 0~8로 바꿔 가며 표로 출력")
+    parser.add_argument("--verify", type=int, default=0, help="몬테카를로 표본 수 (0 = 생략)")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    args = parser.parse_args(argv)
+
+    definitions = rules.load_definitions(args.combos)
+    extra = simulate.parse_extra(args.extra)
+    bag_counts = parse_bag(args.bag, extra)
+    kinds = sorted(k for k, v in bag_counts.items() if v)
+
+    started = time.perf_counter()
+    engine = DrawEngine(definitions, kinds, args.hand)
+    built = time.perf_counter() - started
+    print(f"엔진: 종류 {len(kinds)}개, 손 구성 {len(engine.compositions)}개, "
+          f"패턴 {len(engine.unique_patterns)}개 ({built * 1000:.0f}ms)")
+
+    report = engine.report(bag_counts)
+    print_report(report)
+
+    if args.sweep:
+        color = rules.COLOR_KEYS.index(args.sweep)
+        column = engine.kinds.index((color, rules.TYPE_NORMAL))
+        grid = np.repeat(engine.counts_of(bag_counts)[None, :], dice_bag.PER_COLOR + 1, axis=0)
+        grid[:, column] = np.arange(dice_bag.PER_COLOR + 1)
+        started = time.perf_counter()
+        table = engine.query(grid)
+        elapsed = time.perf_counter() - started
+        d = len(definitions)
+        print(f"\n{args.sweep} 개수별 (가방 상태 {len(grid)}개, {elapsed * 1000:.2f}ms)")
+        print(f"  {args.sweep:>2} " + " ".join(f"{i:>6}" for i in range(d)) + f" {'있음':>6} {'기대':>7}")
+        for count, row in zip(grid[:, column], table):
+            print(f"  {count:>2} " + " ".join(f"{p:>6.2%}" for p in row[:d]) + f" {row[2 * d]:>6.1%} {row[2 * d + 1]:>7.2f}")
+        print("  " + ", ".join(f"{i}={rules.combo_label(definition)}" for i, definition in enumerate(definitions)))
+
+    if args.verify:
+        estimated, best = monte_carlo(engine, bag_counts, args.verify)
+        exact = np.array([row["available"] for row in report["combos"]])
+        stderr = np.sqrt(np.maximum(exact * (1 - exact), 1e-12) / args.verify)
+        z = np.abs(estimated - exact) / stderr
+        print(f"\n몬테카를로 {args.verify}개: 최대 |z| = {z.max():.2f}, "
+              f"최고 점수 기대값 {best:.2f} (정확 {report['expected_best_points']:.2f})")
+        if z.max() > 5:
+            print("❌ 정확 계산과 표본 추정이 어긋납니다")
+            return 1
+        print("✅ 정확 계산과 표본 추정이 맞습니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
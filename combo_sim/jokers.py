@@ -0,0 +1,390 @@
+"""조커 효과 모델 (jokers.csv description 열 파서)
+
+설명 문장을 "<조건> <대상> <연산> <수치>" 꼴로 나눠 구조화된 효과 하나로 바꿉니다.
+
+    "같은 색 3개 이상 시 배율 +15"       → 조건 same_color(3), 대상 mult, +15
+    "짝수 주사위 1개당 점수 +10"         → 개당 per_parity(짝수), 대상 score, +10
+    "족보 성공 시 15% 확률로 해당 족보 점수 +125" → 확률 0.15, 대상 score, +125
+
+대상
+  score  기본 점수에 더함        mult   배율에 더함
+  flat   최종 점수에 더함        final  최종 점수에 곱함
+적용 단위
+  hand   제출한 조합마다        turn   턴마다 (라운드 점수에 바로 더함)
+  round  라운드마다 (턴 평균으로 나눠 씀)
+
+점수와 무관한 효과(골드/상점/목표 점수 등), 라운드를 넘어 성장하는 효과, 시뮬레이션이
+추적하지 않는 상태(골드, 버린 주사위 등)에 의존하는 효과는 "excluded"로, 문법에 맞지
+않는 설명은 "unparsed"로 분류해 리포트에 따로 보여 줍니다.
+
+조합 점수는 score_manager.gd를 따르고, 조커는 특수 주사위 효과 다음에 적용합니다.
+    ((기본 점수 + Plus + Σscore + 눈 합) × (배율 × 2^Multiply + Σmult) + Σflat) × Πfinal
+"""
+import csv
+import os
+import re
+
+import numpy as np
+
+from . import rules
+from . import simulate
+
+JOKERS_CSV = os.path.join(rules.PROJECT_DIR, "jokers.csv")
+
+# game_hud.gd MAX_JOKER_SLOTS
+MAX_JOKER_SLOTS = 5
+
+SCORED = "scored"
+EXCLUDED = "excluded"
+UNPARSED = "unparsed"
+
+# 설명에 이 표현이 있으면 점수 모델 밖 (이유, 정규식) - 위에서부터 검사
+EXCLUSIONS = [
+    ("점수 외 효과 (골드/상점/규칙)", r"골드|\$|상점|리롤|목표 점수|슬롯이|패\(Hand\)|턴 제한|투자 횟수|와일드|인정|판매|아이템"),
+    ("추적하지 않는 게임 상태", r"버린 주사위|누적 \d+점|점수 \d+ 획득 시|투자|무작위 배율\(|라운드 보상"),
+    ("라운드를 넘어 성장", r"라운드 클리어마다|라운드 (?:시작|종료) 시(?:마다| 누적)|매 라운드 시작 시|영구|스테이지당|라운드 \d+부터|\d+회마다|다음 라운드"),
+]
+
+# 문법에 맞게 바꿔 쓰는 표현 (정규식, 바꿀 문장)
+REWRITES = [
+    # 눈 합은 기본 점수와 같은 덧셈 항이라 점수 +N과 같음
+    (r"^주사위 합계 점수 \+(\d+)$", r"점수 +\1"),
+    (r"무작위 주사위 눈수 x(\d+) 만큼 점수 추가", r"무작위 주사위 눈수 점수 +\1"),
+    (r"해당 족보 점수 (\d+(?:\.\d+)?)배$", r"최종 점수 X \1"),
+]
+
+_COMBO_NAMES = {
+    "야트": ["Yacht"], "Yacht": ["Yacht"],
+    "라지 스트레이트": ["라지 스트레이트"],
+    "스몰 스트레이트": ["스몰 스트레이트"],
+    "스트레이트": ["라지 스트레이트", "스몰 스트레이트", "미니 스트레이트"],
+    "런'": ["라지 스트레이트", "스몰 스트레이트", "미니 스트레이트"],
+    "4-카인드": ["포카드"], "포카드": ["포카드"],
+    "풀하우스": ["풀하우스"],
+    "트리플": ["트리플"], "셋(트리플)": ["트리플"], "셋'": ["트리플"],
+    "투페어": ["투페어"],
+}
+_COMBO = "|".join(re.escape(name) for name in sorted(_COMBO_NAMES, key=len, reverse=True))
+_PARITY = {"짝수": 0, "홀수": 1}
+_COLOR_NAMES = {"흰색": "W", "검정": "K", "빨강": "R", "초록": "G", "파랑": "B"}
+
+_TAIL = re.compile(
+    r"(?P<matching>해당 족보 )?"
+    r"(?P<target>최종 점수|최종 배율|기본 점수|기본 배율|추가 점수|점수 대신 배율|점수|배율)\s*"
+    r"(?P<op>[+xX])\s*(?P<lo>\d+(?:\.\d+)?)(?:~\+?(?P<hi>\d+(?:\.\d+)?))?"
+    r"(?:\s*(?:추가|획득|증가|랜덤|누적|성장))*"
+    r"(?:\s*\((?:최대 [xX+]?\s*(?P<cap>\d+(?:\.\d+)?)|라운드 내 유지)\))?$")
+
+_TARGETS = {
+    "점수": "score", "기본 점수": "score", "추가 점수": "score",
+    "배율": "mult", "기본 배율": "mult", "점수 대신 배율": "mult",
+    "최종 점수": "flat", "최종 배율": "final",
+}
+
+
+# ============================================================================
+# 조건 문구 → 효과 필드
+#   (정규식, 필드 함수) - 정규식은 조건 문구 전체와 맞아야 함
+# ============================================================================
+def _heads():
+    return [
+        (r"(?:족보 성공 시|모든 족보의?|족보 제출 시)?", lambda m: {}),
+        (r"(?:족보 성공 시 )?(\d+)% 확률로", lambda m: {"chance": int(m[1]) / 100}),
+        (r"족보 성공 시 다음 족보", lambda m: {"condition": [("after_combo", ())]}),
+        (rf"({_COMBO})(?: 족보)?(?: 성공 시)?", lambda m: {"condition": [("combo", tuple(_COMBO_NAMES[m[1]]))]}),
+        (r"싱글 ?컬러(?: 족보)?(?: 성공)?(?: 시)?", lambda m: {"condition": [("single_color", ())]}),
+        (r"싱글 ?컬러 스트레이트 성공 시", lambda m: {"condition": [
+            ("single_color", ()), ("combo", tuple(_COMBO_NAMES["스트레이트"]))]}),
+        (r"레인보우 성공 시", lambda m: {"condition": [("rainbow", ())]}),
+        (r"같은 색 (\d)개 이상 시", lambda m: {"condition": [("same_color", (int(m[1]),))]}),
+        (r"(짝수|홀수) 주사위 1개당", lambda m: {"per": ("parity", (_PARITY[m[1]],))}),
+        (r"(\d) 주사위 개당", lambda m: {"per": ("face", (int(m[1]),))}),
+        (r"족보에 사용한 주사위 1개당", lambda m: {"per": ("dice", ())}),
+        (r"합 (\d+) 이상 시", lambda m: {"condition": [("sum_at_least", (int(m[1]),))]}),
+        (r"합=(\d+) (?:시|나올 때)", lambda m: {"condition": [("sum_between", (int(m[1]), int(m[1])))]}),
+        (r"족보에 사용된 주사위 눈금 합이 (\d+)~(\d+) 사이일 경우",
+         lambda m: {"condition": [("sum_between", (int(m[1]), int(m[2])))]}),
+        (r"주사위 합이 '(짝수|홀수)'라면", lambda m: {"condition": [("sum_parity", (_PARITY[m[1]],))]}),
+        (r"(\d) 포함(?: 족보| 시)", lambda m: {"condition": [("contains", (int(m[1]), 1))]}),
+        (r"(\d) 두 개 이상 포함 시", lambda m: {"condition": [("contains", (int(m[1]), 2))]}),
+        (r"패에 (\d)과 (\d)이 동시에 있다면", lambda m: {"condition": [
+            ("contains", (int(m[1]), 1)), ("contains", (int(m[2]), 1))]}),
+        (r"(흰색|검정|빨강|초록|파랑) 주사위 포함 시", lambda m: {"condition": [("has_color", (_COLOR_NAMES[m[1]],))]}),
+        (r"정확히 (\d)개의 주사위로 족보 제출 시", lambda m: {"condition": [("dice_between", (int(m[1]), int(m[1])))]}),
+        (r"(\d)개 이하의 주사위로 족보 제출 시", lambda m: {"condition": [("dice_between", (0, int(m[1])))]}),
+        (r"(짝수|홀수)(?:만 조합| 족보 성공) 시", lambda m: {"condition": [("all_parity", (_PARITY[m[1]],))]}),
+        (r"같은 숫자 (?:조합|족보)(?: 시)?", lambda m: {"condition": [("same_number", ())]}),
+        (r"남은 턴이? (\d)(?:회|턴) 이하일 때", lambda m: {"condition": [("turns_left_between", (0, int(m[1])))]}),
+        (r"남은 턴이 단 (\d)회일 때", lambda m: {"condition": [("turns_left_between", (int(m[1]), int(m[1])))]}),
+        (r"남은 턴 횟수가 (\d)회 이상일 때 족보 성공 시", lambda m: {"condition": [("turns_left_between", (int(m[1]), 99))]}),
+        (r"필드(?:의|에 있는) 빈 칸 1개당", lambda m: {"per": ("field_empty", ())}),
+        (r"무작위 주사위 눈수", lambda m: {"per": ("mean_value", ())}),
+        (r"보유한? 조커 1개당", lambda m: {"per": ("jokers", ())}),
+        (r"보유한 '(\w+)' 등급 조커 1개당", lambda m: {"per": ("tier", (m[1],))}),
+        (r"조커 슬롯 (\d)개 꽉 채우면", lambda m: {"condition": [("jokers_at_least", (int(m[1]),))]}),
+        (r"매 라운드 무작위 족보", lambda m: {"chance": 1 / len(rules.COMBO_CONDITIONS)}),
+        (r"매 턴", lambda m: {"level": "turn"}),
+        (r"턴 종료 시", lambda m: {"scaling": "turn"}),
+        (r"(?:첫 턴 시작|라운드 시작|라운드 종료) 시(?: 무작위)?", lambda m: {"level": "round"}),
+    ]
+
+
+_HEAD_PATTERNS = [(re.compile(pattern), fields) for pattern, fields in _heads()]
+
+
+# ============================================================================
+# CSV / 파싱
+# ============================================================================
+def load_jokers(path=JOKERS_CSV):
+    """jokers.csv → [{"id", "name", "tier", "price", "description", "status", "reason", "effect"}]"""
+    jokers = []
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            joker = {
+                "id": int(row["id"]),
+                "name": row["korean_name"].strip(),
+                "tier": row["Tier"].strip(),
+                "price": int(row["Price"]),
+                "description": row["description"].strip(),
+            }
+            joker.update(parse_description(joker["description"]))
+            jokers.append(joker)
+    return jokers
+
+
+def parse_description(text):
+    """설명 한 줄 → {"status", "reason", "effect"}"""
+    for reason, pattern in EXCLUSIONS:
+        if re.search(pattern, text):
+            return {"status": EXCLUDED, "reason": reason, "effect": None}
+
+    for pattern, replacement in REWRITES:
+        text = re.sub(pattern, replacement, text)
+    tail = _TAIL.search(text)
+    if not tail:
+        return {"status": UNPARSED, "reason": "대상/수치를 찾지 못함", "effect": None}
+    head = text[:tail.start()].strip()
+    scaling = None
+    # "~시마다 ... 증가": 조건을 만족할 때마다 커지는 효과
+    if "마다" in head:
+        head = re.sub(r"(시|때)?마다$", lambda m: m[1] or " 시", head)
+        scaling = "trigger"
+
+    effect = {
+        "level": "hand",
+        "target": _TARGETS[tail["target"]],
+        "op": tail["op"].lower(),
+        "amount": (float(tail["lo"]) + float(tail["hi"])) / 2 if tail["hi"] else float(tail["lo"]),
+        "cap": float(tail["cap"]) if tail["cap"] else None,
+        "condition": [],
+        "per": None,
+        "chance": 1.0,
+        "scaling": scaling,
+        "matching": bool(tail["matching"]),
+    }
+    for pattern, fields in _HEAD_PATTERNS:
+        match = pattern.fullmatch(head)
+        if match:
+            effect.update(fields(match))
+            break
+    else:
+        return {"status": UNPARSED, "reason": f"조건 문구: {head}", "effect": None}
+
+    # 곱하기는 최종 점수/배율에만
+    if effect["op"] == "x" and effect["target"] in ("flat", "final"):
+        effect["target"] = "final"
+    elif effect["op"] == "x":
+        return {"status": UNPARSED, "reason": "곱하기 대상이 최종 점수/배율이 아님", "effect": None}
+    if effect["level"] == "round" and effect["target"] == "mult":
+        effect["level"] = "hand"  # 라운드 시작 시 배율 → 그 라운드 모든 조합에 적용
+    return {"status": SCORED, "reason": "", "effect": effect}
+
+
+def describe_effect(effect):
+    parts = [f"{effect['level']}:{effect['target']} {effect['op']}{effect['amount']:g}"]
+    parts += [f"{name}{list(args) if args else ''}" for name, args in effect["condition"]]
+    if effect["per"]:
+        parts.append(f"per {effect['per'][0]}{list(effect['per'][1]) if effect['per'][1] else ''}")
+    if effect["chance"] != 1.0:
+        parts.append(f"p={effect['chance']:.3g}")
+    if effect["scaling"]:
+        parts.append(f"scaling={effect['scaling']}")
+    if effect["cap"]:
+        parts.append(f"cap={effect['cap']:g}")
+    return ", ".join(parts)
+
+
+# ============================================================================
+# 제출 기록 → 조커 평가용 특징
+# ============================================================================
+class SubmissionSample:
+    """simulate_rounds(log=...) 기록을 모아 둔 배열 (제출 n개)"""
+
+    def __init__(self, log, definitions, games, rolls):
+        rows = {key: np.concatenate([row[key] for row in log]) for key in log[0]} if log else {}
+        # 게임 안에서 제출 순서대로 정렬 (누적 효과 계산용)
+        order = np.lexsort((rows["order"], rows["turn"], rows["game"]))
+        rows = {key: value[order] for key, value in rows.items()}
+
+        self.games = games
+        self.rolls = rolls
+        self.turns = games * rolls
+        self.definitions = definitions
+        self.game = rows["game"]
+        self.turn = rows["turn"].astype(np.int64)
+        self.index = rows["index"].astype(np.intp)
+        self.field = rows["field"].astype(np.int64)
+        self.used = rows["used"]
+        self.values = np.where(self.used, rows["values"], 0).astype(np.int64)
+        self.colors = rows["colors"].astype(np.int64)
+        types = rows["types"]
+        self.faceless = self.used & (types == rules.TYPE_FACELESS)
+        self.painted = self.used & (types != rules.TYPE_PRISM)
+
+        self.size = self.used.sum(axis=1)
+        self.dice_sum = self.values.sum(axis=1)
+        plus = (self.used & (types == rules.TYPE_PLUS)).sum(axis=1)
+        doubling = (self.used & (types == rules.TYPE_MULTIPLY)).sum(axis=1)
+        self.base = np.array([d["base_score"] for d in definitions])[self.index] + rules.PLUS_BONUS * plus
+        self.multiplier = np.array([d["multiplier"] for d in definitions])[self.index] * 2 ** doubling
+        # 게임 안에서 몇 번째 제출인지 (0부터)
+        starts = np.r_[0, np.flatnonzero(np.diff(self.game)) + 1]
+        first = np.zeros(len(self.game), dtype=np.int64)
+        first[starts] = starts
+        self._game_start = np.maximum.accumulate(first)
+        self.seq = np.arange(len(self.game)) - self._game_start
+
+    def __len__(self):
+        return len(self.game)
+
+    def cumulative(self, mask):
+        """게임 안에서 지금까지(자기 포함) mask가 참이었던 횟수"""
+        counts = np.cumsum(mask.astype(np.int64))
+        before_game = np.where(self._game_start > 0, counts[self._game_start - 1], 0)
+        return counts - before_game
+
+    def base_points(self):
+        return (self.base + self.dice_sum) * self.multiplier
+
+
+def _condition_mask(sample, name, args, loadout):
+    definitions = sample.definitions
+    if name == "combo":
+        wanted = np.array([d["name"] in args for d in definitions])
+        return wanted[sample.index]
+    if name == "single_color":
+        return np.array([d["is_color"] for d in definitions])[sample.index]
+    if name == "rainbow":
+        return ~np.array([d["is_color"] for d in definitions])[sample.index]
+    if name == "same_number":
+        numbers = {"is_n_of_a_kind", "is_full_house", "is_two_pair"}
+        return np.array([d["condition"] in numbers for d in definitions])[sample.index]
+    if name == "same_color":
+        prism = (sample.used & ~sample.painted).sum(axis=1)
+        most = np.max([((sample.colors == c) & sample.painted).sum(axis=1) for c in range(len(rules.COLOR_KEYS))], axis=0)
+        return most + prism >= args[0]
+    if name == "has_color":
+        color = rules.COLOR_KEYS.index(args[0])
+        return ((sample.colors == color) & sample.used).any(axis=1)
+    if name == "contains":
+        return ((sample.values == args[0]) & sample.used & ~sample.faceless).sum(axis=1) >= args[1]
+    if name == "sum_at_least":
+        return sample.dice_sum >= args[0]
+    if name == "sum_between":
+        return (sample.dice_sum >= args[0]) & (sample.dice_sum <= args[1])
+    if name == "sum_parity":
+        return sample.dice_sum % 2 == args[0]
+    if name == "all_parity":
+        return ((sample.values % 2 == args[0]) | ~sample.used).all(axis=1)
+    if name == "dice_between":
+        return (sample.size >= args[0]) & (sample.size <= args[1])
+    if name == "turns_left_between":
+        turns_left = sample.rolls - 1 - sample.turn
+        return (turns_left >= args[0]) & (turns_left <= args[1])
+    if name == "after_combo":
+        return sample.seq > 0
+    if name == "jokers_at_least":
+        return np.full(len(sample), len(loadout) >= args[0])
+    raise ValueError(f"알 수 없는 조건: {name}")
+
+
+def _per_count(sample, name, args, loadout):
+    if name == "parity":
+        return ((sample.values % 2 == args[0]) & sample.used).sum(axis=1)
+    if name == "face":
+        return ((sample.values == args[0]) & sample.used & ~sample.faceless).sum(axis=1)
+    if name == "dice":
+        return sample.size
+    if name == "field_empty":
+        return np.maximum(0, simulate.MAX_INVESTED_DICE - sample.field)
+    if name == "mean_value":
+        return sample.dice_sum / np.maximum(sample.size, 1)
+    if name == "jokers":
+        return np.full(len(sample), len(loadout))
+    if name == "tier":
+        return np.full(len(sample), sum(1 for joker in loadout if joker["tier"] == args[0]))
+    raise ValueError(f"알 수 없는 개당 조건: {name}")
+
+
+def effect_contribution(effect, sample, loadout=()):
+    """효과 하나 → (대상, 제출별 값 (n,)) 또는 ("turn", 턴당 점수)
+
+    final 대상은 곱할 배수(기본 1), 나머지는 더할 값입니다. loadout은 보유 조커 수/등급
+    조건에 씁니다.
+    """
+    if effect["level"] == "turn":
+        return "turn", effect["amount"] * effect["chance"]
+    if effect["level"] == "round":
+        return "turn", effect["amount"] * effect["chance"] / sample.rolls
+
+    mask = np.ones(len(sample), dtype=bool)
+    for name, args in effect["condition"]:
+        mask &= _condition_mask(sample, name, args, loadout)
+
+    amount = np.full(len(sample), effect["amount"])
+    if effect["per"]:
+        amount = amount * _per_count(sample, *effect["per"], loadout)
+    if effect["scaling"] == "trigger":
+        amount = amount * sample.cumulative(mask)
+        if not effect["matching"]:
+            mask = sample.cumulative(mask) > 0  # 한 번 커지면 이후 모든 조합에 적용
+    elif effect["scaling"] == "turn":
+        amount = amount * sample.turn
+
+    if effect["target"] == "final":
+        if effect["op"] == "x":
+            factor = 1 + effect["chance"] * (amount - 1)
+        else:
+            factor = 1 + effect["chance"] * amount
+        if effect["cap"]:
+            factor = np.minimum(factor, effect["cap"])
+        return "final", np.where(mask, factor, 1.0)
+    value = amount * effect["chance"]
+    if effect["cap"]:
+        value = np.minimum(value, effect["cap"])
+    return effect["target"], np.where(mask, value, 0.0)
+
+
+def loadout_points(loadout, sample):
+    """로드아웃(조커 dict 목록)의 턴당 기대 점수 (정확 계산, effect가 None인 자리는 빈 슬롯)"""
+    score = np.zeros(len(sample))
+    mult = np.zeros(len(sample))
+    flat = np.zeros(len(sample))
+    final = np.ones(len(sample))
+    per_turn = 0.0
+    for joker in loadout:
+        if joker["effect"] is None:
+            continue
+        target, value = effect_contribution(joker["effect"], sample, loadout)
+        if target == "turn":
+            per_turn += value
+        elif target == "score":
+            score += value
+        elif target == "mult":
+            mult += value
+        elif target == "flat":
+            flat += value
+        else:
+            final *= value
+    points = ((sample.base + sample.dice_sum + score) * (sample.multiplier + mult) + flat) * final
+    return points.sum() / sample.turns + per_turn
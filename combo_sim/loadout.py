@@ -0,0 +1,419 @@
+"""조커 로드아웃 시너지 탐색
+
+jokers.csv의 점수 조커(jokers.py로 파싱) 중 슬롯 수만큼 골라 턴당 기대 점수가 가장 높은
+조합을 찾고, 과한 시너지와 가격 대비 가치 이상치를 리포트합니다.
+
+  1. 표본: simulate.py의 greedy 정책으로 라운드를 돌려 제출된 조합을 기록
+     (조커가 정책을 바꾸지는 않는다고 가정)
+  2. 모델: 조합 점수 ((기본 + Σscore + 눈 합) × (배율 + Σmult) + Σflat) × Πfinal 은
+     final 조커를 고정하면 조커 포함 여부에 대한 2차식이므로
+         상수 + Σ 단독 항 + Σ 쌍 항
+     을 표본 전체에 대해 미리 계산해 둡니다. final 조커는 포함 여부 부분집합마다
+     가중치(Πfinal)를 바꿔 모델을 따로 만듭니다.
+  3. 탐색: 분기 한정(branch and bound) 깊이 우선 탐색
+     - 부분 점수와 쌍 항 합은 부모 노드에서 이어받음 (메모이제이션)
+     - 남은 자리 상한 = 후보별 (단독 + 현재 조합과의 쌍 + 남은 자리 쌍 최대) 상위 합
+     - beam 탐색으로 찾은 N번째 점수를 하한으로 모든 작업에 공유
+     - (final 부분집합, 첫 조커)별 작업을 프로세스 풀로 나눠 실행
+  4. 상위 후보는 실제 로드아웃으로 정확히 다시 계산해서 순위를 매김
+     (보유 조커 등급 수 같은 로드아웃 의존 효과는 탐색 중에는 상한으로 계산)
+
+    python -m combo_sim.loadout --games 4000 --top 20
+    python -m combo_sim.loadout --budget 30 --json loadouts.json
+"""
+import argparse
+import heapq
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import jokers as joker_model
+from . import rules
+from . import simulate
+
+DEFAULT_GAMES = 4000
+OUTLIER_Z = 3.0
+BEAM_WIDTH = 64
+
+
+# ============================================================================
+# 표본 / 모델
+# ============================================================================
+def build_sample(definitions, games, seed=0, turns=simulate.TURNS):
+    log = []
+    simulate.simulate_rounds(definitions, games, seed=seed, turns=turns, log=log)
+    return joker_model.SubmissionSample(log, definitions, games, turns + 1)
+
+
+def _fillers(count):
+    """효과 없는 Common 자리 (보유 조커 수/등급 조건을 슬롯이 찬 상태로 계산할 때)"""
+    return [{"id": 0, "tier": "Common", "effect": None}] * count
+
+
+def _empty_slot():
+    return {"id": 0, "name": "(빈 슬롯)", "tier": "", "price": 0, "effect": None}
+
+
+def _upper_loadout(joker, slots):
+    """탐색용 가정 로드아웃: 나머지 자리는 모두 Common (등급 수 조건의 상한)"""
+    return [joker] + _fillers(slots - 1)
+
+
+class SearchModel:
+    """final 조커 부분집합 하나에 대한 2차 모델 (후보는 단독 항 내림차순)"""
+
+    def __init__(self, finals, candidates, const, linear, pair, prices, slots):
+        order = np.argsort(-linear, kind="stable")
+        self.finals = finals
+        self.candidates = [candidates[i] for i in order]
+        self.const = const
+        self.linear = linear[order]
+        self.pair = pair[np.ix_(order, order)]
+        self.max_pair = self.pair.max(axis=1) if len(order) > 1 else np.zeros(len(order))
+        self.prices = prices[order]
+        # 빈 슬롯끼리는 서로 바꿔도 같은 로드아웃이라 한 단계에서 하나만 시도
+        self.empty = np.array([c["effect"] is None for c in self.candidates], dtype=bool)
+        self.slots = slots - len(finals)
+        self.fixed_price = sum(j["price"] for j in finals)
+
+    def budget(self, budget):
+        """후보에 쓸 수 있는 가격 (final 조커 가격을 뺀 값, 제한 없으면 None)"""
+        return None if budget is None else budget - self.fixed_price
+
+    def value(self, chosen):
+        chosen = list(chosen)
+        return self.const + self.linear[chosen].sum() + self.pair[np.ix_(chosen, chosen)].sum() / 2
+
+
+def build_models(jokers, sample, slots, allow_empty=False):
+    """점수 조커 → final 부분집합별 SearchModel 목록
+
+    allow_empty면 값 0, 가격 0인 빈 슬롯 후보를 넣어 슬롯보다 적은 로드아웃도 찾습니다
+    (가격 상한이 있을 때 비싼 조커 하나가 싼 조커 여럿보다 나을 수 있음).
+    """
+    scored = [j for j in jokers if j["status"] == joker_model.SCORED]
+    finals = [j for j in scored if j["effect"]["target"] == "final" and j["effect"]["level"] == "hand"]
+    others = [j for j in scored if j not in finals]
+    if allow_empty:
+        others += [_empty_slot() for _ in range(slots - 1)]
+
+    n = len(sample)
+    base = (sample.base + sample.dice_sum).astype(float)
+    multiplier = sample.multiplier.astype(float)
+    score = np.zeros((len(others), n))
+    mult = np.zeros((len(others), n))
+    flat = np.zeros((len(others), n))
+    per_turn = np.zeros(len(others))
+    for i, joker in enumerate(others):
+        if joker["effect"] is None:
+            continue
+        target, value = joker_model.effect_contribution(joker["effect"], sample, _upper_loadout(joker, slots))
+        if target == "turn":
+            per_turn[i] = value
+        else:
+            {"score": score, "mult": mult, "flat": flat}[target][i] = value
+    factors = {j["id"]: joker_model.effect_contribution(j["effect"], sample, _upper_loadout(j, slots))[1]
+               for j in finals}
+    prices = np.array([j["price"] for j in others], dtype=float)
+
+    models = []
+    for size in range(min(len(finals), slots) + 1):
+        for subset in itertools.combinations(finals, size):
+            weight = np.ones(n)
+            for joker in subset:
+                weight = weight * factors[joker["id"]]
+            const = (weight * base * multiplier).sum() / sample.turns
+            linear = ((weight * (base * mult + score * multiplier + score * mult + flat)).sum(axis=1)
+                      / sample.turns + per_turn)
+            cross = (score * weight) @ mult.T / sample.turns
+            pair = cross + cross.T
+            np.fill_diagonal(pair, 0.0)
+            models.append(SearchModel(list(subset), others, const, linear, pair, prices, slots))
+    return models
+
+
+# ============================================================================
+# 분기 한정 탐색
+# ============================================================================
+def _beam(models, top, budget):
+    """beam 탐색으로 찾은 상위 로드아웃 [(점수, 모델 인덱스, 후보 튜플)] (분기 한정의 초기 하한)"""
+    found = []
+    for m, model in enumerate(models):
+        if not _searchable(model, budget):
+            continue
+        limit = model.budget(budget)
+        beam = [((), 0.0)]
+        for _ in range(model.slots):
+            expanded = {}
+            for chosen, cost in beam:
+                free_empty = [i for i in np.flatnonzero(model.empty) if i not in chosen][:1]
+                for i in range(len(model.candidates)):
+                    if i in chosen or (limit is not None and cost + model.prices[i] > limit):
+                        continue
+                    if model.empty[i] and i not in free_empty:
+                        continue
+                    key = tuple(sorted(chosen + (i,)))
+                    if key not in expanded:
+                        expanded[key] = cost + model.prices[i]
+            beam = sorted(expanded.items(), key=lambda item: -model.value(item[0]))[:BEAM_WIDTH]
+        found += [(model.value(chosen), m, chosen) for chosen, _ in beam if len(chosen) == model.slots]
+    found.sort(key=lambda item: -item[0])
+    return found[:top]
+
+
+def _searchable(model, budget):
+    limit = model.budget(budget)
+    return 0 <= model.slots <= len(model.candidates) and (limit is None or limit >= 0)
+
+
+def _search(model, first, top, floor, budget):
+    """첫 후보를 first로 고정한 하위 트리 탐색 → ([(점수, 후보 인덱스 튜플)], 방문 노드 수)
+
+    budget은 후보에 쓸 수 있는 가격 (model.budget으로 계산, 제한 없으면 None)
+    """
+    heap = []
+    nodes = 0
+    linear, pair, max_pair, prices, empty = model.linear, model.pair, model.max_pair, model.prices, model.empty
+    count = len(linear)
+
+    def visit(chosen, value, cross, start, cost):
+        nonlocal nodes
+        nodes += 1
+        remaining = model.slots - len(chosen)
+        if remaining == 0:
+            item = (value, tuple(chosen))
+            if len(heap) < top:
+                heapq.heappush(heap, item)
+            elif value > heap[0][0]:
+                heapq.heapreplace(heap, item)
+            return
+        rest = np.arange(start, count)
+        if budget is not None:
+            rest = rest[prices[rest] <= budget - cost]
+        if len(rest) < remaining:
+            return
+        gains = linear[rest] + cross[rest]
+        bound = value + np.sort(gains + (remaining - 1) / 2 * max_pair[rest])[-remaining:].sum()
+        # 하한과 같은 점수는 beam 결과에 이미 있으므로 부동소수 오차만큼 여유를 둠
+        if bound < floor or (len(heap) == top and bound <= heap[0][0]):
+            return
+        tried_empty = False
+        for i, gain in zip(rest, gains):
+            if count - i < remaining:
+                break
+            if empty[i]:
+                if tried_empty:
+                    continue
+                tried_empty = True
+            visit(chosen + [int(i)], value + gain, cross + pair[i], i + 1, cost + prices[i])
+
+    if model.slots == 0:
+        return [(model.const, ())], 1
+    if budget is None or prices[first] <= budget:
+        visit([first], model.const + linear[first], pair[first].copy(), first + 1, prices[first])
+    return heap, nodes
+
+
+_worker_state = {}
+
+
+def _init_worker(models):
+    _worker_state["models"] = models
+
+
+def _run_task(task):
+    model_index, first, top, floor, budget = task
+    heap, nodes = _search(_worker_state["models"][model_index], first, top, floor, budget)
+    return model_index, heap, nodes
+
+
+def search_loadouts(models, top, budget=None, workers=None):
+    """모든 모델에서 상위 top개 → [(모델 점수, 모델 인덱스, 후보 인덱스 튜플)], 방문 노드 수"""
+    beam = _beam(models, top, budget)
+    floor = beam[-1][0] - 1e-6 * abs(beam[-1][0]) if len(beam) == top else -np.inf
+    tasks = []
+    for m, model in enumerate(models):
+        if not _searchable(model, budget):
+            continue
+        firsts = range(len(model.candidates) - model.slots + 1) if model.slots else range(1)
+        tasks += [(m, first, top, floor, model.budget(budget)) for first in firsts]
+
+    if workers == 1:
+        _init_worker(models)
+        return _merge(map(_run_task, tasks), beam, top)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(models,)) as pool:
+        return _merge(pool.map(_run_task, tasks, chunksize=8), beam, top)
+
+
+def _merge(results, beam, top):
+    best = {(m, tuple(chosen)): value for value, m, chosen in beam}
+    nodes = 0
+    for model_index, heap, task_nodes in results:
+        nodes += task_nodes
+        for value, chosen in heap:
+            best[(model_index, chosen)] = value
+    ranked = sorted(((value, m, chosen) for (m, chosen), value in best.items()), key=lambda item: -item[0])
+    return ranked[:top], nodes
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+def rescore(candidates, models, sample):
+    """탐색 결과를 실제 로드아웃으로 다시 계산 → [{"jokers", "points", "price"}] 점수 내림차순"""
+    cache = {}
+    ranked = []
+    for _, model_index, chosen in candidates:
+        model = models[model_index]
+        loadout = model.finals + [model.candidates[i] for i in chosen if model.candidates[i]["id"]]
+        key = frozenset(j["id"] for j in loadout)
+        if key in cache:
+            continue
+        cache[key] = joker_model.loadout_points(loadout, sample)
+        ranked.append({"jokers": sorted(loadout, key=lambda j: j["id"]), "points": cache[key],
+                       "price": sum(j["price"] for j in loadout)})
+    ranked.sort(key=lambda item: -item["points"])
+    return ranked
+
+
+def joker_values(jokers, sample, slots, baseline):
+    """점수 조커별 단독 가치 (나머지 자리는 효과 없는 Common) + 등급 안 가성비 이상치"""
+    rows = []
+    for joker in jokers:
+        if joker["status"] != joker_model.SCORED:
+            continue
+        gain = joker_model.loadout_points([joker] + _fillers(slots - 1), sample) - baseline
+        rows.append({"id": joker["id"], "name": joker["name"], "tier": joker["tier"], "price": joker["price"],
+                     "gain": gain, "per_gold": gain / max(joker["price"], 1), "flag": ""})
+
+    for tier in sorted({row["tier"] for row in rows}):
+        group = [row for row in rows if row["tier"] == tier]
+        ratios = np.array([row["per_gold"] for row in group])
+        median = np.median(ratios)
+        spread = 1.4826 * np.median(np.abs(ratios - median)) or 1e-9
+        for row in group:
+            row["z"] = (row["per_gold"] - median) / spread
+            if row["gain"] <= 1e-9:
+                row["flag"] = "발동 안 함"
+            elif row["z"] >= OUTLIER_Z:
+                row["flag"] = "가격 대비 과함"
+            elif row["z"] <= -OUTLIER_Z:
+                row["flag"] = "가격 대비 약함"
+    rows.sort(key=lambda row: -row["gain"])
+    return rows
+
+
+def synergy_pairs(model, z_threshold=OUTLIER_Z):
+    """final 조커 없는 모델에서 쌍 보너스가 이상치(로버스트 z ≥ z_threshold)인 쌍
+
+    점수 조커 × 배율 조커는 원래 곱으로 커지므로 쌍 보너스 자체가 아니라
+    전체 쌍 분포에서 튀는 쌍만 과한 시너지로 봅니다.
+    """
+    a, b = np.triu_indices(len(model.candidates), k=1)
+    synergy = model.pair[a, b]
+    positive = synergy[synergy > 0]
+    if not len(positive):
+        return []
+    median = np.median(positive)
+    spread = 1.4826 * np.median(np.abs(positive - median)) or 1e-9
+    pairs = []
+    for i in np.flatnonzero((synergy - median) / spread >= z_threshold):
+        first, second = model.candidates[a[i]], model.candidates[b[i]]
+        solo = model.linear[a[i]] + model.linear[b[i]]
+        pairs.append({"ids": (first["id"], second["id"]), "names": (first["name"], second["name"]),
+                      "synergy": float(synergy[i]), "ratio": float(synergy[i] / solo) if solo > 0 else None,
+                      "z": float((synergy[i] - median) / spread)})
+    pairs.sort(key=lambda pair: -pair["synergy"])
+    return pairs
+
+
+def print_report(jokers, values, ranked, pairs, baseline, top):
+    counts = {status: sum(1 for j in jokers if j["status"] == status)
+              for status in (joker_model.SCORED, joker_model.EXCLUDED, joker_model.UNPARSED)}
+    print(f"조커 {len(jokers)}개: 점수 모델 {counts['scored']}, 제외 {counts['excluded']}, 파싱 실패 {counts['unparsed']}")
+    for joker in jokers:
+        if joker["status"] == joker_model.UNPARSED:
+            print(f"  ❌ #{joker['id']:<3} {joker['name']}: {joker['description']} ({joker['reason']})")
+
+    flagged = {frozenset(pair["ids"]) for pair in pairs}
+    print(f"\n상위 로드아웃 (조커 없음: 턴당 {baseline:.1f}점)")
+    for rank, item in enumerate(ranked[:top], 1):
+        ids = [j["id"] for j in item["jokers"]]
+        broken = [pair for pair in itertools.combinations(ids, 2) if frozenset(pair) in flagged]
+        mark = f"  ⚠️ 과한 시너지 {', '.join(f'{a}+{b}' for a, b in broken)}" if broken else ""
+        print(f"  {rank:>2}. {item['points']:>9.1f}점/턴 (×{item['points'] / baseline:.2f}) ${item['price']:<3} "
+              + ", ".join(f"#{j['id']} {j['name']}" for j in item["jokers"]) + mark)
+
+    print(f"\n과한 시너지 {len(pairs)}쌍 (쌍 보너스 로버스트 z ≥ {OUTLIER_Z:g})")
+    for pair in pairs[:top]:
+        ratio = f", 단독 합의 {pair['ratio']:.0%}" if pair["ratio"] is not None else ""
+        print(f"  ⚠️ #{pair['ids'][0]} {pair['names'][0]} + #{pair['ids'][1]} {pair['names'][1]}: "
+              f"+{pair['synergy']:.1f}점/턴 (z={pair['z']:.1f}{ratio})")
+
+    print("\n가격 대비 가치 이상치 (등급 안 로버스트 z)")
+    for row in values:
+        if row["flag"]:
+            print(f"  {row['flag']:<10} #{row['id']:<3} {row['name']:<10} {row['tier']:<9} ${row['price']:<3} "
+                  f"+{row['gain']:.1f}점/턴 ({row['per_gold']:.1f}/골드, z={row['z']:+.1f})")
+
+
+# ============================================================================
+# 메인
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.loadout", description="조커 로드아웃 시너지 탐색")
+    parser.add_argument("--jokers", default=joker_model.JOKERS_CSV, help="jokers.csv 경로")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="표본 라운드 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slots", type=int, default=joker_model.MAX_JOKER_SLOTS, help="조커 슬롯 수")
+    parser.add_argument("--budget", type=int, default=None, help="로드아웃 가격 합 상한")
+    parser.add_argument("--top", type=int, default=20, help="출력할 로드아웃 수")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 1이면 풀 없이)")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    jokers = joker_model.load_jokers(args.jokers)
+    definitions = rules.load_definitions(args.combos)
+
+    started = time.perf_counter()
+    sample = build_sample(definitions, args.games, seed=args.seed)
+    baseline = joker_model.loadout_points(_fillers(args.slots), sample)
+    models = build_models(jokers, sample, args.slots, allow_empty=args.budget is not None)
+    print(f"표본: {args.games}라운드, 제출 {len(sample)}회, 모델 {len(models)}개 "
+          f"({time.perf_counter() - started:.1f}초)")
+
+    started = time.perf_counter()
+    candidates, nodes = search_loadouts(models, args.top * 3, args.budget, args.workers or os.cpu_count())
+    ranked = rescore(candidates, models, sample)
+    search_seconds = time.perf_counter() - started
+    values = joker_values(jokers, sample, args.slots, baseline)
+    pairs = synergy_pairs(models[0])
+
+    print_report(jokers, values, ranked, pairs, baseline, args.top)
+    print(f"\n✅ 탐색 노드 {nodes}개, {search_seconds:.1f}초")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": {k: getattr(args, k) for k in ("games", "seed", "slots", "budget", "top")},
+                "baseline": baseline,
+                "loadouts": [{"ids": [j["id"] for j in item["jokers"]], "points": item["points"],
+                              "price": item["price"]} for item in ranked[:args.top]],
+                "synergies": pairs,
+                "jokers": values,
+                "parse": [{"id": j["id"], "status": j["status"], "reason": j["reason"],
+                           "effect": joker_model.describe_effect(j["effect"]) if j["effect"] else None}
+                          for j in jokers],
+            }, f, ensure_ascii=False, indent=2, default=float)
+        print(f"결과: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
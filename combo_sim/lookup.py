@@ -0,0 +1,420 @@
+"""조합 룩업 테이블 생성기 (완전 해시)
+
+한 손의 조합은 (면별 개수, faceless 수, 색상 조건)에만 달려 있습니다.
+  - 면별 개수 / faceless 수: 3~5개 손에서 가능한 모든 개수 벡터 (756가지)
+  - 색상 비트: 비트 0 = 모두 같은 색, 비트 1 = 모두 다른 색 (prism 제외)
+이 정규화된 손(756 × 4가지 중 만들 수 있는 2905가지)을 참조 구현(rules.eval_combo)으로 한 번씩 평가해
+최소 완전 해시(hash-and-displace)로 만든 표에 담습니다. 게임에서는 주사위를 한 번 훑어
+손 키를 만들고 표를 한 번 읽으면 조합 / 기본 점수 / 배율이 나옵니다.
+
+    손 키 = Σ 1 << 3*(눈-1)  |  faceless 수 << 18  |  색상 비트 << 21
+    항목  = -1 (조합 아님) 또는 정의 인덱스 | 배율 << 8 | 기본 점수 << 16
+
+출력
+  gd   scripts/core/combo_table.gd (class_name ComboTable, ComboRules.eval_combo가 사용)
+  bin  리틀 엔디언 바이너리 (헤더 + 정의 + 변위 + 항목)
+
+    python -m combo_sim.lookup                 # combo_table.gd 생성
+    python -m combo_sim.lookup --format bin --output combo_table.bin
+    python -m combo_sim.lookup --verify        # 생성된 파일을 참조 구현과 전수 비교
+"""
+import argparse
+import hashlib
+import itertools
+import os
+import re
+import struct
+import sys
+import time
+
+from . import evaluator
+from . import rules
+
+GD_OUTPUT = os.path.join(rules.PROJECT_DIR, "scripts", "core", "combo_table.gd")
+COMBO_RULES_GD = os.path.join(rules.PROJECT_DIR, "scripts", "core", "combo_rules.gd")
+
+MIN_DICE = 3
+MAX_DICE = rules.HAND_SIZE
+
+_FACELESS_SHIFT = evaluator._FACE_BITS
+_COLOR_SHIFT = evaluator._FACE_BITS + evaluator._BITS
+KEYS_PER_BUCKET = 3
+
+BIN_MAGIC = b"CMBT"
+BIN_VERSION = 1
+_BIN_HEADER = struct.Struct("<4sHBBHHI32s")
+
+
+# ============================================================================
+# 정규화된 손
+# ============================================================================
+def canonical_keys():
+    """3~5개 손의 모든 (키, 대표 손) - 대표 손은 키의 조건을 그대로 만족하는 주사위 목록"""
+    for counts in evaluator._count_vectors(len(evaluator._FACES), MAX_DICE):
+        for faceless in range(MAX_DICE - sum(counts) + 1):
+            size = sum(counts) + faceless
+            if size < MIN_DICE:
+                continue
+            values = [face + 1 for face, count in enumerate(counts) for _ in range(count)]
+            for color_bits in range(4):
+                if color_bits == 3 and faceless > 1:
+                    continue  # faceless는 prism이 될 수 없어 색 있는 주사위가 2개 이상 → 만들 수 없는 키
+                dice = [{"value": v, "color": 0, "type": rules.TYPE_NORMAL} for v in values]
+                dice += [{"value": 1, "color": 0, "type": rules.TYPE_FACELESS} for _ in range(faceless)]
+                _paint(dice, color_bits)
+                yield _pack_key(counts, faceless, color_bits), dice
+
+
+def _paint(dice, color_bits):
+    """색상 비트에 맞게 색/prism 지정 (3개 이상이라 색상 비트 0~2는 항상 만들 수 있음)"""
+    if color_bits == 3:      # 같은 색이면서 다른 색 → prism 아닌 주사위가 1개 이하
+        normal = [d for d in dice if d["type"] == rules.TYPE_NORMAL]
+        faceless = len(dice) - len(normal)
+        for d in normal[1 - faceless:]:
+            d["type"] = rules.TYPE_PRISM
+    elif color_bits == 2:    # 모두 다른 색
+        for i, d in enumerate(dice):
+            d["color"] = i
+    elif color_bits == 0:    # 둘 다 아님: 같은 색 2개 + 다른 색
+        dice[-1]["color"] = 1
+
+
+def _pack_key(counts, faceless, color_bits):
+    return evaluator._pack(counts) | faceless << _FACELESS_SHIFT | color_bits << _COLOR_SHIFT
+
+
+def hand_key(dice):
+    """주사위 목록 → 손 키 (표 범위 밖이면 -1). ComboRules._table_key와 같은 계산"""
+    if not MIN_DICE <= len(dice) <= MAX_DICE:
+        return -1
+    face_key = 0
+    faceless = 0
+    colors = set()
+    painted = 0
+    for d in dice:
+        if d["type"] == rules.TYPE_FACELESS:
+            faceless += 1
+        elif 1 <= d["value"] <= len(evaluator._FACES):
+            face_key += 1 << (evaluator._BITS * (d["value"] - 1))
+        else:
+            return -1
+        if d["type"] != rules.TYPE_PRISM:
+            painted += 1
+            colors.add(d["color"])
+    color_bits = (len(colors) <= 1) | (len(colors) == painted) << 1
+    return face_key | faceless << _FACELESS_SHIFT | color_bits << _COLOR_SHIFT
+
+
+def encode_entry(index, definitions):
+    if index < 0:
+        return -1
+    d = definitions[index]
+    return index | d["multiplier"] << 8 | d["base_score"] << 16
+
+
+def decode_entry(entry):
+    """항목 → (정의 인덱스, 기본 점수, 배율) - 조합 아니면 (-1, 0, 0)"""
+    if entry < 0:
+        return -1, 0, 0
+    return entry & 0xFF, entry >> 16, entry >> 8 & 0xFF
+
+
+# ============================================================================
+# 완전 해시 (hash-and-displace)
+#   h = mix(키 ^ seed),  버킷 = h % 버킷 수,  슬롯 = (mix(h) + 변위[버킷]) % 슬롯 수
+#   키가 32비트 안이라 GDScript int64 곱셈에서도 넘치지 않음
+# ============================================================================
+def _mix(x):
+    x = ((x >> 16) ^ x) * 0x45D9F3B & 0xFFFFFFFF
+    x = ((x >> 16) ^ x) * 0x45D9F3B & 0xFFFFFFFF
+    return (x >> 16) ^ x
+
+
+def _hashes(key, seed):
+    h = _mix(key ^ seed)
+    return h, _mix(h)
+
+
+def build_perfect_hash(keys, seed=0x2545F491, max_attempts=64):
+    """키 목록 → (seed, 변위 목록, 슬롯별 키) - 슬롯 수 = 키 수 (최소 완전 해시)"""
+    slot_count = len(keys)
+    bucket_count = max(1, len(keys) // KEYS_PER_BUCKET)
+    for attempt in range(max_attempts):
+        attempt_seed = (seed + attempt * 0x9E3779B9) & 0xFFFFFFFF
+        result = _displace(keys, attempt_seed, bucket_count, slot_count)
+        if result is not None:
+            displacements, slots = result
+            return attempt_seed, displacements, slots
+    raise RuntimeError(f"완전 해시를 만들지 못했습니다 (키 {len(keys)}개, 시도 {max_attempts}회)")
+
+
+def _displace(keys, seed, bucket_count, slot_count):
+    buckets = [[] for _ in range(bucket_count)]
+    for key in keys:
+        h, h2 = _hashes(key, seed)
+        buckets[h % bucket_count].append((key, h2))
+
+    displacements = [0] * bucket_count
+    slots = [None] * slot_count
+    # 큰 버킷부터 채워야 빈 슬롯이 많을 때 자리를 잡음
+    for b in sorted(range(bucket_count), key=lambda b: -len(buckets[b])):
+        members = buckets[b]
+        if not members:
+            continue
+        for displacement in range(slot_count):
+            positions = [(h2 + displacement) % slot_count for _, h2 in members]
+            if len(set(positions)) == len(positions) and all(slots[p] is None for p in positions):
+                break
+        else:
+            return None
+        displacements[b] = displacement
+        for (key, _), p in zip(members, positions):
+            slots[p] = key
+    return displacements, slots
+
+
+class LookupTable:
+    """완전 해시 조합 표"""
+
+    def __init__(self, seed, displacements, entries, names, source_hash):
+        self.seed = seed
+        self.displacements = displacements
+        self.entries = entries
+        self.names = names
+        self.source_hash = source_hash
+
+    def lookup(self, key):
+        h, h2 = _hashes(key, self.seed)
+        return self.entries[(h2 + self.displacements[h % len(self.displacements)]) % len(self.entries)]
+
+
+def build_table(definitions, source_hash=""):
+    """정규화된 손 전부를 참조 구현으로 평가해 표 생성"""
+    results = {}
+    for key, dice in canonical_keys():
+        index, _ = rules.eval_combo(dice, definitions)
+        results[key] = encode_entry(index, definitions)
+
+    seed, displacements, slots = build_perfect_hash(sorted(results))
+    entries = [results[key] for key in slots]
+    names = [rules.combo_label(d) for d in definitions]
+    return LookupTable(seed, displacements, entries, names, source_hash)
+
+
+def source_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+def _int_rows(values, per_row=16):
+    return ",\n".join("\t" + ", ".join(str(v) for v in values[i:i + per_row])
+                      for i in range(0, len(values), per_row))
+
+
+def render_gd(table):
+    names = ", ".join(f'"{name}"' for name in table.names)
+    return f"""# 자동 생성 파일 - 직접 수정하지 마세요.
+#   python -m combo_sim.lookup  (combo_definitions.csv를 바꾸면 다시 생성)
+# ComboRules.eval_combo가 손 키 하나로 조합을 찾는 완전 해시 표입니다.
+#   손 키 = Σ 1 << 3*(눈-1) | faceless 수 << 18 | 색상 비트(1 = 같은 색, 2 = 다른 색) << 21
+#   항목  = -1 (조합 아님) 또는 정의 인덱스 | 배율 << 8 | 기본 점수 << 16
+extends RefCounted
+class_name ComboTable
+
+const SOURCE_HASH := "{table.source_hash}"
+const MIN_DICE := {MIN_DICE}
+const MAX_DICE := {MAX_DICE}
+const SEED := {table.seed}
+
+const NAMES := PackedStringArray([{names}])
+
+const DISPLACEMENTS := PackedInt32Array([
+{_int_rows(table.displacements)}
+])
+
+const ENTRIES := PackedInt32Array([
+{_int_rows(table.entries)}
+])
+
+
+## 손 키 → 항목 (조합 아니면 -1)
+static func lookup(key: int) -> int:
+	var h := _mix(key ^ SEED)
+	return ENTRIES[(_mix(h) + DISPLACEMENTS[h % DISPLACEMENTS.size()]) % ENTRIES.size()]
+
+
+static func _mix(x: int) -> int:
+	x = (((x >> 16) ^ x) * 0x45D9F3B) & 0xFFFFFFFF
+	x = (((x >> 16) ^ x) * 0x45D9F3B) & 0xFFFFFFFF
+	return (x >> 16) ^ x
+"""
+
+
+def render_bin(table, definitions):
+    """헤더 | 정의 (기본 점수 u16, 배율 u16, 싱글컬러 u8, 이름 길이 u8 + UTF-8) | 변위 u16 | 항목 i32"""
+    out = bytearray(_BIN_HEADER.pack(
+        BIN_MAGIC, BIN_VERSION, MIN_DICE, MAX_DICE, len(table.displacements), len(table.entries),
+        table.seed, bytes.fromhex(table.source_hash) if table.source_hash else bytes(32)))
+    out += struct.pack("<H", len(definitions))
+    for d, name in zip(definitions, table.names):
+        encoded = name.encode("utf-8")
+        out += struct.pack("<HHBB", d["base_score"], d["multiplier"], d["is_color"], len(encoded)) + encoded
+    out += struct.pack(f"<{len(table.displacements)}H", *table.displacements)
+    out += struct.pack(f"<{len(table.entries)}i", *table.entries)
+    return bytes(out)
+
+
+def write_table(table, definitions, path, fmt):
+    data = render_bin(table, definitions) if fmt == "bin" else render_gd(table).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_table(path):
+    """생성된 .gd / .bin → LookupTable"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] == BIN_MAGIC:
+        return _parse_bin(data)
+    return _parse_gd(data.decode("utf-8"))
+
+
+def _parse_bin(data):
+    magic, version, _, _, bucket_count, slot_count, seed, digest = _BIN_HEADER.unpack_from(data)
+    if version != BIN_VERSION:
+        raise ValueError(f"지원하지 않는 표 버전: {version}")
+    offset = _BIN_HEADER.size
+    (definition_count,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    names = []
+    for _ in range(definition_count):
+        _, _, _, length = struct.unpack_from("<HHBB", data, offset)
+        offset += 6
+        names.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+    displacements = list(struct.unpack_from(f"<{bucket_count}H", data, offset))
+    offset += 2 * bucket_count
+    entries = list(struct.unpack_from(f"<{slot_count}i", data, offset))
+    return LookupTable(seed, displacements, entries, names, digest.hex() if any(digest) else "")
+
+
+def _parse_gd(text):
+    def const(name, pattern):
+        match = re.search(rf"^const {name} := {pattern}", text, re.M | re.S)
+        if not match:
+            raise ValueError(f"{name} 상수를 찾을 수 없습니다")
+        return match.group(1)
+
+    def ints(name):
+        return [int(v) for v in re.findall(r"-?\d+", const(name, r"PackedInt32Array\(\[(.*?)\]\)"))]
+
+    names = re.findall(r'"([^"]*)"', const("NAMES", r"PackedStringArray\(\[(.*?)\]\)"))
+    return LookupTable(int(const("SEED", r"(\d+)")), ints("DISPLACEMENTS"), ints("ENTRIES"),
+                       names, const("SOURCE_HASH", r'"([0-9a-f]*)"'))
+
+
+# ============================================================================
+# 검증
+# ============================================================================
+def _die_states():
+    """주사위 하나가 조합에 영향을 주는 상태: (눈 1~6 또는 faceless) × (색상 0~4 또는 prism)"""
+    values = [(v, rules.TYPE_NORMAL) for v in evaluator._FACES] + [(1, rules.TYPE_FACELESS)]
+    for (value, value_type), color in itertools.product(values, list(evaluator._COLORS) + [None]):
+        if color is None:
+            if value_type == rules.TYPE_FACELESS:
+                continue  # faceless + prism 주사위는 없음 (타입이 하나)
+            yield {"value": value, "color": 0, "type": rules.TYPE_PRISM}
+        else:
+            yield {"value": value, "color": color, "type": value_type}
+
+
+def verify_table(table, definitions, expected_hash=""):
+    """모든 3~5개 손(주사위 상태의 중복 조합)을 참조 구현과 비교 → 불일치 목록"""
+    mismatches = []
+    if expected_hash and table.source_hash != expected_hash:
+        mismatches.append(("SOURCE_HASH", table.source_hash, expected_hash))
+    labels = [rules.combo_label(d) for d in definitions]
+    if table.names != labels:
+        mismatches.append(("NAMES", table.names, labels))
+
+    states = list(_die_states())
+    checked = 0
+    for size in range(MIN_DICE, MAX_DICE + 1):
+        for dice in itertools.combinations_with_replacement(states, size):
+            checked += 1
+            index, _ = rules.eval_combo(dice, definitions)
+            expected = (index, definitions[index]["base_score"], definitions[index]["multiplier"]) if index >= 0 else (-1, 0, 0)
+            actual = decode_entry(table.lookup(hand_key(dice)))
+            if actual != expected and len(mismatches) < 20:
+                mismatches.append(([(d["value"], d["color"], d["type"]) for d in dice], actual, expected))
+    return checked, mismatches
+
+
+def verify_gd_definitions(definitions, path=COMBO_RULES_GD):
+    """combo_rules.gd의 COMBO_DEFINITIONS(표 범위 밖 대체 경로)가 CSV와 같은지 → 불일치 목록"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    pattern = (r'\{"name": "([^"]+)", "is_color": (true|false), "condition": "(\w+)", '
+               r'"params": \[([\d, ]*)\], "base_score": (\d+), "multiplier": (\d+)\}')
+    parsed = [{
+        "name": name,
+        "is_color": is_color == "true",
+        "condition": condition,
+        "params": [int(p) for p in params.split(",") if p.strip()],
+        "base_score": int(base_score),
+        "multiplier": int(multiplier),
+    } for name, is_color, condition, params, base_score, multiplier in re.findall(pattern, text)]
+    if len(parsed) != len(definitions):
+        return [("COMBO_DEFINITIONS", f"{len(parsed)}개", f"{len(definitions)}개")]
+    return [(rules.combo_label(a), a, b) for a, b in zip(parsed, definitions) if a != b]
+
+
+# ============================================================================
+# 메인
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.lookup", description="조합 룩업 테이블 생성기")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    parser.add_argument("--format", choices=("gd", "bin"), default="gd")
+    parser.add_argument("--output", default=None, help=f"출력 경로 (gd 기본: {os.path.relpath(GD_OUTPUT, rules.PROJECT_DIR)})")
+    parser.add_argument("--verify", action="store_true", help="생성하지 않고 기존 파일을 참조 구현과 전수 비교")
+    args = parser.parse_args(argv)
+
+    output = args.output or (GD_OUTPUT if args.format == "gd" else os.path.join(rules.PROJECT_DIR, "combo_table.bin"))
+    definitions = rules.load_definitions(args.combos)
+    digest = source_hash(args.combos)
+
+    if args.verify:
+        if not os.path.exists(output):
+            print(f"❌ 표 파일이 없습니다: {output}")
+            return 1
+        started = time.perf_counter()
+        checked, mismatches = verify_table(read_table(output), definitions, digest)
+        if os.path.abspath(output) == GD_OUTPUT:
+            mismatches += verify_gd_definitions(definitions)
+        elapsed = time.perf_counter() - started
+        for where, actual, expected in mismatches:
+            print(f"  {where}: 표 {actual} / 참조 {expected}")
+        if mismatches:
+            print(f"❌ 불일치 {len(mismatches)}건 (손 {checked}개 검사) - python -m combo_sim.lookup 으로 다시 생성하세요")
+            return 1
+        print(f"✅ 손 {checked}개 일치 ({elapsed:.1f}초): {output}")
+        return 0
+
+    started = time.perf_counter()
+    table = build_table(definitions, digest)
+    size = write_table(table, definitions, output, args.format)
+    combos = sum(1 for e in table.entries if e >= 0)
+    print(f"✅ {output}: 정규화된 손 {len(table.entries)}개 (조합 {combos}개), "
+          f"버킷 {len(table.displacements)}개, {size} bytes, {time.perf_counter() - started:.2f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""조합 규칙 (scripts/core/combo_rules.gd의 파이썬 포팅)
+
+combo_definitions.csv를 읽어 COMBO_DEFINITIONS와 같은 순서(우선순위)의 정의 목록을
+만들고, 한 손씩 평가하는 참조 구현을 제공합니다. 벡터화 평가기(evaluator.py)의
+결과는 이 참조 구현과 같아야 합니다.
+"""
+import csv
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMBO_CSV = os.path.join(PROJECT_DIR, "combo_definitions.csv")
+STAGES_CSV = os.path.join(PROJECT_DIR, "stages.csv")
+
+# DiceBag.COLORS 순서 (색상 인덱스 0~4)
+COLOR_KEYS = ["W", "K", "R", "G", "B"]
+
+# 주사위 타입 (Main.ALL_DICE_INFO)
+TYPE_NORMAL = 0
+TYPE_PLUS = 1        # 기본 점수 +50
+TYPE_MULTIPLY = 3    # 배율 ×2
+TYPE_FACELESS = 4    # 숫자 와일드카드
+TYPE_PRISM = 8       # 색상 와일드카드
+
+PLUS_BONUS = 50
+HAND_SIZE = 5
+
+# 조합 이름 → (조건, 파라미터); 순서가 combo_rules.gd의 평가 우선순위
+COMBO_CONDITIONS = [
+    ("Yacht", "is_n_of_a_kind", (5,)),
+    ("라지 스트레이트", "is_straight", (5,)),
+    ("포카드", "is_n_of_a_kind", (4,)),
+    ("풀하우스", "is_full_house", ()),
+    ("스몰 스트레이트", "is_straight", (4,)),
+    ("트리플", "is_n_of_a_kind", (3,)),
+    ("투페어", "is_two_pair", ()),
+    ("미니 스트레이트", "is_straight", (3,)),
+]
+
+# CSV Type 열 → is_color
+COLOR_TYPES = {"싱글컬러": True, "레인보우": False}
+
+
+# ============================================================================
+# CSV 읽기
+# ============================================================================
+def load_definitions(path=COMBO_CSV):
+    """combo_definitions.csv → COMBO_DEFINITIONS 형식의 dict 목록 (평가 순서)"""
+    scores = {}
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            name = row["Combination"].strip()
+            kind = row["Type"].strip()
+            if kind not in COLOR_TYPES:
+                raise ValueError(f"알 수 없는 조합 타입: {kind} ({name})")
+            scores[(name, COLOR_TYPES[kind])] = (int(row["Base Score"]), int(row["Multiplier"]))
+
+    known = {name for name, _, _ in COMBO_CONDITIONS}
+    unknown = sorted({name for name, _ in scores} - known)
+    if unknown:
+        raise ValueError(f"조건이 정의되지 않은 조합: {', '.join(unknown)}")
+
+    definitions = []
+    for name, condition, params in COMBO_CONDITIONS:
+        # 같은 조합은 싱글컬러가 레인보우보다 먼저 평가됨
+        for is_color in (True, False):
+            if (name, is_color) not in scores:
+                continue
+            base_score, multiplier = scores[(name, is_color)]
+            definitions.append({
+                "name": name,
+                "is_color": is_color,
+                "condition": condition,
+                "params": list(params),
+                "base_score": base_score,
+                "multiplier": multiplier,
+            })
+    return definitions
+
+
+def load_stages(path=STAGES_CSV):
+    """stages.csv → [{"stage", "round", "target_score"}]"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [{"stage": int(row["stage"]), "round": int(row["round"]), "target_score": int(row["target_score"])}
+                for row in csv.DictReader(f)]
+
+
+def combo_label(definition):
+    return f"{definition['name']} ({'싱글컬러' if definition['is_color'] else '레인보우'})"
+
+
+# ============================================================================
+# 참조 구현 (한 손씩)
+#   dice: [{"value": 1~6, "color": 0~4, "type": 0}, ...]
+# ============================================================================
+def eval_combo(dice, definitions):
+    """(정의 인덱스, 점수) - 조합이 아니면 (-1, 0). 특수 주사위 효과 포함"""
+    for index, definition in enumerate(definitions):
+        if not CONDITIONS[definition["condition"]](dice, *definition["params"]):
+            continue
+        if definition["is_color"]:
+            if not _all_same_color(dice):
+                continue
+        elif not _all_different_colors(dice):
+            continue
+        return index, combo_points(dice, definition)
+    return -1, 0
+
+
+def combo_points(dice, definition):
+    """(기본 점수 + 눈 합) × 배율 (score_manager.gd의 Plus/Multiply 보정 포함)"""
+    base_score = definition["base_score"] + PLUS_BONUS * sum(1 for d in dice if d["type"] == TYPE_PLUS)
+    multiplier = definition["multiplier"] * 2 ** sum(1 for d in dice if d["type"] == TYPE_MULTIPLY)
+    return (base_score + sum(d["value"] for d in dice)) * multiplier
+
+
+def is_n_of_a_kind(dice, n):
+    if len(dice) != n:
+        return False
+    faceless, counts = _split_faceless(dice)
+    if faceless == n:
+        return True
+    return any(count + faceless >= n for count in counts.values())
+
+
+def is_two_pair(dice):
+    if len(dice) != 4:
+        return False
+    faceless, counts = _split_faceless(dice)
+    pairs = 0
+    for count in sorted(counts.values(), reverse=True):
+        if count >= 2:
+            pairs += 1
+        elif count == 1 and faceless >= 1:
+            pairs += 1
+            faceless -= 1
+    pairs += faceless // 2
+    return pairs >= 2
+
+
+def is_full_house(dice):
+    if len(dice) != 5:
+        return False
+    faceless, counts = _split_faceless(dice)
+    if faceless >= 2:
+        return True
+    vals = sorted(counts.values(), reverse=True)
+    if faceless == 1:
+        return len(vals) >= 2 and ((vals[0] >= 2 and vals[1] >= 2) or (vals[0] >= 3 and vals[1] >= 1))
+    return len(vals) == 2 and vals[0] >= 3 and vals[1] >= 2
+
+
+def is_straight(dice, min_length):
+    if len(dice) != min_length:
+        return False
+    faceless, counts = _split_faceless(dice)
+    unique_vals = sorted(counts)
+    if len(unique_vals) + faceless < min_length:
+        return False
+    if not unique_vals:
+        return True
+    needed = sum(b - a - 1 for a, b in zip(unique_vals, unique_vals[1:]))
+    return needed <= faceless
+
+
+CONDITIONS = {
+    "is_n_of_a_kind": is_n_of_a_kind,
+    "is_two_pair": is_two_pair,
+    "is_full_house": is_full_house,
+    "is_straight": is_straight,
+}
+
+
+def _split_faceless(dice):
+    faceless = 0
+    counts = {}
+    for d in dice:
+        if d["type"] == TYPE_FACELESS:
+            faceless += 1
+        else:
+            counts[d["value"]] = counts.get(d["value"], 0) + 1
+    return faceless, counts
+
+
+def _all_same_color(dice):
+    colors = {d["color"] for d in dice if d["type"] != TYPE_PRISM}
+    return bool(dice) and len(colors) <= 1
+
+
+def _all_different_colors(dice):
+    colors = [d["color"] for d in dice if d["type"] != TYPE_PRISM]
+    return bool(dice) and len(colors) == len(set(colors))
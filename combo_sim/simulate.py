@@ -0,0 +1,334 @@
+"""라운드 단위 몬테카를로 점수 시뮬레이터
+
+게임 N개를 배열로 묶어 game_hud.gd의 라운드 흐름을 그대로 돌립니다.
+
+  1. 라운드 시작: 새 가방(색상별 8개)에서 5개를 뽑아 눈을 굴린 채로 투자 영역에 둠
+  2. 턴마다(처음 굴림 + 턴 종료 4회 = 5번): 5개를 뽑아 굴림
+  3. 정책(greedy): 투자 + 손 주사위 중 점수가 가장 큰 3~5개 조합을 조합이 없을 때까지 제출
+  4. 남은 손 주사위는 투자 횟수가 남아 있으면 한 번의 투자(1회 차감)로 투자 영역의 빈 칸만큼
+     옮기고 나머지는 버림. 빈 칸이 없으면 투자하지 않음 (횟수 유지)
+
+stages.csv의 라운드마다 목표 점수 달성 확률과 점수 분포를 출력합니다.
+
+    python -m combo_sim.simulate --games 20000
+    python -m combo_sim.simulate --extra W:4 R:8 --json sim.json   # Faceless 흰색, Prism 빨강 추가
+    python -m combo_sim.simulate --benchmark
+"""
+import argparse
+import itertools
+import json
+import sys
+import time
+
+import numpy as np
+
+from . import bag as dice_bag
+from . import evaluator
+from . import rules
+
+# scripts/main.gd, stage_manager.gd, game_hud.gd 기본값
+TURNS = 4
+INVESTS = 5
+INITIAL_INVEST = 5
+MAX_INVESTED_DICE = 10
+
+MIN_COMBO_DICE = 3
+
+_subset_tables = {}
+
+
+# ============================================================================
+# 최선 조합 찾기
+# ============================================================================
+def subset_table(pool_size, k):
+    """pool_size개 중 k개 조합의 인덱스 (C, k)"""
+    key = (pool_size, k)
+    if key not in _subset_tables:
+        _subset_tables[key] = np.array(list(itertools.combinations(range(pool_size), k)), dtype=np.intp).reshape(-1, k)
+    return _subset_tables[key]
+
+
+def score_subsets(values, colors, types, valid, compiled):
+    """게임마다 유효한 주사위의 모든 3~5개 조합 점수
+
+    반환: (점수 (N, C), 정의 인덱스 (N, C), 조합별 슬롯 비트마스크 (N, C))
+    """
+    n = values.shape[0]
+    # 유효한 주사위를 앞으로 모아서 실제로 필요한 풀 크기만큼만 조합을 만듭니다
+    order = np.argsort(~valid, axis=1, kind="stable")
+    pool_size = int(valid.sum(axis=1).max()) if n else 0
+    order = order[:, :pool_size]
+    rows = np.arange(n)[:, None]
+    codes = evaluator.die_codes(values[rows, order], colors[rows, order], types[rows, order])
+    # 빈 슬롯은 비트 하나를 더해서 그 슬롯이 들어간 조합을 표시 (아래에서 0점 처리)
+    invalid = (~valid[rows, order]).astype(np.int64)
+    slot_bits = (np.int64(1) << order.astype(np.int64)) | (invalid << 62)
+
+    points_parts, index_parts, bits_parts = [], [], []
+    for k in range(MIN_COMBO_DICE, min(rules.HAND_SIZE, pool_size) + 1):
+        table = subset_table(pool_size, k)
+        # 조합 키 = 구성 주사위 코드의 합 (열 단위 gather)
+        keys = [code[:, table[:, 0]].copy() for code in codes]
+        bits = slot_bits[:, table[:, 0]].copy()
+        for j in range(1, k):
+            for key, code in zip(keys, codes):
+                key += code[:, table[:, j]]
+            bits |= slot_bits[:, table[:, j]]
+        index, points = evaluator.evaluate_keys(*keys, compiled)
+        points_parts.append(np.where(bits >> 62 & 1, 0, points))
+        index_parts.append(index)
+        bits_parts.append(bits & ~(np.int64(1) << 62))
+    if not points_parts:
+        empty = np.zeros((n, 0), dtype=np.int64)
+        return empty, empty.astype(np.int16), empty
+    return np.hstack(points_parts), np.hstack(index_parts), np.hstack(bits_parts)
+
+
+def submit_greedy(values, colors, types, valid, compiled, picks=None):
+    """점수가 가장 큰 조합부터 겹치지 않게 계속 제출 (valid를 갱신)
+
+    조합 점수는 턴마다 한 번만 계산하고, 제출한 주사위가 들어간 조합만 지워 가며 고릅니다.
+    picks 목록을 주면 제출마다 (제출한 게임 마스크, 슬롯 비트마스크, 정의 인덱스)를 덧붙입니다.
+    반환: (게임별 획득 점수 (N,), 제출된 정의 인덱스 목록)
+    """
+    n = values.shape[0]
+    points, index, bits = score_subsets(values, colors, types, valid, compiled)
+    gained = np.zeros(n, dtype=np.int64)
+    used = np.zeros(n, dtype=np.int64)
+    submitted = []
+    all_rows = np.arange(n)
+    while points.shape[1]:
+        pick = points.argmax(axis=1)
+        best = points[all_rows, pick]
+        submit = best > 0
+        if not submit.any():
+            break
+        gained += best
+        submitted.append(index[all_rows, pick][submit])
+        if picks is not None:
+            picks.append((submit, bits[all_rows, pick], index[all_rows, pick]))
+        used[submit] |= bits[all_rows, pick][submit]
+        points[(bits & used[:, None]) != 0] = 0
+
+    for slot in range(valid.shape[1]):
+        valid[:, slot] &= (used >> slot) & 1 == 0
+    return gained, submitted
+
+
+# ============================================================================
+# 라운드 시뮬레이션
+# ============================================================================
+def simulate_rounds(definitions, games, seed=0, extra=(), turns=TURNS, invests=INVESTS, chunk=2000, log=None):
+    """게임 games개의 라운드 최종 점수 (games,)와 조합별 제출 횟수
+
+    log 목록을 주면 제출한 조합마다 한 행씩 기록합니다 (SubmissionLog.rows 형식, 조커 평가용).
+    """
+    compiled = evaluator.compile_definitions(definitions)
+    rng = np.random.default_rng(seed)
+    bag_colors, bag_types = dice_bag.standard_bag(extra=extra)
+    scores = []
+    combo_counts = np.zeros(len(compiled.definitions), dtype=np.int64)
+    for start in range(0, games, chunk):
+        n = min(chunk, games - start)
+        chunk_log = [] if log is not None else None
+        draws = draw_chunk(rng, n, bag_colors, bag_types, turns)
+        chunk_scores, chunk_counts = play_chunk(draws, compiled, invests, chunk_log)
+        if log is not None:
+            for row in chunk_log:
+                row["game"] += start
+                log.append(row)
+        scores.append(chunk_scores)
+        combo_counts += chunk_counts
+    return np.concatenate(scores), combo_counts
+
+
+def draw_chunk(rng, n, bag_colors, bag_types, turns=TURNS):
+    """게임 n개가 라운드 동안 뽑고 굴리는 주사위 [(colors, types, values) (n, k), ...]
+
+    첫 항목은 라운드 시작 투자, 나머지는 턴마다 뽑는 손입니다. 가방에서 뽑는 순서와
+    눈은 정책과 무관하므로 미리 뽑아 두면 같은 주사위로 여러 정의를 비교할 수 있습니다.
+    """
+    bag = dice_bag.BagBatch(rng, n, bag_colors, bag_types)
+    c, t = bag.draw(INITIAL_INVEST)
+    draws = [(c, t, bag.roll(c.shape))]
+    for _ in range(turns + 1):
+        if not bag.can_draw(rules.HAND_SIZE):
+            break  # end_challenge_due_to_empty_bag
+        c, t = bag.draw(rules.HAND_SIZE)
+        draws.append((c, t, bag.roll(c.shape)))
+    return draws
+
+
+def play_chunk(draws, compiled, invests=INVESTS, log=None):
+    """draw_chunk로 뽑아 둔 주사위로 greedy 정책을 돌림 → (점수 (n,), 조합별 제출 횟수)"""
+    n = draws[0][0].shape[0]
+    slots = MAX_INVESTED_DICE + rules.HAND_SIZE
+    values = np.zeros((n, slots), dtype=np.int8)
+    colors = np.zeros((n, slots), dtype=np.int8)
+    types = np.zeros((n, slots), dtype=np.int8)
+    valid = np.zeros((n, slots), dtype=bool)
+
+    # 라운드 시작 투자 (_invest_initial_dice)
+    c, t, v = draws[0]
+    count = c.shape[1]
+    colors[:, :count], types[:, :count], values[:, :count] = c, t, v
+    valid[:, :count] = True
+
+    score = np.zeros(n, dtype=np.int64)
+    combo_counts = np.zeros(len(compiled.definitions), dtype=np.int64)
+    invests_left = np.full(n, invests, dtype=np.int16)
+    rows = np.arange(n)[:, None]
+    hand = slice(MAX_INVESTED_DICE, slots)
+
+    for turn, (c, t, v) in enumerate(draws[1:]):
+        colors[:, hand], types[:, hand], values[:, hand] = c, t, v
+        valid[:, hand] = True
+
+        # 조합이 남아 있는 동안 가장 높은 조합부터 제출
+        picks = [] if log is not None else None
+        field = valid[:, :MAX_INVESTED_DICE].sum(axis=1)
+        gained, submitted = submit_greedy(values, colors, types, valid, compiled, picks)
+        if log is not None:
+            _log_picks(log, picks, turn, field, values, colors, types)
+        score += gained
+        for index in submitted:
+            combo_counts += np.bincount(index, minlength=len(combo_counts))
+
+        # 남은 손 주사위 투자: game_hud._on_invest_pressed는 선택한 주사위를 한 번에(1회 차감) 옮기고
+        # 빈 칸보다 많이 고르면 거절하므로, 빈 칸 수만큼 골라 한 번 투자하고 나머지는 버림
+        free = MAX_INVESTED_DICE - valid[:, :MAX_INVESTED_DICE].sum(axis=1)
+        investing = (invests_left > 0) & (free > 0) & valid[:, hand].any(axis=1)
+        candidates = valid.copy()
+        candidates[:, hand] &= investing[:, None]
+        order = np.argsort(~candidates, axis=1, kind="stable")[:, :MAX_INVESTED_DICE]
+        for array in (values, colors, types):
+            array[:, :MAX_INVESTED_DICE] = array[rows, order]
+        valid[:, :MAX_INVESTED_DICE] = candidates[rows, order]
+        valid[:, hand] = False
+        invests_left -= investing
+    return score, combo_counts
+
+
+def _log_picks(log, picks, turn, field, values, colors, types):
+    """제출 하나당 행 하나: 게임, 턴, 턴 내 순서, 주사위 (최대 5개), 정의 인덱스, 제출 전 투자 영역 주사위 수"""
+    slots = values.shape[1]
+    for order, (submit, bits, index) in enumerate(picks):
+        games = np.flatnonzero(submit)
+        in_combo = (bits[games, None] >> np.arange(slots)) & 1 == 1
+        # 제출한 슬롯을 앞으로 모아서 (M, 5)로 자름
+        slot_order = np.argsort(~in_combo, axis=1, kind="stable")[:, :rules.HAND_SIZE]
+        rows = games[:, None]
+        log.append({
+            "game": games,
+            "turn": np.full(len(games), turn, dtype=np.int16),
+            "order": np.full(len(games), order, dtype=np.int16),
+            "values": values[rows, slot_order],
+            "colors": colors[rows, slot_order],
+            "types": types[rows, slot_order],
+            "used": np.take_along_axis(in_combo, slot_order, axis=1),
+            "index": index[games],
+            "field": field[games],
+        })
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+
+def stage_report(scores, stages):
+    report = []
+    for stage in stages:
+        report.append(dict(stage, clear_rate=float((scores >= stage["target_score"]).mean())))
+    return report
+
+
+def distribution(scores):
+    return {
+        "games": int(len(scores)),
+        "mean": float(scores.mean()),
+        "std": float(scores.std()),
+        "percentiles": {str(p): float(np.percentile(scores, p)) for p in PERCENTILES},
+        "histogram": _histogram(scores),
+    }
+
+
+def _histogram(scores, bins=20):
+    counts, edges = np.histogram(scores, bins=bins)
+    return [{"from": int(edges[i]), "to": int(edges[i + 1]), "count": int(counts[i])} for i in range(len(counts))]
+
+
+def print_report(dist, stages_report, combo_counts, definitions):
+    print(f"\n라운드 점수 분포 ({dist['games']}게임): 평균 {dist['mean']:.1f}, 표준편차 {dist['std']:.1f}")
+    print("  " + "  ".join(f"p{p}={dist['percentiles'][str(p)]:.0f}" for p in PERCENTILES))
+
+    print(f"\n{'스테이지':>6} {'라운드':>4} {'목표':>6} {'달성 확률':>9}")
+    for row in stages_report:
+        print(f"{row['stage']:>6} {row['round']:>6} {row['target_score']:>8} {row['clear_rate']:>10.1%}")
+
+    total = combo_counts.sum()
+    print(f"\n제출된 조합 ({total}회)")
+    for i in np.argsort(-combo_counts):
+        if combo_counts[i]:
+            label = rules.combo_label(definitions[i])
+            print(f"  {label:<24} {combo_counts[i]:>9} ({combo_counts[i] / total:.1%})")
+
+
+def parse_extra(items):
+    """["W:4", "R:8"] → [("W", 4), ("R", 8)]"""
+    extra = []
+    for item in items or []:
+        color_key, _, type_index = item.partition(":")
+        if color_key not in rules.COLOR_KEYS or not type_index.isdigit():
+            raise SystemExit(f"❌ 잘못된 추가 주사위: {item} (예: W:4)")
+        extra.append((color_key, int(type_index)))
+    return extra
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.simulate", description="조합 점수 몬테카를로 시뮬레이터")
+    parser.add_argument("--games", type=int, default=20000, help="시뮬레이션할 라운드 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=2000, help="한 번에 배열로 묶을 게임 수")
+    parser.add_argument("--turns", type=int, default=TURNS, help="턴 종료 횟수 (굴림 = turns + 1)")
+    parser.add_argument("--invests", type=int, default=INVESTS, help="라운드당 투자 횟수")
+    parser.add_argument("--extra", nargs="*", metavar="COLOR:TYPE", help="가방에 추가할 특수 주사위 (예: W:4 R:8)")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    parser.add_argument("--stages", default=rules.STAGES_CSV, help="stages.csv 경로")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--benchmark", action="store_true", help="평가기 처리량만 측정")
+    args = parser.parse_args(argv)
+
+    definitions = rules.load_definitions(args.combos)
+    if args.benchmark:
+        print("평가기 처리량 (프로세스 1개, 손 100만 개씩 - CPU에 따라 크게 다름)")
+        for k in (3, 4, 5):
+            print(f"  {k}개 손: {evaluator.benchmark(definitions, k=k) / 1e6:.2f}M hands/s")
+        return 0
+
+    started = time.perf_counter()
+    scores, combo_counts = simulate_rounds(
+        definitions, args.games, seed=args.seed, extra=parse_extra(args.extra),
+        turns=args.turns, invests=args.invests, chunk=args.chunk)
+    elapsed = time.perf_counter() - started
+
+    dist = distribution(scores)
+    stages_report = stage_report(scores, rules.load_stages(args.stages))
+    print_report(dist, stages_report, combo_counts, definitions)
+    print(f"\n✅ {args.games}게임 {elapsed:.1f}초 ({args.games / elapsed:.0f} 라운드/초)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": {k: getattr(args, k) for k in ("games", "seed", "turns", "invests", "extra")},
+                "distribution": dist,
+                "stages": stages_report,
+                "combos": {rules.combo_label(d): int(c) for d, c in zip(definitions, combo_counts)},
+            }, f, ensure_ascii=False, indent=2)
+        print(f"결과: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
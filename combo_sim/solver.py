@@ -0,0 +1,571 @@
+"""투자/제출 최적 전략 솔버 (expectimax)
+
+한 라운드를 "턴 사이 상태"(투자 영역 주사위, 가방 구성, 남은 굴림, 남은 투자 횟수)의
+기대값 문제로 보고 굴림(확률 노드)과 제출/투자 선택(결정 노드)을 번갈아 계산합니다.
+목표는 두 가지입니다.
+
+  score  라운드 기대 점수 최대화
+  clear  stages.csv 라운드별 목표 점수 달성 확률 최대화 (남은 목표 점수가 상태에 들어감)
+
+상태 공간을 줄이는 방법
+  - 색상 정규화: 규칙은 색상 이름과 무관하므로 색상마다 (가방에 남은 개수, 투자 주사위)를
+    서명으로 만들어 정렬한 것을 상태 키로 씀 → 색상만 바꾼 상태는 한 키로 모임
+  - 남은 투자 횟수는 앞으로 투자가 의미 있는 굴림 수(남은 굴림 - 1)까지만 구분
+  - 제출 미루기: 점수는 제출 시점과 무관하므로 투자 영역에 둘 수 있는 조합은 지금 낼 이유가
+    없음 → 투자 영역(최대 10개)에 남길 수 있는데 제출하는 조합이 있는 선택지는 버림
+  - 마지막 굴림은 남은 주사위 전체의 최대 제출(정확한 집합 패킹)으로 바로 계산
+  - 결정 노드의 후보는 "이번 점수 + 남길 주사위로 확보된 점수" 순으로 상위 width개만 전개
+
+확률 노드는 굴림마다 정해진 개수의 손을 뽑아 평균합니다 (표본 평균 근사). 뽑는 손은 가방
+구성과 남은 굴림으로 시드를 정하므로, 같은 결정 노드의 형제 선택지는 같은 손으로 비교되고
+(common random numbers) 메모에 저장된 값은 같은 키에 대해 항상 같습니다.
+메모는 최대 크기를 넘으면 가장 오래 안 쓴 상태부터 버립니다. 표본이 적으면 표본 트리의
+값은 낙관적이므로, --evaluate 게임 수만큼 새 무작위 라운드를 정책대로 실제 진행해서 같이 보고합니다.
+
+    python -m combo_sim.solver
+    python -m combo_sim.solver --samples 6,4,3,3,6 --width 4 --openings 24
+    python -m combo_sim.solver --objective score --json solver.json
+"""
+import argparse
+import heapq
+import itertools
+import json
+import sys
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from . import bag as dice_bag
+from . import evaluator
+from . import rules
+from . import simulate
+
+# 남은 굴림 5 → 1 순서의 확률 노드 표본 수
+DEFAULT_SAMPLES = (3, 3, 2, 2, 4)
+DEFAULT_OPENINGS = 8
+DEFAULT_WIDTH = 2
+DEFAULT_EVALUATE = 20
+DEFAULT_MEMO = 500_000
+
+
+# ============================================================================
+# 메모
+# ============================================================================
+class BoundedMemo:
+    """최대 크기가 있는 LRU 메모 (hits/misses/evictions 통계 포함)"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "states": len(self.data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+# ============================================================================
+# 주사위 풀 (투자 + 손)의 조합과 최대 제출
+#   주사위: (눈, 색상, 타입)
+# ============================================================================
+class Pool:
+    """주사위 풀 하나의 모든 3~5개 조합과 부분집합별 최대 제출 점수"""
+
+    def __init__(self, dice, compiled):
+        self.dice = dice
+        self.size = len(dice)
+        self.by_low = [[] for _ in range(self.size)]
+        self.useful = 0
+        self._best = {0: 0}
+        if self.size < simulate.MIN_COMBO_DICE:
+            return
+        values, colors, types = (np.array([d[i] for d in dice], dtype=np.intp) for i in range(3))
+        codes = evaluator.die_codes(values, colors, types)
+        bits = np.int64(1) << np.arange(self.size, dtype=np.int64)
+        for k in range(simulate.MIN_COMBO_DICE, min(rules.HAND_SIZE, self.size) + 1):
+            table = simulate.subset_table(self.size, k)
+            keys = [code[table].sum(axis=1) for code in codes]
+            _, points = evaluator.evaluate_keys(*keys, compiled)
+            hit = np.flatnonzero(points > 0)
+            for mask, value in zip(bits[table[hit]].sum(axis=1).tolist(), points[hit].tolist()):
+                # 가장 낮은 주사위 기준으로 묶어 두면 패킹 재귀가 조합마다 한 번씩만 봄
+                self.by_low[(mask & -mask).bit_length() - 1].append((mask, value))
+                self.useful |= mask
+
+    def best(self, avail):
+        """avail 비트마스크 안에서 겹치지 않게 낼 수 있는 최대 점수"""
+        # 어떤 조합에도 안 들어가는 주사위는 빼고 메모 (같은 값의 키가 하나로 모임)
+        avail &= self.useful
+        value = self._best.get(avail)
+        if value is not None:
+            return value
+        low = avail & -avail
+        value = self.best(avail ^ low)
+        for mask, points in self.by_low[low.bit_length() - 1]:
+            if mask & avail == mask:
+                value = max(value, points + self.best(avail ^ mask))
+        self._best[avail] = value
+        return value
+
+    def packing(self, avail):
+        """best(avail)를 내는 조합 마스크 목록"""
+        masks = []
+        while avail:
+            target = self.best(avail)
+            if target == 0:
+                break
+            low = avail & -avail
+            if self.best(avail ^ low) == target:
+                avail ^= low
+                continue
+            for mask, points in self.by_low[low.bit_length() - 1]:
+                if mask & avail == mask and points + self.best(avail ^ mask) == target:
+                    masks.append(mask)
+                    avail ^= mask
+                    break
+        return masks
+
+
+# ============================================================================
+# 상태 키
+#   (남은 굴림, 유효 투자 횟수, 색상 서명 정렬 튜플, 남은 목표 점수 또는 None)
+#   색상 서명 = (타입별 가방 개수, 정렬된 투자 주사위 (눈, 타입))
+# ============================================================================
+def canonical_key(invested, bag_counts, rolls_left, invests_left, need, kind_types):
+    signatures = []
+    for color in range(len(rules.COLOR_KEYS)):
+        counts = tuple(bag_counts.get((color, t), 0) for t in kind_types)
+        dice = tuple(sorted((v, t) for v, c, t in invested if c == color))
+        signatures.append((counts, dice))
+    useful = min(invests_left, max(rolls_left - 1, 0))
+    return rolls_left, useful, tuple(sorted(signatures)), need
+
+
+def key_state(key, kind_types):
+    """키 → (투자 주사위 목록, {(색상, 타입): 개수}) - 색상은 서명 순서로 다시 붙임"""
+    _, _, signatures, _ = key
+    invested = []
+    bag_counts = {}
+    for color, (counts, dice) in enumerate(signatures):
+        invested += [(v, color, t) for v, t in dice]
+        for t, count in zip(kind_types, counts):
+            if count:
+                bag_counts[(color, t)] = count
+    return invested, bag_counts
+
+
+# ============================================================================
+# 솔버
+# ============================================================================
+class Solver:
+    def __init__(self, definitions, samples=DEFAULT_SAMPLES, width=DEFAULT_WIDTH, memo_size=DEFAULT_MEMO,
+                 seed=0, invests=simulate.INVESTS, extra=()):
+        self.compiled = evaluator.compile_definitions(definitions)
+        self.samples = tuple(samples)
+        self.width = width
+        self.seed = seed
+        self.invests = invests
+        bag_colors, bag_types = dice_bag.standard_bag(extra=extra)
+        self.bag = {}
+        for c, t in zip(bag_colors.tolist(), bag_types.tolist()):
+            self.bag[(c, t)] = self.bag.get((c, t), 0) + 1
+        self.kind_types = sorted({t for _, t in self.bag})
+        self.memo = BoundedMemo(memo_size)
+        self.decisions = 0
+
+    # ------------------------------------------------------------------
+    # 확률 노드
+    # ------------------------------------------------------------------
+    def _samples_for(self, rolls_left):
+        return self.samples[max(len(self.samples) - rolls_left, 0)]
+
+    def draw_hands(self, bag_counts, rolls_left, count, size=rules.HAND_SIZE):
+        """가방에서 size개씩 count번 뽑아 굴린 손 목록 (가방 구성으로 시드를 정함)
+
+        같은 개수의 색상은 서로 바꿔도 분포가 같으므로, 색상을 (개수, 색상) 순으로 줄 세운
+        순위로 시드를 만들고 뽑은 뒤 실제 색상으로 되돌립니다.
+        """
+        ranked = sorted(range(len(rules.COLOR_KEYS)),
+                        key=lambda c: (tuple(bag_counts.get((c, t), 0) for t in self.kind_types), c))
+        kinds = []
+        for rank, color in enumerate(ranked):
+            for t in self.kind_types:
+                kinds += [(rank, t)] * bag_counts.get((color, t), 0)
+        signature = repr((rolls_left, count, size, [(r, t) for r, t in kinds]))
+        rng = np.random.default_rng([self.seed, zlib.crc32(signature.encode())])
+        hands = []
+        for _ in range(count):
+            picked = rng.choice(len(kinds), size=min(size, len(kinds)), replace=False)
+            values = rng.integers(1, 7, size=len(picked))
+            hands.append([(int(v), ranked[kinds[i][0]], kinds[i][1]) for v, i in zip(values, sorted(picked))])
+        return hands
+
+    def value(self, key):
+        """턴 사이 상태의 값 (score: 기대 점수, clear: 목표 달성 확률)"""
+        rolls_left, _, _, need = key
+        if need is not None and need <= 0:
+            return 1.0
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+
+        invested, bag_counts = key_state(key, self.kind_types)
+        if rolls_left == 0 or sum(bag_counts.values()) < rules.HAND_SIZE:
+            # 굴림이 없거나 가방이 비면 라운드 끝 (남은 투자 주사위는 그 전에 제출)
+            banked = Pool(invested, self.compiled).best((1 << len(invested)) - 1)
+            result = banked if need is None else float(banked >= need)
+        else:
+            hands = self.draw_hands(bag_counts, rolls_left, self._samples_for(rolls_left))
+            total = 0.0
+            for hand in hands:
+                total += self.decide(invested, hand, bag_counts, rolls_left, key[1], need)[0]
+            result = total / len(hands)
+        self.memo.put(key, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # 결정 노드
+    # ------------------------------------------------------------------
+    def decide(self, invested, hand, bag_counts, rolls_left, invests_left, need):
+        """굴린 손에 대한 최선 (값, 제출 조합 마스크 목록, 남길 주사위 마스크, Pool)"""
+        self.decisions += 1
+        pool = Pool(invested + hand, self.compiled)
+        everything = (1 << pool.size) - 1
+        if rolls_left == 1:
+            # 마지막 굴림: 전부 제출
+            points = pool.best(everything)
+            value = points if need is None else float(points >= need)
+            return value, pool.packing(everything), 0, pool
+
+        after = dict(bag_counts)
+        for _, color, type_index in hand:
+            after[(color, type_index)] -= 1
+        # 같은 상태로 가는 선택지가 겹칠 수 있으므로 width의 몇 배를 뽑아 둠
+        limit = self.width * 4 if self.width else None
+        candidates = self.candidates(pool, len(invested), invests_left > 0, invests_left < rolls_left - 1, limit)
+
+        # 순위 순으로 상태 키를 만들면서 같은 상태로 가는 선택지는 처음 것(이번 점수가 가장 큰 것)만 남김
+        hand_bits = ((1 << pool.size) - 1) ^ ((1 << len(invested)) - 1)
+        ranked = {}
+        for reward, kept, used in candidates:
+            kept_dice = [pool.dice[i] for i in range(pool.size) if kept >> i & 1]
+            rest = None if need is None else need - reward
+            key = canonical_key(kept_dice, after, rolls_left - 1, invests_left - bool(kept & hand_bits), rest,
+                                self.kind_types)
+            if key not in ranked:
+                ranked[key] = (reward, kept, used)
+                if len(ranked) == self.width:
+                    break
+        best = None
+        for key, (reward, kept, used) in ranked.items():
+            if need is None:
+                value = reward + self.value(key)
+            elif reward + pool.best(kept) >= need:
+                value = 1.0
+            else:
+                value = self.value(key)
+            if best is None or value > best[0]:
+                best = (value, pool.packing(used), kept, pool)
+            if need is not None and best[0] >= 1.0:
+                break
+        return best
+
+    def candidates(self, pool, invested_count, can_invest, spare_invest, limit):
+        """순위 순 (이번 점수, 남길 주사위 마스크, 제출할 주사위 마스크) 목록
+
+        순위 = 이번 점수 + 남길 주사위만으로 확보된 최대 점수. 조합 집합을 깊이 우선으로 늘려 가며
+          - 남길 자리가 남는데 제출한 조합이 있으면 (미루는 쪽이 손해가 없으므로) 그 가지를 자름
+          - 가지의 순위 상한(이번 점수 + 남은 주사위 전체의 최대 점수)이 limit번째 순위 이하면 자름
+        남는 손 주사위가 자리보다 많으면 어느 것을 남길지 나눕니다.
+        """
+        everything = (1 << pool.size) - 1
+        hand_bits = everything ^ ((1 << invested_count) - 1)
+        combos = sorted((combo for group in pool.by_low for combo in group), key=lambda c: -c[1])
+        top = []  # (순위, 순번, 후보) 최소 힙
+        counter = itertools.count()
+
+        def push(rank, candidate):
+            item = (rank, next(counter), candidate)
+            if limit is None or len(top) < limit:
+                heapq.heappush(top, item)
+            elif rank > top[0][0]:
+                heapq.heapreplace(top, item)
+
+        def keep_choices(used):
+            rest = everything ^ used
+            invested_rest = rest & ~hand_bits
+            hand_rest = rest & hand_bits if can_invest else 0
+            slots = simulate.MAX_INVESTED_DICE - bin(invested_rest).count("1")
+            if slots < 0:
+                return None, []
+            hand_indices = [i for i in range(pool.size) if hand_rest >> i & 1]
+            slack = slots - len(hand_indices)
+            if slack >= 0:
+                kepts = [invested_rest | hand_rest]
+            else:
+                slack = 0
+                kepts = [invested_rest | sum(1 << i for i in chosen)
+                         for chosen in itertools.combinations(hand_indices, slots)]
+            if spare_invest and hand_rest:
+                # 투자 횟수를 아끼는 선택 (남은 손 주사위는 버림)
+                kepts.append(invested_rest)
+            return slack, kepts
+
+        def visit(start, used, reward, smallest):
+            slack, kepts = keep_choices(used)
+            if slack is not None:
+                if smallest <= slack:
+                    return  # 이 조합들 중 하나는 투자 영역에 남겨 둘 수 있음 → 더 늘려도 마찬가지
+                for kept in kepts:
+                    push(reward + pool.best(kept), (reward, kept, used))
+            for i in range(start, len(combos)):
+                mask, points = combos[i]
+                if mask & used:
+                    continue
+                if limit is not None and len(top) == limit and \
+                        reward + points + pool.best(everything ^ used ^ mask) <= top[0][0]:
+                    continue
+                # 투자 주사위만으로 된 조합은 투자 횟수와 무관하게 남길 수 있음
+                size = bin(mask).count("1") if (mask & hand_bits == 0 or can_invest) else pool.size
+                visit(i + 1, used | mask, reward + points, min(smallest, size))
+
+        visit(0, 0, 0, pool.size + 1)
+        return [candidate for _, _, candidate in sorted(top, key=lambda item: (-item[0], item[1]))]
+
+    # ------------------------------------------------------------------
+    # 라운드 시작
+    # ------------------------------------------------------------------
+    def round_value(self, rolls, need=None, openings=DEFAULT_OPENINGS):
+        """라운드 시작 기대값: 처음 투자 주사위 openings개 표본 평균"""
+        values = []
+        for opening in self.draw_hands(self.bag, rolls + 1, openings, simulate.INITIAL_INVEST):
+            bag_counts = dict(self.bag)
+            for _, color, type_index in opening:
+                bag_counts[(color, type_index)] -= 1
+            key = canonical_key(opening, bag_counts, rolls, self.invests, need, self.kind_types)
+            values.append(self.value(key))
+        return float(np.mean(values)), values
+
+    def policy(self, invested, hand, bag_counts, rolls_left, invests_left, need=None):
+        """실제 상황 하나의 최선 선택: (값, 제출 조합 [[주사위]], 남길 주사위 [주사위])"""
+        value, packing, kept, pool = self.decide(list(invested), list(hand), bag_counts,
+                                                 rolls_left, invests_left, need)
+        combos = [[pool.dice[i] for i in range(pool.size) if mask >> i & 1] for mask in packing]
+        return value, combos, [pool.dice[i] for i in range(pool.size) if kept >> i & 1]
+
+    def play_round(self, rng, rolls, need=None):
+        """새 무작위 라운드 하나를 이 정책으로 끝까지 진행한 실제 점수
+
+        확률 노드의 표본 평균은 적은 표본에서 낙관적으로 치우치므로, 정책의 실제 성능은
+        솔버가 본 적 없는 굴림으로 따로 재야 합니다.
+        """
+        kinds = [kind for kind, count in sorted(self.bag.items()) for _ in range(count)]
+        order = iter(rng.permutation(len(kinds)).tolist())
+        bag_counts = dict(self.bag)
+
+        def draw(n):
+            dice = []
+            for i in itertools.islice(order, n):
+                color, type_index = kinds[i]
+                bag_counts[(color, type_index)] -= 1
+                dice.append((int(rng.integers(1, 7)), color, type_index))
+            return dice
+
+        invested = draw(simulate.INITIAL_INVEST)
+        invests_left = self.invests
+        score = 0
+        for rolls_left in range(rolls, 0, -1):
+            if sum(bag_counts.values()) < rules.HAND_SIZE:
+                break
+            before = dict(bag_counts)
+            hand = draw(rules.HAND_SIZE)
+            # 목표를 넘긴 뒤에는 점수 목표로 계속 진행
+            rest = None if need is None or need <= score else need - score
+            _, combos, kept = self.policy(invested, hand, before, rolls_left, invests_left, rest)
+            for combo in combos:
+                score += rules.eval_combo([{"value": v, "color": c, "type": t} for v, c, t in combo],
+                                          self.compiled.definitions)[1]
+            remaining = list(invested)
+            for die in kept:
+                if die in remaining:
+                    remaining.remove(die)
+                else:
+                    invests_left -= 1  # 손 주사위를 남겼으면 투자 1회
+                    break
+            invested = kept
+        if invested:
+            score += Pool(invested, self.compiled).best((1 << len(invested)) - 1)
+        return score
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+def die_label(die):
+    value, color, type_index = die
+    suffix = "" if type_index == rules.TYPE_NORMAL else f"/{type_index}"
+    return f"{rules.COLOR_KEYS[color]}{value}{suffix}"
+
+
+def example_turns(solver, definitions, rolls, count):
+    """라운드 첫 굴림 count개에 대한 최선 선택 (score 목표)"""
+    examples = []
+    for opening in solver.draw_hands(solver.bag, rolls + 2, count, simulate.INITIAL_INVEST):
+        bag_counts = dict(solver.bag)
+        for _, color, type_index in opening:
+            bag_counts[(color, type_index)] -= 1
+        hand = solver.draw_hands(bag_counts, rolls + 3, 1)[0]
+        value, combos, kept = solver.policy(opening, hand, bag_counts, rolls, solver.invests)
+        submitted = []
+        for combo in combos:
+            index, points = rules.eval_combo([{"value": v, "color": c, "type": t} for v, c, t in combo], definitions)
+            submitted.append({"dice": [die_label(d) for d in combo],
+                              "combo": rules.combo_label(definitions[index]), "points": points})
+        examples.append({
+            "invested": [die_label(d) for d in opening],
+            "hand": [die_label(d) for d in hand],
+            "submit": submitted,
+            "keep": [die_label(d) for d in kept],
+            "expected": value,
+        })
+    return examples
+
+
+def print_report(result):
+    settings = result["settings"]
+    print(f"\n솔버 설정: 굴림 {settings['rolls']}회, 표본 {settings['samples']}, 후보 폭 {settings['width']}, "
+          f"첫 투자 표본 {settings['openings']}")
+    if "score" in result:
+        score = result["score"]
+        print(f"\n기대 점수: 최적 {score['expected']:.1f} (표본 트리)  /  greedy {result['greedy']['mean']:.1f}"
+              f"  ({score['elapsed']:.1f}초)")
+        if "played" in score:
+            played = score["played"]
+            print(f"  새 라운드 {played['games']}게임 실제 진행: {played['mean']:.1f} ± {played['stderr']:.1f}")
+    if result["stages"]:
+        print(f"\n{'스테이지':>6} {'라운드':>4} {'목표':>6} {'최적 달성':>9} {'실제 진행':>9} {'greedy':>8} {'시간':>6}")
+        for row in result["stages"]:
+            played = f"{row['played']['clear_rate']:.1%}" if "played" in row else "-"
+            print(f"{row['stage']:>6} {row['round']:>6} {row['target_score']:>8} {row['clear_rate']:>10.1%}"
+                  f" {played:>10} {row['greedy_clear_rate']:>9.1%} {row['elapsed']:>6.1f}초")
+    for example in result.get("examples", []):
+        submit = ", ".join(f"{s['combo']} {'/'.join(s['dice'])} {s['points']}점" for s in example["submit"]) or "없음"
+        print(f"\n  투자 {' '.join(example['invested'])} + 손 {' '.join(example['hand'])}")
+        print(f"    → 제출: {submit}")
+        print(f"    → 투자 영역: {' '.join(example['keep'])}  (기대 {example['expected']:.1f})")
+    memo = result["memo"]
+    print(f"\n메모: 상태 {memo['states']}개, 적중률 {memo['hit_rate']:.1%}, 제거 {memo['evictions']}개, "
+          f"결정 노드 {result['decisions']}개")
+
+
+def play_summary(solver, rolls, games, seed, need=None):
+    rng = np.random.default_rng([seed, 1 if need is None else need])
+    scores = np.array([solver.play_round(rng, rolls, need) for _ in range(games)])
+    summary = {"games": games, "mean": float(scores.mean()),
+               "stderr": float(scores.std() / np.sqrt(games)) if games > 1 else 0.0}
+    if need is not None:
+        summary["clear_rate"] = float((scores >= need).mean())
+    return summary
+
+
+def parse_samples(text):
+    samples = tuple(int(s) for s in text.split(","))
+    if not samples or min(samples) < 1:
+        raise SystemExit(f"❌ 잘못된 표본 수: {text} (예: 4,3,3,2,6)")
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m combo_sim.solver", description="투자/제출 최적 전략 솔버")
+    parser.add_argument("--objective", choices=("both", "score", "clear"), default="both",
+                        help="score: 기대 점수, clear: stages.csv 목표 달성 확률")
+    parser.add_argument("--samples", type=parse_samples, default=DEFAULT_SAMPLES,
+                        help="남은 굴림이 많은 쪽부터 확률 노드 표본 수 (쉼표 구분, 모자라면 첫 값)")
+    parser.add_argument("--openings", type=int, default=DEFAULT_OPENINGS, help="라운드 시작 투자 주사위 표본 수")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="결정 노드에서 전개할 후보 수 (0 = 전부)")
+    parser.add_argument("--memo", type=int, default=DEFAULT_MEMO, help="메모 최대 상태 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--turns", type=int, default=simulate.TURNS, help="턴 종료 횟수 (굴림 = turns + 1)")
+    parser.add_argument("--invests", type=int, default=simulate.INVESTS, help="라운드당 투자 횟수")
+    parser.add_argument("--extra", nargs="*", metavar="COLOR:TYPE", help="가방에 추가할 특수 주사위 (예: W:4 R:8)")
+    parser.add_argument("--evaluate", type=int, default=DEFAULT_EVALUATE,
+                        help="정책을 새 무작위 라운드로 실제 진행해 볼 게임 수 (0 = 생략)")
+    parser.add_argument("--greedy-games", type=int, default=20000, help="비교용 greedy 시뮬레이션 게임 수")
+    parser.add_argument("--examples", type=int, default=3, help="출력할 첫 턴 예시 수")
+    parser.add_argument("--combos", default=rules.COMBO_CSV, help="combo_definitions.csv 경로")
+    parser.add_argument("--stages", default=rules.STAGES_CSV, help="stages.csv 경로")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    definitions = rules.load_definitions(args.combos)
+    extra = simulate.parse_extra(args.extra)
+    rolls = args.turns + 1
+    solver = Solver(definitions, samples=args.samples, width=args.width, memo_size=args.memo,
+                    seed=args.seed, invests=args.invests, extra=extra)
+    greedy, _ = simulate.simulate_rounds(definitions, args.greedy_games, seed=args.seed, extra=extra,
+                                         turns=args.turns, invests=args.invests)
+    result = {
+        "settings": {"rolls": rolls, "samples": list(args.samples), "width": args.width,
+                     "openings": args.openings, "memo": args.memo, "seed": args.seed,
+                     "invests": args.invests, "extra": args.extra},
+        "greedy": {"games": args.greedy_games, "mean": float(greedy.mean())},
+        "stages": [],
+    }
+
+    if args.objective in ("both", "score"):
+        started = time.perf_counter()
+        expected, _ = solver.round_value(rolls, openings=args.openings)
+        result["score"] = {"expected": expected, "elapsed": time.perf_counter() - started}
+        if args.evaluate:
+            result["score"]["played"] = play_summary(solver, rolls, args.evaluate, args.seed)
+        result["examples"] = example_turns(solver, definitions, rolls, args.examples)
+
+    if args.objective in ("both", "clear"):
+        for stage in rules.load_stages(args.stages):
+            started = time.perf_counter()
+            clear_rate, _ = solver.round_value(rolls, need=stage["target_score"], openings=args.openings)
+            row = dict(stage, clear_rate=clear_rate,
+                       greedy_clear_rate=float((greedy >= stage["target_score"]).mean()))
+            if args.evaluate:
+                row["played"] = play_summary(solver, rolls, args.evaluate, args.seed, need=stage["target_score"])
+            row["elapsed"] = time.perf_counter() - started
+            result["stages"].append(row)
+
+    result["memo"] = solver.memo.stats()
+    result["decisions"] = solver.decisions
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"결과: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""주사위 팔레트 아틀라스 (공유 재질 익스포트 모드)
+
+모든 (타입, 색상) 변형의 본체/눈 색상을 팔레트 텍스처 한 장에 모으고,
+러프니스/메탈릭은 같은 배치의 MR 텍스처(G = 러프니스, B = 메탈릭)에 담습니다.
+각 변형 메시는 두 번째 UV("PaletteUV")로 자기 셀을 가리키므로 모든 주사위가
+재질 하나를 공유하고, 엔진은 uv_offset만 바꿔서 배칭/멀티메시로 그릴 수 있습니다.
+
+순수 파이썬 모듈입니다 (PNG도 zlib으로 직접 씀).
+"""
+import json
+import math
+import os
+import struct
+import zlib
+
+PALETTE_NAME = "dice_palette.png"
+MR_NAME = "dice_palette_mr.png"
+INDEX_NAME = "dice_palette.json"
+# 아틀라스 모드 출력 이름 접미사 (일반 익스포트의 .gltf를 덮어쓰지 않도록)
+OUTPUT_SUFFIX = "_atlas"
+
+# 스와치 한 칸의 픽셀 크기 (밉맵/선형 필터에서도 중심값이 번지지 않도록 여유)
+DEFAULT_SWATCH_PX = 8
+# 셀 = [본체 스와치][눈 스와치]
+SWATCHES_PER_CELL = 2
+
+
+# ============================================================================
+# 배치
+# ============================================================================
+def variant_key(variant):
+    return f"{variant['type']}/{variant['color']}"
+
+
+def output_name(name):
+    """일반 변형 이름 → 아틀라스 모드 출력 이름 (0_dice_red → 0_dice_red_atlas)"""
+    return name if name.endswith(OUTPUT_SUFFIX) else name + OUTPUT_SUFFIX
+
+
+def build_layout(variants, swatch_px=DEFAULT_SWATCH_PX):
+    """변형 목록 → 아틀라스 배치 (타입/색상 이름 순으로 고정되어 실행마다 같음)"""
+    keys = sorted({variant_key(v) for v in variants})
+    # 셀 가로:세로 = 2:1 → 열 수 ≈ sqrt(n / 2) 이면 정사각형에 가까움
+    cols = max(1, math.ceil(math.sqrt(len(keys) / SWATCHES_PER_CELL)))
+    rows = max(1, math.ceil(len(keys) / cols))
+    width = _next_pow2(cols * SWATCHES_PER_CELL * swatch_px)
+    height = _next_pow2(rows * swatch_px)
+
+    cells = {}
+    for i, key in enumerate(keys):
+        col, row = i % cols, i // cols
+        x0, y0 = col * SWATCHES_PER_CELL * swatch_px, row * swatch_px
+        cells[key] = {
+            "cell": [col, row],
+            "pixel_rect": [x0, y0, x0 + SWATCHES_PER_CELL * swatch_px, y0 + swatch_px],
+            "uv_offset": [x0 / width, _flip_v(y0 + swatch_px, height)],
+            "uv_rect": [x0 / width, _flip_v(y0 + swatch_px, height),
+                        (x0 + SWATCHES_PER_CELL * swatch_px) / width, _flip_v(y0, height)],
+            "body_uv": _swatch_center_uv(x0, y0, 0, swatch_px, width, height),
+            "pip_uv": _swatch_center_uv(x0, y0, 1, swatch_px, width, height),
+        }
+    return {"size": [width, height], "swatch_px": swatch_px, "cells": cells}
+
+
+def _swatch_center_uv(x0, y0, index, swatch_px, width, height):
+    cx = x0 + (index + 0.5) * swatch_px
+    cy = y0 + 0.5 * swatch_px
+    return [cx / width, _flip_v(cy, height)]
+
+
+def _flip_v(y, height):
+    # 이미지 행(위→아래) → Blender UV (아래→위)
+    return 1.0 - y / height
+
+
+def _next_pow2(n):
+    return 1 << max(0, math.ceil(math.log2(max(1, n))))
+
+
+# ============================================================================
+# 텍스처 / 인덱스 쓰기
+# ============================================================================
+def write_atlas(out_dir, variants, layout):
+    """팔레트 PNG, MR PNG, 사이드카 인덱스 JSON을 씁니다"""
+    os.makedirs(out_dir, exist_ok=True)
+    width, height = layout["size"]
+    swatch = layout["swatch_px"]
+    color_px = [[(0, 0, 0, 255)] * width for _ in range(height)]
+    mr_px = [[(0, 255, 0, 255)] * width for _ in range(height)]
+
+    index = {}
+    for variant in variants:
+        key = variant_key(variant)
+        cell = layout["cells"][key]
+        x0, y0 = cell["pixel_rect"][:2]
+        for i, part in enumerate((variant["body"], variant["pip"])):
+            rgba = tuple(_to_srgb8(c) for c in part["color"][:3]) + (255,)
+            roughness = part.get("roughness", 0.5)
+            if i == 0 and variant.get("cracks"):
+                roughness = variant["cracks"].get("crack_roughness", roughness)  # 균열 본체는 균열 거칠기
+            mr = (0, _to_byte(roughness), _to_byte(part.get("metallic") or 0.0), 255)
+            for y in range(y0, y0 + swatch):
+                for x in range(x0 + i * swatch, x0 + (i + 1) * swatch):
+                    color_px[y][x] = rgba
+                    mr_px[y][x] = mr
+        index[key] = dict(cell, name=output_name(variant["name"]), type=variant["type"], color=variant["color"])
+
+    write_png(os.path.join(out_dir, PALETTE_NAME), color_px)
+    write_png(os.path.join(out_dir, MR_NAME), mr_px)
+    with open(os.path.join(out_dir, INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump({
+            "atlas": PALETTE_NAME,
+            "metallic_roughness": MR_NAME,
+            "size": layout["size"],
+            "uv_set": 1,
+            # 같은 형태의 다른 변형으로 바꾸려면 PaletteUV를 uv_offset 차이만큼 이동
+            "variants": index,
+        }, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return os.path.join(out_dir, INDEX_NAME)
+
+
+def write_png(path, rows):
+    """RGBA8 행 목록 → PNG (zlib 최대 압축)"""
+    height, width = len(rows), len(rows[0])
+    raw = b"".join(b"\x00" + bytes(c for px in row for c in px) for row in rows)
+    write_png_raw(path, width, height, raw)
+
+
+def write_png_raw(path, width, height, raw, level=9):
+    """필터 바이트가 붙은 RGBA8 스캔라인 바이트 → PNG (tmp에 쓰고 교체)"""
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    png = (b"\x89PNG\r\n\x1a\n"
+           + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+           + chunk(b"IDAT", zlib.compress(raw, level))
+           + chunk(b"IEND", b""))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(png)
+    os.replace(tmp_path, path)
+
+
+def _to_byte(value):
+    return max(0, min(255, round(value * 255)))
+
+
+def _to_srgb8(linear):
+    # Blender 재질 색상은 선형 → 팔레트는 sRGB 텍스처
+    linear = max(0.0, min(1.0, linear))
+    srgb = linear * 12.92 if linear <= 0.0031308 else 1.055 * linear ** (1 / 2.4) - 0.055
+    return _to_byte(srgb)
@@ -0,0 +1,169 @@
+"""균열 셰이더 베이크 (Blender 전용)
+
+dice_variants.add_crack_normal()의 Voronoi → ColorRamp → Bump 그래프는 glTF로
+내보낼 수 없어서, 탄젠트 공간 노멀 맵으로 한 번 구워 둡니다. 맵은 색상과 무관하므로
+모든 색상이 같은 파일을 공유하고, 균열 재질은 Voronoi 대신 텍스처 한 번 읽기로 바뀝니다.
+균열 거칠기(crack_roughness)는 표면 전체에 같은 값이라 텍스처 대신 스칼라
+(glTF roughnessFactor)로 씁니다.
+
+맵 파일 이름에는 (지오메트리 + 균열 파라미터 + 해상도) 해시가 들어가므로 같은 설정이면
+다시 굽지 않습니다. 병렬 팜 워커가 같은 맵을 동시에 필요로 하면 해시별 잠금 파일로
+한 워커만 굽고 나머지는 파일이 생길 때까지 기다립니다.
+"""
+import hashlib
+import json
+import os
+import time
+
+import bpy
+
+import dice_geometry
+import dice_variants
+
+DEFAULT_RESOLUTION = 1024
+# 파일 형식 → 확장자 (glTF가 읽을 수 있는 압축 이미지만)
+FILE_FORMATS = {"PNG": ".png", "JPEG": ".jpg"}
+# 이보다 오래된 잠금 파일은 죽은 워커가 남긴 것으로 보고 치움 (초)
+BAKE_LOCK_TIMEOUT = 600
+
+
+def crack_map_path(texture_dir, geometry_params, crack_params, resolution=DEFAULT_RESOLUTION, file_format="PNG"):
+    """노멀 맵 경로 - 설정 해시가 파일 이름에 들어갑니다 (거칠기는 맵에 영향 없음)"""
+    shape_params = {k: v for k, v in crack_params.items() if k != "crack_roughness"}
+    payload = json.dumps({"geometry": geometry_params, "cracks": shape_params, "resolution": resolution,
+                          **dice_geometry.uv_layout_params()}, sort_keys=True)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(texture_dir, f"dice_crack_{digest}_normal{FILE_FORMATS[file_format]}")
+
+
+def bake_crack_maps(texture_dir, geometry_params, crack_params, resolution=DEFAULT_RESOLUTION,
+                    file_format="PNG", samples=4, margin=8):
+    """균열 그래프를 노멀 맵으로 굽습니다. 이미 있으면 굽지 않고 경로만 반환합니다"""
+    normal_path = crack_map_path(texture_dir, geometry_params, crack_params, resolution, file_format)
+    if os.path.exists(normal_path):
+        return normal_path
+    os.makedirs(texture_dir, exist_ok=True)
+    lock_path = normal_path + ".lock"
+    if not _acquire_bake_lock(lock_path, normal_path):
+        return normal_path  # 다른 워커가 구워 둠
+    try:
+        if not os.path.exists(normal_path):
+            _bake_normal(normal_path, geometry_params, crack_params, resolution, file_format, samples, margin)
+    finally:
+        os.remove(lock_path)
+    return normal_path
+
+
+def _acquire_bake_lock(lock_path, target_path, timeout=BAKE_LOCK_TIMEOUT):
+    """해시별 잠금 파일을 만듭니다 → 잠금을 얻었는지 (False면 기다리는 동안 다른 워커가 구움)"""
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if os.path.exists(target_path):
+                return False
+            try:
+                stale = time.time() - os.path.getmtime(lock_path) > timeout
+            except OSError:
+                continue  # 그 사이 잠금이 풀림
+            if stale:
+                try:
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+                continue
+            time.sleep(0.5)
+            continue
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        os.close(fd)
+        return True
+
+
+def _bake_normal(normal_path, geometry_params, crack_params, resolution, file_format, samples, margin):
+    print(f"  균열 맵 베이크 ({resolution}×{resolution}) → {os.path.basename(normal_path)}")
+
+    scene = bpy.context.scene
+    saved = (scene.render.engine, scene.cycles.samples, scene.render.bake.margin)
+
+    shape_mesh = dice_variants.get_shape_mesh("Shape_Bake", **geometry_params)
+    bake_mat = dice_variants.make_body_material("Bake_Crack", (0.5, 0.5, 0.5, 1.0))
+    dice_variants.add_crack_normal(bake_mat, **crack_params)
+    # 베이크는 모든 재질에 활성 이미지 노드가 필요합니다 (눈 슬롯은 버리는 이미지)
+    scratch_mat = dice_variants.make_pip_material("Bake_Scratch", (0.0, 0.0, 0.0, 1.0))
+    obj = dice_variants.make_variant(shape_mesh, "Bake_Target", bake_mat, scratch_mat)
+
+    target = bpy.data.images.new("Bake_Crack_Target", resolution, resolution, alpha=False, float_buffer=False)
+    target.colorspace_settings.name = 'Non-Color'
+    scratch = bpy.data.images.new("Bake_Scratch", 16, 16, alpha=False)
+    _add_active_image_node(bake_mat, target)
+    _add_active_image_node(scratch_mat, scratch)
+
+    try:
+        scene.render.engine = 'CYCLES'
+        scene.cycles.samples = samples
+        scene.render.bake.margin = margin
+        scene.render.bake.use_clear = True
+        scene.render.bake.target = 'IMAGE_TEXTURES'
+
+        for other in bpy.context.view_layer.objects:
+            other.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        bpy.ops.object.bake(type='NORMAL', normal_space='TANGENT', margin=margin)
+        _save_image(target, normal_path, file_format)
+    finally:
+        scene.render.engine, scene.cycles.samples, scene.render.bake.margin = saved
+        bpy.data.objects.remove(obj, do_unlink=True)
+        for mat in (bake_mat, scratch_mat):
+            bpy.data.materials.remove(mat)
+        for img in (target, scratch):
+            bpy.data.images.remove(img)
+
+    print("  ✅ 균열 맵 베이크 완료")
+
+
+def apply_crack_maps(material, normal_path, roughness=None, strength=1.0):
+    """본체 재질에 구운 균열 노멀 맵을 연결하고 거칠기를 스칼라로 설정합니다
+
+    Roughness 입력이 이미 텍스처에 연결된 재질(아틀라스 MR 맵)은 그 값을 그대로 둡니다.
+    """
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    # 같은 파일은 이미지 데이터 블록 하나를 공유 (check_existing)
+    normal_img = bpy.data.images.load(normal_path, check_existing=True)
+    normal_img.colorspace_settings.name = 'Non-Color'
+
+    normal_tex = nodes.new(type="ShaderNodeTexImage")
+    normal_tex.image = normal_img
+    normal_tex.location = (-600, 100)
+
+    normal_map = nodes.new(type="ShaderNodeNormalMap")
+    normal_map.space = 'TANGENT'
+    normal_map.inputs['Strength'].default_value = strength
+    normal_map.location = (-300, 100)
+
+    links.new(normal_tex.outputs['Color'], normal_map.inputs['Color'])
+    links.new(normal_map.outputs['Normal'], bsdf.inputs['Normal'])
+    if roughness is not None and not bsdf.inputs['Roughness'].is_linked:
+        bsdf.inputs['Roughness'].default_value = roughness
+    return material
+
+
+def _add_active_image_node(material, image):
+    node = material.node_tree.nodes.new(type="ShaderNodeTexImage")
+    node.image = image
+    node.select = True
+    material.node_tree.nodes.active = node
+    return node
+
+
+def _save_image(image, path, file_format):
+    # 같은 폴더에 임시 파일로 저장 후 교체 (병렬 워커가 반쯤 쓴 파일을 읽지 않도록)
+    tmp_path = path + ".tmp" + FILE_FORMATS[file_format]
+    image.filepath_raw = tmp_path
+    image.file_format = file_format
+    image.save()
+    os.replace(tmp_path, path)
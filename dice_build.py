@@ -0,0 +1,275 @@
+"""카탈로그 변형 하나를 Blender 씬에 만들고 glTF로 내보내는 공용 단계
+
+dice_farm_worker.py 등 헤드리스 빌드 스크립트가 사용합니다.
+"""
+import math
+import os
+
+import bpy
+
+import dice_atlas
+import dice_bake
+import dice_catalog
+import dice_geometry
+import dice_lod
+import dice_trace
+import dice_variants
+
+ATLAS_MATERIAL = "DiceAtlas"
+PALETTE_UV = "PaletteUV"
+
+
+def reset_scene():
+    """연산자 없이 씬의 오브젝트를 모두 제거합니다"""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+
+def add_preview_rig():
+    """미리보기 조명(주광 + 보조광)과 카메라 - dice_optimized.py STEP 4 설정
+
+    반환: (camera, [key_light, fill_light])
+    """
+    bpy.ops.object.light_add(type='SUN', location=(5, -5, 8))
+    light = bpy.context.active_object
+    light.data.energy = 3.0
+    light.rotation_euler = (math.radians(45), 0, math.radians(45))
+
+    bpy.ops.object.light_add(type='SUN', location=(-3, 3, 6))
+    fill_light = bpy.context.active_object
+    fill_light.data.energy = 1.0
+    fill_light.rotation_euler = (math.radians(60), 0, math.radians(-135))
+
+    bpy.ops.object.camera_add(location=(5, -5, 4))
+    camera = bpy.context.active_object
+    camera.rotation_euler = (math.radians(65), 0, math.radians(45))
+    bpy.context.scene.camera = camera
+    return camera, [light, fill_light]
+
+
+def build_variant(variant, location=(0, 0, 0), output_root=dice_catalog.DEFAULT_OUTPUT_ROOT):
+    """카탈로그 변형 dict → 재질이 지정된 링크 복제본 오브젝트"""
+    shape_mesh = dice_variants.get_shape_mesh(variant["shape_name"], **variant["geometry"])
+
+    body = variant["body"]
+    pip = variant["pip"]
+    body_mat = dice_variants.make_body_material(
+        body["name"], tuple(body["color"]), roughness=body.get("roughness", 0.3), metallic=body.get("metallic"))
+    pip_mat = dice_variants.make_pip_material(
+        pip["name"], tuple(pip["color"]), roughness=pip.get("roughness", 0.4), metallic=pip.get("metallic"))
+
+    if variant.get("cracks") and variant.get("crack_maps"):
+        # 구운 균열 맵 (없으면 한 번 굽고 이후 색상은 같은 파일 공유)
+        maps = variant["crack_maps"]
+        normal_path = dice_bake.bake_crack_maps(
+            dice_catalog.texture_dir(output_root), variant["geometry"], variant["cracks"],
+            resolution=maps.get("resolution", dice_bake.DEFAULT_RESOLUTION),
+            file_format=maps.get("file_format", "PNG"))
+        dice_bake.apply_crack_maps(body_mat, normal_path, variant["cracks"].get("crack_roughness"))
+    elif variant.get("cracks"):
+        dice_variants.add_crack_normal(body_mat, **variant["cracks"])
+
+    return dice_variants.make_variant(shape_mesh, variant["object_name"], body_mat, pip_mat, location=location)
+
+
+def build_atlas_variant(variant, location=(0, 0, 0), output_root=dice_catalog.DEFAULT_OUTPUT_ROOT):
+    """공유 팔레트 재질 하나를 쓰는 변형 (PaletteUV가 변형의 아틀라스 셀을 가리킴)"""
+    shape_mesh = dice_variants.get_shape_mesh(variant["shape_name"], **variant["geometry"])
+    cell = variant["atlas"]
+    tex_dir = dice_catalog.texture_dir(output_root)
+    palette_path = os.path.join(tex_dir, dice_atlas.PALETTE_NAME)
+    mr_path = os.path.join(tex_dir, dice_atlas.MR_NAME)
+
+    # 균열 타입은 노멀 맵이 추가된 두 번째 공유 재질을 씁니다
+    material_name = ATLAS_MATERIAL
+    crack_map = None
+    if variant.get("cracks") and variant.get("crack_maps"):
+        material_name = f"{ATLAS_MATERIAL}_Cracked"
+        maps = variant["crack_maps"]
+        crack_map = dice_bake.bake_crack_maps(
+            tex_dir, variant["geometry"], variant["cracks"],
+            resolution=maps.get("resolution", dice_bake.DEFAULT_RESOLUTION),
+            file_format=maps.get("file_format", "PNG"))
+    material = bpy.data.materials.get(material_name)
+    if material is None:
+        material = dice_variants.make_atlas_material(material_name, palette_path, mr_path, uv_map=PALETTE_UV)
+        # 모든 변형이 공유하므로 release_variant에서 사용자 0이 되어도 지워지지 않게
+        material.use_fake_user = True
+        if crack_map:
+            # 거칠기는 아틀라스 MR 맵의 본체 스와치에 들어 있음 (dice_atlas.write_atlas)
+            dice_bake.apply_crack_maps(material, crack_map)
+
+    # UV만 다른 메시 복사본: 본체 면 → 본체 스와치, 눈 면 → 눈 스와치
+    mesh = shape_mesh.copy()
+    mesh.name = variant["object_name"]
+    mesh.use_fake_user = False
+    palette_uv = mesh.uv_layers.new(name=PALETTE_UV)
+    mesh.uv_layers[0].active_render = True
+    coords = []
+    for poly in mesh.polygons:
+        uv = cell["body_uv"] if poly.material_index == dice_geometry.BODY_MATERIAL_INDEX else cell["pip_uv"]
+        coords.extend(uv * poly.loop_total)
+    palette_uv.data.foreach_set("uv", coords)
+
+    # 재질 슬롯 하나 = 프리미티브 하나 = 드로우 콜 하나
+    mesh.polygons.foreach_set("material_index", [0] * len(mesh.polygons))
+    mesh.materials.clear()
+    mesh.materials.append(material)
+
+    obj = bpy.data.objects.new(variant["object_name"], mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def build_lod_variant(variant, location=(0, 0, 0), output_root=dice_catalog.DEFAULT_OUTPUT_ROOT):
+    """LOD0(원본) + LOD 단계별 오브젝트 목록 (dice_lod.LOD_LEVELS 순서)
+
+    LOD0/LOD1은 변형의 재질(또는 아틀라스 재질)을 그대로 쓰고, LOD2는 눈 텍스처를
+    입힌 본체 재질 하나만 씁니다.
+    """
+    levels = variant["lods"]["levels"]
+    objects = []
+    for level in levels:
+        lod_variant = dict(variant,
+                           geometry=dice_lod.lod_geometry(variant["geometry"], level),
+                           shape_name=dice_lod.lod_name(variant["shape_name"], level),
+                           object_name=dice_lod.lod_name(variant["object_name"], level))
+        if level.get("pip_texture"):
+            obj = _build_pip_texture_lod(lod_variant, variant, location, output_root)
+        elif variant.get("atlas"):
+            obj = build_atlas_variant(lod_variant, location, output_root)
+        elif objects:
+            # 재질은 LOD0 것을 공유하고 형태 메시만 바꿉니다
+            shape_mesh = dice_variants.get_shape_mesh(lod_variant["shape_name"], **lod_variant["geometry"])
+            slots = objects[0].material_slots
+            obj = dice_variants.make_variant(
+                shape_mesh, lod_variant["object_name"],
+                slots[dice_geometry.BODY_MATERIAL_INDEX].material,
+                slots[dice_geometry.PIP_MATERIAL_INDEX].material, location=location)
+        else:
+            obj = build_variant(lod_variant, location, output_root)
+
+        triangles = sum(poly.loop_total - 2 for poly in obj.data.polygons)
+        if triangles > level["triangle_budget"]:
+            raise ValueError(f"{obj.name}: 삼각형 {triangles}개가 LOD{level['lod']} 예산 "
+                             f"{level['triangle_budget']}개를 넘습니다")
+        obj["lod"] = level["lod"]
+        obj["triangles"] = triangles
+        objects.append(obj)
+    return objects
+
+
+def _build_pip_texture_lod(lod_variant, variant, location, output_root):
+    shape_mesh = dice_variants.get_shape_mesh(lod_variant["shape_name"], **lod_variant["geometry"])
+    body = variant["body"]
+    texture_path = dice_lod.write_pip_texture(
+        dice_catalog.texture_dir(output_root), variant,
+        size=variant["lods"].get("pip_texture_px", dice_lod.DEFAULT_PIP_TEXTURE_PX))
+
+    material = dice_variants.make_body_material(
+        f"{body['name']}_LOD2", tuple(body["color"]), roughness=body.get("roughness", 0.3), metallic=body.get("metallic"))
+    nodes = material.node_tree.nodes
+    image = nodes.new(type="ShaderNodeTexImage")
+    image.image = bpy.data.images.load(texture_path, check_existing=True)
+    image.location = (-400, 300)
+    material.node_tree.links.new(image.outputs['Color'], nodes.get("Principled BSDF").inputs['Base Color'])
+
+    return dice_variants.make_variant(shape_mesh, lod_variant["object_name"], material, material, location=location)
+
+
+def export_variant(obj, filepath):
+    """선택한 오브젝트(또는 LOD 오브젝트 목록)만 GLTF_SEPARATE 형식으로 내보냅니다"""
+    objects = obj if isinstance(obj, (list, tuple)) else [obj]
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    for other in bpy.context.view_layer.objects:
+        other.select_set(False)
+    for selected in objects:
+        selected.select_set(True)
+    bpy.context.view_layer.objects.active = objects[0]
+
+    bpy.ops.export_scene.gltf(
+        filepath=filepath,
+        use_selection=True,
+        export_format='GLTF_SEPARATE',
+        export_apply=True,
+        export_materials='EXPORT',
+        export_normals=True,
+        export_tangents=False,
+        export_texcoords=True,
+        export_attributes=True,
+        export_texture_dir=dice_catalog.TEXTURE_SUBDIR,
+    )
+    return filepath
+
+
+def build_and_export(variant, out_path, output_root=dice_catalog.DEFAULT_OUTPUT_ROOT, tracer=None):
+    """변형 하나를 빌드 → glTF 익스포트 → (LOD 주석) → 해제합니다
+
+    tracer: 단계를 기록할 dice_trace.Tracer (없으면 버리는 추적기)
+    """
+    tracer = tracer or dice_trace.Tracer()
+    name = variant["name"]
+    with tracer.stage("빌드", variant=name):
+        if variant.get("lods"):
+            obj = build_lod_variant(variant, output_root=output_root)
+        elif variant.get("atlas"):
+            obj = build_atlas_variant(variant, output_root=output_root)
+        else:
+            obj = build_variant(variant, output_root=output_root)
+    with tracer.stage("glTF Export", variant=name):
+        export_variant(obj, out_path)
+    if variant.get("lods"):
+        with tracer.stage("LOD 주석", variant=name):
+            dice_lod.annotate_gltf(out_path, variant["object_name"], variant["lods"]["levels"],
+                                   triangles={o["lod"]: o["triangles"] for o in obj})
+    with tracer.stage("해제", variant=name):
+        release_variant(obj)
+    return out_path
+
+
+def release_variant(obj):
+    """내보낸 변형의 오브젝트와 재질을 정리합니다 (공유 형태 메시는 유지)"""
+    if isinstance(obj, (list, tuple)):
+        for lod_obj in obj:
+            release_variant(lod_obj)
+        return
+    materials = {slot.material for slot in obj.material_slots if slot.material}
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    # 아틀라스 변형의 메시 복사본 (공유 형태 메시는 fake user라 남음)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+    for mat in materials:
+        if mat.users == 0:
+            images = [node.image for node in mat.node_tree.nodes
+                      if node.type == 'TEX_IMAGE' and node.image
+                      and node.image.name.startswith(dice_lod.PIP_TEXTURE_PREFIX)]
+            bpy.data.materials.remove(mat)
+            # LOD2 눈 텍스처는 변형마다 달라서 같이 해제 (균열 맵은 공유라 유지)
+            for image in images:
+                if image.users == 0:
+                    bpy.data.images.remove(image)
+
+
+# 배치 모드에서 변형마다 정리하는 데이터 블록 (fake user가 있는 공유 형태 메시는 남음)
+PURGE_TYPES = ("meshes", "materials", "node_groups", "textures", "images")
+
+
+def purge_orphans():
+    """사용자가 없는 데이터 블록을 재귀적으로 해제하고 해제한 개수를 반환합니다
+
+    Blender 3.2+는 bpy.data.orphans_purge 한 번으로, 그 전 버전은 타입별로 직접 지웁니다.
+    """
+    if hasattr(bpy.data, "orphans_purge"):
+        return bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True) or 0
+    removed = 0
+    while True:
+        orphans = [(collection, block) for collection in (getattr(bpy.data, name) for name in PURGE_TYPES)
+                   for block in collection if block.users == 0 and not block.use_fake_user]
+        if not orphans:
+            return removed
+        for collection, block in orphans:
+            collection.remove(block)
+        removed += len(orphans)
+
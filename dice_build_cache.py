@@ -0,0 +1,125 @@
+"""주사위 익스포트 증분 빌드 캐시
+
+변형마다 (유효 파라미터 + 생성기 소스 버전 + Blender 버전)의 해시를 매니페스트에
+기록해 두고, 해시가 바뀌었거나 .gltf/.bin 출력이 없어진 변형만 다시 빌드합니다.
+순수 파이썬 모듈이라 익스포트 팜 드라이버와 Blender 스크립트 양쪽에서 씁니다.
+"""
+import hashlib
+import json
+import os
+import subprocess
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_NAME = ".dice_build_manifest.json"
+
+# 생성기 모듈: dice_build와 그 모듈이 불러오는 것 전부 + 충돌 헐 사이드카
+# 의존 순서 (의존하는 쪽이 뒤) - 상주 데몬은 이 순서대로 다시 불러옵니다
+GENERATOR_MODULES = ("dice_trace", "dice_geometry", "dice_atlas", "dice_catalog", "dice_collision",
+                     "dice_variants", "dice_bake", "dice_lod", "dice_build")
+# 출력 지오메트리/재질에 영향을 주는 생성기 소스
+GENERATOR_SOURCES = tuple(f"{name}.py" for name in GENERATOR_MODULES)
+
+
+# ============================================================================
+# 해시
+# ============================================================================
+def generator_version(extra_sources=()):
+    """생성기 소스 파일 내용의 해시 (코드가 바뀌면 전체 재빌드)"""
+    digest = hashlib.sha256()
+    for path in list(GENERATOR_SOURCES) + list(extra_sources):
+        full = path if os.path.isabs(path) else os.path.join(PROJECT_DIR, path)
+        digest.update(os.path.basename(full).encode("utf-8"))
+        with open(full, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def query_blender_version(blender):
+    """'blender --version' 첫 줄 (예: 'Blender 4.2.0')"""
+    try:
+        out = subprocess.run([blender, "-b", "--factory-startup", "--version"],
+                             capture_output=True, text=True, timeout=120).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    for line in out.splitlines():
+        if line.startswith("Blender "):
+            return line.strip()
+    return "unknown"
+
+
+def variant_hash(params, generator, blender_version):
+    payload = json.dumps({"params": params, "generator": generator, "blender": blender_version},
+                         sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def output_files(gltf_path):
+    """GLTF_SEPARATE 익스포트가 만드는 파일 (.gltf + 같은 이름의 .bin)
+
+    dice_dedupe.py로 버퍼를 통합한 .gltf는 실제로 참조하는 버퍼 파일들을 돌려줍니다.
+    """
+    try:
+        with open(gltf_path, encoding="utf-8") as f:
+            uris = [b["uri"] for b in json.load(f).get("buffers", []) if "uri" in b]
+    except (OSError, ValueError, KeyError):
+        return [gltf_path, os.path.splitext(gltf_path)[0] + ".bin"]
+    base_dir = os.path.dirname(gltf_path)
+    return [gltf_path] + [os.path.normpath(os.path.join(base_dir, uri)) for uri in uris]
+
+
+# ============================================================================
+# 매니페스트
+# ============================================================================
+class BuildManifest:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("variants", {})
+
+    @classmethod
+    def for_output_root(cls, output_root):
+        return cls(os.path.join(output_root, MANIFEST_NAME))
+
+    def check(self, key, digest, gltf_path):
+        """최신이면 None, 다시 빌드해야 하면 이유 문자열을 반환합니다"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return "새 변형"
+        if entry.get("hash") != digest:
+            return "파라미터/생성기 변경"
+        missing = [p for p in output_files(gltf_path) if not os.path.exists(p)]
+        if missing:
+            return f"출력 없음: {', '.join(os.path.basename(p) for p in missing)}"
+        return None
+
+    def record(self, key, digest, gltf_path):
+        base_dir = os.path.dirname(gltf_path)
+        self.entries[key] = {
+            "hash": digest,
+            "outputs": [os.path.relpath(p, base_dir).replace(os.sep, "/") for p in output_files(gltf_path)],
+        }
+
+    def forget(self, key):
+        self.entries.pop(key, None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"variants": self.entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def plan_incremental(variants, manifest, generator, blender_version, output_path_fn):
+    """(다시 빌드할 변형 [(variant, hash, 이유)], 최신이라 건너뛸 변형 목록)"""
+    stale, fresh = [], []
+    for variant in variants:
+        digest = variant_hash(variant, generator, blender_version)
+        reason = manifest.check(variant["name"], digest, output_path_fn(variant))
+        if reason is None:
+            fresh.append(variant)
+        else:
+            stale.append((variant, digest, reason))
+    return stale, fresh
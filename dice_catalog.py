@@ -0,0 +1,126 @@
+"""주사위 변형 카탈로그 (타입 × 색상 매트릭스)
+
+Blender 없이도 읽을 수 있는 순수 데이터 모듈입니다. 타입 × 색상 설정은 스펙 파일
+dice_matrix.json 하나에 있고, 익스포트 팜, 빌드 캐시 등 파이프라인 도구는 모두
+expand_matrix()가 만든 변형 목록을 기준으로 동작합니다.
+"""
+import argparse
+import json
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SPEC_PATH = os.path.join(PROJECT_DIR, "dice_matrix.json")
+
+TEXTURE_SUBDIR = "textures"
+
+# 오브젝트 이름 기본값 ({Color}는 색상 이름 그대로)
+DEFAULT_OBJECT_NAME = "D6_Dice_{Color}"
+
+
+# ============================================================================
+# 스펙 파일 (dice_matrix.json)
+# ============================================================================
+#   output_root: 기본 출력 폴더 (프로젝트 기준 상대 경로)
+#   color_order / base_geometry: 색상 순서, 모든 타입의 기본 지오메트리
+#   palettes: 이름 → 본체/눈 색상 테이블 (타입이 palette로 참조)
+#   types: 타입 이름 → 설정
+#     geometry: base_geometry 덮어쓰기
+#     body / pip: 재질 (color는 팔레트에서 채움)
+#     cracks: 균열 노멀 파라미터 (없으면 균열 없음)
+#     crack_maps: 균열 베이크 설정 (해상도, 파일 형식) - 맵은 모든 색상이 공유
+#     filename: 확장자 없는 출력 파일 이름 ({color}는 소문자 색상 이름)
+#     object_name: 오브젝트 이름 (기본 DEFAULT_OBJECT_NAME)
+#     manual: 생성기로 만들 수 없는 수작업 에셋 (설명 문자열) - 매트릭스에서 제외
+def load_spec(path=SPEC_PATH):
+    """스펙 파일 → (기본 출력 폴더, 색상 순서, 기본 지오메트리, 타입 설정 dict)
+
+    타입 설정은 팔레트를 펼친 형태입니다 (dice_colors / pip_colors, 색상은 튜플).
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    palettes = spec.get("palettes", {})
+    types = {}
+    for type_name, entry in spec["types"].items():
+        entry = dict(entry)
+        if "palette" in entry:
+            palette_name = entry.pop("palette")
+            if palette_name not in palettes:
+                raise KeyError(f"{type_name}: 알 수 없는 팔레트 {palette_name}")
+            palette = palettes[palette_name]
+            entry["dice_colors"] = {c: tuple(v) for c, v in palette["dice_colors"].items()}
+            entry["pip_colors"] = {c: tuple(v) for c, v in palette["pip_colors"].items()}
+        types[type_name] = entry
+    output_root = os.path.join(os.path.dirname(os.path.abspath(path)), spec.get("output_root", "assets/models"))
+    return output_root, list(spec["color_order"]), dict(spec["base_geometry"]), types
+
+
+DEFAULT_OUTPUT_ROOT, COLOR_ORDER, BASE_GEOMETRY, DICE_TYPES = load_spec()
+
+
+def manual_types(types=None):
+    """생성기 없이 수작업으로 관리하는 타입 {이름: 설명}"""
+    types = DICE_TYPES if types is None else types
+    return {name: spec["manual"] for name, spec in types.items() if spec.get("manual")}
+
+
+def type_geometry(type_name, types=None):
+    """타입의 지오메트리 (기본 지오메트리 + 타입 덮어쓰기)"""
+    types = DICE_TYPES if types is None else types
+    return dict(BASE_GEOMETRY, **types[type_name].get("geometry", {}))
+
+
+def expand_matrix(types=None, colors=None, catalog=None):
+    """타입 × 색상 매트릭스를 변형 dict 목록으로 펼칩니다 (형태별로 정렬됨)
+
+    catalog: load_spec()의 타입 설정 (기본: dice_matrix.json). 수작업 타입은 건너뜁니다.
+    """
+    catalog = DICE_TYPES if catalog is None else catalog
+    type_names = list(types) if types else [name for name in catalog if name not in manual_types(catalog)]
+    variants = []
+    for type_name in type_names:
+        if type_name not in catalog:
+            raise KeyError(f"알 수 없는 주사위 타입: {type_name}")
+        spec = catalog[type_name]
+        if spec.get("manual"):
+            raise ValueError(f"{type_name}은 수작업 에셋이라 생성할 수 없습니다: {spec['manual']}")
+        for color in COLOR_ORDER:
+            if colors and color not in colors:
+                continue
+            if color not in spec["dice_colors"]:
+                continue
+            geometry = type_geometry(type_name, catalog)
+            variants.append({
+                "type": type_name,
+                "color": color,
+                "name": spec["filename"].format(color=color.lower()),
+                "object_name": spec.get("object_name", DEFAULT_OBJECT_NAME).format(Color=color),
+                "shape_name": f"Shape_{type_name}",
+                "geometry": geometry,
+                "body": dict(spec.get("body", {}), color=spec["dice_colors"][color],
+                             name=f"Dice_Body_{color}"),
+                "pip": dict(spec.get("pip", {}), color=spec["pip_colors"][color],
+                            name=f"Pip_Material_{color}"),
+                "cracks": spec.get("cracks"),
+                "crack_maps": spec.get("crack_maps"),
+            })
+    # 같은 형태끼리 붙어 있어야 워커 안에서 형태 캐시가 재사용됩니다
+    variants.sort(key=lambda v: (sorted(v["geometry"].items()), v["type"]))
+    return variants
+
+
+def script_output_root(argv, default=None):
+    """Blender 스크립트 인자("--" 뒤)의 --output-root → 절대 경로 (없으면 default, 그것도 없으면 스펙 기본값)"""
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--output-root", default=default or DEFAULT_OUTPUT_ROOT)
+    args, _ = parser.parse_known_args(argv)
+    return os.path.abspath(args.output_root)
+
+
+def output_path(variant, output_root=DEFAULT_OUTPUT_ROOT):
+    return os.path.join(output_root, variant["name"] + ".gltf")
+
+
+def texture_dir(output_root=DEFAULT_OUTPUT_ROOT):
+    """공유 텍스처(균열 맵 등) 폴더 - glTF에서는 'textures/...'로 참조"""
+    return os.path.join(output_root, TEXTURE_SUBDIR)
@@ -0,0 +1,69 @@
+"""주사위 충돌 헐(convex hull) 사이드카
+
+렌더 메시(눈 홈, 베벨 2단)를 물리에 그대로 쓰지 않도록, 같은 바운드의 베벨 큐브
+볼록 헐을 Godot ConvexPolygonShape3D 리소스(.tres)로 glTF 옆에 씁니다.
+
+    assets/models/0_dice_red.gltf
+    assets/models/0_dice_red_collision.tres   ← 점 24개 (베벨 1단)
+
+glTF 안에 "-colonly"/"-convcolonly" 노드로 넣으면 Godot이 StaticBody3D를 만들어서
+RigidBody3D인 주사위(colored_dice.gd)에는 맞지 않으므로 사이드카 리소스를 씁니다.
+정점 수는 max_vertices 이하가 되도록 베벨 분할 수를 줄여서 맞춥니다.
+
+순수 파이썬 모듈입니다.
+"""
+import os
+
+import dice_geometry
+
+COLLISION_SUFFIX = "_collision.tres"
+
+# 헐 정점 상한 (베벨 1단 = 24, 2단 = 56)
+DEFAULT_MAX_VERTICES = 32
+
+
+def collision_path(gltf_path):
+    return os.path.splitext(gltf_path)[0] + COLLISION_SUFFIX
+
+
+def hull_points(geometry, max_vertices=DEFAULT_MAX_VERTICES):
+    """지오메트리 파라미터 → 헐 정점 목록 (Blender 좌표, 렌더 메시와 같은 바운드)"""
+    dice_size = geometry.get("dice_size", 2.0)
+    bevel_amount = geometry.get("bevel_amount", 0.08)
+    for segments in range(geometry.get("bevel_segments", 1), 0, -1):
+        # 눈이 없으면 평면은 분할 없이 모서리/꼭짓점 띠의 정점만 남음 (= 볼록 헐 정점)
+        mesh = dice_geometry.build_dice_geometry(
+            dice_size=dice_size, bevel_amount=bevel_amount, bevel_segments=segments, pip_style="none")
+        if len(mesh.vertices) <= max_vertices:
+            return list(mesh.vertices)
+
+    # 상한이 베벨 1단보다 작으면 꼭짓점 8개짜리 상자
+    half = dice_size / 2
+    return [(x, y, z) for x in (-half, half) for y in (-half, half) for z in (-half, half)]
+
+
+def to_godot(point):
+    """Blender (Z-up) → glTF/Godot (Y-up) 좌표"""
+    x, y, z = point
+    return (x, z, -y + 0.0)
+
+
+def write_collision_shape(gltf_path, geometry, max_vertices=DEFAULT_MAX_VERTICES):
+    """glTF 옆에 ConvexPolygonShape3D .tres를 씁니다 (내용이 같으면 건드리지 않음)"""
+    points = [to_godot(p) for p in hull_points(geometry, max_vertices)]
+    values = ", ".join(f"{c:.6g}" for point in points for c in point)
+    text = ("[gd_resource type=\"ConvexPolygonShape3D\" format=3]\n\n"
+            "[resource]\n"
+            f"points = PackedVector3Array({values})\n")
+
+    path = collision_path(gltf_path)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return path
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,265 @@
+"""상주 빌드 데몬 클라이언트
+
+Blender를 매번 새로 띄우는 대신 헤드리스 Blender 하나(dice_daemon_worker.py)를 계속
+살려 두고 빌드 요청을 소켓으로 보냅니다. 시작 비용(Blender 부팅, 익스포터 로드)은
+start에서 한 번만 치르고, 그 뒤의 재빌드는 변형 하나당 빌드 + 익스포트 시간만 듭니다.
+일반 파이썬으로 실행합니다.
+
+    python dice_daemon.py start --blender /Applications/Blender.app/Contents/MacOS/Blender
+    python dice_daemon.py build --types 0_dice --colors Red
+    python dice_daemon.py build --types 0_dice --colors Red --set geometry.pip_size=0.4 --set body.roughness=0.2
+    python dice_daemon.py build --types 0_dice 4_faceless_dice   # 배치 (변형마다 진행 상황 스트리밍)
+    python dice_daemon.py status
+    python dice_daemon.py reload         # 생성기 모듈 강제 재로딩 (소스가 바뀌면 build가 알아서 함)
+    python dice_daemon.py stop
+
+--set으로 파라미터를 덮어쓴 빌드는 기본적으로 임시 미리보기 폴더에 씁니다. 카탈로그 출력
+폴더에 쓰면 빌드 캐시 매니페스트에서 그 변형을 지워 다음 dice_farm.py 실행이 스펙대로
+다시 빌드하게 합니다. 덮어쓰기 없는 빌드는 팜과 같은 해시로 매니페스트에 기록됩니다.
+여러 클라이언트가 동시에 build를 보내면 데몬이 도착한 순서대로 하나씩 처리합니다.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import dice_build_cache
+import dice_catalog
+import dice_lod
+
+WORKER_SCRIPT = os.path.join(dice_catalog.PROJECT_DIR, "dice_daemon_worker.py")
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "dice_daemon.sock")
+PREVIEW_ROOT = os.path.join(tempfile.gettempdir(), "dice_daemon_preview")
+
+
+# ============================================================================
+# 연결
+# ============================================================================
+def connect(args, timeout=None):
+    if args.port is not None:
+        sock = socket.create_connection(("127.0.0.1", args.port), timeout=timeout)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(args.socket)
+    sock.settimeout(None)
+    return sock
+
+
+def request(args, message, timeout=None):
+    """요청 한 줄을 보내고 이벤트 dict를 하나씩 돌려줍니다 (finished/pong/reloaded/bye/error에서 끝)"""
+    with connect(args, timeout) as sock:
+        sock.sendall((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("r", encoding="utf-8") as lines:
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def ping(args, timeout=2.0):
+    try:
+        return next(request(args, {"op": "ping"}, timeout), None)
+    except (OSError, ValueError):
+        return None
+
+
+# ============================================================================
+# 변형 / 덮어쓰기
+# ============================================================================
+def parse_override(text):
+    """'geometry.pip_size=0.4' → (['geometry', 'pip_size'], 0.4) - 값은 JSON, 아니면 문자열"""
+    key, sep, raw = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"KEY=VALUE 형식이 아닙니다: {text}")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return key.split("."), value
+
+
+def apply_overrides(variant, overrides):
+    for path, value in overrides:
+        target = variant
+        for key in path[:-1]:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[path[-1]] = value
+    return variant
+
+
+def plan_jobs(args):
+    """(변형, 해시 대상 변형, 출력 경로) 목록과 카탈로그 출력 폴더"""
+    spec_output_root, _, _, catalog_types = dice_catalog.load_spec(args.spec)
+    catalog_root = os.path.abspath(spec_output_root)
+    output_root = os.path.abspath(args.output_root or (PREVIEW_ROOT if args.overrides else catalog_root))
+    jobs = []
+    for variant in dice_catalog.expand_matrix(args.types, args.colors, catalog_types):
+        if args.lods:
+            variant["lods"] = dice_lod.lod_spec()
+        apply_overrides(variant, args.overrides)
+        out_path = dice_catalog.output_path(variant, output_root)
+        jobs.append((variant, out_path))
+    return jobs, output_root, catalog_root
+
+
+# ============================================================================
+# 명령
+# ============================================================================
+def cmd_start(args):
+    status = ping(args)
+    if status:
+        print(f"✅ 이미 실행 중: pid {status['pid']} ({status['blender']})")
+        return 0
+    command = [args.blender, "-b", "--factory-startup", "-t", "1", "--python", WORKER_SCRIPT, "--"]
+    command += ["--port", str(args.port)] if args.port is not None else ["--socket", args.socket]
+    if args.idle_timeout:
+        command += ["--idle-timeout", str(args.idle_timeout)]
+    if args.no_warm:
+        command.append("--no-warm")
+    log_path = args.log or os.path.join(tempfile.gettempdir(), "dice_daemon.log")
+    try:
+        with open(log_path, "w", encoding="utf-8") as log:
+            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT,
+                                       stdin=subprocess.DEVNULL, start_new_session=True)
+    except OSError as e:
+        print(f"❌ Blender를 실행할 수 없습니다: {e}")
+        return 2
+
+    deadline = time.time() + args.start_timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            print(f"❌ 데몬이 시작 중 종료했습니다 (코드 {process.returncode}). 로그: {log_path}")
+            return 1
+        status = ping(args)
+        if status:
+            print(f"✅ 빌드 데몬 시작: pid {status['pid']} ({status['blender']}), 로그: {log_path}")
+            return 0
+        time.sleep(0.25)
+    print(f"❌ {args.start_timeout:.0f}초 안에 응답이 없습니다. 로그: {log_path}")
+    return 1
+
+
+def cmd_status(args):
+    status = ping(args)
+    if not status:
+        print("⏭️ 빌드 데몬이 실행 중이 아닙니다")
+        return 1
+    print(f"✅ pid {status['pid']} · {status['blender']} · 생성기 {status['generator']}")
+    print(f"   가동 {status['uptime_s']:.0f}초, 빌드 {status['jobs']}개, 재로딩 {status['reloads']}회, "
+          f"형태 캐시 {status['shapes']}개, RSS {status['rss_mb']}MB")
+    return 0
+
+
+def cmd_simple(args, op):
+    if not ping(args):
+        print("⏭️ 빌드 데몬이 실행 중이 아닙니다")
+        return 1
+    for event in request(args, {"op": op}):
+        if event["event"] == "reloaded":
+            print(f"✅ 생성기 다시 불러옴 ({event['generator']})")
+        elif event["event"] == "bye":
+            print("✅ 빌드 데몬 종료")
+        elif event["event"] == "error":
+            print(f"❌ {event['error']}")
+            return 1
+    return 0
+
+
+def cmd_build(args):
+    try:
+        jobs, output_root, catalog_root = plan_jobs(args)
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+    if not jobs:
+        print("빌드할 변형이 없습니다.")
+        return 0
+    if not ping(args):
+        print("❌ 빌드 데몬이 실행 중이 아닙니다. 먼저 'python dice_daemon.py start'")
+        return 1
+
+    payload = [dict(variant, output=out_path, output_root=output_root) for variant, out_path in jobs]
+    results, finished = {}, None
+    for event in request(args, {"op": "build", "variants": payload}):
+        kind = event["event"]
+        if kind == "reloaded":
+            print(f"🔄 생성기 소스가 바뀌어 다시 불러옴 ({event['generator']})")
+        elif kind == "stage" and args.verbose:
+            print(f"     {event['stage']:<14} {event['ms']:>8.1f}ms")
+        elif kind == "done":
+            results[event["name"]] = event
+            if event["status"] == "ok":
+                print(f"  ✅ {event['name']:<32} {event['seconds']:.3f}초 → {event['output']}")
+            else:
+                print(f"  ❌ {event['name']} 실패\n{event['error']}")
+        elif kind == "finished":
+            finished = event
+        elif kind == "error":
+            print(f"❌ {event['error']}")
+            return 1
+    if finished is None:
+        print("❌ 데몬 연결이 중간에 끊겼습니다")
+        return 1
+
+    # 카탈로그 출력 폴더에 쓴 결과만 빌드 캐시에 반영
+    if output_root == catalog_root:
+        manifest = dice_build_cache.BuildManifest.for_output_root(catalog_root)
+        for variant, out_path in jobs:
+            result = results.get(variant["name"])
+            if result and result["status"] == "ok" and not args.overrides:
+                digest = dice_build_cache.variant_hash(variant, finished["generator"], finished["blender"])
+                manifest.record(variant["name"], digest, out_path)
+            else:
+                manifest.forget(variant["name"])
+        manifest.save()
+    print(f"완료 {finished['ok']}개 / 실패 {finished['failed']}개, {finished['seconds']:.2f}초")
+    return 0 if finished["failed"] == 0 else 1
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상주 Blender 빌드 데몬 클라이언트")
+    parser.add_argument("command", choices=("start", "status", "build", "reload", "stop"))
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix 소켓 경로")
+    parser.add_argument("--port", type=int, default=None, help="127.0.0.1 TCP 포트 (Unix 소켓 대신)")
+    # start
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender 실행 파일")
+    parser.add_argument("--idle-timeout", type=float, default=0, help="요청 없이 이 시간(초)이 지나면 데몬 종료")
+    parser.add_argument("--no-warm", action="store_true", help="시작할 때 예열 빌드를 건너뜀")
+    parser.add_argument("--start-timeout", type=float, default=120.0, help="데몬 시작 대기 시간(초)")
+    parser.add_argument("--log", default=None, help="데몬 로그 경로 (기본: 임시 폴더)")
+    # build
+    parser.add_argument("--types", nargs="*", help="빌드할 타입 (기본: 전체)")
+    parser.add_argument("--colors", nargs="*", help="빌드할 색상 (기본: 전체)")
+    parser.add_argument("--spec", default=dice_catalog.SPEC_PATH, help="타입 × 색상 스펙 파일")
+    parser.add_argument("--output-root", default=None,
+                        help="출력 폴더 (기본: 스펙의 output_root, --set이 있으면 임시 미리보기 폴더)")
+    parser.add_argument("--set", dest="overrides", action="append", type=parse_override, default=[],
+                        metavar="KEY=VALUE", help="변형 파라미터 덮어쓰기 (예: geometry.pip_size=0.4)")
+    parser.add_argument("--lods", action="store_true", help="LOD 체인을 함께 익스포트")
+    parser.add_argument("-v", "--verbose", action="store_true", help="단계별 시간 출력")
+    args = parser.parse_args(argv)
+
+    if args.port is None and not hasattr(socket, "AF_UNIX"):
+        print("❌ 이 OS는 Unix 소켓을 지원하지 않습니다. --port를 지정하세요")
+        return 2
+    if args.command == "start":
+        return cmd_start(args)
+    if args.command == "status":
+        return cmd_status(args)
+    if args.command == "build":
+        return cmd_build(args)
+    return cmd_simple(args, "shutdown" if args.command == "stop" else "reload")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""상주 빌드 데몬 (Blender 헤드리스 전용)
+
+dice_daemon.py start가 아래처럼 띄웁니다. 직접 실행할 일은 거의 없습니다.
+
+    blender -b --factory-startup -t 1 --python dice_daemon_worker.py -- \
+        --socket /tmp/dice_daemon.sock          # 또는 --port 47321 (127.0.0.1 전용)
+
+Blender를 한 번만 띄워 생성기 모듈과 glTF 익스포터를 올려 둔 채로 빌드 요청을 받습니다.
+요청 사이에는 씬 오브젝트와 고아 데이터 블록만 비우고 형태 메시 캐시(fake user)는
+남겨서, 색상/재질만 바꾼 재빌드는 재질 교체 + 익스포트 비용만 듭니다.
+생성기 소스(dice_build_cache.GENERATOR_SOURCES)가 바뀌면 다음 요청 전에 모듈을
+다시 불러오고 형태 캐시를 비웁니다.
+
+프로토콜: 줄 단위 JSON. 요청 한 줄에 이벤트가 여러 줄로 돌아옵니다.
+    {"op": "ping"}                               → {"event": "pong", ...상태}
+    {"op": "build", "variants": [..]}            → start / stage / done (변형마다) → finished
+    {"op": "reload"}                             → {"event": "reloaded", "generator": ..}
+    {"op": "shutdown"}                           → {"event": "bye"} 후 종료
+variants의 각 항목은 dice_catalog.expand_matrix() 변형 dict에 "output"(.gltf 경로)과
+"output_root"를 더한 것입니다. Blender 파이썬은 메인 스레드에서만 bpy를 쓸 수 있어서
+연결은 하나씩 순서대로 처리합니다 (다른 클라이언트 요청은 accept 대기열에서 기다림).
+"""
+import argparse
+import importlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+import bpy
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import dice_build
+import dice_build_cache
+import dice_catalog
+import dice_trace
+import dice_variants
+
+# 다시 불러올 순서 = 해시하는 생성기 소스와 같은 목록 (의존하는 쪽이 뒤)
+RELOAD_MODULES = dice_build_cache.GENERATOR_MODULES
+
+
+def parse_args(argv):
+    # Blender 인자와 스크립트 인자는 "--"로 구분됩니다
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="dice_daemon_worker")
+    parser.add_argument("--socket", default=None, help="Unix 소켓 경로")
+    parser.add_argument("--port", type=int, default=None, help="127.0.0.1 TCP 포트 (Unix 소켓 대신)")
+    parser.add_argument("--idle-timeout", type=float, default=0, help="요청 없이 이 시간(초)이 지나면 종료 (0 = 안 함)")
+    parser.add_argument("--no-warm", action="store_true", help="시작할 때 익스포터 예열 빌드를 건너뜀")
+    return parser.parse_args(argv)
+
+
+# ============================================================================
+# 데몬 상태
+# ============================================================================
+class BuildDaemon:
+    def __init__(self):
+        self.started = time.time()
+        self.blender_version = f"Blender {bpy.app.version_string}"
+        self.generator = dice_build_cache.generator_version()
+        self.jobs = 0
+        self.reloads = 0
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "blender": self.blender_version,
+            "generator": self.generator,
+            "uptime_s": round(time.time() - self.started, 1),
+            "jobs": self.jobs,
+            "reloads": self.reloads,
+            "shapes": len(dice_variants._shape_meshes),
+            "rss_mb": dice_trace.current_rss_mb(),
+            "blocks": dice_trace.block_counts(transient=True),
+        }
+
+    def reload_if_changed(self, force=False):
+        """생성기 소스가 바뀌었으면 형태 캐시를 비우고 모듈을 다시 불러옵니다 → 다시 불렀는지"""
+        generator = dice_build_cache.generator_version()
+        if not force and generator == self.generator:
+            return False
+        # 캐시 dict가 모듈과 함께 새로 만들어지므로 그 전에 fake user 메시를 해제
+        dice_variants.clear_shape_cache()
+        dice_build.reset_scene()
+        dice_build.purge_orphans()
+        for name in RELOAD_MODULES:
+            # dice_collision처럼 데몬이 아직 불러오지 않은 모듈은 다음 import 때 새로 읽힘
+            if name in sys.modules:
+                importlib.reload(sys.modules[name])
+        self.generator = generator
+        self.reloads += 1
+        return True
+
+    def build(self, variants, send):
+        ok = failed = 0
+        started = time.perf_counter()
+        for variant in variants:
+            name = variant["name"]
+            out_path = variant["output"]
+            output_root = variant.get("output_root", dice_catalog.DEFAULT_OUTPUT_ROOT)
+            variant_started = time.perf_counter()
+            send({"event": "start", "name": name})
+            tracer = dice_trace.Tracer(process_name="dice_daemon", on_record=lambda r, name=name: send({
+                "event": "stage", "name": name, "stage": r["name"], "ms": round(r["wall_ms"], 1)}))
+            try:
+                dice_build.build_and_export(variant, out_path, output_root, tracer)
+                status, error = "ok", None
+                ok += 1
+            except Exception:
+                status, error = "failed", traceback.format_exc()
+                failed += 1
+            # 다음 요청을 위해 씬과 고아 블록만 비움 (형태 캐시는 유지)
+            dice_build.reset_scene()
+            dice_build.purge_orphans()
+            self.jobs += 1
+            send({"event": "done", "name": name, "status": status, "output": out_path if status == "ok" else None,
+                  "seconds": round(time.perf_counter() - variant_started, 3), "error": error})
+        send({"event": "finished", "ok": ok, "failed": failed,
+              "seconds": round(time.perf_counter() - started, 3),
+              "blender": self.blender_version, "generator": self.generator})
+
+    def warm(self):
+        """익스포터 애드온 로드와 첫 Boolean 등 1회성 비용을 시작할 때 미리 치릅니다"""
+        # 균열 베이크가 없는 변형 (예열에 베이크 시간까지 쓸 필요는 없음)
+        variant = next(v for v in dice_catalog.expand_matrix() if not v.get("cracks"))
+        with tempfile.TemporaryDirectory(prefix="dice_daemon_warm_") as tmp:
+            started = time.perf_counter()
+            dice_build.build_and_export(variant, os.path.join(tmp, variant["name"] + ".gltf"), tmp)
+        dice_build.reset_scene()
+        dice_build.purge_orphans()
+        print(f"  ✅ 예열 빌드 {variant['name']} ({time.perf_counter() - started:.2f}초)")
+
+
+# ============================================================================
+# 소켓
+# ============================================================================
+def open_server(args):
+    if args.port is not None:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", args.port))
+        address = f"127.0.0.1:{args.port}"
+    else:
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(args.socket)
+        os.chmod(args.socket, 0o600)
+        address = args.socket
+    server.listen(16)
+    if args.idle_timeout:
+        server.settimeout(args.idle_timeout)
+    return server, address
+
+
+def serve_connection(daemon, conn):
+    """연결 하나의 요청을 모두 처리합니다 → 종료 요청을 받았는지"""
+    def send(message):
+        try:
+            conn.sendall((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        except OSError:
+            # 클라이언트가 먼저 끊어도 진행 중인 빌드는 끝까지
+            pass
+
+    with conn, conn.makefile("r", encoding="utf-8") as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "ping":
+                    send(dict(daemon.status(), event="pong"))
+                elif op == "build":
+                    if daemon.reload_if_changed():
+                        send({"event": "reloaded", "generator": daemon.generator})
+                    daemon.build(request.get("variants", []), send)
+                elif op == "reload":
+                    daemon.reload_if_changed(force=True)
+                    send({"event": "reloaded", "generator": daemon.generator})
+                elif op == "shutdown":
+                    send({"event": "bye"})
+                    return True
+                else:
+                    send({"event": "error", "error": f"알 수 없는 요청: {op}"})
+            except Exception:
+                send({"event": "error", "error": traceback.format_exc()})
+    return False
+
+
+def main():
+    args = parse_args(sys.argv)
+    if args.socket is None and args.port is None:
+        print("❌ --socket 또는 --port가 필요합니다")
+        sys.exit(2)
+
+    daemon = BuildDaemon()
+    dice_build.reset_scene()
+    if not args.no_warm:
+        daemon.warm()
+    server, address = open_server(args)
+    print(f"✅ 빌드 데몬 대기 중: {address} (pid {os.getpid()}, {daemon.blender_version})", flush=True)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                print(f"⏭️ {args.idle_timeout:.0f}초 동안 요청이 없어 종료합니다")
+                break
+            conn.settimeout(None)
+            if serve_connection(daemon, conn):
+                break
+    finally:
+        server.close()
+        if args.port is None and os.path.exists(args.socket):
+            os.remove(args.socket)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+"""assets/models glTF 지오메트리 중복 제거 + 공유 버퍼 통합
+
+색상만 다른 변형은 .gltf마다 똑같은 정점/인덱스 데이터를 각자의 .bin에 들고 있습니다
+(1_plus_dice_<색> 5개, 눈(pip) 메시는 0_dice/6_growing/프리즘 12개가 같은 데이터).
+이 스크립트는 모든 .gltf의 accessor를 내용으로 해시해서 같은 데이터를 찾고, 한 번만
+저장하도록 버퍼를 다시 씁니다. Blender 없이 NumPy만 사용합니다.
+
+  1. accessor 해시 - (type, componentType, normalized, count) + 저장된 바이트
+     float/정규화 accessor는 --tolerance 이하로만 다른 것도 같은 데이터로 봄 (대표값 사용)
+  2. 같은 데이터를 쓰는 .gltf 집합이 같은 accessor끼리 버퍼 하나로 묶음
+       한 파일만 쓰는 데이터   → <이름>.bin (기존 자리)
+       여러 파일이 같이 쓰는 데이터 → shared/<내용 해시>.bin
+     .gltf는 bufferView로 필요한 버퍼 구간만 가리킵니다 (buffers가 여러 개가 됨)
+  3. 다시 읽어서 모든 accessor 값이 원본과 (허용 오차 안에서) 같은지 확인한 뒤에만 씀
+  4. 더 이상 아무도 참조하지 않는 기존 .bin / 지난 실행의 공유 버퍼는 지움
+
+옛 경로 → 새 경로 대응은 <root>/dedupe_manifest.json에 누적 기록합니다.
+리포트에는 같은 지오메트리를 쓰는 메시 묶음, 어떤 .gltf도 참조하지 않는 .bin(같은 내용의
+복사본인지, 7_dice_ugly_<색>/7_ugly_dice_<색>/7_dice_<색>_ugly처럼 이름만 다른 것인지),
+root 아래의 .blend1 백업이 함께 나옵니다. 이들은 --prune을 줘야만 지웁니다.
+root 밖(프로젝트 루트의 .blend 원본 옆 등)의 .blend1은 --blend-backups로 폴더를 직접 지정해야 봅니다.
+
+양자화(dice_quantize.py)는 파일별 .bin을 전제로 하므로 중복 제거보다 먼저 돌려야 합니다.
+dice_farm.py --dedupe는 빌드/양자화가 끝난 뒤 출력 폴더 전체에 이 단계를 실행합니다.
+
+    python dice_dedupe.py --dry-run               # 리포트만
+    python dice_dedupe.py                         # assets/models 다시 쓰기
+    python dice_dedupe.py --tolerance 0 --json dedupe_report.json
+    python dice_dedupe.py --prune                 # 참조 없는 .bin과 root 아래 .blend1 백업도 삭제
+    python dice_dedupe.py --prune --blend-backups .   # 프로젝트 루트의 .blend1 백업까지 삭제
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+import dice_catalog
+import dice_quantize
+
+DEFAULT_TOLERANCE = 1e-6
+SHARED_DIR = "shared"
+MANIFEST_NAME = "dedupe_manifest.json"
+
+# bufferView를 직접 참조할 수 있어서 다시 쓸 수 없는 확장
+_VIEW_EXTENSIONS = ("KHR_draco_mesh_compression", "EXT_meshopt_compression", "KHR_meshopt_compression")
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+class Blob:
+    """내용이 같은 accessor 데이터 하나 (대표 배열 + 이 데이터를 쓰는 accessor 목록)"""
+
+    def __init__(self, fmt, raw, values, digest):
+        self.fmt = fmt
+        self.raw = raw
+        self.values = values
+        self.digest = digest
+        self.users = []
+        self.near = []
+        self.target = None
+
+    @property
+    def nbytes(self):
+        return self.raw.nbytes
+
+
+def unsupported_reason(gltf):
+    if any(ext in gltf.get("extensionsUsed", []) for ext in _VIEW_EXTENSIONS):
+        return "압축 확장"
+    if any("bufferView" in image for image in gltf.get("images", [])):
+        return "버퍼에 내장된 이미지"
+    for accessor in gltf.get("accessors", []):
+        if "sparse" in accessor or "bufferView" not in accessor:
+            return "sparse/빈 accessor"
+        if accessor["type"] not in dice_quantize._TYPE_COMPONENTS:
+            return f"{accessor['type']} accessor"
+    return None
+
+
+def accessor_targets(gltf):
+    """accessor 번호 → bufferView target (인덱스/정점 어트리뷰트, 그 밖은 None)"""
+    targets = {}
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh["primitives"]:
+            streams = list(primitive["attributes"].values())
+            for target in primitive.get("targets", []):
+                streams += list(target.values())
+            for index in streams:
+                targets[index] = dice_quantize._TARGET_ARRAY_BUFFER
+            if "indices" in primitive:
+                targets[primitive["indices"]] = dice_quantize._TARGET_ELEMENT_ARRAY_BUFFER
+    return targets
+
+
+def load_catalog(root):
+    """root 아래 .gltf를 모두 읽습니다 → (항목 목록, 건너뛴 [(경로, 이유)])"""
+    entries, skipped = [], []
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.gltf"), recursive=True)):
+        try:
+            gltf, buffers = dice_quantize.load_gltf(path)
+        except (OSError, ValueError) as e:
+            skipped.append((path, str(e)))
+            continue
+        reason = unsupported_reason(gltf)
+        if reason:
+            skipped.append((path, reason))
+            continue
+        base_dir = os.path.dirname(path)
+        entries.append({
+            "path": path,
+            "gltf": gltf,
+            "buffers": buffers,
+            "buffer_paths": [os.path.normpath(os.path.join(base_dir, b["uri"])) for b in gltf.get("buffers", [])],
+        })
+    return entries, skipped
+
+
+# ============================================================================
+# 해시 / 묶기
+# ============================================================================
+def group_accessors(entries, tolerance=DEFAULT_TOLERANCE):
+    """모든 accessor를 Blob으로 묶습니다 → (Blob 목록, {(경로, accessor 번호): Blob})"""
+    blobs, exact, buckets, mapping = [], {}, {}, {}
+    for entry in entries:
+        gltf, path = entry["gltf"], entry["path"]
+        targets = accessor_targets(gltf)
+        for index, accessor in enumerate(gltf.get("accessors", [])):
+            fmt = (accessor["type"], accessor["componentType"], bool(accessor.get("normalized")), accessor["count"])
+            raw = dice_quantize.raw_accessor(gltf, entry["buffers"], index)
+            digest = hashlib.sha1(repr(fmt).encode("utf-8") + raw.tobytes()).hexdigest()
+            blob = exact.get(digest)
+            if blob is None:
+                values = dice_quantize.read_accessor(gltf, entry["buffers"], index)
+                blob = _near_match(buckets.get(fmt, ()), values, tolerance)
+                if blob is None:
+                    blob = Blob(fmt, raw, values, digest)
+                    blobs.append(blob)
+                    buckets.setdefault(fmt, []).append(blob)
+                else:
+                    blob.near.append((path, index, float(np.abs(blob.values - values).max())))
+                exact[digest] = blob
+            blob.users.append((path, index))
+            blob.target = blob.target or targets.get(index)
+            mapping[(path, index)] = blob
+    return blobs, mapping
+
+
+def _near_match(candidates, values, tolerance):
+    # 정수 accessor(인덱스 등)는 바이트가 같을 때만 같은 데이터
+    if tolerance <= 0 or values.dtype.kind != "f":
+        return None
+    low, high = values.min(axis=0), values.max(axis=0)
+    for blob in candidates:
+        if np.abs(blob.values.min(axis=0) - low).max() > tolerance:
+            continue
+        if np.abs(blob.values.max(axis=0) - high).max() > tolerance:
+            continue
+        if np.abs(blob.values - values).max() <= tolerance:
+            return blob
+    return None
+
+
+def duplicate_meshes(entries, mapping):
+    """모든 프리미티브가 같은 Blob을 쓰는 메시 묶음 [[(파일, 메시 이름)], ...]"""
+    groups = {}
+    for entry in entries:
+        for mesh in entry["gltf"].get("meshes", []):
+            signature = []
+            for primitive in mesh["primitives"]:
+                streams = sorted(primitive["attributes"].items())
+                if "indices" in primitive:
+                    streams.append(("indices", primitive["indices"]))
+                signature.append(tuple((name, id(mapping[(entry["path"], index)])) for name, index in streams))
+            groups.setdefault(tuple(signature), []).append((entry["path"], mesh.get("name", "")))
+    return [members for members in groups.values() if len(members) > 1]
+
+
+# ============================================================================
+# 다시 쓰기
+# ============================================================================
+def plan_buffers(entries, blobs, root):
+    """쓰는 파일 집합이 같은 Blob끼리 버퍼 하나 → {버퍼 경로: [Blob]}"""
+    by_users = {}
+    for blob in blobs:
+        users = tuple(sorted({path for path, _ in blob.users}))
+        by_users.setdefault(users, []).append(blob)
+    plan = {}
+    for users, members in by_users.items():
+        if len(users) == 1:
+            path = os.path.splitext(users[0])[0] + ".bin"
+        else:
+            digest = hashlib.sha1("".join(blob.digest for blob in members).encode("utf-8")).hexdigest()[:16]
+            path = os.path.join(root, SHARED_DIR, digest + ".bin")
+        plan[os.path.normpath(path)] = members
+    return plan
+
+
+def pack_buffer(members):
+    """Blob들을 4바이트 정렬로 이어 붙임 → (bytes, {id(Blob): bufferView 틀})"""
+    writer = dice_quantize.BufferWriter()
+    views = {}
+    for blob in members:
+        if blob.target == dice_quantize._TARGET_ARRAY_BUFFER:
+            index = writer.add_attribute(blob.raw)
+        else:
+            index = writer.add(np.ascontiguousarray(blob.raw).tobytes(), blob.target)
+        views[id(blob)] = writer.views[index]
+    return writer.data(), views
+
+
+def rewrite_gltf(entry, mapping, layout):
+    """Blob 배치에 맞춰 buffers/bufferViews/accessors를 다시 만든 glTF 사본"""
+    gltf = json.loads(json.dumps(entry["gltf"]))
+    base_dir = os.path.dirname(entry["path"])
+    blobs = [mapping[(entry["path"], index)] for index in range(len(gltf.get("accessors", [])))]
+    buffer_paths = sorted({layout[id(blob)][0] for blob in blobs},
+                          key=lambda p: (os.path.dirname(p) != base_dir, p))
+    gltf["buffers"] = [{"byteLength": layout[("size", p)], "uri": os.path.relpath(p, base_dir).replace(os.sep, "/")}
+                       for p in buffer_paths]
+    gltf["bufferViews"], view_of = [], {}
+    near = {(path, index) for blob in blobs for path, index, _ in blob.near}
+    for index, (accessor, blob) in enumerate(zip(gltf.get("accessors", []), blobs)):
+        if id(blob) not in view_of:
+            buffer_path, template = layout[id(blob)]
+            view = dict(template, buffer=buffer_paths.index(buffer_path))
+            view_of[id(blob)] = len(gltf["bufferViews"])
+            gltf["bufferViews"].append(view)
+        accessor["bufferView"] = view_of[id(blob)]
+        accessor.pop("byteOffset", None)
+        # 허용 오차로 합친 accessor는 대표 데이터의 범위로 맞춤
+        if (entry["path"], index) in near and ("min" in accessor or "max" in accessor):
+            accessor["min"] = blob.raw.min(axis=0).tolist()
+            accessor["max"] = blob.raw.max(axis=0).tolist()
+    return gltf, buffer_paths
+
+
+def verify(entry, gltf, buffer_paths, packed, tolerance):
+    """다시 쓴 glTF의 모든 accessor가 원본과 같은지 (허용 오차 안) - 다르면 ValueError"""
+    buffers = [packed[p] for p in buffer_paths]
+    for index in range(len(gltf.get("accessors", []))):
+        before = dice_quantize.read_accessor(entry["gltf"], entry["buffers"], index)
+        after = dice_quantize.read_accessor(gltf, buffers, index)
+        if before.shape != after.shape:
+            raise ValueError(f"{os.path.basename(entry['path'])} accessor {index}: 모양이 다릅니다")
+        limit = tolerance if before.dtype.kind == "f" else 0
+        if before.size and np.abs(before.astype(np.float64) - after.astype(np.float64)).max() > limit:
+            raise ValueError(f"{os.path.basename(entry['path'])} accessor {index}: 값이 원본과 다릅니다")
+
+
+def dedupe(root, tolerance=DEFAULT_TOLERANCE, write=True, prune=False, backup_root=None):
+    """root의 glTF 버퍼를 공유 버퍼로 통합합니다 → 리포트 dict"""
+    root = os.path.abspath(root)
+    entries, skipped = load_catalog(root)
+    blobs, mapping = group_accessors(entries, tolerance)
+    plan = plan_buffers(entries, blobs, root)
+
+    packed, layout = {}, {}
+    for buffer_path, members in plan.items():
+        data, views = pack_buffer(members)
+        packed[buffer_path] = data
+        layout[("size", buffer_path)] = len(data)
+        for blob in members:
+            layout[id(blob)] = (buffer_path, views[id(blob)])
+
+    rewritten = []
+    for entry in entries:
+        gltf, buffer_paths = rewrite_gltf(entry, mapping, layout)
+        verify(entry, gltf, buffer_paths, packed, tolerance)
+        rewritten.append((entry, gltf, buffer_paths))
+
+    old_paths = sorted({p for entry in entries for p in entry["buffer_paths"]})
+    report = {
+        "root": root,
+        "tolerance": tolerance,
+        "gltf": len(entries),
+        "skipped": [(_rel(p), reason) for p, reason in skipped],
+        "accessors": len(mapping),
+        "unique_accessors": len(blobs),
+        "bytes_before": sum(os.path.getsize(p) for p in old_paths if os.path.exists(p)),
+        "bytes_after": sum(len(data) for data in packed.values()),
+        "files_before": len(old_paths),
+        "files_after": len(packed),
+        "shared_accessors": [_blob_report(blob) for blob in blobs if len(blob.users) > 1],
+        "duplicate_meshes": [[f"{_rel(p)}:{name}" for p, name in members]
+                             for members in duplicate_meshes(entries, mapping)],
+    }
+    report.update(scan_leftovers(root, set(old_paths), backup_root))
+
+    if write:
+        moved = {}
+        for entry, gltf, buffer_paths in rewritten:
+            if buffer_paths == entry["buffer_paths"]:
+                continue
+            for old_path in entry["buffer_paths"]:
+                moved.setdefault(old_path, set()).update(buffer_paths)
+        for buffer_path, data in packed.items():
+            os.makedirs(os.path.dirname(buffer_path), exist_ok=True)
+            if _read_bytes(buffer_path) != data:
+                dice_quantize._replace(buffer_path, data)
+        for entry, gltf, _ in rewritten:
+            dice_quantize._replace(entry["path"], json.dumps(gltf, ensure_ascii=False, indent=2).encode("utf-8"))
+        removed = remove_unreferenced(root, set(old_paths) | _shared_buffers(root))
+        if prune:
+            removed += prune_leftovers(report)
+        save_manifest(root, moved, removed, tolerance)
+        report["removed"] = [_rel(p) for p in removed]
+    return report
+
+
+def _read_bytes(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _shared_buffers(root):
+    return {os.path.normpath(p) for p in glob.glob(os.path.join(root, SHARED_DIR, "*.bin"))}
+
+
+def referenced_buffers(root):
+    """root 아래 .gltf가 참조하는 모든 버퍼 경로 (건너뛴 파일 포함)"""
+    referenced = set()
+    for path in glob.glob(os.path.join(root, "**", "*.gltf"), recursive=True):
+        try:
+            with open(path, encoding="utf-8") as f:
+                uris = [b.get("uri", "") for b in json.load(f).get("buffers", [])]
+        except (OSError, ValueError):
+            continue
+        referenced.update(os.path.normpath(os.path.join(os.path.dirname(path), uri)) for uri in uris if uri)
+    return referenced
+
+
+def remove_unreferenced(root, candidates):
+    """다시 쓰기로 참조가 끊긴 기존 버퍼만 지움 (원래부터 고아였던 .bin은 --prune 대상)"""
+    removed = []
+    for path in sorted(candidates - referenced_buffers(root)):
+        if os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+# ============================================================================
+# 남은 파일 (고아 .bin / 이름 중복 / .blend1)
+# ============================================================================
+def _name_key(path):
+    """7_dice_ugly_black / 7_ugly_dice_black / 7_dice_black_ugly → 같은 키"""
+    return tuple(sorted(os.path.splitext(os.path.basename(path))[0].lower().split("_")))
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def scan_leftovers(root, referenced_before, backup_root=None):
+    """고아 .bin과 .blend1 백업 (backup_root를 주지 않으면 .blend1도 root 아래에서만 찾음)"""
+    referenced = referenced_before | referenced_buffers(root)
+    shared = _shared_buffers(root)
+    bins = {os.path.normpath(p) for p in glob.glob(os.path.join(root, "**", "*.bin"), recursive=True)}
+    orphans = sorted(bins - referenced - shared)
+
+    digests = {}
+    for path in sorted(referenced & bins):
+        digests.setdefault(_file_digest(path), path)
+    names = {}
+    for path in sorted(bins | set(glob.glob(os.path.join(root, "**", "*.gltf"), recursive=True))):
+        names.setdefault(_name_key(path), set()).add(os.path.splitext(os.path.basename(path))[0])
+
+    orphan_report = []
+    for path in orphans:
+        digest = _file_digest(path)
+        copy_of = digests.get(digest)
+        digests.setdefault(digest, path)
+        aliases = sorted(names.get(_name_key(path), set()) - {os.path.splitext(os.path.basename(path))[0]})
+        orphan_report.append({"path": _rel(path), "bytes": os.path.getsize(path),
+                              "copy_of": _rel(copy_of) if copy_of else None, "aliases": aliases})
+
+    backup_root = backup_root or root
+    backups = []
+    for path in sorted(glob.glob(os.path.join(backup_root, "**", "*.blend1"), recursive=True)):
+        if os.sep + "." not in os.path.relpath(path, backup_root):
+            backups.append({"path": _rel(path), "bytes": os.path.getsize(path)})
+    return {"orphan_buffers": orphan_report, "blend_backups": backups}
+
+
+def prune_leftovers(report):
+    removed = []
+    for item in report["orphan_buffers"] + report["blend_backups"]:
+        path = os.path.join(dice_catalog.PROJECT_DIR, item["path"])
+        if os.path.exists(path):
+            os.remove(path)
+            removed.append(os.path.normpath(path))
+    return removed
+
+
+# ============================================================================
+# 매니페스트 / 리포트
+# ============================================================================
+def _rel(path):
+    return os.path.relpath(path, dice_catalog.PROJECT_DIR).replace(os.sep, "/")
+
+
+def _blob_report(blob):
+    return {
+        "format": "{}/{}{}x{}".format(blob.fmt[0], blob.fmt[1], "n" if blob.fmt[2] else "", blob.fmt[3]),
+        "bytes": blob.nbytes,
+        "users": [f"{_rel(path)}#{index}" for path, index in blob.users],
+        "near": [{"accessor": f"{_rel(path)}#{index}", "max_diff": diff} for path, index, diff in blob.near],
+    }
+
+
+def save_manifest(root, moved, removed, tolerance):
+    """옛 버퍼 경로 → 새 버퍼 경로 목록 (지운 파일은 null) - 이전 실행 기록에 이어서 씀"""
+    path = os.path.join(root, MANIFEST_NAME)
+    manifest = {"files": {}}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    files = manifest.setdefault("files", {})
+    # 이전에 옮겨진 경로는 그 새 경로가 다시 옮겨진 곳을 따라감
+    current = {_rel(old): sorted(_rel(p) for p in new) for old, new in moved.items()}
+    for old, new in list(files.items()):
+        if new is not None:
+            files[old] = sorted({p for target in new for p in current.get(target, [target])})
+    files.update(current)
+    for removed_path in removed:
+        key = _rel(removed_path)
+        if key not in current:
+            files[key] = None
+    manifest["tolerance"] = tolerance
+    manifest["shared_dir"] = _rel(os.path.join(root, SHARED_DIR))
+    dice_quantize._replace(path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+    return path
+
+
+def print_report(report, verbose=False):
+    print(f"glTF {report['gltf']}개, accessor {report['accessors']}개 → 고유 데이터 {report['unique_accessors']}개 "
+          f"(허용 오차 {report['tolerance']:g})")
+    for path, reason in report["skipped"]:
+        print(f"⏭️ {path}: {reason}")
+
+    if report["duplicate_meshes"]:
+        print(f"\n같은 지오메트리를 쓰는 메시 {len(report['duplicate_meshes'])}묶음:")
+        for members in report["duplicate_meshes"]:
+            print(f"  {len(members)}× {', '.join(members[:3])}{' …' if len(members) > 3 else ''}")
+    near = [item for blob in report["shared_accessors"] for item in blob["near"]]
+    if near:
+        print(f"\n허용 오차로 합친 accessor {len(near)}개 (최대 차이 {max(n['max_diff'] for n in near):.2e})")
+    if verbose:
+        for blob in sorted(report["shared_accessors"], key=lambda b: -b["bytes"] * len(b["users"])):
+            print(f"  {blob['format']:<22} {blob['bytes'] / 1024:>8.0f}K × {len(blob['users'])}: "
+                  f"{', '.join(blob['users'][:3])}{' …' if len(blob['users']) > 3 else ''}")
+
+    if report["orphan_buffers"]:
+        total = sum(item["bytes"] for item in report["orphan_buffers"])
+        print(f"\n참조되지 않는 .bin {len(report['orphan_buffers'])}개 ({total / 1048576:.1f}M):")
+        for item in report["orphan_buffers"]:
+            notes = []
+            if item["copy_of"]:
+                notes.append(f"{item['copy_of']}와 같은 내용")
+            if item["aliases"]:
+                notes.append(f"이름만 다름: {', '.join(item['aliases'])}")
+            print(f"  {item['path']:<48} {item['bytes'] / 1024:>8.0f}K  {'; '.join(notes)}")
+    if report["blend_backups"]:
+        total = sum(item["bytes"] for item in report["blend_backups"])
+        print(f"\n.blend1 백업 {len(report['blend_backups'])}개 ({total / 1048576:.1f}M)")
+
+    before, after = report["bytes_before"], report["bytes_after"]
+    print("-" * 96)
+    print(f"참조 버퍼: {report['files_before']}개 {before / 1048576:.1f}M → {report['files_after']}개 {after / 1048576:.1f}M"
+          + (f" ({100 * (1 - after / before):.0f}% 감소)" if before else ""))
+    if "removed" in report:
+        print(f"✅ 다시 썼습니다. 지운 파일 {len(report['removed'])}개, "
+              f"매니페스트: {_rel(os.path.join(report['root'], MANIFEST_NAME))}")
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="glTF 지오메트리 중복 제거 + 공유 버퍼 통합")
+    parser.add_argument("root", nargs="?", default=dice_catalog.DEFAULT_OUTPUT_ROOT, help="glTF 폴더")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="float accessor를 같은 데이터로 볼 최대 차이 (0이면 바이트가 같을 때만)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 리포트만")
+    parser.add_argument("--prune", action="store_true", help="참조되지 않는 .bin과 .blend1 백업도 삭제")
+    parser.add_argument("--blend-backups", default=None, metavar="DIR",
+                        help=".blend1 백업을 찾을 폴더 (기본: root 아래만)")
+    parser.add_argument("--json", default=None, help="리포트 JSON 저장 경로")
+    parser.add_argument("-v", "--verbose", action="store_true", help="공유 accessor 목록 출력")
+    args = parser.parse_args(argv)
+
+    if not glob.glob(os.path.join(args.root, "**", "*.gltf"), recursive=True):
+        print(f"❌ glTF 파일이 없습니다: {args.root}")
+        return 1
+    try:
+        report = dedupe(args.root, args.tolerance, not args.dry_run, args.prune, args.blend_backups)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}")
+        return 1
+    print_report(report, args.verbose)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
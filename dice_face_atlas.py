@@ -0,0 +1,361 @@
+"""주사위 면 텍스처 아틀라스 오프라인 생성기
+
+DiceFaceTextureCache(scripts/utils/dice_face_texture_cache.gd)가 게임 시작 때 만들던
+색상별 면 아틀라스를 미리 그려 둡니다. 주사위 타입(Main.ALL_DICE_INFO)마다 페이지 한 장,
+페이지 안에 색상(DiceBag.COLORS)마다 3 × 2 블록이 있고, 블록 안의 면 배치는
+dice_face_image.gd의 FACE_RECTS와 같습니다 (기본 셀 200px).
+
+  - 눈 위치/크기: dice_geometry.make_pip_patterns(pip_spacing), pip_size (dice_catalog 기본 지오메트리)
+  - 눈 가장자리: 픽셀마다 눈까지의 부호 거리(SDF)로 덮인 비율을 계산해 안티앨리어싱
+  - 색상: dice_catalog "0_dice"의 본체/눈 색상 (선형 → sRGB), 섞기와 밉맵 축소는 선형 공간
+  - 특수 타입: 테두리 강조색, Faceless는 눈 없음, Prism은 무지개 본체, Shadow는 어두운 본체
+
+출력 (기본 assets/dice_faces/)
+  dice_faces_<타입>.png    밉 0 (미리보기 / 일반 임포트용)
+  dice_faces_<타입>.mips   밉 전체 (Godot Image 밉맵 순서, RGBA8, zlib) - Image.create_from_data용
+  dice_faces.json          페이지/블록/면별 픽셀 사각형과 UV (왼쪽 위 원점)
+
+.mips는 임포트되지 않는 파일이므로 내보내기 프리셋의 리소스 필터에 *.mips, *.json을 넣어야 합니다.
+설정과 지오메트리가 같으면 다시 그리지 않습니다 (--force로 강제).
+
+    python dice_face_atlas.py
+    python dice_face_atlas.py --cell 256 --types 0 1 4 8 --force
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+
+import numpy as np
+
+import dice_atlas
+import dice_catalog
+import dice_geometry
+
+OUTPUT_DIR = os.path.join(dice_catalog.PROJECT_DIR, "assets", "dice_faces")
+INDEX_NAME = "dice_faces.json"
+PAGE_NAME = "dice_faces_{type}"
+
+# dice_face_image.gd FACE_RECTS: 면 값 → (열, 행), 셀 200px
+DEFAULT_CELL_PX = 200
+BLOCK_GRID = (3, 2)
+FACE_CELLS = {1: (0, 1), 2: (2, 0), 3: (2, 1), 4: (1, 1), 5: (0, 0), 6: (1, 0)}
+
+# DiceBag.COLORS → dice_catalog 색상 이름
+COLOR_KEYS = ["W", "K", "R", "G", "B"]
+CATALOG_COLORS = {"W": "White", "K": "Black", "R": "Red", "G": "Green", "B": "Blue"}
+COLOR_SOURCE = "0_dice"
+
+# Main.ALL_DICE_INFO 타입별 그리기 방식
+#   frame: 테두리 강조색 (선형 RGB), pips: 눈을 그릴지, body: "prism" / "shadow" / None
+TYPE_STYLES = {
+    0: {"name": "Basic Dice"},
+    1: {"name": "Plus Dice", "frame": (1.0, 0.55, 0.0)},
+    2: {"name": "Dollar Dice", "frame": (0.1, 0.6, 0.1)},
+    3: {"name": "Multiply Dice", "frame": (0.5, 0.0, 0.8)},
+    4: {"name": "Faceless Dice", "frame": (0.5, 0.5, 0.5), "pips": False},
+    5: {"name": "Lucky Dice", "frame": (0.9, 0.75, 0.0)},
+    6: {"name": "Growing Dice", "frame": (0.0, 0.7, 0.4)},
+    7: {"name": "Ugly Dice", "frame": (0.35, 0.25, 0.1)},
+    8: {"name": "Prism Dice", "body": "prism"},
+    9: {"name": "Shadow Dice", "body": "shadow"},
+}
+
+# 테두리: 면 반폭 대비 중심선 위치 / 두께 (눈 바깥, 베벨 안쪽)
+FRAME_POSITION = 0.84
+FRAME_WIDTH = 0.05
+# 베벨 띠 밝기 (가장자리 → 안쪽)
+BEVEL_SHADE = 0.8
+SHADOW_SHADE = 0.45
+
+
+# ============================================================================
+# 색 공간
+# ============================================================================
+def srgb_to_linear(srgb):
+    srgb = np.asarray(srgb, dtype=np.float32)
+    return np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb8(linear):
+    linear = np.clip(linear, 0.0, 1.0)
+    srgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
+    return np.round(srgb * 255).astype(np.uint8)
+
+
+def _hue_rgb(hue):
+    """색상환 위치 (0~1) → 선형 RGB (HSV 채도/명도 1)"""
+    k = (hue[..., None] * 6 + np.array([5, 3, 1])) % 6
+    srgb = 1 - np.clip(np.minimum(k, 4 - k), 0, 1)
+    return srgb_to_linear(srgb)
+
+
+# ============================================================================
+# 면 그리기
+# ============================================================================
+def face_coordinates(cell_px, dice_size):
+    """셀 픽셀 중심 → 면 좌표 (u 오른쪽, v 위쪽, -half ~ half)"""
+    half = dice_size / 2
+    t = ((np.arange(cell_px) + 0.5) / cell_px * 2 - 1) * half
+    return np.meshgrid(t, -t)
+
+
+def box_sdf(u, v, cx, cy, half_w, half_h):
+    """축 정렬 사각형까지의 부호 거리 (안쪽 음수)"""
+    qx = np.abs(u - cx) - half_w
+    qy = np.abs(v - cy) - half_h
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    return outside + np.minimum(np.maximum(qx, qy), 0)
+
+
+def coverage(sdf, pixel):
+    """부호 거리 → 픽셀이 덮인 비율 (경계 1픽셀 폭 선형 램프)"""
+    return np.clip(0.5 - sdf / pixel, 0.0, 1.0)
+
+
+def render_face(face_value, body, pip, style, geometry, cell_px, pip_patterns):
+    """면 하나 → (cell, cell, 3) 선형 RGB"""
+    dice_size = geometry["dice_size"]
+    half = dice_size / 2
+    pixel = dice_size / cell_px
+    u, v = face_coordinates(cell_px, dice_size)
+
+    if style.get("body") == "prism":
+        color = _hue_rgb(((u + v) / (4 * half) + 0.5) % 1.0)
+    else:
+        color = np.broadcast_to(np.asarray(body, dtype=np.float32), u.shape + (3,)).copy()
+        if style.get("body") == "shadow":
+            color *= SHADOW_SHADE
+
+    # 베벨 띠: 가장자리로 갈수록 어둡게
+    edge = half - np.maximum(np.abs(u), np.abs(v))
+    bevel = geometry["bevel_amount"]
+    shade = np.where(edge < bevel, BEVEL_SHADE + (1 - BEVEL_SHADE) * np.clip(edge / bevel, 0, 1), 1.0)
+    color *= shade[..., None]
+
+    if style.get("frame"):
+        frame_sdf = np.abs(box_sdf(u, v, 0, 0, half * FRAME_POSITION, half * FRAME_POSITION)) - half * FRAME_WIDTH / 2
+        alpha = coverage(frame_sdf, pixel)[..., None]
+        color = color * (1 - alpha) + np.asarray(style["frame"], dtype=np.float32) * alpha
+
+    if style.get("pips", True):
+        r = geometry["pip_size"] / 2
+        alpha = np.zeros(u.shape, dtype=np.float32)
+        for px, py in pip_patterns[face_value]:
+            alpha = np.maximum(alpha, coverage(box_sdf(u, v, px, py, r, r), pixel))
+        alpha = alpha[..., None]
+        color = color * (1 - alpha) + np.asarray(pip, dtype=np.float32) * alpha
+    return color
+
+
+def render_page(type_index, geometry, cell_px, colors):
+    """타입 한 장 (2 × cell, 색상 수 × 3 × cell, 3) 선형 RGB"""
+    style = TYPE_STYLES[type_index]
+    pip_patterns = dice_geometry.make_pip_patterns(geometry["pip_spacing"])
+    block_w, block_h = BLOCK_GRID[0] * cell_px, BLOCK_GRID[1] * cell_px
+    page = np.zeros((block_h, block_w * len(colors), 3), dtype=np.float32)
+    for b, (color_key, body, pip) in enumerate(colors):
+        for face_value, (col, row) in FACE_CELLS.items():
+            x0, y0 = b * block_w + col * cell_px, row * cell_px
+            page[y0:y0 + cell_px, x0:x0 + cell_px] = render_face(
+                face_value, body, pip, style, geometry, cell_px, pip_patterns)
+    return page
+
+
+# ============================================================================
+# 밉맵
+# ============================================================================
+def mip_sizes(width, height):
+    """Godot Image 밉맵 크기 순서 (1 × 1까지, 각 변 max(1, n >> 1))"""
+    sizes = [(width, height)]
+    while width > 1 or height > 1:
+        width, height = max(1, width >> 1), max(1, height >> 1)
+        sizes.append((width, height))
+    return sizes
+
+
+def downsample(image, width, height):
+    """선형 RGB 2 × 2 박스 필터 → (height, width) (홀수 변은 마지막 줄을 복제해 맞춤)"""
+    h, w = image.shape[:2]
+    if h % 2:
+        image = np.concatenate([image, image[-1:]], axis=0)
+    if w % 2:
+        image = np.concatenate([image, image[:, -1:]], axis=1)
+    if h == 1:
+        image = np.concatenate([image, image], axis=0)
+    if w == 1:
+        image = np.concatenate([image, image], axis=1)
+    reduced = (image[0::2, 0::2] + image[1::2, 0::2] + image[0::2, 1::2] + image[1::2, 1::2]) / 4
+    return reduced[:height, :width]
+
+
+def mip_chain(page):
+    """선형 RGB 페이지 → [RGBA8 배열] (Godot 밉맵 순서)"""
+    height, width = page.shape[:2]
+    levels = []
+    image = page
+    for i, (w, h) in enumerate(mip_sizes(width, height)):
+        if i:
+            image = downsample(image, w, h)
+        rgba = np.empty((h, w, 4), dtype=np.uint8)
+        rgba[..., :3] = linear_to_srgb8(image)
+        rgba[..., 3] = 255
+        levels.append(rgba)
+    return levels
+
+
+def aligned_levels(cell_px):
+    """블록/면 경계가 픽셀 경계와 맞아 이웃 면이 섞이지 않는 밉 레벨 수 (셀이 짝수인 동안)"""
+    levels = 1
+    while cell_px % 2 == 0:
+        cell_px //= 2
+        levels += 1
+    return levels
+
+
+# ============================================================================
+# 쓰기
+# ============================================================================
+def write_png_array(path, rgba):
+    height, width = rgba.shape[:2]
+    raw = np.concatenate([np.zeros((height, 1), dtype=np.uint8), rgba.reshape(height, width * 4)], axis=1)
+    dice_atlas.write_png_raw(path, width, height, raw.tobytes(), level=6)
+
+
+def write_mips(path, levels):
+    data = zlib.compress(b"".join(level.tobytes() for level in levels), 6)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def catalog_colors():
+    """[(색상 키, 본체 선형 RGB, 눈 선형 RGB)] - DiceBag.COLORS 순서"""
+    spec = dice_catalog.DICE_TYPES[COLOR_SOURCE]
+    return [(key, tuple(spec["dice_colors"][CATALOG_COLORS[key]][:3]), tuple(spec["pip_colors"][CATALOG_COLORS[key]][:3]))
+            for key in COLOR_KEYS]
+
+
+def settings_hash(settings):
+    text = json.dumps(settings, sort_keys=True)
+    with open(os.path.abspath(__file__), "rb") as f:
+        source = f.read()
+    return hashlib.sha256(text.encode() + source).hexdigest()[:16]
+
+
+def build_index(type_indices, cell_px, colors, geometry, pages, source_hash):
+    block_w, block_h = BLOCK_GRID[0] * cell_px, BLOCK_GRID[1] * cell_px
+    page_w, page_h = block_w * len(colors), block_h
+    blocks = {}
+    for type_index in type_indices:
+        for b, (color_key, _, _) in enumerate(colors):
+            x0 = b * block_w
+            faces = {}
+            for face_value, (col, row) in FACE_CELLS.items():
+                fx, fy = x0 + col * cell_px, row * cell_px
+                faces[str(face_value)] = {
+                    "pixel_rect": [fx, fy, fx + cell_px, fy + cell_px],
+                    "uv_rect": [fx / page_w, fy / page_h, (fx + cell_px) / page_w, (fy + cell_px) / page_h],
+                }
+            blocks[f"{type_index}/{color_key}"] = {
+                "page": str(type_index),
+                "pixel_rect": [x0, 0, x0 + block_w, block_h],
+                "faces": faces,
+            }
+    return {
+        "source_hash": source_hash,
+        "cell_px": cell_px,
+        "block_grid": list(BLOCK_GRID),
+        "face_cells": {str(k): list(v) for k, v in FACE_CELLS.items()},
+        "uv_origin": "top_left",
+        "format": "RGBA8",
+        "colors": [key for key, _, _ in colors],
+        "geometry": geometry,
+        "pages": pages,
+        "blocks": blocks,
+    }
+
+
+def generate(out_dir=OUTPUT_DIR, cell_px=DEFAULT_CELL_PX, type_indices=None, force=False):
+    """아틀라스 페이지와 인덱스를 쓰고 인덱스 dict를 반환 (변경 없으면 기존 인덱스)"""
+    type_indices = sorted(type_indices if type_indices is not None else TYPE_STYLES)
+    geometry = dict(dice_catalog.BASE_GEOMETRY)
+    colors = catalog_colors()
+    source_hash = settings_hash({
+        "cell_px": cell_px, "types": type_indices, "colors": colors, "geometry": geometry,
+        "styles": {str(k): TYPE_STYLES[k] for k in type_indices},
+    })
+
+    index_path = os.path.join(out_dir, INDEX_NAME)
+    if not force and os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            existing = json.load(f)
+        files = [page[key] for page in existing.get("pages", {}).values() for key in ("png", "mips")]
+        if existing.get("source_hash") == source_hash and all(os.path.exists(os.path.join(out_dir, n)) for n in files):
+            return existing, False
+
+    os.makedirs(out_dir, exist_ok=True)
+    pages = {}
+    for type_index in type_indices:
+        page = render_page(type_index, geometry, cell_px, colors)
+        levels = mip_chain(page)
+        name = PAGE_NAME.format(type=type_index)
+        write_png_array(os.path.join(out_dir, name + ".png"), levels[0])
+        compressed = write_mips(os.path.join(out_dir, name + ".mips"), levels)
+        pages[str(type_index)] = {
+            "name": TYPE_STYLES[type_index]["name"],
+            "png": name + ".png",
+            "mips": name + ".mips",
+            "size": [page.shape[1], page.shape[0]],
+            "mip_sizes": [[level.shape[1], level.shape[0]] for level in levels],
+            "aligned_mips": aligned_levels(cell_px),
+            # PackedByteArray.decompress(data_bytes, FileAccess.COMPRESSION_DEFLATE)에 넘길 크기
+            "data_bytes": sum(level.nbytes for level in levels),
+            "compressed_bytes": compressed,
+        }
+
+    index = build_index(type_indices, cell_px, colors, geometry, pages, source_hash)
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, index_path)
+    return index, True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 면 텍스처 아틀라스 (밉맵 + UV 인덱스) 생성")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="출력 폴더")
+    parser.add_argument("--cell", type=int, default=DEFAULT_CELL_PX, help="면 한 칸 픽셀 크기 (dice_face_image.gd는 200)")
+    parser.add_argument("--types", type=int, nargs="*", default=None, help="생성할 타입 번호 (기본: 전부)")
+    parser.add_argument("--force", action="store_true", help="변경이 없어도 다시 생성")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.types or []) - set(TYPE_STYLES))
+    if unknown:
+        print(f"❌ 알 수 없는 타입: {unknown} (가능: {sorted(TYPE_STYLES)})")
+        return 2
+    if args.cell < 8:
+        print(f"❌ 셀 크기가 너무 작습니다: {args.cell}")
+        return 2
+
+    started = time.perf_counter()
+    index, written = generate(args.out, args.cell, args.types, args.force)
+    if not written:
+        print(f"✅ 변경 없음: {os.path.join(args.out, INDEX_NAME)}")
+        return 0
+    for type_index, page in index["pages"].items():
+        width, height = page["size"]
+        print(f"  {page['png']:<20} {width}×{height}, 밉 {len(page['mip_sizes'])}단계 "
+              f"(경계 정렬 {page['aligned_mips']}단계), .mips {page['compressed_bytes'] / 1024:.0f}KB")
+    print(f"✅ 페이지 {len(index['pages'])}장, 블록 {len(index['blocks'])}개 "
+          f"({time.perf_counter() - started:.1f}초): {os.path.join(args.out, INDEX_NAME)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
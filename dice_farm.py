@@ -0,0 +1,390 @@
+"""주사위 변형 매트릭스 병렬 익스포트 팜
+
+스펙 파일(dice_matrix.json)의 (타입 × 색상) 매트릭스를 빌드 계획으로 펼쳐 N개의
+헤드리스 Blender 프로세스에 나눠 빌드/익스포트하고, 종료 코드·로그·출력 경로를 하나의
+요약으로 모읍니다. 변형은 -j개 워커 모두에 고르게 나누고, 같은 형태의 변형은 이어지게
+배정해서 워커마다 만드는 형태 메시 수를 줄입니다. 공유 균열 맵은 해시별 잠금으로
+한 워커만 굽습니다 (dice_bake.bake_crack_maps). 일반 파이썬으로 실행합니다.
+
+    python dice_farm.py --output-root /tmp/models    # 전체 카탈로그 재생성
+    python dice_farm.py --blender /Applications/Blender.app/Contents/MacOS/Blender -j 8
+    python dice_farm.py --spec my_matrix.json --dry-run   # 빌드 계획(공유 단계, 워커 배정)만 출력
+    python dice_farm.py --types 0_dice --colors Red Blue --dry-run
+    python dice_farm.py --force          # 빌드 캐시 무시하고 전체 재빌드
+    python dice_farm.py --atlas          # 모든 변형이 팔레트 아틀라스 재질 하나를 공유 (출력: <이름>_atlas.gltf)
+    python dice_farm.py --lods           # 변형마다 LOD0~2를 같은 glTF에 함께 익스포트
+    python dice_farm.py --trace farm_trace.json --profile   # 단계별 추적 + 가장 느린 변형 프로파일
+    python dice_farm.py -j 1 --batch     # 프로세스 하나로 전체 익스포트 (변형마다 메모리 정리 + 검사)
+    python dice_farm.py --icons          # 익스포트 후 아이콘 스프라이트 시트 렌더 (dice_icons.py)
+    python dice_farm.py --quantize       # 새로 익스포트한 glTF를 양자화 + 인덱스 최적화 (dice_quantize.py)
+    python dice_farm.py --quantize --dedupe   # 이어서 같은 지오메트리를 공유 버퍼로 통합 (dice_dedupe.py)
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import dice_atlas
+import dice_build_cache
+import dice_catalog
+import dice_collision
+import dice_dedupe
+import dice_icons
+import dice_lod
+import dice_quantize
+import dice_trace
+
+WORKER_SCRIPT = os.path.join(dice_catalog.PROJECT_DIR, "dice_farm_worker.py")
+
+
+# ============================================================================
+# 작업 분할
+# ============================================================================
+def shape_group_key(variant):
+    """같은 형태 메시(와 그 형태로 굽는 균열 맵)를 쓰는 변형끼리 같은 키"""
+    return json.dumps(variant["geometry"], sort_keys=True)
+
+
+def build_plan(variants, workers):
+    """변형 목록 → 빌드 계획 (공유 단계 + 워커별 몫)
+
+    변형을 형태 순으로 늘어놓고 워커 수만큼 연속 구간으로 자릅니다 (워커 수 ≤ 변형 수).
+    형태 메시는 워커 안에서만 캐시되므로 같은 형태가 한 구간에 모일수록 덜 만들고,
+    균열 베이크는 해시별 잠금 파일로 여러 워커 중 하나만 굽습니다.
+    """
+    groups = {}
+    for variant in variants:
+        groups.setdefault(shape_group_key(variant), []).append(variant)
+    bakes = {json.dumps([v["geometry"], v["cracks"], v["crack_maps"]], sort_keys=True)
+             for v in variants if v.get("cracks") and v.get("crack_maps")}
+
+    ordered = [variant for group in groups.values() for variant in group]
+    workers = max(1, min(workers, len(ordered)))
+    base, extra = divmod(len(ordered), workers)
+    shares, start = [], 0
+    for i in range(workers):
+        end = start + base + (1 if i < extra else 0)
+        shares.append(ordered[start:end])
+        start = end
+    return {
+        "shapes": [{"geometry": group[0]["geometry"], "variants": [v["name"] for v in group]}
+                   for group in groups.values()],
+        "bakes": len(bakes),
+        "shares": [share for share in shares if share],
+    }
+
+
+def split_jobs(variants, workers):
+    """워커별 변형 목록 (같은 형태는 가능한 한 같은 워커에)"""
+    return build_plan(variants, workers)["shares"]
+
+
+def print_plan(plan):
+    print(f"공유 단계: 형태 {len(plan['shapes'])}개, 균열 베이크 {plan['bakes']}개")
+    for shape in plan["shapes"]:
+        print(f"  형태 {shape_group_key({'geometry': shape['geometry']})}")
+        print(f"    → {', '.join(shape['variants'])}")
+    for i, share in enumerate(plan["shares"]):
+        print(f"워커 {i}: {', '.join(v['name'] for v in share)}")
+
+
+def worker_command(blender, jobs_path, result_path, output_root, trace_path=None, profile=False, batch=False):
+    command = [
+        blender, "-b", "--factory-startup", "-t", "1",
+        "--python-exit-code", "1",
+        "--python", WORKER_SCRIPT, "--",
+        "--jobs", jobs_path, "--result", result_path, "--output-root", output_root,
+    ]
+    if trace_path:
+        command += ["--trace", trace_path]
+    if profile:
+        command.append("--profile")
+    if batch:
+        command.append("--batch")
+    return command
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+def _pin_to_core(core):
+    # 워커 하나당 CPU 코어 하나 (지원하는 OS에서만)
+    def pin():
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {core})
+            except OSError:
+                pass
+    return pin
+
+
+def run_worker(index, command, log_path, core):
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run(command, stdout=log, stderr=subprocess.STDOUT,
+                              preexec_fn=_pin_to_core(core) if os.name == "posix" else None)
+    return {
+        "worker": index,
+        "exit_code": proc.returncode,
+        "seconds": round(time.perf_counter() - started, 3),
+        "log": log_path,
+    }
+
+
+def run_farm(variants, blender, workers, output_root, log_dir, trace=False, profile=False, batch=False):
+    shares = split_jobs(variants, workers)
+    os.makedirs(log_dir, exist_ok=True)
+    cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+
+    jobs = []
+    for i, share in enumerate(shares):
+        jobs_path = os.path.join(log_dir, f"jobs_{i}.json")
+        result_path = os.path.join(log_dir, f"result_{i}.json")
+        with open(jobs_path, "w", encoding="utf-8") as f:
+            json.dump(share, f, ensure_ascii=False)
+        if os.path.exists(result_path):
+            os.remove(result_path)
+        trace_path = os.path.join(log_dir, f"trace_{i}.json") if trace or profile else None
+        jobs.append((i, worker_command(blender, jobs_path, result_path, output_root, trace_path, profile, batch),
+                     os.path.join(log_dir, f"worker_{i}.log"), cores[i % len(cores)], result_path, share))
+
+    print(f"변형 {len(variants)}개 → 워커 {len(jobs)}개")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [pool.submit(run_worker, i, cmd, log, core) for i, cmd, log, core, _, _ in jobs]
+        worker_reports = [f.result() for f in futures]
+
+    # 워커별 결과 JSON 수집 (워커가 죽었으면 맡은 변형을 모두 실패로 기록)
+    variant_reports = []
+    for (i, _, _, _, result_path, share), report in zip(jobs, worker_reports):
+        if os.path.exists(result_path):
+            with open(result_path, encoding="utf-8") as f:
+                result = json.load(f)
+            variant_reports.extend(result["variants"])
+            report["memory"] = result.get("memory")
+        else:
+            variant_reports.extend({
+                "name": v["name"], "type": v["type"], "color": v["color"], "status": "failed",
+                "output": None, "seconds": None, "error": f"워커 {i} 비정상 종료 ({report['log']})",
+            } for v in share)
+
+    return {
+        "total_seconds": round(time.perf_counter() - started, 3),
+        "traces": [os.path.join(log_dir, f"trace_{i}.json") for i in range(len(jobs))] if trace or profile else [],
+        "workers": worker_reports,
+        "variants": variant_reports,
+        "ok": sum(1 for r in variant_reports if r["status"] == "ok"),
+        "failed": sum(1 for r in variant_reports if r["status"] != "ok"),
+    }
+
+
+def print_summary(summary):
+    print("\n" + "=" * 70)
+    print(f"{'워커':>4} {'종료코드':>8} {'시간(s)':>9}  로그")
+    for w in summary["workers"]:
+        print(f"{w['worker']:>4} {w['exit_code']:>8} {w['seconds']:>9.2f}  {w['log']}")
+    for w in summary["workers"]:
+        memory = w.get("memory")
+        if memory:
+            print(f"     워커 {w['worker']} 메모리: RSS {memory['rss_first_mb']} → {memory['rss_last_mb']}MB, "
+                  f"위반 {len(memory['violations'])}건")
+            for violation in memory["violations"]:
+                print(f"     ❌ {violation}")
+    print("-" * 70)
+    for r in summary["variants"]:
+        mark = "✅" if r["status"] == "ok" else "❌"
+        print(f"{mark} {r['name']:<32} {r['output'] or r['error'].splitlines()[-1]}")
+    print("=" * 70)
+    print(f"완료 {summary['ok']}개 / 실패 {summary['failed']}개, 총 {summary['total_seconds']:.1f}초")
+
+
+def render_icons(blender, output_root):
+    """익스포트 결과로 아이콘 시트를 다시 렌더합니다 (모델이 그대로면 건너뜀)"""
+    try:
+        manifest, written, missing = dice_icons.render_icons(blender, output_root)
+    except RuntimeError as e:
+        print(f"❌ 아이콘: {e}")
+        return False
+    for line in missing:
+        print(f"  ⚠️ 아이콘 {line}")
+    if manifest is None:
+        print("❌ 아이콘: 렌더할 모델이 없습니다.")
+        return False
+    state = "렌더" if written else "변경 없음"
+    print(f"✅ 아이콘 {len(manifest['icons'])}개 ({state}): {os.path.join(dice_icons.OUTPUT_DIR, dice_icons.MANIFEST_NAME)}")
+    return True
+
+
+def quantize_outputs(paths):
+    """새로 익스포트한 glTF만 양자화합니다 (캐시로 건너뛴 출력은 이미 처리됨)"""
+    shared = dice_quantize.shared_buffers(paths)
+    reports = []
+    for path in paths:
+        try:
+            reports.append(dice_quantize.quantize_gltf(path, shared=shared))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ 양자화 {os.path.basename(path)}: {e}")
+            return False
+    dice_quantize.print_table(reports)
+    return True
+
+
+def dedupe_outputs(output_root):
+    """출력 폴더 전체의 같은 지오메트리를 공유 버퍼로 통합합니다 (양자화 뒤에 실행)"""
+    try:
+        report = dice_dedupe.dedupe(output_root)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 중복 제거: {e}")
+        return False
+    dice_dedupe.print_report(report)
+    return True
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 변형 병렬 익스포트 팜")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender 실행 파일")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--types", nargs="*", help="빌드할 타입 (기본: 전체)")
+    parser.add_argument("--colors", nargs="*", help="빌드할 색상 (기본: 전체)")
+    parser.add_argument("--spec", default=dice_catalog.SPEC_PATH, help="타입 × 색상 스펙 파일")
+    parser.add_argument("--output-root", default=None, help="출력 폴더 (기본: 스펙의 output_root)")
+    parser.add_argument("--log-dir", default=None, help="워커 로그/결과 폴더 (기본: 임시 폴더)")
+    parser.add_argument("--summary", default=None, help="요약 JSON 저장 경로")
+    parser.add_argument("--dry-run", action="store_true", help="분할 결과만 출력")
+    parser.add_argument("--force", action="store_true", help="빌드 캐시를 무시하고 모두 다시 빌드")
+    parser.add_argument("--atlas", action="store_true", help="공유 팔레트 아틀라스 + 단일 재질로 익스포트")
+    parser.add_argument("--lods", action="store_true", help="LOD 체인(홈 없는 눈, 눈 텍스처 큐브)을 함께 익스포트")
+    parser.add_argument("--trace", default=None, help="워커 추적을 합친 Chrome 추적 JSON 경로")
+    parser.add_argument("--profile", action="store_true", help="워커마다 가장 느린 변형의 cProfile 통계 저장")
+    parser.add_argument("--batch", action="store_true",
+                        help="장시간 배치 모드: 변형마다 고아 블록을 해제하고 메모리가 평평한지 검사")
+    parser.add_argument("--icons", action="store_true", help="익스포트 후 아이콘 스프라이트 시트를 렌더")
+    parser.add_argument("--quantize", action="store_true",
+                        help="익스포트한 glTF를 KHR_mesh_quantization + 정점 캐시 순서로 다시 씀")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="출력 폴더의 같은 지오메트리를 공유 .bin 하나로 통합 (dice_dedupe.py)")
+    parser.add_argument("--collision-max-vertices", type=int, default=dice_collision.DEFAULT_MAX_VERTICES,
+                        help="충돌 헐 사이드카(.tres)의 정점 상한")
+    args = parser.parse_args(argv)
+
+    spec_output_root, _, _, catalog_types = dice_catalog.load_spec(args.spec)
+    output_root = os.path.abspath(args.output_root or spec_output_root)
+    for name, note in dice_catalog.manual_types(catalog_types).items():
+        if not args.types or name in args.types:
+            print(f"⏭️ {name}: {note}")
+    types = [t for t in args.types if t not in dice_catalog.manual_types(catalog_types)] if args.types else None
+    if args.types and not types:
+        print("빌드할 변형이 없습니다.")
+        return 0
+    variants = dice_catalog.expand_matrix(types, args.colors, catalog_types)
+    if not variants:
+        print("빌드할 변형이 없습니다.")
+        return 0
+
+    if args.atlas:
+        # 배치는 항상 전체 카탈로그 기준 (일부만 빌드해도 셀 위치가 바뀌지 않도록)
+        catalog = dice_catalog.expand_matrix(catalog=catalog_types)
+        layout = dice_atlas.build_layout(catalog)
+        if not args.dry_run:
+            index_path = dice_atlas.write_atlas(dice_catalog.texture_dir(output_root), catalog, layout)
+            print(f"팔레트 아틀라스: {index_path} ({layout['size'][0]}×{layout['size'][1]})")
+        for variant in variants:
+            variant["atlas"] = layout["cells"][dice_atlas.variant_key(variant)]
+            # 일반 익스포트와 출력·매니페스트 키가 겹치지 않도록 이름에 접미사
+            variant["name"] = dice_atlas.output_name(variant["name"])
+
+    if args.lods:
+        for variant in variants:
+            variant["lods"] = dice_lod.lod_spec()
+            over = [r for r in dice_lod.check_budgets(variant["geometry"]) if not r[3]]
+            for lod, triangles, budget, _ in over:
+                print(f"⚠️ {variant['name']} LOD{lod}: 삼각형 {triangles}개 > 예산 {budget}개")
+
+    blender_found = shutil.which(args.blender) is not None or os.path.exists(args.blender)
+    if not blender_found and not args.dry_run:
+        print(f"❌ Blender 실행 파일을 찾을 수 없습니다: {args.blender}")
+        return 2
+
+    # 증분 빌드: 해시가 바뀌었거나 출력이 없는 변형만 빌드
+    manifest = dice_build_cache.BuildManifest.for_output_root(output_root)
+    generator = dice_build_cache.generator_version()
+    blender_version = dice_build_cache.query_blender_version(args.blender) if blender_found else "unknown"
+    stale, fresh = dice_build_cache.plan_incremental(
+        variants, manifest, generator, blender_version,
+        lambda v: dice_catalog.output_path(v, output_root))
+    if args.force:
+        stale = [(v, dice_build_cache.variant_hash(v, generator, blender_version), "--force") for v in variants]
+        fresh = []
+    print(f"빌드 캐시: 다시 빌드 {len(stale)}개, 최신 {len(fresh)}개 ({blender_version}, 생성기 {generator})")
+    for variant, _, reason in stale:
+        print(f"  - {variant['name']}: {reason}")
+
+    # 충돌 헐 사이드카는 Blender 없이 만들 수 있어서 캐시와 무관하게 항상 맞춰 둡니다
+    if not args.dry_run:
+        for variant in variants:
+            dice_collision.write_collision_shape(
+                dice_catalog.output_path(variant, output_root), variant["geometry"], args.collision_max_vertices)
+        print(f"충돌 헐: {len(variants)}개 (정점 ≤ {args.collision_max_vertices})")
+
+    to_build = [variant for variant, _, _ in stale]
+    if not to_build:
+        print("✅ 모든 변형이 최신입니다.")
+        if args.dry_run:
+            return 0
+        dedupe_ok = dedupe_outputs(output_root) if args.dedupe else True
+        icons_ok = render_icons(args.blender, output_root) if args.icons else True
+        return 0 if dedupe_ok and icons_ok else 1
+
+    if args.dry_run:
+        print_plan(build_plan(to_build, args.workers))
+        return 0
+
+    log_dir = args.log_dir or tempfile.mkdtemp(prefix="dice_farm_")
+    summary = run_farm(to_build, args.blender, args.workers, output_root, log_dir,
+                       bool(args.trace), args.profile, args.batch)
+    summary["skipped"] = [v["name"] for v in fresh]
+    print_summary(summary)
+    if args.trace:
+        rows = dice_trace.merge_traces(summary["traces"], args.trace,
+                                       [f"worker {i}" for i in range(len(summary["traces"]))])
+        dice_trace.print_summary(rows)
+        print(f"📈 추적: {args.trace}")
+    if args.profile:
+        for path in summary["traces"]:
+            prof_path = os.path.splitext(path)[0] + ".prof"
+            if os.path.exists(prof_path):
+                print(f"🔬 프로파일: {prof_path}")
+
+    # 성공한 변형만 매니페스트에 기록 (실패한 변형은 다음 실행에 다시 시도)
+    hashes = {variant["name"]: digest for variant, digest, _ in stale}
+    for report in summary["variants"]:
+        if report["status"] == "ok":
+            manifest.record(report["name"], hashes[report["name"]], report["output"])
+        else:
+            manifest.forget(report["name"])
+    manifest.save()
+
+    quantize_ok = True
+    if args.quantize:
+        quantize_ok = quantize_outputs([r["output"] for r in summary["variants"] if r["status"] == "ok"])
+    dedupe_ok = dedupe_outputs(output_root) if args.dedupe else True
+
+    summary_path = args.summary or os.path.join(log_dir, "summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    print(f"요약: {summary_path}")
+    icons_ok = render_icons(args.blender, output_root) if args.icons else True
+    memory_ok = not any(w.get("memory") and w["memory"]["violations"] for w in summary["workers"])
+    return 0 if summary["failed"] == 0 and icons_ok and memory_ok and quantize_ok and dedupe_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
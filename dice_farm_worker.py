@@ -0,0 +1,96 @@
+"""익스포트 팜 워커 (Blender 헤드리스 전용)
+
+dice_farm.py가 아래처럼 실행합니다. 직접 실행할 일은 거의 없습니다.
+
+    blender -b --factory-startup -t 1 --python dice_farm_worker.py -- \
+        --jobs jobs_0.json --result result_0.json --output-root assets/models [--batch]
+
+--batch(장시간 배치 모드)는 변형을 하나 익스포트할 때마다 씬을 비우고 고아 데이터 블록
+(메시, 재질, 노드 트리, 이미지)을 해제한 뒤, 임시 블록 수와 RSS가 기준에서 늘지 않는지
+검사합니다. 그래서 한 프로세스로 수천 개를 익스포트해도 느려지거나 OOM으로 죽지 않고,
+어딘가 새는 곳이 생기면 종료 코드 1과 위반 목록으로 드러납니다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import dice_build
+import dice_catalog
+import dice_trace
+
+
+def parse_args(argv):
+    # Blender 인자와 스크립트 인자는 "--"로 구분됩니다
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="dice_farm_worker")
+    parser.add_argument("--jobs", required=True, help="이 워커가 맡을 변형 목록 JSON")
+    parser.add_argument("--result", required=True, help="결과를 기록할 JSON 경로")
+    parser.add_argument("--output-root", default=dice_catalog.DEFAULT_OUTPUT_ROOT)
+    parser.add_argument("--trace", default=None, help="단계별 추적(Chrome 추적 JSON) 경로")
+    parser.add_argument("--profile", action="store_true", help="가장 느린 변형의 cProfile 통계를 함께 저장")
+    parser.add_argument("--batch", action="store_true",
+                        help="변형마다 씬과 고아 데이터 블록을 비우고 메모리가 평평한지 검사")
+    parser.add_argument("--warmup", type=int, default=3, help="메모리 기준을 잡기 전 변형 수 (--batch)")
+    parser.add_argument("--rss-slack-mb", type=float, default=64.0, help="기준 대비 허용 RSS 증가량 (--batch)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args(sys.argv)
+    with open(args.jobs, encoding="utf-8") as f:
+        variants = json.load(f)
+
+    tracer = dice_trace.Tracer(args.trace, args.profile, process_name=os.path.basename(args.jobs))
+    with tracer.stage("씬 초기화"):
+        dice_build.reset_scene()
+    memory = dice_trace.FlatMemoryCheck(args.warmup, args.rss_slack_mb, strict=False) if args.batch else None
+    results = []
+    for variant in variants:
+        out_path = dice_catalog.output_path(variant, args.output_root)
+        name = variant["name"]
+        started = time.perf_counter()
+        try:
+            with tracer.stage("변형", category="variant", variant=name):
+                dice_build.build_and_export(variant, out_path, args.output_root, tracer)
+            status, error = "ok", None
+            print(f"  ✅ {variant['name']} → {out_path}")
+        except Exception:
+            status, error = "failed", traceback.format_exc()
+            print(f"  ❌ {variant['name']} 실패\n{error}")
+        if memory is not None:
+            # 성공/실패와 관계없이 남은 오브젝트와 재질·노드 트리·이미지를 모두 해제
+            with tracer.stage("고아 블록 정리", variant=name):
+                dice_build.reset_scene()
+                dice_build.purge_orphans()
+            memory.check(name)
+            if memory.violations and memory.violations[-1].startswith(name + ":"):
+                print(f"  ❌ {memory.violations[-1]}")
+        results.append({
+            "name": variant["name"],
+            "type": variant["type"],
+            "color": variant["color"],
+            "status": status,
+            "output": out_path if status == "ok" else None,
+            "seconds": round(time.perf_counter() - started, 3),
+            "error": error,
+        })
+
+    memory_report = memory.report() if memory is not None else None
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump({"variants": results, "memory": memory_report}, f, ensure_ascii=False, indent=2)
+
+    tracer.finish()
+    if memory_report:
+        print(f"메모리: 변형 {memory_report['variants']}개, RSS {memory_report['rss_first_mb']} → "
+              f"{memory_report['rss_last_mb']}MB (최대 {memory_report['rss_max_mb']}MB), "
+              f"위반 {len(memory_report['violations'])}건")
+    failed = sum(1 for r in results if r["status"] != "ok")
+    sys.exit(1 if failed or (memory_report and memory_report["violations"]) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,559 @@
+"""주사위 지오메트리 엔진
+
+bpy.ops 호출이나 Boolean 모디파이어 없이 베벨 본체, 눈 홈(recess), 눈 채우기 큐브를
+순수 파이썬 데이터로 직접 만듭니다. Blender 안에서는 create_mesh()로 메시 데이터
+블록을 만들고, Blender 밖(분석/베이크 도구 등)에서는 DiceMesh 데이터만 사용합니다.
+
+좌표 규칙은 dice.py / dice_optimized.py 와 동일합니다.
+  - Z면: (px, py, ±half)   X면: (±half, px, py)   Y면: (px, ±half, py)
+  - 눈 커터: pip_size 큐브, 면 바깥쪽 pip_depth/2 위치 → 홈 깊이 (pip_size - pip_depth) / 2
+  - 눈 채우기: pip_size * 0.9 큐브, 면 안쪽 pip_depth * 0.7 위치
+  - 재질 슬롯: 0 = 본체, 1 = 눈
+
+눈 표현 방식 (pip_style)
+  - "recessed": 눈 홈 + 눈 채우기 큐브 (기존 Boolean 결과와 같은 형태)
+  - "painted":  홈 없이 면과 같은 높이의 눈 사각형에만 눈 재질 (LOD용)
+  - "none":     눈 지오메트리 없음, 베벨 큐브만 (눈은 텍스처로)
+"""
+import itertools
+import math
+
+# ============================================================================
+# 눈 패턴 / 면 방향 테이블
+# ============================================================================
+# (면 값, 면 법선)
+FACES = [
+    (1, (0, 0, 1)), (6, (0, 0, -1)), (2, (1, 0, 0)),
+    (5, (-1, 0, 0)), (3, (0, 1, 0)), (4, (0, -1, 0)),
+]
+
+# 면 법선 → 눈 좌표 (px, py)가 놓이는 축 (u축, v축)
+FACE_AXES = {
+    (0, 0, 1): (0, 1), (0, 0, -1): (0, 1),
+    (1, 0, 0): (1, 2), (-1, 0, 0): (1, 2),
+    (0, 1, 0): (0, 2), (0, -1, 0): (0, 2),
+}
+
+BODY_MATERIAL_INDEX = 0
+PIP_MATERIAL_INDEX = 1
+
+PIP_STYLES = ("recessed", "painted", "none")
+
+# UV 레이아웃 (겹치는 곳이 없어야 노멀/텍스처 베이크와 탄젠트 계산이 가능)
+#   위쪽 2/3: 3 × 2 격자에 면 하나씩 (정사각형 셀), 홈 벽/바닥은 자기 눈 구멍 자리 안에
+#   아래쪽 1/3: 눈 채우기 큐브마다 정사각형 5칸 띠 (윗면 + 옆면 4개)
+#   면 값 → (열, 행), FACES 순서대로 배치
+UV_GRID = (3, 2)
+UV_LAYOUT = {face_value: (i % UV_GRID[0], i // UV_GRID[0]) for i, (face_value, _) in enumerate(FACES)}
+# 셀 가장자리 여백 (베이크 margin 번짐 방지, 셀 크기 대비 비율)
+UV_PADDING = 0.04
+# 눈 채우기 큐브 띠 영역의 높이와 칸 하나의 크기 (UV 단위)
+PIP_UV_BAND = 1.0 / 3
+PIP_UV_SQUARE = 0.05
+_PIP_UV_FACES = 5
+
+# 정점 병합 시 좌표 반올림 자릿수
+_MERGE_DIGITS = 6
+
+
+def make_pip_patterns(pip_spacing):
+    """면 값(1~6) → 눈 중심 좌표 목록"""
+    s = pip_spacing
+    return {
+        1: [(0, 0)],
+        2: [(-s, s), (s, -s)],
+        3: [(-s, s), (0, 0), (s, -s)],
+        4: [(-s, s), (s, s), (-s, -s), (s, -s)],
+        5: [(-s, s), (s, s), (0, 0), (-s, -s), (s, -s)],
+        6: [(-s, s), (s, s), (-s, 0), (s, 0), (-s, -s), (s, -s)],
+    }
+
+
+def uv_layout_params():
+    """UV 배치를 정하는 상수 (베이크/텍스처 캐시 해시용)"""
+    return {"uv_grid": UV_GRID, "uv_padding": UV_PADDING,
+            "pip_uv_band": PIP_UV_BAND, "pip_uv_square": PIP_UV_SQUARE}
+
+
+def face_uv_rect(face_value):
+    """면 값 → UV 공간의 셀 사각형 (u0, v0, u1, v1), 여백 제외"""
+    col, row = UV_LAYOUT[face_value]
+    cw, ch = 1.0 / UV_GRID[0], (1.0 - PIP_UV_BAND) / UV_GRID[1]
+    pu, pv = cw * UV_PADDING, ch * UV_PADDING
+    v_base = PIP_UV_BAND
+    return (col * cw + pu, v_base + row * ch + pv, (col + 1) * cw - pu, v_base + (row + 1) * ch - pv)
+
+
+def pip_uv_origin(pip_index):
+    """눈 채우기 큐브 번호 → 띠 왼쪽 아래 UV (칸 PIP_UV_SQUARE × 5개가 오른쪽으로 이어짐)"""
+    per_row = int(1.0 / (PIP_UV_SQUARE * _PIP_UV_FACES) + 1e-9)
+    rows = int(PIP_UV_BAND / PIP_UV_SQUARE + 1e-9)
+    if pip_index >= per_row * rows:
+        raise ValueError(f"눈이 너무 많아 UV 띠에 들어가지 않습니다: {pip_index + 1} > {per_row * rows}")
+    return ((pip_index % per_row) * PIP_UV_SQUARE * _PIP_UV_FACES, (pip_index // per_row) * PIP_UV_SQUARE)
+
+
+def face_uv(face_value, u, v, dice_size):
+    """면 위 좌표 (u, v) (-half ~ half) → UV"""
+    u0, v0, u1, v1 = face_uv_rect(face_value)
+    su = u / dice_size + 0.5
+    sv = v / dice_size + 0.5
+    return (u0 + (u1 - u0) * su, v0 + (v1 - v0) * sv)
+
+
+def face_point(normal, depth, u, v):
+    """면 법선 기준 (깊이, u, v) → 3D 좌표"""
+    axis = _normal_axis(normal)
+    ua, va = FACE_AXES[normal]
+    p = [0.0, 0.0, 0.0]
+    p[axis] = normal[axis] * depth
+    p[ua] = u
+    p[va] = v
+    return tuple(p)
+
+
+# ============================================================================
+# 메시 데이터
+# ============================================================================
+class DiceMesh:
+    """정점/면/재질 인덱스/UV 버퍼 (Blender 메시로 그대로 옮길 수 있는 형태)"""
+
+    def __init__(self, dice_size):
+        self.dice_size = dice_size
+        self.vertices = []
+        self.faces = []
+        self.material_indices = []
+        self.uvs = []
+        self._lookup = {}
+
+    def vertex(self, co):
+        key = tuple(round(c, _MERGE_DIGITS) + 0.0 for c in co)
+        index = self._lookup.get(key)
+        if index is None:
+            index = len(self.vertices)
+            self._lookup[key] = index
+            self.vertices.append(key)
+        return index
+
+    def add_face(self, points, outward, material_index=BODY_MATERIAL_INDEX, uvs=None):
+        """points를 outward 방향이 앞면이 되도록 정렬해서 추가합니다
+
+        uvs를 주지 않으면 폴리곤이 속한 주사위 면 셀에 평면 투영합니다 (면과 평행한 폴리곤용).
+        """
+        if uvs is None:
+            uvs = [None] * len(points)
+        if _dot(_newell_normal(points), outward) < 0:
+            points = list(reversed(points))
+            uvs = list(reversed(uvs))
+        indices = [self.vertex(p) for p in points]
+        # 병합으로 찌그러진 면(중복 정점)은 버립니다
+        if len(set(indices)) < 3:
+            return
+        if len(set(indices)) < len(indices):
+            keep = [n for n, i in enumerate(indices) if i != indices[n - 1]]
+            indices = [indices[n] for n in keep]
+            uvs = [uvs[n] for n in keep]
+        self.faces.append(tuple(indices))
+        self.material_indices.append(material_index)
+        if uvs[0] is None:
+            face_value, normal = self._owner_face([self.vertices[i] for i in indices], outward)
+            ua, va = FACE_AXES[normal]
+            uvs = [face_uv(face_value, self.vertices[i][ua], self.vertices[i][va], self.dice_size) for i in indices]
+        self.uvs.append(list(uvs))
+
+    def _owner_face(self, points, outward):
+        # 폴리곤 중심이 가장 멀리 나간 축의 주사위 면에 UV를 배정합니다
+        # (베벨 띠/모서리도 가장 가까운 면의 셀 가장자리로 들어감)
+        n = len(points)
+        centroid = [sum(p[i] for p in points) / n for i in range(3)]
+        axis = max(range(3), key=lambda i: (round(abs(centroid[i]), _MERGE_DIGITS), abs(outward[i])))
+        sign = 1 if centroid[axis] > 0 or (centroid[axis] == 0 and outward[axis] >= 0) else -1
+        normal = tuple(sign if i == axis else 0 for i in range(3))
+        return next(value for value, face_normal in FACES if face_normal == normal), normal
+
+    def triangle_count(self):
+        return sum(len(f) - 2 for f in self.faces)
+
+    def bounds(self):
+        xs, ys, zs = zip(*self.vertices)
+        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+
+# ============================================================================
+# 생성
+# ============================================================================
+def build_dice_geometry(dice_size=2.0, pip_size=0.35, pip_depth=0.25,
+                        bevel_amount=0.08, bevel_segments=1, pip_spacing=0.5,
+                        pip_style="recessed", fill_scale=0.9, fill_inset=0.7, pip_patterns=None):
+    """베벨 본체 + 눈(pip_style)을 하나의 DiceMesh로 만듭니다"""
+    half = dice_size / 2
+    inner = half - bevel_amount
+    if not 0 < bevel_amount < half:
+        raise ValueError(f"bevel_amount는 0과 dice_size/2 사이여야 합니다: {bevel_amount}")
+    if bevel_segments < 1:
+        raise ValueError(f"bevel_segments는 1 이상이어야 합니다: {bevel_segments}")
+    if pip_style not in PIP_STYLES:
+        raise ValueError(f"pip_style은 {PIP_STYLES} 중 하나여야 합니다: {pip_style}")
+    if pip_style == "none":
+        pip_patterns = {face_value: [] for face_value, _ in FACES}
+    elif pip_patterns is None:
+        pip_patterns = make_pip_patterns(pip_spacing)
+
+    r = pip_size / 2
+    for face_value, _ in FACES:
+        for px, py in pip_patterns[face_value]:
+            if max(abs(px), abs(py)) + r > inner:
+                raise ValueError(f"{face_value}번 면의 눈 ({px}, {py})이 베벨 영역을 침범합니다")
+        for (ax, ay), (bx, by) in itertools.combinations(pip_patterns[face_value], 2):
+            if abs(ax - bx) < 2 * r + _EPS and abs(ay - by) < 2 * r + _EPS:
+                raise ValueError(f"{face_value}번 면의 눈 ({ax}, {ay}), ({bx}, {by})이 서로 겹칩니다")
+
+    # 커터 큐브가 면 아래로 파고든 깊이
+    recess = max(0.0, (pip_size - pip_depth) / 2) if pip_style == "recessed" else 0.0
+
+    mesh = DiceMesh(dice_size)
+    for face_value, normal in FACES:
+        holes = [(px - r, px + r, py - r, py + r) for px, py in pip_patterns[face_value]]
+        _add_flat_face(mesh, face_value, normal, half, inner, recess, holes, painted=pip_style == "painted")
+
+    _add_edge_strips(mesh, inner, bevel_amount, bevel_segments)
+    _add_corners(mesh, inner, bevel_amount, bevel_segments)
+
+    if pip_style == "recessed":
+        fill_half = pip_size * fill_scale / 2
+        pip_index = 0
+        for face_value, normal in FACES:
+            for px, py in pip_patterns[face_value]:
+                center = face_point(normal, half - pip_depth * fill_inset, px, py)
+                # 본체 안쪽을 향한 바닥면은 홈 바닥 아래에 묻혀 보이지 않으므로 만들지 않음
+                _add_box(mesh, center, fill_half, PIP_MATERIAL_INDEX, skip=tuple(-n for n in normal),
+                         uv_origin=pip_uv_origin(pip_index))
+                pip_index += 1
+
+    return mesh
+
+
+def _add_flat_face(mesh, face_value, normal, half, inner, recess, holes, painted=False):
+    ua, va = FACE_AXES[normal]
+    dice_size = mesh.dice_size
+
+    def uv(u, v):
+        return face_uv(face_value, u, v, dice_size)
+
+    # 평면부: 외곽 사각형에서 눈 구멍을 뺀 영역을 정점 추가 없이 삼각형으로 분할
+    # (외곽은 네 꼭짓점뿐이라 베벨 띠와 T-정점 없이 맞물림)
+    outer = [(-inner, -inner), (inner, -inner), (inner, inner), (-inner, inner)]
+    for triangle in _triangulate_holes(outer, holes):
+        mesh.add_face([face_point(normal, half, u, v) for u, v in triangle], normal)
+
+    # 구멍 UV: 구멍 자리의 셀 영역 안에서 바닥을 홈 깊이만큼 안쪽으로 줄이고, 벽은 그 둘레의
+    # 사다리꼴 띠로 펼칩니다 (벽 넓이가 0이 되지 않고, 면/벽/바닥 텍스처가 이어짐)
+    for u0, u1, v0, v1 in holes:
+        inset = min(recess, (u1 - u0) / 4, (v1 - v0) / 4)
+
+        def floor_uv(u, v):
+            return uv(u + inset if u == u0 else u - inset, v + inset if v == v0 else v - inset)
+
+        # 구멍: 홈 바닥(recessed, 홈이 없으면 면 높이) 또는 같은 높이의 눈 재질 사각형(painted)
+        depth = half - recess
+        material_index = PIP_MATERIAL_INDEX if painted else BODY_MATERIAL_INDEX
+        corners = ((u0, v0), (u1, v0), (u1, v1), (u0, v1))
+        quad = [face_point(normal, depth, u, v) for u, v in corners]
+        mesh.add_face(quad, normal, material_index, uvs=[floor_uv(u, v) for u, v in corners])
+
+        # 홈 벽: 구멍 테두리 → 바닥 (벽 법선은 구멍 안쪽을 향함), 변 하나당 사각형 하나
+        if recess <= 0:
+            continue
+        for (a, b), wall_axis, inward in ((((u0, v0), (u0, v1)), ua, +1), (((u1, v0), (u1, v1)), ua, -1),
+                                          (((u0, v0), (u1, v0)), va, +1), (((u0, v1), (u1, v1)), va, -1)):
+            quad = [face_point(normal, half, *a), face_point(normal, half, *b),
+                    face_point(normal, half - recess, *b), face_point(normal, half - recess, *a)]
+            wall_normal = [0.0, 0.0, 0.0]
+            wall_normal[wall_axis] = inward
+            mesh.add_face(quad, wall_normal, uvs=[uv(*a), uv(*b), floor_uv(*b), floor_uv(*a)])
+
+
+# ============================================================================
+# 구멍 있는 다각형 삼각 분할 (구멍 연결 + ear clipping)
+# ============================================================================
+_EPS = 1e-9
+
+
+def _triangulate_holes(outer, holes):
+    """반시계 외곽 + 직사각형 구멍 (u0, u1, v0, v1) → 삼각형 [(p, p, p)]
+
+    구멍마다 외곽(또는 이미 연결된 구멍)의 보이는 정점으로 다리를 놓아 하나의 다각형으로
+    만든 뒤 귀를 잘라 냅니다. 새 정점을 만들지 않으므로 삼각형은 n + 2h - 2개입니다.
+    """
+    loops = [[(u0, v0), (u0, v1), (u1, v1), (u1, v0)] for u0, u1, v0, v1 in holes]  # 시계 방향
+    polygon = list(outer)
+    pending = sorted(loops, key=lambda loop: -max(p[0] for p in loop))
+    while pending:
+        hole = pending.pop(0)
+        polygon = _bridge(polygon, hole, pending)
+    return _ear_clip(polygon)
+
+
+def _bridge(polygon, hole, others):
+    # 구멍의 가장 오른쪽(동률이면 위쪽) 정점에서 가장 가까운, 가려지지 않은 다각형 정점으로 연결
+    start = max(range(len(hole)), key=lambda i: (hole[i][0], hole[i][1]))
+    h = hole[start]
+    edges = _edges(polygon) + _edges(hole) + [e for loop in others for e in _edges(loop)]
+    order = sorted(range(len(polygon)), key=lambda i: (_dist2(polygon[i], h), i))
+    for i in order:
+        p = polygon[i]
+        if not _in_wedge(polygon[i - 1], p, polygon[(i + 1) % len(polygon)], h):
+            continue
+        if any(_blocks(p, h, a, b) for a, b in edges):
+            continue
+        ring = hole[start:] + hole[:start]
+        return polygon[:i + 1] + ring + [h, p] + polygon[i + 1:]
+    raise ValueError("눈 구멍을 외곽과 연결할 수 없습니다 (눈이 서로 겹치는지 확인하세요)")
+
+
+def _ear_clip(polygon):
+    points = list(polygon)
+    triangles = []
+    while len(points) > 3:
+        for i in range(len(points)):
+            a, b, c = points[i - 1], points[i], points[(i + 1) % len(points)]
+            if _cross(a, b, c) <= _EPS:
+                continue
+            if any(_in_triangle(p, a, b, c) for p in points if p not in (a, b, c)):
+                continue
+            triangles.append((a, b, c))
+            del points[i]
+            break
+        else:
+            raise ValueError("면 삼각 분할 실패 (귀를 찾지 못함)")
+    triangles.append(tuple(points))
+    return triangles
+
+
+def _edges(loop):
+    return [(loop[i], loop[(i + 1) % len(loop)]) for i in range(len(loop))]
+
+
+def _dist2(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+
+
+def _cross(a, b, c):
+    return (b[0] - a[0]) * (c[1] - b[1]) - (b[1] - a[1]) * (c[0] - b[0])
+
+
+def _orient(a, b, c):
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _in_wedge(prev, p, nxt, target):
+    # target 방향이 p의 내부각(반시계 다각형의 왼쪽) 안에 있는지
+    convex = _cross(prev, p, nxt) > 0
+    after = _orient(p, nxt, target) > _EPS    # 나가는 변의 왼쪽
+    before = _orient(prev, p, target) > _EPS  # 들어오는 변의 왼쪽
+    return (after and before) if convex else (after or before)
+
+
+def _blocks(p, q, a, b):
+    """선분 pq가 변 ab와 끝점 말고 다른 곳에서 닿는지 (접촉도 막힌 것으로 봄)"""
+    shared = {a, b} & {p, q}
+    if len(shared) == 2:
+        return False
+    d1, d2 = _orient(p, q, a), _orient(p, q, b)
+    d3, d4 = _orient(a, b, p), _orient(a, b, q)
+    if ((d1 > _EPS and d2 < -_EPS) or (d1 < -_EPS and d2 > _EPS)) and \
+            ((d3 > _EPS and d4 < -_EPS) or (d3 < -_EPS and d4 > _EPS)):
+        return True
+    # 한 점이 다른 선분 위에 놓이는 경우 (공유 끝점 제외)
+    for point, (s, t) in ((a, (p, q)), (b, (p, q)), (p, (a, b)), (q, (a, b))):
+        if point in shared:
+            continue
+        if abs(_orient(s, t, point)) <= _EPS and _on_segment(point, s, t):
+            return True
+    return False
+
+
+def _on_segment(point, s, t):
+    return (min(s[0], t[0]) - _EPS <= point[0] <= max(s[0], t[0]) + _EPS
+            and min(s[1], t[1]) - _EPS <= point[1] <= max(s[1], t[1]) + _EPS)
+
+
+def _in_triangle(p, a, b, c):
+    return _orient(a, b, p) >= -_EPS and _orient(b, c, p) >= -_EPS and _orient(c, a, p) >= -_EPS
+
+
+def _add_edge_strips(mesh, inner, bevel, segments):
+    # 12개 모서리: 축 a, b 방향 부호 (sa, sb), 모서리 진행 축 c
+    for a, b in ((0, 1), (0, 2), (1, 2)):
+        c = 3 - a - b
+        for sa in (-1, 1):
+            for sb in (-1, 1):
+                outward = [0.0, 0.0, 0.0]
+                outward[a], outward[b] = sa, sb
+                # 중심 (±inner, ±inner), 반지름 bevel 원호 (bevel profile 0.5)
+                arc = []
+                for k in range(segments + 1):
+                    theta = (math.pi / 2) * k / segments
+                    arc.append((sa * (inner + bevel * math.cos(theta)),
+                                sb * (inner + bevel * math.sin(theta))))
+                # 면 외곽에는 꼭짓점만 있으므로 띠는 모서리 전체 길이의 사각형 하나씩
+                for (pa0, pb0), (pa1, pb1) in zip(arc, arc[1:]):
+                    quad = []
+                    for pa, pb, t in ((pa0, pb0, -inner), (pa1, pb1, -inner), (pa1, pb1, inner), (pa0, pb0, inner)):
+                        p = [0.0, 0.0, 0.0]
+                        p[a], p[b], p[c] = pa, pb, t
+                        quad.append(tuple(p))
+                    mesh.add_face(quad, outward)
+
+
+def _add_corners(mesh, inner, bevel, segments):
+    axes = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+    for sx in (-1, 1):
+        for sy in (-1, 1):
+            for sz in (-1, 1):
+                signs = (sx, sy, sz)
+                center = tuple(s * inner for s in signs)
+
+                def place(d):
+                    return tuple(center[i] + bevel * signs[i] * d[i] for i in range(3))
+
+                if segments % 2 == 0:
+                    # 짝수 분할: 중심 정점을 공유하는 사각형 패치 3개 (Blender bevel과 같은 형태)
+                    m = segments // 2
+                    diag = _normalize((1.0, 1.0, 1.0))
+                    for i in range(3):
+                        e, f, g = axes[i], axes[(i + 1) % 3], axes[(i + 2) % 3]
+                        mid_ef = _normalize(_add(e, f))
+                        mid_eg = _normalize(_add(e, g))
+                        grid = [[_normalize(_coons(
+                            _slerp(e, mid_ef, s / m), _slerp(mid_eg, diag, s / m),
+                            _slerp(e, mid_eg, t / m), _slerp(mid_ef, diag, t / m),
+                            e, mid_ef, mid_eg, diag, s / m, t / m))
+                            for t in range(m + 1)] for s in range(m + 1)]
+                        for s in range(m):
+                            for t in range(m):
+                                quad = [place(grid[s][t]), place(grid[s + 1][t]),
+                                        place(grid[s + 1][t + 1]), place(grid[s][t + 1])]
+                                mesh.add_face(quad, signs)
+                else:
+                    # 홀수 분할: 구면 삼각형을 행 단위 삼각형으로 분할
+                    n = segments
+                    rows = []
+                    for i in range(n + 1):
+                        left = _slerp(axes[0], axes[1], i / n)
+                        right = _slerp(axes[0], axes[2], i / n)
+                        rows.append([_slerp(left, right, j / i) if i else axes[0] for j in range(i + 1)])
+                    for i in range(n):
+                        for j in range(i + 1):
+                            mesh.add_face([place(rows[i][j]), place(rows[i + 1][j]), place(rows[i + 1][j + 1])], signs)
+                            if j < i:
+                                mesh.add_face([place(rows[i][j]), place(rows[i + 1][j + 1]), place(rows[i][j + 1])], signs)
+
+
+def _add_box(mesh, center, half, material_index, skip=None, uv_origin=None):
+    """축 정렬 큐브 (skip 방향 면 제외); uv_origin이 있으면 면마다 띠의 다음 칸에 펼침"""
+    cx, cy, cz = center
+    slot = 0
+    for axis in range(3):
+        for sign in (-1, 1):
+            ua, va = [i for i in range(3) if i != axis]
+            quad = []
+            for du, dv in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+                p = [cx, cy, cz]
+                p[axis] += sign * half
+                p[ua] += du * half
+                p[va] += dv * half
+                quad.append(tuple(p))
+            outward = [0.0, 0.0, 0.0]
+            outward[axis] = sign
+            if skip is not None and tuple(outward) == tuple(float(n) for n in skip):
+                continue
+            uvs = None
+            if uv_origin is not None:
+                pad = PIP_UV_SQUARE * UV_PADDING
+                size = PIP_UV_SQUARE - 2 * pad
+                u0 = uv_origin[0] + slot * PIP_UV_SQUARE + pad
+                v0 = uv_origin[1] + pad
+                uvs = [(u0 + (du + 1) / 2 * size, v0 + (dv + 1) / 2 * size)
+                       for du, dv in ((-1, -1), (1, -1), (1, 1), (-1, 1))]
+                slot += 1
+            mesh.add_face(quad, outward, material_index, uvs=uvs)
+
+
+# ============================================================================
+# Blender 연동 (bpy는 함수 안에서만 import → Blender 밖에서도 모듈 사용 가능)
+# ============================================================================
+def create_mesh(name, geometry):
+    """DiceMesh → bpy 메시 데이터 블록 (연산자 호출 없음)"""
+    import bpy
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(geometry.vertices, [], geometry.faces)
+    mesh.polygons.foreach_set("material_index", geometry.material_indices)
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", [c for face_uvs in geometry.uvs for uv in face_uvs for c in uv])
+    mesh.validate()
+    mesh.update()
+    return mesh
+
+
+def fill_bmesh(bm, geometry):
+    """DiceMesh를 기존 bmesh에 추가합니다 (bmesh 기반 후처리용)"""
+    verts = [bm.verts.new(co) for co in geometry.vertices]
+    uv_layer = bm.loops.layers.uv.verify()
+    for face, material_index, face_uvs in zip(geometry.faces, geometry.material_indices, geometry.uvs):
+        f = bm.faces.new([verts[i] for i in face])
+        f.material_index = material_index
+        for loop, uv in zip(f.loops, face_uvs):
+            loop[uv_layer].uv = uv
+    bm.normal_update()
+    return bm
+
+
+# ============================================================================
+# 벡터 유틸리티
+# ============================================================================
+def _normal_axis(normal):
+    return next(i for i in range(3) if normal[i] != 0)
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _normalize(v):
+    length = math.sqrt(_dot(v, v))
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _slerp(a, b, t):
+    omega = math.acos(max(-1.0, min(1.0, _dot(a, b))))
+    if omega < 1e-12:
+        return a
+    sa = math.sin((1 - t) * omega) / math.sin(omega)
+    sb = math.sin(t * omega) / math.sin(omega)
+    return (a[0] * sa + b[0] * sb, a[1] * sa + b[1] * sb, a[2] * sa + b[2] * sb)
+
+
+def _coons(bottom, top, left, right, p00, p10, p01, p11, s, t):
+    # 네 경계 곡선으로 내부 점을 보간 (경계에서는 곡선을 그대로 재현)
+    out = []
+    for i in range(3):
+        bilinear = ((1 - s) * (1 - t) * p00[i] + s * (1 - t) * p10[i]
+                    + (1 - s) * t * p01[i] + s * t * p11[i])
+        out.append((1 - t) * bottom[i] + t * top[i] + (1 - s) * left[i] + s * right[i] - bilinear)
+    return tuple(out)
+
+
+def _newell_normal(points):
+    nx = ny = nz = 0.0
+    for i, (x0, y0, z0) in enumerate(points):
+        x1, y1, z1 = points[(i + 1) % len(points)]
+        nx += (y0 - y1) * (z0 + z1)
+        ny += (z0 - z1) * (x0 + x1)
+        nz += (x0 - x1) * (y0 + y1)
+    return (nx, ny, nz)
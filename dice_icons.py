@@ -0,0 +1,283 @@
+"""주사위 아이콘 스프라이트 시트 오프라인 렌더러
+
+Dice3DIcon(scripts/components/dice_3d_icon.gd)은 아이콘마다 SubViewport를 만들어
+매 프레임(UPDATE_ALWAYS) 3D로 다시 그립니다. 여기서는 익스포트된 모델로 모든
+(타입, 색상, 면) 아이콘을 헤드리스 Blender 한 번의 렌더로 시트 한 장에 미리 그리고,
+게임은 시트의 사각형 영역(AtlasTexture)만 보여 줍니다.
+
+  - 모델 경로: colored_dice.gd get_model_path()와 같은 표
+    (.tscn은 씬이 인스턴스하는 glTF를 렌더 - 씬의 재질 덮어쓰기/파티클은 반영하지 않음)
+  - 같은 모델을 쓰는 조합(Lucky는 항상 레드, Prism은 색상 없음)은 같은 셀을 공유
+  - 조명/카메라 방향: dice_build.add_preview_rig() (dice_optimized.py와 같음), 정사영
+  - 면 방향/기울기: dice_3d_icon.gd _set_model_face()와 같은 면 매핑 + (10°, -15°)
+
+출력 (기본 assets/dice_icons/)
+  dice_icons.png     스프라이트 시트 (RGBA, 투명 배경)
+  dice_icons.json    "<타입>/<색상 키>/<면>" → 셀 픽셀 사각형 [x, y, w, h]
+
+모델과 설정이 같으면 다시 렌더하지 않습니다 (--force로 강제).
+
+    python dice_icons.py --blender /Applications/Blender.app/Contents/MacOS/Blender
+    python dice_icons.py --cell 96 --types 0 1 2 --dry-run
+    python dice_farm.py --icons          # 익스포트 후 이어서 아이콘 렌더
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import dice_catalog
+
+WORKER_SCRIPT = os.path.join(dice_catalog.PROJECT_DIR, "dice_icons_worker.py")
+OUTPUT_DIR = os.path.join(dice_catalog.PROJECT_DIR, "assets", "dice_icons")
+SHEET_NAME = "dice_icons.png"
+MANIFEST_NAME = "dice_icons.json"
+
+DEFAULT_CELL_PX = 128
+FACE_VALUES = [1, 2, 3, 4, 5, 6]
+
+# DiceBag.COLORS → colored_dice.gd COLOR_NAMES
+COLOR_KEYS = ["W", "K", "R", "G", "B"]
+COLOR_NAMES = {"W": "white", "K": "black", "R": "red", "G": "green", "B": "blue"}
+
+# colored_dice.gd get_model_path() - {color}는 소문자 색상 이름
+MODEL_PATHS = {
+    0: "0_dice_{color}.gltf",
+    1: "1_plus_dice_{color}.gltf",
+    2: "2_dollar_dice_{color}.gltf",
+    3: "3_multiply_dice_{color}.gltf",
+    4: "4_faceless_dice_{color}.gltf",
+    5: "5_lucky_dice_777_red.gltf",
+    6: "6_growing_dice_{color}.gltf",
+    7: "7_ugly_dice_{color}.gltf",
+    8: "8_dice_prism.tscn",
+    9: "9_dice_shadow_{color}.tscn",
+}
+
+# dice_3d_icon.gd: 면을 카메라 쪽으로 돌린 뒤 입체감을 위해 살짝 비틀고, 크기의 1.3배를 화면에 담음
+ICON_TILT_DEGREES = (10.0, -15.0, 0.0)
+ICON_FILL = 1.3
+
+_PACKED_SCENE_RE = re.compile(r'\[ext_resource type="PackedScene"[^\]]*path="res://([^"]+\.gltf)"')
+
+
+# ============================================================================
+# 작업 목록
+# ============================================================================
+def resolve_model(models_dir, filename):
+    """모델 파일 이름 → 렌더할 glTF 경로 (.tscn이면 씬이 인스턴스하는 첫 glTF, 없으면 None)"""
+    path = os.path.join(models_dir, filename)
+    if not os.path.exists(path):
+        return None
+    if not filename.endswith(".tscn"):
+        return path
+    with open(path, encoding="utf-8") as f:
+        match = _PACKED_SCENE_RE.search(f.read())
+    if not match:
+        return None
+    gltf_path = os.path.join(dice_catalog.PROJECT_DIR, match.group(1))
+    return gltf_path if os.path.exists(gltf_path) else None
+
+
+def plan_icons(models_dir, type_indices=None):
+    """(모델 목록, 아이콘 키 → 모델 번호, 누락 목록)
+
+    모델 하나가 면 6개 = 셀 6개를 차지하고, 같은 모델을 쓰는 (타입, 색상)은 셀을 공유합니다.
+    """
+    type_indices = sorted(type_indices if type_indices is not None else MODEL_PATHS)
+    models, model_index, icons, missing = [], {}, {}, []
+    for type_index in type_indices:
+        for color_key in COLOR_KEYS:
+            filename = MODEL_PATHS[type_index].format(color=COLOR_NAMES[color_key])
+            source = resolve_model(models_dir, filename)
+            if source is None:
+                missing.append(f"{type_index}/{color_key}: {filename}")
+                continue
+            if source not in model_index:
+                model_index[source] = len(models)
+                models.append({"source": source, "name": os.path.splitext(os.path.basename(source))[0]})
+            icons[f"{type_index}/{color_key}"] = model_index[source]
+    return models, icons, missing
+
+
+def sheet_layout(model_count, cell_px):
+    """모델마다 한 줄에 면 6개 - 줄 수가 많으면 두 모델씩 한 줄로 (시트를 정사각형에 가깝게)"""
+    models_per_row = max(1, round(math.sqrt(model_count / len(FACE_VALUES))))
+    columns = len(FACE_VALUES) * models_per_row
+    rows = max(1, math.ceil(model_count / models_per_row))
+    cells = []
+    for m in range(model_count):
+        row, slot = divmod(m, models_per_row)
+        cells.append([[slot * len(FACE_VALUES) + f, row] for f in range(len(FACE_VALUES))])
+    return {"columns": columns, "rows": rows, "cell_px": cell_px,
+            "size": [columns * cell_px, rows * cell_px], "cells": cells}
+
+
+def source_hash(models, layout, engine):
+    """모델 파일(glTF + 버퍼) 내용, 시트 배치, 렌더 설정, 워커 코드 해시"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"layout": layout, "engine": engine, "tilt": ICON_TILT_DEGREES,
+                              "fill": ICON_FILL}, sort_keys=True).encode())
+    for model in models:
+        digest.update(model["name"].encode())
+        with open(model["source"], "rb") as f:
+            data = f.read()
+        digest.update(data)
+        for buffer in json.loads(data).get("buffers", []):
+            uri = buffer.get("uri", "")
+            buffer_path = os.path.join(os.path.dirname(model["source"]), uri)
+            if uri and not uri.startswith("data:") and os.path.exists(buffer_path):
+                with open(buffer_path, "rb") as f:
+                    digest.update(f.read())
+    for script in (WORKER_SCRIPT, os.path.abspath(__file__)):
+        with open(script, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def build_manifest(icons, layout, rendered, digest):
+    cell_px = layout["cell_px"]
+    entries = {}
+    for icon_key, m in sorted(icons.items()):
+        if not rendered[m]:
+            continue
+        for face_value, (col, row) in zip(FACE_VALUES, layout["cells"][m]):
+            entries[f"{icon_key}/{face_value}"] = [col * cell_px, row * cell_px, cell_px, cell_px]
+    return {
+        "source_hash": digest,
+        "sheet": SHEET_NAME,
+        "size": layout["size"],
+        "cell_px": cell_px,
+        "rect_format": "x, y, w, h (왼쪽 위 원점)",
+        "icons": entries,
+    }
+
+
+# ============================================================================
+# 렌더
+# ============================================================================
+def worker_command(blender, jobs_path, result_path):
+    return [
+        blender, "-b", "--factory-startup",
+        "--python-exit-code", "1",
+        "--python", WORKER_SCRIPT, "--",
+        "--jobs", jobs_path, "--result", result_path,
+    ]
+
+
+def render_icons(blender, models_dir=dice_catalog.DEFAULT_OUTPUT_ROOT, out_dir=OUTPUT_DIR,
+                 cell_px=DEFAULT_CELL_PX, type_indices=None, engine=None, force=False, log_dir=None):
+    """시트와 매니페스트를 쓰고 (매니페스트, 렌더했는지, 누락 목록)을 반환합니다"""
+    models, icons, missing = plan_icons(models_dir, type_indices)
+    if not models:
+        return None, False, missing
+    layout = sheet_layout(len(models), cell_px)
+    digest = source_hash(models, layout, engine)
+
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    sheet_path = os.path.join(out_dir, SHEET_NAME)
+    if not force and os.path.exists(manifest_path) and os.path.exists(sheet_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            existing = json.load(f)
+        if existing.get("source_hash") == digest:
+            return existing, False, missing
+
+    os.makedirs(out_dir, exist_ok=True)
+    log_dir = log_dir or tempfile.mkdtemp(prefix="dice_icons_")
+    os.makedirs(log_dir, exist_ok=True)
+    jobs_path = os.path.join(log_dir, "icon_jobs.json")
+    result_path = os.path.join(log_dir, "icon_result.json")
+    log_path = os.path.join(log_dir, "icon_worker.log")
+    with open(jobs_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "models": models, "layout": layout, "faces": FACE_VALUES,
+            "tilt_degrees": ICON_TILT_DEGREES, "fill": ICON_FILL,
+            "engine": engine, "output": sheet_path + ".tmp.png",
+        }, f, ensure_ascii=False)
+    if os.path.exists(result_path):
+        os.remove(result_path)
+
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run(worker_command(blender, jobs_path, result_path), stdout=log, stderr=subprocess.STDOUT)
+    if proc.returncode != 0 or not os.path.exists(result_path):
+        raise RuntimeError(f"아이콘 렌더 실패 (종료 코드 {proc.returncode}, 로그 {log_path})")
+    with open(result_path, encoding="utf-8") as f:
+        result = json.load(f)
+
+    os.replace(sheet_path + ".tmp.png", sheet_path)
+    manifest = build_manifest(icons, layout, result["rendered"], digest)
+    manifest["render_seconds"] = result["seconds"]
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+    failed = [models[m]["name"] for m, ok in enumerate(result["rendered"]) if not ok]
+    return manifest, True, missing + [f"{name}: 임포트 실패" for name in failed]
+
+
+# ============================================================================
+# 진입점
+# ============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 아이콘 스프라이트 시트 렌더 (헤드리스 Blender 한 번)")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender 실행 파일")
+    parser.add_argument("--models", default=dice_catalog.DEFAULT_OUTPUT_ROOT, help="익스포트된 모델 폴더")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="출력 폴더")
+    parser.add_argument("--cell", type=int, default=DEFAULT_CELL_PX, help="아이콘 한 칸 픽셀 크기")
+    parser.add_argument("--types", type=int, nargs="*", default=None, help="렌더할 타입 번호 (기본: 전부)")
+    parser.add_argument("--engine", default=None, help="렌더 엔진 (기본: 설치된 EEVEE)")
+    parser.add_argument("--log-dir", default=None, help="워커 작업/로그 폴더 (기본: 임시 폴더)")
+    parser.add_argument("--force", action="store_true", help="변경이 없어도 다시 렌더")
+    parser.add_argument("--dry-run", action="store_true", help="셀 배치만 출력")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.types or []) - set(MODEL_PATHS))
+    if unknown:
+        print(f"❌ 알 수 없는 타입: {unknown} (가능: {sorted(MODEL_PATHS)})")
+        return 2
+
+    if args.dry_run:
+        models, icons, missing = plan_icons(os.path.abspath(args.models), args.types)
+        layout = sheet_layout(len(models), args.cell)
+        print(f"모델 {len(models)}개, 아이콘 {len(icons) * len(FACE_VALUES)}개 → "
+              f"{layout['columns']}×{layout['rows']} 셀, {layout['size'][0]}×{layout['size'][1]}px")
+        for icon_key, m in sorted(icons.items()):
+            print(f"  {icon_key:<6} → {models[m]['name']}")
+        for line in missing:
+            print(f"  ⚠️ 모델 없음 {line}")
+        return 0
+
+    if shutil.which(args.blender) is None and not os.path.exists(args.blender):
+        print(f"❌ Blender 실행 파일을 찾을 수 없습니다: {args.blender}")
+        return 2
+
+    started = time.perf_counter()
+    try:
+        manifest, written, missing = render_icons(args.blender, os.path.abspath(args.models), args.out, args.cell,
+                                                  args.types, args.engine, args.force, args.log_dir)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    for line in missing:
+        print(f"  ⚠️ {line}")
+    if manifest is None:
+        print("❌ 렌더할 모델이 없습니다.")
+        return 1
+    if not written:
+        print(f"✅ 변경 없음: {os.path.join(args.out, MANIFEST_NAME)}")
+        return 0
+    width, height = manifest["size"]
+    print(f"✅ 아이콘 {len(manifest['icons'])}개, 시트 {width}×{height} "
+          f"({time.perf_counter() - started:.1f}초): {os.path.join(args.out, MANIFEST_NAME)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
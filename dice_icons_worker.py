@@ -0,0 +1,151 @@
+"""아이콘 시트 렌더 워커 (Blender 헤드리스 전용)
+
+dice_icons.py가 아래처럼 실행합니다. 직접 실행할 일은 거의 없습니다.
+
+    blender -b --factory-startup --python dice_icons_worker.py -- \
+        --jobs icon_jobs.json --result icon_result.json
+
+모델마다 glTF를 한 번 임포트해 컬렉션으로 묶고, 면 6개를 컬렉션 인스턴스로 시트 격자에
+배치한 다음 정사영 카메라로 한 번에 렌더합니다. 조명이 태양광(방향광)이고 카메라가
+정사영이라 격자 위치와 관계없이 모든 셀이 같은 조건으로 그려집니다.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import traceback
+
+import bpy
+from mathutils import Euler, Vector
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import dice_build
+import dice_geometry
+
+FACE_NORMALS = dict(dice_geometry.FACES)
+
+
+def parse_args(argv):
+    # Blender 인자와 스크립트 인자는 "--"로 구분됩니다
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="dice_icons_worker")
+    parser.add_argument("--jobs", required=True, help="모델 목록 + 시트 배치 JSON")
+    parser.add_argument("--result", required=True, help="결과를 기록할 JSON 경로")
+    return parser.parse_args(argv)
+
+
+def pick_engine(requested):
+    available = {item.identifier for item in bpy.types.RenderSettings.bl_rna.properties["engine"].enum_items}
+    if requested:
+        return requested
+    for engine in ("BLENDER_EEVEE_NEXT", "BLENDER_EEVEE"):
+        if engine in available:
+            return engine
+    return "CYCLES"
+
+
+def setup_scene(jobs):
+    """미리보기 조명/카메라를 그대로 쓰되 카메라만 정사영으로 시트 전체를 담도록 옮깁니다"""
+    layout = jobs["layout"]
+    scene = bpy.context.scene
+    camera, lights = dice_build.add_preview_rig()
+    # 아이콘끼리 그림자가 드리우지 않도록 (Godot 아이콘의 DirectionalLight3D도 그림자 없음)
+    for light in lights:
+        light.data.use_shadow = False
+
+    cam_rot = camera.rotation_euler.to_quaternion()
+    span = max(layout["columns"], layout["rows"])
+    distance = 10.0 + span
+    camera.location = cam_rot @ Vector((0.0, 0.0, distance))
+    camera.data.type = 'ORTHO'
+    camera.data.ortho_scale = span
+    camera.data.clip_start = 0.1
+    camera.data.clip_end = distance * 2.0
+
+    scene.render.engine = pick_engine(jobs.get("engine"))
+    scene.render.resolution_x, scene.render.resolution_y = layout["size"]
+    scene.render.resolution_percentage = 100
+    scene.render.film_transparent = True
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.color_depth = '8'
+    scene.view_settings.view_transform = 'Standard'
+    scene.render.filepath = jobs["output"]
+    return cam_rot
+
+
+def import_model(source, name):
+    """glTF → 씬에 링크되지 않은 컬렉션 (인스턴스로만 그려짐), 원점은 바운딩 박스 중심"""
+    before = set(bpy.data.objects)
+    bpy.ops.import_scene.gltf(filepath=source)
+    imported = [obj for obj in bpy.data.objects if obj not in before]
+    collection = bpy.data.collections.new(f"Icon_{name}")
+    for obj in imported:
+        for owner in list(obj.users_collection):
+            owner.objects.unlink(obj)
+        collection.objects.link(obj)
+
+    bpy.context.view_layer.update()
+    corners = [obj.matrix_world @ Vector(corner)
+               for obj in imported if obj.type == 'MESH' for corner in obj.bound_box]
+    if not corners:
+        raise ValueError(f"{source}: 메시가 없습니다")
+    lo = Vector([min(c[i] for c in corners) for i in range(3)])
+    hi = Vector([max(c[i] for c in corners) for i in range(3)])
+    collection.instance_offset = (lo + hi) / 2
+    return collection, max(hi - lo)
+
+
+def place_faces(collection, max_dim, cells, layout, faces, cam_rot, tilt, fill):
+    columns, rows = layout["columns"], layout["rows"]
+    right = cam_rot @ Vector((1.0, 0.0, 0.0))
+    up = cam_rot @ Vector((0.0, 1.0, 0.0))
+    scale = 1.0 / (max_dim * fill)
+    for face_value, (col, row) in zip(faces, cells):
+        # 해당 면을 카메라 쪽(카메라 로컬 +Z)으로 돌린 뒤 아이콘 기울기 적용
+        face_rot = Vector(FACE_NORMALS[face_value]).rotation_difference(Vector((0.0, 0.0, 1.0)))
+        empty = bpy.data.objects.new(f"{collection.name}_{face_value}", None)
+        empty.instance_type = 'COLLECTION'
+        empty.instance_collection = collection
+        empty.rotation_mode = 'QUATERNION'
+        empty.rotation_quaternion = cam_rot @ tilt @ face_rot
+        empty.scale = (scale, scale, scale)
+        empty.location = right * (col + 0.5 - columns / 2) + up * (rows / 2 - row - 0.5)
+        bpy.context.scene.collection.objects.link(empty)
+
+
+def main():
+    args = parse_args(sys.argv)
+    with open(args.jobs, encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    started = time.perf_counter()
+    dice_build.reset_scene()
+    cam_rot = setup_scene(jobs)
+    # Godot rotation_degrees는 YXZ 순서 (Z → X → Y 순으로 적용)
+    tilt = Euler([math.radians(a) for a in jobs["tilt_degrees"]], 'ZXY').to_quaternion()
+
+    rendered = []
+    for model, cells in zip(jobs["models"], jobs["layout"]["cells"]):
+        try:
+            collection, max_dim = import_model(model["source"], model["name"])
+            place_faces(collection, max_dim, cells, jobs["layout"], jobs["faces"], cam_rot, tilt, jobs["fill"])
+            rendered.append(True)
+            print(f"  ✅ {model['name']}")
+        except Exception:
+            rendered.append(False)
+            print(f"  ❌ {model['name']} 실패\n{traceback.format_exc()}")
+
+    # 셀 전체를 렌더 한 번으로
+    bpy.ops.render.render(write_still=True)
+    print(f"  ✅ 시트 → {jobs['output']}")
+
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump({"rendered": rendered, "seconds": round(time.perf_counter() - started, 3)}, f, indent=2)
+    sys.exit(0 if any(rendered) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""주사위 LOD 체인
+
+변형 하나를 화면 크기에 따라 세 단계 메시로 내보냅니다 (같은 glTF 안의 노드 3개).
+
+  LOD0  원본: 눈 홈 + 눈 채우기 큐브                 (화면 높이의 25% 이상)
+  LOD1  홈 없는 평면 + 눈 셀에만 눈 재질 (painted)   (8% 이상)
+  LOD2  베벨 1단 큐브 + 눈 텍스처 (지오메트리 눈 없음) (그 이하: 가방 팝업, 상점 미리보기)
+
+LOD 정보는 MSFT_lod 확장(LOD0 노드의 ids + extras.MSFT_screencoverage)과
+노드별 extras(lod, screen_size, triangle_budget)로 함께 기록합니다. Godot은 MSFT_lod를
+직접 읽지 않으므로 LOD 노드도 씬에 남겨 두고, 모델을 붙일 때
+DiceLod.apply_visibility_ranges(scripts/utils/dice_lod.gd)가 extras(없으면 노드 이름
+접미사)로 노드마다 visibility_range_begin/end를 설정해서 한 단계만 그려지게 합니다.
+LOD_LEVELS의 screen_size를 바꾸면 dice_lod.gd의 LOD_SCREEN_SIZES도 같이 맞춰야 합니다.
+
+순수 파이썬 모듈입니다 (Blender 쪽 생성은 dice_build.build_lod_variant).
+"""
+import hashlib
+import json
+import os
+
+import dice_atlas
+import dice_geometry
+
+# screen_size: 이 LOD를 쓰기 시작하는 최소 화면 높이 비율
+# triangle_budget: 기본 지오메트리(베벨 2단) 기준 삼각형 상한
+LOD_LEVELS = [
+    {"lod": 0, "suffix": "", "screen_size": 0.25, "triangle_budget": 1500,
+     "geometry": {}},
+    {"lod": 1, "suffix": "_LOD1", "screen_size": 0.08, "triangle_budget": 1000,
+     "geometry": {"pip_style": "painted"}},
+    {"lod": 2, "suffix": "_LOD2", "screen_size": 0.0, "triangle_budget": 64,
+     "geometry": {"pip_style": "none", "bevel_segments": 1}, "pip_texture": True},
+]
+
+# LOD2 눈 텍스처 해상도 (면 셀 하나 ≈ 42px)
+DEFAULT_PIP_TEXTURE_PX = 128
+PIP_TEXTURE_PREFIX = "dice_pips_"
+
+
+def lod_spec(pip_texture_px=DEFAULT_PIP_TEXTURE_PX):
+    """변형 dict에 붙일 LOD 설정 (빌드 캐시 해시에 그대로 들어감)"""
+    return {"levels": LOD_LEVELS, "pip_texture_px": pip_texture_px}
+
+
+def lod_geometry(geometry, level):
+    """변형 지오메트리에 LOD 단계의 덮어쓰기를 적용합니다"""
+    return dict(geometry, **level["geometry"])
+
+
+def lod_name(name, level):
+    return f"{name}{level['suffix']}"
+
+
+# ============================================================================
+# 삼각형 예산
+# ============================================================================
+def check_budgets(geometry, levels=LOD_LEVELS):
+    """[(lod, 삼각형 수, 예산, 통과 여부)] - Blender 없이 계산"""
+    report = []
+    for level in levels:
+        mesh = dice_geometry.build_dice_geometry(**lod_geometry(geometry, level))
+        triangles = mesh.triangle_count()
+        report.append((level["lod"], triangles, level["triangle_budget"], triangles <= level["triangle_budget"]))
+    return report
+
+
+# ============================================================================
+# LOD2 눈 텍스처
+# ============================================================================
+def pip_texture_path(texture_dir, variant, size=DEFAULT_PIP_TEXTURE_PX):
+    """색상/눈 배치가 같으면 같은 파일을 공유하도록 내용 해시로 이름을 짓습니다"""
+    payload = json.dumps({
+        "geometry": variant["geometry"],
+        "body": variant["body"]["color"],
+        "pip": variant["pip"]["color"],
+        "size": size,
+        **dice_geometry.uv_layout_params(),
+    }, sort_keys=True)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(texture_dir, f"{PIP_TEXTURE_PREFIX}{digest}.png")
+
+
+def write_pip_texture(texture_dir, variant, size=DEFAULT_PIP_TEXTURE_PX):
+    """면 UV 배치(3×2 셀)에 맞춰 본체색 바탕 + 사각 눈을 그린 PNG (이미 있으면 재사용)"""
+    path = pip_texture_path(texture_dir, variant, size)
+    if os.path.exists(path):
+        return path
+    os.makedirs(texture_dir, exist_ok=True)
+
+    geometry = dict(variant["geometry"])
+    dice_size = geometry.get("dice_size", 2.0)
+    r = geometry.get("pip_size", 0.35) / 2
+    patterns = dice_geometry.make_pip_patterns(geometry.get("pip_spacing", 0.5))
+    body = tuple(dice_atlas._to_srgb8(c) for c in variant["body"]["color"][:3]) + (255,)
+    pip = tuple(dice_atlas._to_srgb8(c) for c in variant["pip"]["color"][:3]) + (255,)
+
+    rows = [[body] * size for _ in range(size)]
+    for face_value, pips in patterns.items():
+        for px, py in pips:
+            # 눈 사각형 → UV → 픽셀 (이미지 행은 위→아래라 v를 뒤집음)
+            ua, va = dice_geometry.face_uv(face_value, px - r, py - r, dice_size)
+            ub, vb = dice_geometry.face_uv(face_value, px + r, py + r, dice_size)
+            x0, x1 = sorted((round(ua * size), round(ub * size)))
+            y0, y1 = sorted((round((1 - va) * size), round((1 - vb) * size)))
+            for y in range(y0, y1):
+                rows[y][x0:x1] = [pip] * (x1 - x0)
+    dice_atlas.write_png(path, rows)
+    return path
+
+
+# ============================================================================
+# glTF 후처리
+# ============================================================================
+def annotate_gltf(gltf_path, object_name, levels=LOD_LEVELS, triangles=None):
+    """익스포트된 .gltf에 MSFT_lod 확장과 노드별 LOD 힌트를 기록합니다
+
+    triangles: {lod: 실제 삼각형 수} (있으면 extras에 함께 기록)
+    """
+    with open(gltf_path, encoding="utf-8") as f:
+        gltf = json.load(f)
+
+    node_index = {node.get("name"): i for i, node in enumerate(gltf.get("nodes", []))}
+    ids = []
+    for level in levels:
+        name = lod_name(object_name, level)
+        if name not in node_index:
+            raise ValueError(f"glTF에 LOD 노드가 없습니다: {name}")
+        ids.append(node_index[name])
+        extras = gltf["nodes"][ids[-1]].setdefault("extras", {})
+        extras.update({
+            "lod": level["lod"],
+            "screen_size": level["screen_size"],
+            "triangle_budget": level["triangle_budget"],
+        })
+        if triangles and level["lod"] in triangles:
+            extras["triangles"] = triangles[level["lod"]]
+
+    base = gltf["nodes"][ids[0]]
+    base.setdefault("extensions", {})["MSFT_lod"] = {"ids": ids[1:]}
+    base["extras"]["MSFT_screencoverage"] = [level["screen_size"] for level in levels]
+    used = gltf.setdefault("extensionsUsed", [])
+    if "MSFT_lod" not in used:
+        used.append("MSFT_lod")
+
+    tmp_path = gltf_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(gltf, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, gltf_path)
+    return ids
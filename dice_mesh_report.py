@@ -0,0 +1,302 @@
+"""생성된 주사위 에셋의 메시 예산 리포트 + 회귀 검사
+
+assets/models의 .gltf/.bin을 읽어 에셋별 삼각형/정점 수, 어트리뷰트 스트림,
+버퍼 바이트, 재질 수, 바운딩 박스를 표로 출력하고 JSON으로 저장합니다.
+커밋된 기준선(dice_mesh_baseline.json)과 비교해서 임계값을 넘게 커진 에셋이 있으면
+종료 코드 1로 실패합니다. Blender 없이 일반 파이썬으로 실행합니다.
+
+    python dice_mesh_report.py                              # 표 + 기준선 비교
+    python dice_mesh_report.py --json report.json
+    python dice_mesh_report.py --threshold triangles=0 --threshold buffer_bytes=0.2
+    python dice_mesh_report.py --update-baseline            # 현재 값을 기준선으로 저장
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+
+import dice_catalog
+
+DEFAULT_BASELINE = os.path.join(dice_catalog.PROJECT_DIR, "dice_mesh_baseline.json")
+
+# 기준선 대비 허용 증가율 (0.05 = 5%); materials는 개수 차이
+DEFAULT_THRESHOLDS = {
+    "triangles": 0.05,
+    "vertices": 0.05,
+    "buffer_bytes": 0.10,
+    "materials": 0,
+}
+
+# glTF componentType → 바이트 수
+_COMPONENT_BYTES = {5120: 1, 5121: 1, 5122: 2, 5123: 2, 5125: 4, 5126: 4}
+_TYPE_COMPONENTS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+_MODE_TRIANGLES = 4
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+def measure_gltf(path):
+    """.gltf 하나 → 지표 dict"""
+    with open(path, encoding="utf-8") as f:
+        gltf = json.load(f)
+    accessors = gltf.get("accessors", [])
+    base_dir = os.path.dirname(path)
+
+    triangles = vertices = primitives = 0
+    streams = {}
+    for mesh_index, instances in _mesh_instances(gltf).items():
+        for primitive in gltf["meshes"][mesh_index].get("primitives", []):
+            position = accessors[primitive["attributes"]["POSITION"]]
+            mode = primitive.get("mode", _MODE_TRIANGLES)
+            index_count = accessors[primitive["indices"]]["count"] if "indices" in primitive else position["count"]
+            primitives += instances
+            vertices += position["count"] * instances
+            if mode == _MODE_TRIANGLES:
+                triangles += index_count // 3 * instances
+            for name, accessor_index in primitive["attributes"].items():
+                accessor = accessors[accessor_index]
+                stream = streams.setdefault(name, {"format": _accessor_format(accessor), "bytes": 0})
+                stream["bytes"] += _accessor_bytes(accessor)
+            if "indices" in primitive:
+                accessor = accessors[primitive["indices"]]
+                stream = streams.setdefault("INDICES", {"format": _accessor_format(accessor), "bytes": 0})
+                stream["bytes"] += _accessor_bytes(accessor)
+
+    buffer_bytes = sum(b.get("byteLength", 0) for b in gltf.get("buffers", []))
+    files = [path] + [os.path.join(base_dir, b["uri"]) for b in gltf.get("buffers", [])
+                      if "uri" in b and not b["uri"].startswith("data:")]
+    return {
+        "triangles": triangles,
+        "vertices": vertices,
+        "primitives": primitives,
+        "streams": streams,
+        "buffer_bytes": buffer_bytes,
+        "file_bytes": sum(os.path.getsize(p) for p in files if os.path.exists(p)),
+        "buffers": [os.path.relpath(p, base_dir).replace(os.sep, "/") for p in files[1:]],
+        "materials": len(gltf.get("materials", [])),
+        "textures": len(gltf.get("images", [])),
+        "bbox": _scene_bounds(gltf),
+    }
+
+
+def scan(root):
+    """root 아래 모든 .gltf 측정 + 어떤 .gltf도 참조하지 않는 .bin 목록"""
+    assets = {}
+    referenced = set()
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.gltf"), recursive=True)):
+        key = os.path.relpath(path, root).replace(os.sep, "/")
+        assets[key] = measure_gltf(path)
+        rel_dir = os.path.dirname(key)
+        referenced.update(f"{rel_dir}/{b}".lstrip("/") for b in assets[key]["buffers"])
+    bins = {os.path.relpath(p, root).replace(os.sep, "/")
+            for p in glob.glob(os.path.join(root, "**", "*.bin"), recursive=True)}
+    return {"root": os.path.abspath(root), "assets": assets, "orphan_buffers": sorted(bins - referenced)}
+
+
+def _accessor_format(accessor):
+    return f"{accessor['type']}/{accessor['componentType']}"
+
+
+def _accessor_bytes(accessor):
+    return accessor["count"] * _TYPE_COMPONENTS[accessor["type"]] * _COMPONENT_BYTES[accessor["componentType"]]
+
+
+def _mesh_instances(gltf):
+    """씬에서 각 메시가 몇 번 그려지는지 (노드 참조 수)"""
+    counts = {}
+    for node_index, _ in _walk_nodes(gltf):
+        mesh = gltf["nodes"][node_index].get("mesh")
+        if mesh is not None:
+            counts[mesh] = counts.get(mesh, 0) + 1
+    return counts
+
+
+# ============================================================================
+# 바운딩 박스 (노드 변환 적용)
+# ============================================================================
+def _walk_nodes(gltf):
+    scenes = gltf.get("scenes", [])
+    roots = scenes[gltf.get("scene", 0)]["nodes"] if scenes else range(len(gltf.get("nodes", [])))
+    stack = [(i, _IDENTITY) for i in roots]
+    while stack:
+        index, parent = stack.pop()
+        world = _matmul(parent, _node_matrix(gltf["nodes"][index]))
+        yield index, world
+        stack.extend((child, world) for child in gltf["nodes"][index].get("children", []))
+
+
+def _scene_bounds(gltf):
+    accessors = gltf.get("accessors", [])
+    lo, hi = [math.inf] * 3, [-math.inf] * 3
+    for node_index, world in _walk_nodes(gltf):
+        mesh = gltf["nodes"][node_index].get("mesh")
+        if mesh is None:
+            continue
+        for primitive in gltf["meshes"][mesh].get("primitives", []):
+            position = accessors[primitive["attributes"]["POSITION"]]
+            if "min" not in position:
+                continue
+            pmin, pmax = position["min"], position["max"]
+            for corner in ((x, y, z) for x in (pmin[0], pmax[0]) for y in (pmin[1], pmax[1]) for z in (pmin[2], pmax[2])):
+                p = [sum(world[r][c] * v for c, v in enumerate(corner + (1.0,))) for r in range(3)]
+                lo = [min(a, b) for a, b in zip(lo, p)]
+                hi = [max(a, b) for a, b in zip(hi, p)]
+    if lo[0] == math.inf:
+        return None
+    return {"min": [round(v, 5) for v in lo], "max": [round(v, 5) for v in hi]}
+
+
+_IDENTITY = [[1.0 if r == c else 0.0 for c in range(4)] for r in range(4)]
+
+
+def _node_matrix(node):
+    if "matrix" in node:
+        m = node["matrix"]  # 열 우선
+        return [[m[c * 4 + r] for c in range(4)] for r in range(4)]
+    tx, ty, tz = node.get("translation", (0, 0, 0))
+    qx, qy, qz, qw = node.get("rotation", (0, 0, 0, 1))
+    sx, sy, sz = node.get("scale", (1, 1, 1))
+    rot = [
+        [1 - 2 * (qy * qy + qz * qz), 2 * (qx * qy - qz * qw), 2 * (qx * qz + qy * qw)],
+        [2 * (qx * qy + qz * qw), 1 - 2 * (qx * qx + qz * qz), 2 * (qy * qz - qx * qw)],
+        [2 * (qx * qz - qy * qw), 2 * (qy * qz + qx * qw), 1 - 2 * (qx * qx + qy * qy)],
+    ]
+    return [
+        [rot[0][0] * sx, rot[0][1] * sy, rot[0][2] * sz, tx],
+        [rot[1][0] * sx, rot[1][1] * sy, rot[1][2] * sz, ty],
+        [rot[2][0] * sx, rot[2][1] * sy, rot[2][2] * sz, tz],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def _matmul(a, b):
+    return [[sum(a[r][k] * b[k][c] for k in range(4)) for c in range(4)] for r in range(4)]
+
+
+# ============================================================================
+# 기준선 비교
+# ============================================================================
+def compare(report, baseline, thresholds):
+    """(회귀 목록, 경고 목록) - 회귀가 하나라도 있으면 실패"""
+    regressions, warnings = [], []
+    base_assets = baseline.get("assets", {})
+    for key, metrics in report["assets"].items():
+        base = base_assets.get(key)
+        if base is None:
+            warnings.append(f"{key}: 기준선에 없는 새 에셋")
+            continue
+        for metric, limit in thresholds.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            # materials 같은 개수 지표는 절대 차이, 나머지는 증가율
+            allowed = old + limit if metric == "materials" else old * (1 + limit)
+            if new > allowed:
+                change = f"+{new - old}" if metric == "materials" else f"{(new - old) / max(old, 1):+.1%}"
+                regressions.append(f"{key}: {metric} {old} → {new} ({change}, 허용 {limit})")
+    for key in sorted(set(base_assets) - set(report["assets"])):
+        warnings.append(f"{key}: 기준선에는 있지만 없어진 에셋")
+    return regressions, warnings
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+def print_table(report, baseline=None):
+    base_assets = (baseline or {}).get("assets", {})
+    header = f"{'에셋':<40} {'삼각형':>7} {'정점':>7} {'버퍼(B)':>9} {'재질':>4} {'스트림':<32} {'크기 (x×y×z)':<20}"
+    print(header)
+    print("-" * len(header))
+    for key, m in report["assets"].items():
+        streams = ",".join(name.replace("TEXCOORD_", "UV").replace("POSITION", "POS").replace("INDICES", "IDX")
+                           for name in sorted(m["streams"]))
+        size = "-" if m["bbox"] is None else "×".join(
+            f"{hi - lo:.2f}" for lo, hi in zip(m["bbox"]["min"], m["bbox"]["max"]))
+        delta = ""
+        base = base_assets.get(key)
+        if base and base.get("triangles") != m["triangles"]:
+            delta = f"  (삼각형 기준 {base['triangles']})"
+        print(f"{key:<40} {m['triangles']:>7} {m['vertices']:>7} {m['buffer_bytes']:>9} {m['materials']:>4} "
+              f"{streams:<32} {size:<20}{delta}")
+    totals = {k: sum(m[k] for m in report["assets"].values()) for k in ("triangles", "vertices", "buffer_bytes")}
+    print("-" * len(header))
+    print(f"{'합계 (' + str(len(report['assets'])) + '개)':<40} {totals['triangles']:>7} {totals['vertices']:>7} "
+          f"{totals['buffer_bytes']:>9}")
+    if report["orphan_buffers"]:
+        print(f"\n참조되지 않는 .bin {len(report['orphan_buffers'])}개: {', '.join(report['orphan_buffers'])}")
+
+
+def parse_thresholds(items, base):
+    thresholds = dict(base)
+    for item in items or []:
+        name, _, value = item.partition("=")
+        if name not in DEFAULT_THRESHOLDS or not value:
+            raise SystemExit(f"❌ 잘못된 임계값: {item} (사용 가능: {', '.join(DEFAULT_THRESHOLDS)})")
+        thresholds[name] = int(value) if name == "materials" else float(value)
+    return thresholds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 에셋 메시 예산 리포트 / 회귀 검사")
+    parser.add_argument("root", nargs="?", default=dice_catalog.DEFAULT_OUTPUT_ROOT, help="검사할 모델 폴더")
+    parser.add_argument("--json", default=None, help="리포트 JSON 저장 경로")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교할 기준선 JSON")
+    parser.add_argument("--threshold", action="append", metavar="METRIC=VALUE",
+                        help="허용 증가율 덮어쓰기 (예: triangles=0.05, materials=0)")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 값을 기준선으로 저장")
+    args = parser.parse_args(argv)
+
+    report = scan(args.root)
+    if not report["assets"]:
+        print(f"❌ .gltf 파일이 없습니다: {args.root}")
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    # 임계값 우선순위: 기본값 < 기준선 파일 < 명령행
+    thresholds = parse_thresholds(args.threshold, dict(DEFAULT_THRESHOLDS, **(baseline or {}).get("thresholds", {})))
+    print_table(report, baseline)
+
+    if args.json:
+        save_json(args.json, dict(report, thresholds=thresholds))
+        print(f"\n리포트: {args.json}")
+
+    if args.update_baseline:
+        save_json(args.baseline, {"thresholds": thresholds, "assets": report["assets"]})
+        print(f"✅ 기준선 저장: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"\n기준선이 없습니다 ({args.baseline}) - --update-baseline으로 만드세요.")
+        return 0
+
+    regressions, warnings = compare(report, baseline, thresholds)
+    for message in warnings:
+        print(f"  - {message}")
+    if regressions:
+        print(f"\n❌ 예산 회귀 {len(regressions)}건:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print(f"\n✅ 기준선 대비 회귀 없음 ({len(report['assets'])}개 에셋)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
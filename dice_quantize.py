@@ -0,0 +1,513 @@
+"""익스포트된 주사위 glTF 양자화 + 인덱스 최적화 후처리
+
+Blender가 GLTF_SEPARATE로 쓴 .gltf/.bin은 위치·법선·UV·탄젠트가 모두 float32입니다.
+이 스크립트는 각 .gltf/.bin 쌍을 다음 순서로 다시 씁니다 (Blender 없이 NumPy만 사용).
+
+  1. 양자화 (KHR_mesh_quantization)
+       POSITION     int16 정규화 - 메시 바운딩 박스 기준, 역양자화(이동 + 균일 배율)는 노드 변환에 합침
+       NORMAL       int8 정규화 (--normal-bits 16이면 int16)
+       TANGENT      int8 정규화 (w는 ±1 그대로)
+       TEXCOORD_n   uint16 정규화 ([0, 1] 밖의 UV가 있으면 float 유지)
+       COLOR_n      uint16 정규화 ([0, 1] 밖이면 float 유지)
+  2. 중복 정점 제거 - 양자화한 어트리뷰트가 모두 같은 정점은 하나로 (차이는 양자화 오차 이하)
+  3. 삼각형 순서 최적화 - Tipsify(Sander et al. 2007)로 변환 후 정점 캐시 재사용을 높임
+  4. 정점 순서 - 인덱스에 처음 나오는 순서로 다시 번호 (정점 가져오기 지역성)
+
+전후 .bin 크기와 ACMR(삼각형당 평균 캐시 미스, FIFO 캐시 시뮬레이션)을 표로 출력합니다.
+이미 KHR_mesh_quantization이 적용된 파일은 건너뜁니다. 애니메이션/스킨/모프 타깃이
+있는 파일, 자식이 있는 노드가 쓰는 메시의 위치는 건드리지 않습니다.
+
+Godot은 임포트할 때 glTF를 자체 메시 리소스로 변환하므로 런타임 정점 형식은 임포트
+설정(메시 압축)이 정합니다. 줄어드는 것은 원본 용량과 임포트 시간이고, 정점 수 감소와
+삼각형 순서는 임포트된 메시에도 그대로 남습니다.
+
+    python dice_quantize.py                       # assets/models 전체
+    python dice_quantize.py assets/models --dry-run --json quantize_report.json
+    python dice_quantize.py --files assets/models/0_dice_red.gltf --normal-bits 16
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+import numpy as np
+
+import dice_catalog
+
+EXTENSION = "KHR_mesh_quantization"
+DEFAULT_CACHE_SIZE = 16
+
+# glTF componentType
+BYTE, UNSIGNED_BYTE, SHORT, UNSIGNED_SHORT, UNSIGNED_INT, FLOAT = 5120, 5121, 5122, 5123, 5125, 5126
+_DTYPES = {BYTE: np.int8, UNSIGNED_BYTE: np.uint8, SHORT: np.int16, UNSIGNED_SHORT: np.uint16,
+           UNSIGNED_INT: np.uint32, FLOAT: np.float32}
+_TYPE_COMPONENTS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}
+_NORMALIZE_MAX = {BYTE: 127.0, UNSIGNED_BYTE: 255.0, SHORT: 32767.0, UNSIGNED_SHORT: 65535.0}
+_MODE_TRIANGLES = 4
+_TARGET_ARRAY_BUFFER, _TARGET_ELEMENT_ARRAY_BUFFER = 34962, 34963
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+def read_accessor(gltf, buffers, index):
+    """accessor → NumPy 배열 (정규화 정수는 float로 풀어서, 인덱스는 정수 그대로)"""
+    accessor = gltf["accessors"][index]
+    data = raw_accessor(gltf, buffers, index)
+    if accessor.get("normalized"):
+        return np.maximum(data.astype(np.float64) / _NORMALIZE_MAX[accessor["componentType"]], -1.0)
+    return data.astype(np.float64) if data.dtype.kind == "f" else data
+
+
+def raw_accessor(gltf, buffers, index):
+    """accessor → 저장된 컴포넌트 형식 그대로의 (count, components) 배열 (stride는 풀어서)"""
+    accessor = gltf["accessors"][index]
+    if "sparse" in accessor or "bufferView" not in accessor:
+        raise ValueError(f"accessor {index}: sparse/빈 accessor는 지원하지 않습니다")
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    dtype = np.dtype(_DTYPES[accessor["componentType"]])
+    components = _TYPE_COMPONENTS[accessor["type"]]
+    count = accessor["count"]
+    element = dtype.itemsize * components
+    stride = view.get("byteStride") or element
+    offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    raw = np.frombuffer(buffers[view["buffer"]], dtype=np.uint8, count=stride * (count - 1) + element, offset=offset)
+    if stride != element:
+        rows = np.lib.stride_tricks.as_strided(raw, shape=(count, element), strides=(stride, 1))
+        raw = np.ascontiguousarray(rows).reshape(-1)
+    return raw.view(dtype).reshape(count, components).copy()
+
+
+def load_gltf(path):
+    with open(path, encoding="utf-8") as f:
+        gltf = json.load(f)
+    base_dir = os.path.dirname(path)
+    buffers = []
+    for buffer in gltf.get("buffers", []):
+        uri = buffer.get("uri", "")
+        if not uri or uri.startswith("data:"):
+            raise ValueError("내장(data URI)/GLB 버퍼는 지원하지 않습니다")
+        with open(os.path.join(base_dir, uri), "rb") as f:
+            buffers.append(f.read())
+    return gltf, buffers
+
+
+def shared_buffers(paths):
+    """같은 폴더의 다른 glTF도 참조하는 .bin 경로 (하나만 다시 쓰면 나머지가 깨짐)"""
+    users = {}
+    for folder in {os.path.dirname(os.path.abspath(p)) for p in paths}:
+        for path in glob.glob(os.path.join(folder, "*.gltf")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    uris = [b.get("uri", "") for b in json.load(f).get("buffers", [])]
+            except (OSError, ValueError):
+                continue
+            for uri in uris:
+                users.setdefault(os.path.normpath(os.path.join(folder, uri)), set()).add(path)
+    return {bin_path for bin_path, owners in users.items() if len(owners) > 1}
+
+
+def unsupported_reason(gltf):
+    if EXTENSION in gltf.get("extensionsUsed", []):
+        return "이미 양자화됨"
+    if gltf.get("animations") or gltf.get("skins"):
+        return "애니메이션/스킨"
+    if len(gltf.get("buffers", [])) != 1:
+        return f"버퍼 {len(gltf.get('buffers', []))}개"
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh["primitives"]:
+            if primitive.get("targets"):
+                return "모프 타깃"
+            if primitive.get("mode", _MODE_TRIANGLES) != _MODE_TRIANGLES:
+                return "삼각형 목록이 아닌 프리미티브"
+    return None
+
+
+# ============================================================================
+# 양자화
+# ============================================================================
+def quantize_unit(values, bits, signed=True):
+    """[-1, 1] (signed) / [0, 1] 값 → 정규화 정수"""
+    if signed:
+        top = (1 << (bits - 1)) - 1
+        dtype = np.int8 if bits == 8 else np.int16
+        return np.clip(np.rint(values * top), -top, top).astype(dtype)
+    top = (1 << bits) - 1
+    dtype = np.uint8 if bits == 8 else np.uint16
+    return np.clip(np.rint(values * top), 0, top).astype(dtype)
+
+
+def position_transform(positions):
+    """메시 위치 목록 → (중심, 균일 배율) - (p - 중심) / 배율이 [-1, 1]에 들어감"""
+    stacked = np.concatenate(positions)
+    lo, hi = stacked.min(axis=0), stacked.max(axis=0)
+    center = (lo + hi) / 2
+    scale = float(np.max(hi - lo) / 2) or 1.0
+    return center, scale
+
+
+def quantize_attribute(name, values, normal_bits, position_dequant=None):
+    """(정수/실수 배열, componentType, normalized) - 양자화하지 않으면 float32 그대로"""
+    if name == "POSITION" and position_dequant is not None:
+        center, scale = position_dequant
+        return quantize_unit((values - center) / scale, 16), SHORT, True
+    if name == "NORMAL":
+        return quantize_unit(values, normal_bits), BYTE if normal_bits == 8 else SHORT, True
+    if name == "TANGENT":
+        return quantize_unit(values, normal_bits), BYTE if normal_bits == 8 else SHORT, True
+    if (name.startswith("TEXCOORD_") or name.startswith("COLOR_")) and values.min() >= 0 and values.max() <= 1:
+        return quantize_unit(values, 16, signed=False), UNSIGNED_SHORT, True
+    return values.astype(np.float32), FLOAT, False
+
+
+# ============================================================================
+# 정점 중복 제거 / 캐시 최적화
+# ============================================================================
+def dedupe_vertices(streams, indices):
+    """어트리뷰트가 모두 같은 정점을 합치고 (streams, indices, 제거한 퇴화 삼각형 수)를 반환"""
+    count = len(indices) and streams[0].shape[0]
+    packed = np.concatenate([s.view(np.uint8).reshape(count, -1) for s in streams], axis=1)
+    keys = np.ascontiguousarray(packed).view(np.dtype((np.void, packed.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    remapped = inverse.reshape(-1)[indices]
+    triangles = remapped.reshape(-1, 3)
+    keep = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])
+    return [s[first] for s in streams], triangles[keep].reshape(-1), int((~keep).sum())
+
+
+def acmr(indices, cache_size=DEFAULT_CACHE_SIZE):
+    """FIFO 정점 캐시 시뮬레이션 → 삼각형당 평균 캐시 미스"""
+    triangles = len(indices) // 3
+    if not triangles:
+        return 0.0
+    in_cache = {}
+    fifo = [-1] * cache_size
+    head = misses = 0
+    for v in indices.tolist():
+        if v in in_cache:
+            continue
+        misses += 1
+        evicted = fifo[head]
+        if evicted >= 0:
+            del in_cache[evicted]
+        fifo[head] = v
+        in_cache[v] = True
+        head = (head + 1) % cache_size
+    return misses / triangles
+
+
+def tipsify(indices, vertex_count, cache_size=DEFAULT_CACHE_SIZE):
+    """Tipsify 삼각형 재배치 (선형 시간) → 새 인덱스 배열"""
+    triangles = indices.reshape(-1, 3).tolist()
+    adjacency = [[] for _ in range(vertex_count)]
+    for t, tri in enumerate(triangles):
+        for v in tri:
+            adjacency[v].append(t)
+    live = [len(a) for a in adjacency]
+    cache_time = [0] * vertex_count
+    emitted = [False] * len(triangles)
+    dead_end = []
+    output = []
+    stamp = cache_size + 1
+    cursor = 0
+    fan = 0 if vertex_count else -1
+
+    while fan >= 0:
+        candidates = []
+        for t in adjacency[fan]:
+            if emitted[t]:
+                continue
+            for v in triangles[t]:
+                output.append(v)
+                dead_end.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if stamp - cache_time[v] > cache_size:
+                    cache_time[v] = stamp
+                    stamp += 1
+            emitted[t] = True
+
+        # 캐시에 남아 있을 후보 중 가장 오래된 것 (남은 삼각형이 있는 정점만)
+        fan, best = -1, -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if stamp - cache_time[v] + 2 * live[v] <= cache_size:
+                    priority = stamp - cache_time[v]
+                if priority > best:
+                    fan, best = v, priority
+        if fan >= 0:
+            continue
+        # 막다른 곳: 최근 정점 스택 → 아직 남은 정점을 순서대로
+        while dead_end:
+            v = dead_end.pop()
+            if live[v] > 0:
+                fan = v
+                break
+        else:
+            while cursor < vertex_count and live[cursor] == 0:
+                cursor += 1
+            fan = cursor if cursor < vertex_count else -1
+    return np.array(output, dtype=np.int64)
+
+
+def reorder_vertices(streams, indices):
+    """인덱스에 처음 나오는 순서로 정점 번호를 다시 매깁니다"""
+    _, first = np.unique(indices, return_index=True)
+    order = np.unique(indices)[np.argsort(first)]
+    remap = np.empty(streams[0].shape[0], dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    return [s[order] for s in streams], remap[indices]
+
+
+def optimize_primitive(attributes, indices, cache_size=DEFAULT_CACHE_SIZE):
+    """양자화된 어트리뷰트 dict + 인덱스 → (어트리뷰트 dict, 인덱스, 통계)"""
+    names = list(attributes)
+    before_vertices = attributes[names[0]].shape[0]
+    before_acmr = acmr(indices, cache_size)
+    streams, indices, degenerate = dedupe_vertices([attributes[n] for n in names], indices)
+    indices = tipsify(indices, streams[0].shape[0], cache_size)
+    streams, indices = reorder_vertices(streams, indices)
+    stats = {
+        "vertices_before": before_vertices, "vertices_after": streams[0].shape[0],
+        "triangles": len(indices) // 3, "degenerate_removed": degenerate,
+        "acmr_before": before_acmr, "acmr_after": acmr(indices, cache_size),
+    }
+    return dict(zip(names, streams)), indices, stats
+
+
+# ============================================================================
+# 쓰기
+# ============================================================================
+class BufferWriter:
+    def __init__(self):
+        self.chunks = []
+        self.length = 0
+        self.views = []
+
+    def add(self, data, target=None, stride=None):
+        pad = (-self.length) % 4
+        if pad:
+            self.chunks.append(b"\x00" * pad)
+            self.length += pad
+        view = {"buffer": 0, "byteOffset": self.length, "byteLength": len(data)}
+        if stride:
+            view["byteStride"] = stride
+        if target:
+            view["target"] = target
+        self.chunks.append(data)
+        self.length += len(data)
+        self.views.append(view)
+        return len(self.views) - 1
+
+    def add_attribute(self, array):
+        # 정점 어트리뷰트 요소는 4바이트 정렬 (int16 VEC3 → 8바이트 간격)
+        element = array.dtype.itemsize * array.shape[1]
+        stride = element + (-element) % 4
+        if stride != element:
+            padded = np.zeros((array.shape[0], stride), dtype=np.uint8)
+            padded[:, :element] = array.view(np.uint8).reshape(array.shape[0], element)
+            return self.add(padded.tobytes(), _TARGET_ARRAY_BUFFER, stride)
+        return self.add(np.ascontiguousarray(array).tobytes(), _TARGET_ARRAY_BUFFER)
+
+    def data(self):
+        return b"".join(self.chunks)
+
+
+def _accessor(view, component_type, array, normalized=False, bounds=False):
+    accessor = {
+        "bufferView": view, "componentType": component_type, "count": int(array.shape[0]),
+        "type": "SCALAR" if array.ndim == 1 else {2: "VEC2", 3: "VEC3", 4: "VEC4"}[array.shape[1]],
+    }
+    if normalized:
+        accessor["normalized"] = True
+    if bounds:
+        accessor["min"] = array.min(axis=0).tolist()
+        accessor["max"] = array.max(axis=0).tolist()
+    return accessor
+
+
+def _quat_rotate(q, v):
+    x, y, z, w = q
+    u = np.array([x, y, z])
+    return 2 * np.dot(u, v) * u + (w * w - np.dot(u, u)) * v + 2 * w * np.cross(u, v)
+
+
+def fold_dequantization(node, center, scale):
+    """노드 변환 뒤에 T(center)·S(scale)를 붙입니다 (역양자화)"""
+    if "matrix" in node:
+        m = np.array(node["matrix"], dtype=np.float64).reshape(4, 4).T
+        d = np.diag([scale, scale, scale, 1.0])
+        d[:3, 3] = center
+        node["matrix"] = (m @ d).T.reshape(-1).tolist()
+        return
+    s = np.array(node.get("scale", [1.0, 1.0, 1.0]))
+    r = node.get("rotation", [0.0, 0.0, 0.0, 1.0])
+    t = np.array(node.get("translation", [0.0, 0.0, 0.0]))
+    node["translation"] = (t + _quat_rotate(r, s * center)).tolist()
+    node["scale"] = (s * scale).tolist()
+
+
+def quantize_gltf(path, normal_bits=8, cache_size=DEFAULT_CACHE_SIZE, write=True, shared=()):
+    """.gltf/.bin 한 쌍을 다시 씁니다 → 리포트 dict (건너뛰면 skipped에 이유)"""
+    gltf, buffers = load_gltf(path)
+    bin_path = os.path.join(os.path.dirname(path), gltf["buffers"][0]["uri"]) if gltf.get("buffers") else None
+    report = {"file": os.path.basename(path), "bytes_before": len(buffers[0]) if buffers else 0}
+    reason = unsupported_reason(gltf)
+    if not reason and os.path.normpath(os.path.abspath(bin_path)) in shared:
+        reason = f"{gltf['buffers'][0]['uri']}를 다른 glTF와 공유"
+    if reason:
+        return dict(report, skipped=reason)
+
+    nodes = gltf.get("nodes", [])
+    mesh_nodes = {}
+    for node in nodes:
+        if "mesh" in node:
+            mesh_nodes.setdefault(node["mesh"], []).append(node)
+
+    primitive_accessors = {i for mesh in gltf.get("meshes", []) for p in mesh["primitives"]
+                           for i in list(p["attributes"].values()) + ([p["indices"]] if "indices" in p else [])}
+    other_accessors = set(range(len(gltf.get("accessors", [])))) - primitive_accessors
+    if other_accessors:
+        return dict(report, skipped=f"프리미티브 밖에서 쓰는 accessor {len(other_accessors)}개")
+
+    writer = BufferWriter()
+    # 이미지 등 메시 밖의 bufferView는 그대로 옮김
+    used_views = {gltf["accessors"][i]["bufferView"] for i in primitive_accessors}
+    view_remap = {}
+    for index, view in enumerate(gltf.get("bufferViews", [])):
+        if index not in used_views:
+            start = view.get("byteOffset", 0)
+            new_index = writer.add(buffers[0][start:start + view["byteLength"]], view.get("target"), view.get("byteStride"))
+            view_remap[index] = new_index
+    for image in gltf.get("images", []):
+        if "bufferView" in image:
+            image["bufferView"] = view_remap[image["bufferView"]]
+
+    accessors, stats = [], []
+    for mesh_index, mesh in enumerate(gltf.get("meshes", [])):
+        owners = mesh_nodes.get(mesh_index, [])
+        decoded = [{name: read_accessor(gltf, buffers, a) for name, a in p["attributes"].items()}
+                   for p in mesh["primitives"]]
+        # 자식이 있는 노드의 변환은 바꿀 수 없으니 그 메시의 위치는 float 유지
+        dequant = None
+        if owners and not any(node.get("children") for node in owners):
+            dequant = position_transform([d["POSITION"] for d in decoded])
+            for node in owners:
+                fold_dequantization(node, *dequant)
+
+        for primitive, attributes in zip(mesh["primitives"], decoded):
+            count = attributes["POSITION"].shape[0]
+            indices = (read_accessor(gltf, buffers, primitive["indices"]).reshape(-1).astype(np.int64)
+                       if "indices" in primitive else np.arange(count, dtype=np.int64))
+            quantized, formats = {}, {}
+            for name, values in attributes.items():
+                array, component_type, normalized = quantize_attribute(name, values, normal_bits, dequant)
+                quantized[name] = array
+                formats[name] = (component_type, normalized)
+            quantized, indices, primitive_stats = optimize_primitive(quantized, indices, cache_size)
+            stats.append(primitive_stats)
+
+            new_attributes = {}
+            for name, array in quantized.items():
+                component_type, normalized = formats[name]
+                view = writer.add_attribute(array)
+                accessors.append(_accessor(view, component_type, array, normalized, bounds=name == "POSITION"))
+                new_attributes[name] = len(accessors) - 1
+            primitive["attributes"] = new_attributes
+
+            vertex_count = quantized["POSITION"].shape[0]
+            index_type, index_dtype = ((UNSIGNED_SHORT, np.uint16) if vertex_count <= 0xFFFF
+                                       else (UNSIGNED_INT, np.uint32))
+            index_array = indices.astype(index_dtype)
+            view = writer.add(index_array.tobytes(), _TARGET_ELEMENT_ARRAY_BUFFER)
+            accessors.append(_accessor(view, index_type, index_array))
+            primitive["indices"] = len(accessors) - 1
+
+    data = writer.data()
+    gltf["accessors"] = accessors
+    gltf["bufferViews"] = writer.views
+    gltf["buffers"][0]["byteLength"] = len(data)
+    for key in ("extensionsUsed", "extensionsRequired"):
+        gltf[key] = sorted(set(gltf.get(key, [])) | {EXTENSION})
+
+    triangles = sum(s["triangles"] for s in stats) or 1
+    report.update({
+        "bytes_after": len(data),
+        "vertices_before": sum(s["vertices_before"] for s in stats),
+        "vertices_after": sum(s["vertices_after"] for s in stats),
+        "triangles": sum(s["triangles"] for s in stats),
+        "degenerate_removed": sum(s["degenerate_removed"] for s in stats),
+        "acmr_before": sum(s["acmr_before"] * s["triangles"] for s in stats) / triangles,
+        "acmr_after": sum(s["acmr_after"] * s["triangles"] for s in stats) / triangles,
+    })
+    if write:
+        _replace(bin_path, data)
+        _replace(path, json.dumps(gltf, ensure_ascii=False, indent=2).encode("utf-8"))
+    return report
+
+
+def _replace(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+def print_table(reports):
+    print(f"{'파일':<36} {'.bin 전':>10} {'.bin 후':>10} {'정점 전':>8} {'정점 후':>8} {'ACMR 전':>8} {'ACMR 후':>8}")
+    done = [r for r in reports if "skipped" not in r]
+    for r in done:
+        print(f"{r['file']:<36} {r['bytes_before'] / 1024:>9.0f}K {r['bytes_after'] / 1024:>9.0f}K "
+              f"{r['vertices_before']:>8} {r['vertices_after']:>8} {r['acmr_before']:>8.3f} {r['acmr_after']:>8.3f}")
+    for r in reports:
+        if "skipped" in r:
+            print(f"⏭️ {r['file']:<34} {r['skipped']}")
+    if done:
+        before = sum(r["bytes_before"] for r in done)
+        after = sum(r["bytes_after"] for r in done)
+        triangles = sum(r["triangles"] for r in done) or 1
+        print("-" * 96)
+        print(f"{'합계 ' + str(len(done)) + '개':<36} {before / 1048576:>9.1f}M {after / 1048576:>9.1f}M "
+              f"{sum(r['vertices_before'] for r in done):>8} {sum(r['vertices_after'] for r in done):>8} "
+              f"{sum(r['acmr_before'] * r['triangles'] for r in done) / triangles:>8.3f} "
+              f"{sum(r['acmr_after'] * r['triangles'] for r in done) / triangles:>8.3f}")
+        print(f"✅ .bin {100 * (1 - after / before):.0f}% 감소" if before else "")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 glTF 양자화(KHR_mesh_quantization) + 정점/인덱스 최적화")
+    parser.add_argument("root", nargs="?", default=dice_catalog.DEFAULT_OUTPUT_ROOT, help="glTF 폴더")
+    parser.add_argument("--files", nargs="*", default=None, help="처리할 .gltf 파일 (기본: root 전체)")
+    parser.add_argument("--normal-bits", type=int, choices=(8, 16), default=8, help="법선/탄젠트 비트 수")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="ACMR/Tipsify 정점 캐시 크기")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 리포트만")
+    parser.add_argument("--json", default=None, help="리포트 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    paths = args.files if args.files is not None else sorted(glob.glob(os.path.join(args.root, "*.gltf")))
+    if not paths:
+        print(f"❌ glTF 파일이 없습니다: {args.root}")
+        return 1
+
+    shared = shared_buffers(paths)
+    reports, failed = [], 0
+    for path in paths:
+        try:
+            reports.append(quantize_gltf(path, args.normal_bits, args.cache_size, not args.dry_run, shared))
+        except (OSError, ValueError, KeyError) as e:
+            failed += 1
+            print(f"❌ {os.path.basename(path)}: {e}")
+    print_table(reports)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
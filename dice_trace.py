@@ -0,0 +1,317 @@
+"""주사위 파이프라인 빌드 추적 / 프로파일링
+
+단계(STEP)와 변형 익스포트마다 벽시계 시간, CPU 시간, 최대 RSS, bpy.data 블록 수
+(meshes, materials, objects, images)를 기록해 Chrome 추적 이벤트 JSON
+(chrome://tracing, https://ui.perfetto.dev)과 요약 표로 남깁니다.
+--profile이면 최상위 단계마다 cProfile을 돌리고 가장 느린 단계의 통계만 남깁니다.
+
+Blender 스크립트에서는 "--" 뒤 인자로 켭니다.
+
+    blender -b --python dice_optimized.py -- --trace build_trace.json --profile
+    python dice_farm.py --trace farm_trace.json --profile   # 워커 추적을 하나로 합침
+
+    tracer = dice_trace.Tracer.from_argv(sys.argv)
+    with tracer.stage("STEP 1 재질"):
+        ...
+    tracer.finish()
+"""
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+BLOCK_TYPES = ("meshes", "materials", "objects", "images")
+PROFILE_TOP = 25
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB) - 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def current_rss_mb():
+    """현재 RSS (MB) - /proc이 없는 OS에서는 최대 RSS로 대신합니다"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
+
+
+def block_counts(transient=False):
+    """bpy.data 블록 수 (Blender 밖에서는 빈 dict)
+
+    transient=True면 fake user가 없는 블록만 셉니다 (공유 형태 캐시 제외).
+    """
+    if bpy is None:
+        return {}
+    if not transient:
+        return {name: len(getattr(bpy.data, name)) for name in BLOCK_TYPES}
+    return {name: sum(1 for block in getattr(bpy.data, name) if not block.use_fake_user)
+            for name in BLOCK_TYPES + ("node_groups",)}
+
+
+# ============================================================================
+# 배치 모드 메모리 검사
+# ============================================================================
+class FlatMemoryCheck:
+    """변형을 하나 끝낼 때마다 메모리가 평평한지 확인합니다
+
+    처음 warmup개 변형 뒤의 상태를 기준으로 삼고, 이후 변형마다
+      - 임시 블록 수(fake user 없는 meshes/materials/objects/images/node_groups)가 기준과 같고
+      - 현재 RSS가 기준 + rss_slack_mb 이하인지
+    검사합니다. 어기면 violations에 기록하고, strict면 AssertionError를 냅니다.
+    """
+
+    def __init__(self, warmup=3, rss_slack_mb=64.0, strict=True):
+        self.warmup = warmup
+        self.rss_slack_mb = rss_slack_mb
+        self.strict = strict
+        self.baseline = None
+        self.samples = []
+        self.violations = []
+
+    def check(self, label):
+        blocks = block_counts(transient=True)
+        rss = current_rss_mb()
+        self.samples.append({"label": label, "rss_mb": rss, "blocks": blocks})
+        if len(self.samples) < self.warmup:
+            return
+        if self.baseline is None:
+            self.baseline = self.samples[-1]
+            return
+
+        problems = [f"{name} {self.baseline['blocks'].get(name, 0)} → {count}"
+                    for name, count in blocks.items() if count != self.baseline["blocks"].get(name, 0)]
+        if rss is not None and self.baseline["rss_mb"] is not None and rss > self.baseline["rss_mb"] + self.rss_slack_mb:
+            problems.append(f"RSS {self.baseline['rss_mb']:.1f}MB → {rss:.1f}MB (허용 +{self.rss_slack_mb:.0f}MB)")
+        if problems:
+            message = f"{label}: 메모리가 평평하지 않습니다 - " + ", ".join(problems)
+            self.violations.append(message)
+            if self.strict:
+                raise AssertionError(message)
+
+    def report(self):
+        if not self.samples:
+            return {}
+        rss = [s["rss_mb"] for s in self.samples if s["rss_mb"] is not None]
+        return {
+            "variants": len(self.samples),
+            "baseline": self.baseline,
+            "rss_first_mb": rss[0] if rss else None,
+            "rss_last_mb": rss[-1] if rss else None,
+            "rss_max_mb": max(rss) if rss else None,
+            "violations": self.violations,
+        }
+
+
+# ============================================================================
+# 추적기
+# ============================================================================
+class Tracer:
+    """단계별 측정을 모아 Chrome 추적 JSON / 요약 표 / cProfile 통계로 씁니다"""
+
+    def __init__(self, trace_path=None, profile=False, process_name="dice_build", on_record=None):
+        self.trace_path = trace_path
+        self.profile = profile
+        self.process_name = process_name
+        # 단계가 끝날 때마다 기록 dict로 호출 (빌드 데몬이 진행 상황을 스트리밍)
+        self.on_record = on_record
+        self.records = []
+        self.counters = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+        self._slowest_profile = None
+
+    @classmethod
+    def from_argv(cls, argv, process_name="dice_build"):
+        """Blender 스크립트 인자("--" 뒤)의 --trace / --profile로 만듭니다"""
+        argv = argv[argv.index("--") + 1:] if "--" in argv else []
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--trace", default=None)
+        parser.add_argument("--profile", action="store_true")
+        args, _ = parser.parse_known_args(argv)
+        return cls(args.trace, args.profile, process_name)
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    @contextmanager
+    def stage(self, name, category="stage", **fields):
+        """with 블록 하나 = 추적 이벤트 하나 (중첩 가능, 프로파일은 최상위 단계만)"""
+        profiler = cProfile.Profile() if self.profile and self._depth == 0 else None
+        blocks_before = block_counts()
+        start_us = self._now_us()
+        cpu_start = time.process_time()
+        self._depth += 1
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            self._depth -= 1
+            end_us = self._now_us()
+            record = {
+                "name": name,
+                "category": category,
+                "depth": self._depth,
+                "start_us": start_us,
+                "wall_ms": (end_us - start_us) / 1000,
+                "cpu_ms": (time.process_time() - cpu_start) * 1000,
+                "peak_rss_mb": peak_rss_mb(),
+                "blocks_before": blocks_before,
+                "blocks_after": block_counts(),
+                "fields": fields,
+            }
+            self.records.append(record)
+            self.counters.append((end_us, record["peak_rss_mb"], record["blocks_after"]))
+            if self.on_record:
+                self.on_record(record)
+            if profiler and (self._slowest_profile is None or record["wall_ms"] > self._slowest_profile[1]):
+                self._slowest_profile = (name, record["wall_ms"], profiler)
+
+    # ------------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------------
+    def trace_events(self, pid=0):
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.process_name}}]
+        for r in self.records:
+            # 이벤트 이름에는 변형 이름을 붙이고, 요약은 단계 이름(stage)으로 묶습니다
+            label = f"{r['name']} {r['fields']['variant']}" if "variant" in r["fields"] else r["name"]
+            events.append({
+                "name": label, "cat": r["category"], "ph": "X", "pid": pid, "tid": 0,
+                "ts": round(r["start_us"], 1), "dur": round(r["wall_ms"] * 1000, 1),
+                "args": dict(r["fields"], stage=r["name"], depth=r["depth"], cpu_ms=round(r["cpu_ms"], 2),
+                             peak_rss_mb=r["peak_rss_mb"], blocks_before=r["blocks_before"],
+                             blocks_after=r["blocks_after"]),
+            })
+        for ts, rss, blocks in self.counters:
+            if rss is not None:
+                events.append({"name": "peak_rss_mb", "ph": "C", "pid": pid, "ts": round(ts, 1), "args": {"MB": rss}})
+            if blocks:
+                events.append({"name": "bpy.data", "ph": "C", "pid": pid, "ts": round(ts, 1), "args": blocks})
+        return events
+
+    def write_trace(self, path=None):
+        path = path or self.trace_path
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms",
+                       "otherData": {"summary": summarize(self.records)}}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def write_profile(self, path=None):
+        """가장 느린 최상위 단계의 cProfile 통계 (.prof) → (단계 이름, 경로)"""
+        if self._slowest_profile is None:
+            return None
+        name, wall_ms, profiler = self._slowest_profile
+        path = path or os.path.splitext(self.trace_path or "dice_build")[0] + ".prof"
+        profiler.dump_stats(path)
+        return name, path
+
+    def finish(self):
+        """요약 표를 출력하고 --trace / --profile 결과를 씁니다"""
+        print_summary(summarize(self.records))
+        if self.trace_path:
+            print(f"📈 추적: {self.write_trace()}")
+        if self.profile:
+            result = self.write_profile()
+            if result:
+                name, path = result
+                print(f"🔬 가장 느린 단계 프로파일: {name} → {path}")
+                print(profile_text(path))
+
+
+# ============================================================================
+# 요약
+# ============================================================================
+def summarize(records):
+    """이름별 합계 행 목록 (벽시계 시간 합계 내림차순)"""
+    rows = {}
+    for r in records:
+        row = rows.setdefault(r["name"], {
+            "name": r["name"], "depth": r["depth"], "count": 0, "wall_ms": 0.0, "cpu_ms": 0.0,
+            "peak_rss_mb": None, "block_delta": {name: 0 for name in BLOCK_TYPES},
+        })
+        row["count"] += 1
+        row["wall_ms"] += r["wall_ms"]
+        row["cpu_ms"] += r["cpu_ms"]
+        if r["peak_rss_mb"] is not None:
+            row["peak_rss_mb"] = max(row["peak_rss_mb"] or 0, r["peak_rss_mb"])
+        for name in BLOCK_TYPES:
+            row["block_delta"][name] += r["blocks_after"].get(name, 0) - r["blocks_before"].get(name, 0)
+    return sorted(rows.values(), key=lambda row: -row["wall_ms"])
+
+
+def print_summary(rows):
+    print("\n" + "=" * 96)
+    print(f"{'단계':<40} {'횟수':>4} {'벽시계(ms)':>11} {'CPU(ms)':>10} {'최대RSS(MB)':>11}  "
+          f"{'블록 증감 (mesh/mat/obj/img)'}")
+    for row in rows:
+        delta = "/".join(f"{row['block_delta'][name]:+d}" for name in BLOCK_TYPES)
+        rss = f"{row['peak_rss_mb']:.1f}" if row["peak_rss_mb"] is not None else "-"
+        label = "  " * row["depth"] + row["name"]
+        print(f"{label[:40]:<40} {row['count']:>4} {row['wall_ms']:>11.1f} {row['cpu_ms']:>10.1f} {rss:>11}  {delta}")
+    print("=" * 96)
+
+
+def profile_text(path, top=PROFILE_TOP):
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).sort_stats("cumulative").print_stats(top)
+    return out.getvalue()
+
+
+def merge_traces(paths, out_path, process_names=None):
+    """워커별 추적 JSON을 프로세스(pid)만 바꿔 하나로 합칩니다 → 합친 요약 행 목록"""
+    events, records = [], []
+    for pid, path in enumerate(paths):
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            trace = json.load(f)
+        for event in trace["traceEvents"]:
+            event = dict(event, pid=pid)
+            if event["ph"] == "M" and process_names:
+                event["args"] = {"name": process_names[pid]}
+            events.append(event)
+            if event["ph"] == "X":
+                records.append({
+                    "name": event["args"].get("stage", event["name"]), "depth": event["args"].get("depth", 0),
+                    "wall_ms": event["dur"] / 1000,
+                    "cpu_ms": event["args"].get("cpu_ms", 0.0), "peak_rss_mb": event["args"].get("peak_rss_mb"),
+                    "blocks_before": event["args"].get("blocks_before", {}),
+                    "blocks_after": event["args"].get("blocks_after", {}),
+                })
+    rows = summarize(records)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"summary": rows}}, f,
+                  ensure_ascii=False)
+    os.replace(tmp_path, out_path)
+    return rows
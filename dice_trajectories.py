@@ -0,0 +1,422 @@
+"""미리 계산한 주사위 굴림 궤적 라이브러리 (오프라인 강체 시뮬레이션)
+
+런타임의 Dice(scripts/components/dice.gd)는 매 프레임 강체 물리로 굴러가고, 멈춘 뒤에
+위를 향한 면을 읽습니다. 이 스크립트는 같은 베벨 큐브(dice_matrix.json의 dice_size,
+bevel_amount)를 NumPy로 수천 번 미리 굴려서 결과 면별로 묶은 키프레임 궤적을 만듭니다.
+게임은 원하는 면의 궤적 하나를 재생만 하면 되므로 굴림 중 물리 비용이 거의 없습니다.
+
+  - 좌표/단위는 Godot 그대로 (Y가 위, 테이블 윗면 y = 0, 주사위 한 변 2.0)
+  - 물리 값은 dice.gd의 컵 '외부' 설정(apply_outside_cup_physics)과 같음
+      중력 9.8 × 20, 선형 감쇠 0.8, 회전 감쇠 0.2, 마찰 0.3, 반발 0.5, 질량 1.5
+  - 주사위 모양 = 모서리 반지름이 bevel_amount인 둥근 큐브 (코너 구 8개로 평면과 접촉)
+  - 시작 자세 = 컵(GameConstants.CUP_POSITION) 안의 임의 위치/회전 + 쏟는 방향 속도
+    + start_rolling()과 같은 범위의 각속도. 컵 안 충돌은 시뮬레이션하지 않습니다.
+  - 멈춤 판정은 dice.gd와 같음 (0.5초 이후 각속도 < 1, 선속도 < 0.3). 비스듬히 선 궤적,
+    테이블 밖으로 나간 궤적, MAX_ROLL_TIME을 넘긴 궤적은 버림
+  - 마지막 몇 프레임에 걸쳐 면이 정확히 평평해지도록 보정
+
+주사위는 큐브라서 몸체 좌표를 대칭 회전으로 바꿔 붙여도 굴러가는 모양은 같습니다.
+그래서 면 f로 끝나는 궤적도 remap 회전 하나만 곱하면 어떤 면으로든 끝낼 수 있고,
+인덱스의 face_remap[f][g]가 그 회전(쿼터니언 x, y, z, w)입니다.
+
+출력 (assets/dice_rolls/):
+    dice_rolls.bin    키프레임 int16 × 7 (위치 x, y, z ÷ position_scale, 쿼터니언 x, y, z, w ÷ 32767)
+    dice_rolls.json   궤적 목록 [키 시작 번호, 키 개수, 결과 면, 시작 칸, 끝 x, 끝 z],
+                      결과 면 → 시작 칸 → 궤적 번호, face_remap, 물리/양자화 설정
+
+런타임은 scripts/utils/dice_roll_library.gd (DiceRollLibrary)가 읽고, Dice.play_baked_roll()이
+재생합니다 (GameConstants.USE_BAKED_ROLLS).
+
+    python dice_trajectories.py                     # 기본 1200개
+    python dice_trajectories.py --count 6000 --seed 7 --fps 30
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+import dice_catalog
+
+OUTPUT_DIR = os.path.join(dice_catalog.PROJECT_DIR, "assets", "dice_rolls")
+DATA_NAME = "dice_rolls.bin"
+INDEX_NAME = "dice_rolls.json"
+
+# dice.gd sides (Godot 로컬 면 노멀, Y가 위)
+FACE_NORMALS = {
+    1: (0.0, 1.0, 0.0),
+    6: (0.0, -1.0, 0.0),
+    5: (1.0, 0.0, 0.0),
+    2: (-1.0, 0.0, 0.0),
+    3: (0.0, 0.0, -1.0),
+    4: (0.0, 0.0, 1.0),
+}
+
+# dice.gd 컵 외부 물리 + 멈춤 판정
+PHYSICS = {
+    "gravity": 9.8 * 20,
+    "linear_damp": 0.8,
+    "angular_damp": 0.2,
+    "friction": 0.3,
+    "bounce": 0.5,
+    "mass": 1.5,
+    "max_velocity": 50.0,
+    "max_roll_time": 10.0,
+    "min_roll_time": 0.5,
+    "angular_rest": 1.0,
+    "linear_rest": 0.3,
+}
+# 이 속도보다 느리게 부딪히면 튕기지 않음 (접촉이 떨리지 않도록)
+REST_BOUNCE_SPEED = 2.0
+CONTACT_ITERATIONS = 8
+
+# 시작 자세 (GameConstants: CUP_POSITION, CUP_SPAWN_RADIUS, DICE_IMPULSE_*_RANGE)
+# 쏟기는 컵이 왼쪽(-X)으로 기울어지며 내려가므로 X 임펄스를 -X로 둡니다
+CUP_POSITION = (10.0, 8.0, 0.0)
+ENTRY_RADIUS = 1.0
+IMPULSE_X = (-30.0, -20.0)
+IMPULSE_Y = (15.0, 25.0)
+IMPULSE_Z = (-10.0, 10.0)
+SPIN_RANGE = (10.0, 25.0)
+ENTRY_CELLS = 3
+# FLOOR_SIZE 50 × 50 테이블
+TABLE_HALF_EXTENT = 25.0
+
+DEFAULT_COUNT = 1200
+DEFAULT_FPS = 30
+SUBSTEPS_PER_KEY = 8
+POSITION_SCALE = 1.0 / 1000
+MAX_REST_TILT_DEGREES = 15.0
+SNAP_KEYS = 4
+
+
+# ============================================================================
+# 쿼터니언 (x, y, z, w)
+# ============================================================================
+def quat_multiply(a, b):
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack([
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    ], axis=-1)
+
+
+def quat_to_matrix(q):
+    x, y, z, w = np.moveaxis(q, -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=-1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=-1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=-1),
+    ], axis=-2)
+
+
+def quat_from_to(a, b):
+    """단위 벡터 a → b 최단 회전 (정반대면 a에 수직인 축으로 180°)"""
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    dot = float(np.dot(a, b))
+    if dot < -1 + 1e-9:
+        axis = np.cross(a, (1.0, 0.0, 0.0))
+        if np.linalg.norm(axis) < 1e-6:
+            axis = np.cross(a, (0.0, 0.0, 1.0))
+        axis /= np.linalg.norm(axis)
+        return np.array([axis[0], axis[1], axis[2], 0.0])
+    q = np.array([*np.cross(a, b), 1.0 + dot])
+    return q / np.linalg.norm(q)
+
+
+def random_quaternions(rng, count):
+    """균일한 임의 회전 (Shoemake)"""
+    u1, u2, u3 = rng.random((3, count))
+    a, b = np.sqrt(1 - u1), np.sqrt(u1)
+    return np.stack([a * np.sin(2 * np.pi * u2), a * np.cos(2 * np.pi * u2),
+                     b * np.sin(2 * np.pi * u3), b * np.cos(2 * np.pi * u3)], axis=-1)
+
+
+def face_remap():
+    """face_remap[f][g] - 면 f로 끝나는 궤적의 자세 뒤에 곱하면 면 g가 위로 옴
+
+    q' = q · r, r은 몸체 좌표에서 n_g → n_f 회전 (q'가 n_g를 q가 n_f를 보낸 곳, 즉 위로 보냄)
+    """
+    table = {}
+    for f, n_f in FACE_NORMALS.items():
+        table[str(f)] = {str(g): [round(float(c), 7) for c in quat_from_to(n_g, n_f)]
+                         for g, n_g in FACE_NORMALS.items()}
+    return table
+
+
+# ============================================================================
+# 시뮬레이션
+# ============================================================================
+def sample_entries(rng, count):
+    """컵 안 시작 자세 → (위치, 속도, 자세, 각속도, 시작 칸)"""
+    radius = ENTRY_RADIUS * np.sqrt(rng.random(count))
+    angle = rng.random(count) * 2 * np.pi
+    offset = np.stack([radius * np.cos(angle), np.zeros(count), radius * np.sin(angle)], axis=-1)
+    position = np.asarray(CUP_POSITION) + offset
+    impulse = np.stack([rng.uniform(*IMPULSE_X, count), rng.uniform(*IMPULSE_Y, count),
+                        rng.uniform(*IMPULSE_Z, count)], axis=-1)
+    velocity = impulse / PHYSICS["mass"]
+    # start_rolling(): 축마다 ±(10 ~ 25)
+    spin = rng.uniform(*SPIN_RANGE, (count, 3)) * rng.choice((-1.0, 1.0), (count, 3))
+    return position, velocity, random_quaternions(rng, count), spin, entry_cell(offset)
+
+
+def entry_cell(offset):
+    """컵 중심 기준 (x, z) 오프셋 → ENTRY_CELLS × ENTRY_CELLS 격자 칸 번호"""
+    cells = np.clip(((offset[:, [0, 2]] / ENTRY_RADIUS + 1) / 2 * ENTRY_CELLS).astype(int), 0, ENTRY_CELLS - 1)
+    return cells[:, 1] * ENTRY_CELLS + cells[:, 0]
+
+
+def table_planes():
+    """(노멀, 오프셋) - 테이블 윗면과 가장자리 벽 4개, 점 p는 n·p ≥ d 쪽에 있어야 함"""
+    h = TABLE_HALF_EXTENT
+    normals = np.array([(0, 1, 0), (1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1)], dtype=np.float64)
+    offsets = np.array([0.0, -h, -h, -h, -h])
+    return normals, offsets
+
+
+def simulate(position, velocity, orientation, spin, dice_size, bevel, fps=DEFAULT_FPS):
+    """주사위 N개를 한꺼번에 굴립니다 → (키 목록 [N개의 (K, 7) 배열], 멈춘 시간, 상태 문자열)"""
+    p = dict(PHYSICS)
+    dt = 1.0 / (fps * SUBSTEPS_PER_KEY)
+    count = len(position)
+    x, v, q, w = position.copy(), velocity.copy(), orientation.copy(), spin.copy()
+    mass = p["mass"]
+    inertia = mass * dice_size ** 2 / 6  # 큐브 관성 (모든 축이 같음)
+    core = dice_size / 2 - bevel
+    corners = core * np.array([(sx, sy, sz) for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)], dtype=np.float64)
+    normals, offsets = table_planes()
+
+    keys = [[] for _ in range(count)]
+    status = np.array(["rolling"] * count, dtype=object)
+    settle_time = np.zeros(count)
+    active = np.ones(count, dtype=bool)
+    max_steps = int(p["max_roll_time"] / dt) + 1
+
+    for step in range(max_steps):
+        if step % SUBSTEPS_PER_KEY == 0:
+            for i in np.flatnonzero(active):
+                keys[i].append(np.concatenate([x[i], q[i]]))
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        xs, vs, qs, ws = x[idx], v[idx], q[idx], w[idx]
+
+        vs[:, 1] -= p["gravity"] * dt
+        vs *= max(0.0, 1 - p["linear_damp"] * dt)
+        ws *= max(0.0, 1 - p["angular_damp"] * dt)
+        for vec in (vs, ws):
+            speed = np.linalg.norm(vec, axis=1, keepdims=True)
+            vec *= np.where(speed > p["max_velocity"], p["max_velocity"] / np.maximum(speed, 1e-9), 1.0)
+
+        arms = np.einsum("nij,kj->nki", quat_to_matrix(qs), corners)  # (n, 8, 3)
+        for normal, offset in zip(normals, offsets):
+            depth = offset - (np.einsum("nki,i->nk", xs[:, None, :] + arms, normal) - bevel)
+            touching = depth > 0
+            if not touching.any():
+                continue
+            contact_arm = arms - bevel * normal
+            k_n = 1 / mass + (np.cross(contact_arm, normal) ** 2).sum(-1) / inertia
+            first_vn = (vs[:, None, :] + np.cross(ws[:, None, :], contact_arm)) @ normal
+            # 반발은 들어온 속도 기준 목표 분리 속도로 (느린 접촉은 튕기지 않음)
+            target_vn = np.where(first_vn < -REST_BOUNCE_SPEED, -p["bounce"] * first_vn, 0.0)
+            # 코너마다 순서대로 누적 임펄스를 고정(clamp)하는 순차 임펄스 방식 - 면으로 누운 주사위가 멈춤
+            total_n = np.zeros(touching.shape)
+            total_t = np.zeros(touching.shape + (3,))
+            for iteration in range(CONTACT_ITERATIONS):
+                # 반복마다 순서를 뒤집어 먼저 처리한 코너 쪽으로 치우치지 않게 (대칭 Gauss-Seidel)
+                order = range(len(corners)) if iteration % 2 == 0 else range(len(corners) - 1, -1, -1)
+                for k in order:
+                    hit = touching[:, k]
+                    if not hit.any():
+                        continue
+                    arm = contact_arm[:, k]
+                    vn = (vs + np.cross(ws, arm)) @ normal
+                    accumulated = np.maximum(total_n[:, k] + np.where(hit, (target_vn[:, k] - vn) / k_n[:, k], 0.0), 0.0)
+                    impulse = (accumulated - total_n[:, k])[:, None] * normal
+                    total_n[:, k] = accumulated
+                    vs += impulse / mass
+                    ws += np.cross(arm, impulse) / inertia
+
+                    rel = vs + np.cross(ws, arm)
+                    tangent_vel = rel - (rel @ normal)[:, None] * normal
+                    tangent_speed = np.linalg.norm(tangent_vel, axis=-1)
+                    tangent = tangent_vel / np.maximum(tangent_speed, 1e-9)[:, None]
+                    k_t = 1 / mass + (np.cross(arm, tangent) ** 2).sum(-1) / inertia
+                    friction = total_t[:, k] - tangent_vel / k_t[:, None]
+                    limit = p["friction"] * total_n[:, k]
+                    size = np.linalg.norm(friction, axis=-1)
+                    friction *= np.where(size > limit, limit / np.maximum(size, 1e-12), 1.0)[:, None]
+                    impulse = friction - total_t[:, k]
+                    total_t[:, k] = friction
+                    vs += impulse / mass
+                    ws += np.cross(arm, impulse) / inertia
+            # 파고든 만큼 밀어냄 (가장 깊은 코너 기준)
+            xs += normal * np.maximum(depth.max(axis=1), 0)[:, None] * 0.8
+
+        xs += vs * dt
+        spin_quat = np.concatenate([ws, np.zeros((len(idx), 1))], axis=1)
+        qs += 0.5 * dt * quat_multiply(spin_quat, qs)
+        qs /= np.linalg.norm(qs, axis=1, keepdims=True)
+        x[idx], v[idx], q[idx], w[idx] = xs, vs, qs, ws
+
+        t = (step + 1) * dt
+        if t >= p["min_roll_time"]:
+            resting = (np.linalg.norm(ws, axis=1) < p["angular_rest"]) & (np.linalg.norm(vs, axis=1) < p["linear_rest"])
+            for i in idx[resting]:
+                active[i] = False
+                status[i] = "settled"
+                settle_time[i] = t
+                keys[i].append(np.concatenate([x[i], q[i]]))
+    status[active] = "timeout"
+    return [np.array(k) for k in keys], settle_time, status
+
+
+def up_face(orientation):
+    """자세 → (위를 향한 면, 그 면 노멀과 월드 위의 내적) - dice.gd _calculate_face_value와 같은 방식"""
+    matrix = quat_to_matrix(orientation)
+    best_face, best_dot = 1, -2.0
+    for face, normal in FACE_NORMALS.items():
+        dot = float((matrix @ np.asarray(normal))[1])
+        if dot > best_dot:
+            best_face, best_dot = face, dot
+    return best_face, best_dot
+
+
+def snap_flat(track, face, dice_size, bevel):
+    """마지막 SNAP_KEYS 키에 걸쳐 결과 면이 정확히 위를 향하고 테이블에 닿도록 보정"""
+    final = track[-1, 3:]
+    world_normal = quat_to_matrix(final) @ np.asarray(FACE_NORMALS[face])
+    correction = quat_from_to(world_normal, (0.0, 1.0, 0.0))
+    identity = np.array([0.0, 0.0, 0.0, 1.0])
+    lift = dice_size / 2 - track[-1, 1]
+    count = min(SNAP_KEYS, len(track))
+    for j in range(count):
+        s = (j + 1) / count
+        k = len(track) - count + j
+        # 짧은 보정 회전이라 선형 보간 + 정규화로 충분
+        partial = identity * (1 - s) + correction * s
+        partial /= np.linalg.norm(partial)
+        track[k, 3:] = quat_multiply(partial, track[k, 3:])
+        track[k, 1] += lift * s
+    return track
+
+
+# ============================================================================
+# 라이브러리
+# ============================================================================
+def build_library(count, seed, fps=DEFAULT_FPS, geometry=None):
+    geometry = geometry or dice_catalog.BASE_GEOMETRY
+    dice_size, bevel = geometry["dice_size"], geometry["bevel_amount"]
+    rng = np.random.default_rng(seed)
+    position, velocity, orientation, spin, cells = sample_entries(rng, count)
+    tracks, settle_time, status = simulate(position, velocity, orientation, spin, dice_size, bevel, fps)
+
+    min_dot = math.cos(math.radians(MAX_REST_TILT_DEGREES))
+    accepted, rejected = [], {"timeout": 0, "tilted": 0, "off_table": 0}
+    for i, track in enumerate(tracks):
+        if status[i] != "settled":
+            rejected["timeout"] += 1
+            continue
+        if np.abs(track[:, [0, 2]]).max() > TABLE_HALF_EXTENT - dice_size / 2:
+            rejected["off_table"] += 1
+            continue
+        face, dot = up_face(track[-1, 3:])
+        if dot < min_dot:
+            rejected["tilted"] += 1
+            continue
+        accepted.append((snap_flat(track, face, dice_size, bevel), face, int(cells[i]), float(settle_time[i])))
+    return accepted, rejected, {"dice_size": dice_size, "bevel_amount": bevel}
+
+
+def encode(accepted, fps, shape):
+    """수락된 궤적 → (bin 바이트, 인덱스 dict)"""
+    rows, chunks = [], []
+    by_face = {str(face): {str(cell): [] for cell in range(ENTRY_CELLS * ENTRY_CELLS)} for face in FACE_NORMALS}
+    first_key = 0
+    for number, (track, face, cell, _) in enumerate(accepted):
+        packed = np.empty((len(track), 7), dtype=np.int16)
+        packed[:, :3] = np.clip(np.rint(track[:, :3] / POSITION_SCALE), -32767, 32767)
+        packed[:, 3:] = np.clip(np.rint(track[:, 3:] * 32767), -32767, 32767)
+        chunks.append(packed.astype("<i2").tobytes())
+        rows.append([first_key, len(track), face, cell,
+                     round(float(track[-1, 0]), 3), round(float(track[-1, 2]), 3)])
+        by_face[str(face)][str(cell)].append(number)
+        first_key += len(track)
+
+    index = {
+        "version": 1,
+        "fps": fps,
+        "key_stride": 14,
+        "position_scale": POSITION_SCALE,
+        "shape": shape,
+        "entry": {"center": list(CUP_POSITION), "radius": ENTRY_RADIUS, "cells": ENTRY_CELLS},
+        "physics": PHYSICS,
+        "face_remap": face_remap(),
+        "trajectories": rows,
+        "by_face": by_face,
+    }
+    return b"".join(chunks), index
+
+
+def write_library(out_dir, data, index):
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, payload in ((DATA_NAME, data), (INDEX_NAME, json.dumps(index, ensure_ascii=False).encode("utf-8"))):
+        path = os.path.join(out_dir, name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        paths.append(path)
+    return paths
+
+
+def print_report(accepted, rejected, data, seconds):
+    total = len(accepted) + sum(rejected.values())
+    print(f"시뮬레이션 {total}개 → 수락 {len(accepted)}개 ({seconds:.1f}초)")
+    for reason, n in rejected.items():
+        if n:
+            print(f"  ⏭️ {reason}: {n}개")
+    faces = {face: sum(1 for a in accepted if a[1] == face) for face in sorted(FACE_NORMALS)}
+    print("  결과 면 분포: " + ", ".join(f"{face}={n}" for face, n in faces.items()))
+    if accepted:
+        settle = np.array([a[3] for a in accepted])
+        keys = np.array([len(a[0]) for a in accepted])
+        print(f"  멈춘 시간: 평균 {settle.mean():.2f}초, 최대 {settle.max():.2f}초 / 키 평균 {keys.mean():.0f}개")
+    print(f"  데이터 {len(data) / 1024:.0f}KB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주사위 굴림 궤적 라이브러리 생성 (오프라인 강체 시뮬레이션)")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="시뮬레이션할 궤적 수")
+    parser.add_argument("--seed", type=int, default=1, help="난수 시드 (같으면 같은 라이브러리)")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS, help="키프레임 속도")
+    parser.add_argument("--out-dir", default=OUTPUT_DIR, help="출력 폴더")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 리포트만")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    accepted, rejected, shape = build_library(args.count, args.seed, args.fps)
+    data, index = encode(accepted, args.fps, shape)
+    print_report(accepted, rejected, data, time.perf_counter() - started)
+    if not accepted:
+        print("❌ 수락된 궤적이 없습니다")
+        return 1
+    missing = [face for face, cells in index["by_face"].items() if not any(cells.values())]
+    if missing:
+        print(f"⚠️ 궤적이 없는 결과 면: {', '.join(missing)} (런타임은 face_remap으로 대신함)")
+    if not args.dry_run:
+        for path in write_library(args.out_dir, data, index):
+            print(f"✅ {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
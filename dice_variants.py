@@ -0,0 +1,183 @@
+"""주사위 색상 변형(variant) 모드
+
+형태(지오메트리)는 파라미터 조합마다 한 번만 만들어 캐시하고, 색상별 주사위는
+같은 메시를 공유하는 링크 복제본에 재질만 오브젝트 단위로 붙여서 만듭니다.
+색상 하나당 비용이 Boolean 재생성에서 재질 교체 수준으로 줄어듭니다.
+
+    shape = dice_variants.get_shape_mesh("D6_Shape", dice_size=2.0, bevel_segments=2)
+    body = dice_variants.make_body_material("BodyMat_Red", (1, 0, 0, 1), roughness=0.3)
+    pip = dice_variants.make_pip_material("PipMat_Red", (1, 1, 1, 1), roughness=0.4)
+    obj = dice_variants.make_variant(shape, "D6_Dice_Red", body, pip)
+"""
+import bpy
+
+import dice_geometry
+
+# 지오메트리 파라미터 → 공유 메시
+_shape_meshes = {}
+
+
+# ============================================================================
+# 형태 캐시
+# ============================================================================
+def shape_key(geometry_params):
+    """지오메트리 파라미터 dict → 캐시 키 (순서 무관)"""
+    return tuple(sorted((k, _freeze(v)) for k, v in geometry_params.items()))
+
+
+def get_shape_mesh(shape_name, **geometry_params):
+    """같은 파라미터의 형태는 한 번만 생성하고 이후에는 캐시된 메시를 반환합니다"""
+    key = shape_key(geometry_params)
+    mesh = _shape_meshes.get(key)
+    if mesh is not None and _is_alive(mesh):
+        return mesh
+
+    geometry = dice_geometry.build_dice_geometry(**geometry_params)
+    mesh = dice_geometry.create_mesh(shape_name, geometry)
+    # 재질은 오브젝트 슬롯에 붙이므로 메시 슬롯은 비워 둡니다 (0 = 본체, 1 = 눈)
+    mesh.materials.append(None)
+    mesh.materials.append(None)
+    mesh.use_fake_user = True
+    _shape_meshes[key] = mesh
+    print(f"  ✅ 형태 생성: {shape_name} (폴리곤 {len(mesh.polygons)}개)")
+    return mesh
+
+
+def clear_shape_cache():
+    """캐시된 형태 메시를 모두 해제합니다"""
+    for mesh in _shape_meshes.values():
+        if _is_alive(mesh):
+            bpy.data.meshes.remove(mesh)
+    _shape_meshes.clear()
+
+
+# ============================================================================
+# 재질
+# ============================================================================
+def make_body_material(name, color, roughness=0.3, metallic=None):
+    return _make_principled(name, color, roughness, metallic)
+
+
+def make_pip_material(name, color, roughness=0.4, metallic=None):
+    return _make_principled(name, color, roughness, metallic)
+
+
+def add_crack_normal(material, crack_scale, crack_depth, crack_roughness):
+    """Voronoi → ColorRamp → Bump 균열 노멀을 본체 재질에 연결합니다"""
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    # 노드: Voronoi (균열 패턴)
+    voronoi = nodes.new(type="ShaderNodeTexVoronoi")
+    voronoi.feature = 'DISTANCE_TO_EDGE'
+    voronoi.inputs['Scale'].default_value = crack_scale
+    voronoi.location = (-600, 300)
+
+    # 노드: Color Ramp (날카로운 선 만들기)
+    ramp = nodes.new(type="ShaderNodeValToRGB")
+    ramp.color_ramp.elements[0].position = 0.02
+    ramp.color_ramp.elements[0].color = (1, 1, 1, 1)  # 흰색
+    ramp.color_ramp.elements[1].position = 0.05
+    ramp.color_ramp.elements[1].color = (0, 0, 0, 1)  # 검은색
+    ramp.location = (-300, 300)
+
+    # 노드: Bump (높이 -> 노멀 변환)
+    bump = nodes.new(type="ShaderNodeBump")
+    bump.inputs['Strength'].default_value = crack_depth
+    bump.location = (-100, 100)
+
+    links.new(voronoi.outputs['Distance'], ramp.inputs['Fac'])
+    links.new(ramp.outputs['Color'], bump.inputs['Height'])
+    links.new(bump.outputs['Normal'], bsdf.inputs['Normal'])
+
+    # 거칠기 조절
+    bsdf.inputs['Roughness'].default_value = crack_roughness
+    return material
+
+
+def make_atlas_material(name, palette_path, mr_path, uv_map="PaletteUV"):
+    """팔레트 아틀라스를 읽는 공유 재질 (이미 있으면 그대로 반환)"""
+    mat = bpy.data.materials.get(name)
+    if mat is not None:
+        return mat
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    uv = nodes.new(type="ShaderNodeUVMap")
+    uv.uv_map = uv_map
+    uv.location = (-900, 200)
+
+    palette = nodes.new(type="ShaderNodeTexImage")
+    palette.image = bpy.data.images.load(palette_path, check_existing=True)
+    palette.interpolation = 'Closest'
+    palette.location = (-600, 300)
+
+    # G = 러프니스, B = 메탈릭 (glTF metallicRoughness 규칙)
+    mr_image = bpy.data.images.load(mr_path, check_existing=True)
+    mr_image.colorspace_settings.name = 'Non-Color'
+    mr = nodes.new(type="ShaderNodeTexImage")
+    mr.image = mr_image
+    mr.interpolation = 'Closest'
+    mr.location = (-600, 0)
+    separate = nodes.new(type="ShaderNodeSeparateColor")
+    separate.location = (-300, 0)
+
+    links.new(uv.outputs['UV'], palette.inputs['Vector'])
+    links.new(uv.outputs['UV'], mr.inputs['Vector'])
+    links.new(palette.outputs['Color'], bsdf.inputs['Base Color'])
+    links.new(mr.outputs['Color'], separate.inputs['Color'])
+    links.new(separate.outputs['Green'], bsdf.inputs['Roughness'])
+    links.new(separate.outputs['Blue'], bsdf.inputs['Metallic'])
+    return mat
+
+
+def _make_principled(name, color, roughness, metallic):
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    bsdf.inputs['Base Color'].default_value = color
+    bsdf.inputs['Roughness'].default_value = roughness
+    if metallic is not None:
+        bsdf.inputs['Metallic'].default_value = metallic
+    return mat
+
+
+# ============================================================================
+# 변형 생성
+# ============================================================================
+def make_variant(shape_mesh, object_name, body_material, pip_material, location=(0, 0, 0), collection=None):
+    """공유 메시를 쓰는 링크 복제본을 만들고 오브젝트 단위로 재질을 지정합니다"""
+    obj = bpy.data.objects.new(object_name, shape_mesh)
+    obj.location = location
+    (collection or bpy.context.collection).objects.link(obj)
+
+    slots = obj.material_slots
+    for index, material in ((dice_geometry.BODY_MATERIAL_INDEX, body_material),
+                            (dice_geometry.PIP_MATERIAL_INDEX, pip_material)):
+        slots[index].link = 'OBJECT'
+        slots[index].material = material
+    return obj
+
+
+# ============================================================================
+# 내부 유틸리티
+# ============================================================================
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _is_alive(datablock):
+    # 씬 초기화 등으로 삭제된 데이터 블록은 ReferenceError를 냅니다
+    try:
+        datablock.name
+    except ReferenceError:
+        return False
+    return True
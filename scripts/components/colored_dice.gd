@@ -72,6 +72,8 @@ func setup_dice(color: DiceColor, position_override: Vector3 = Vector3.ZERO, typ
 	var dice_scene = load(model_path)
 	var dice_model = dice_scene.instantiate()
 	add_child(dice_model)
+	# --lods 익스포트 모델이면 거리별로 LOD 한 단계만 보이도록 (일반 모델은 그대로)
+	DiceLod.apply_visibility_ranges(dice_model)
 	
 	# 각 주사위 인스턴스가 고유한 재질을 갖도록 처리
 	var mesh = _find_mesh_recursive(dice_model)
@@ -94,14 +96,19 @@ func setup_dice(color: DiceColor, position_override: Vector3 = Vector3.ZERO, typ
 	collider.name = "CollisionShape3D"
 	add_child(collider)
 	
-	var box_shape = BoxShape3D.new()
-	var blender_dice_size = 2.0
-	var actual_visual_size = blender_dice_size * model_scale
-	var collision_margin = 0.95
-	var collision_box_size = actual_visual_size * collision_margin
-	
-	box_shape.size = Vector3(collision_box_size, collision_box_size, collision_box_size)
-	collider.shape = box_shape
+	# 익스포터가 만든 베벨 큐브 충돌 헐(모델 옆 *_collision.tres)이 있으면 사용
+	var hull_path = model_path.get_basename() + "_collision.tres"
+	if model_path.ends_with(".gltf") and ResourceLoader.exists(hull_path):
+		collider.shape = load(hull_path)
+	else:
+		var box_shape = BoxShape3D.new()
+		var blender_dice_size = 2.0
+		var actual_visual_size = blender_dice_size * model_scale
+		var collision_margin = 0.95
+		var collision_box_size = actual_visual_size * collision_margin
+
+		box_shape.size = Vector3(collision_box_size, collision_box_size, collision_box_size)
+		collider.shape = box_shape
 	
 	dice_name = COLOR_NAMES[color] + "_type" + str(type_index) + "_dice_" + str(randi())
 	name = dice_name
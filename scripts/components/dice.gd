@@ -28,6 +28,9 @@ var sides = {
 var rolling := false
 var roll_time := 0.0
 var original_position: Vector3
+var _baked_roll: Dictionary = {} # 재생 중인 미리 계산한 궤적 (DiceRollLibrary.pick)
+var _baked_prev_y := 0.0
+var _baked_prev_vy := 0.0
 
 var collider: CollisionShape3D
 var mesh_instance: MeshInstance3D
@@ -128,6 +131,10 @@ func _physics_process(delta: float) -> void:
 
 	roll_time += delta
 
+	if not _baked_roll.is_empty():
+		_step_baked_roll(delta)
+		return
+
 	# 속도 제한 적용
 	_apply_velocity_limits()
 
@@ -158,6 +165,42 @@ func _physics_process(delta: float) -> void:
 	if angular_vel < ANGULAR_VELOCITY_THRESHOLD and linear_vel < LINEAR_VELOCITY_THRESHOLD:
 		_finish_roll()
 
+## 미리 계산한 궤적(dice_trajectories.py)으로 굴립니다. face_value 면으로 끝나고 물리 연산은 하지 않습니다.
+## avoid: 먼저 굴린 주사위들이 멈출 위치 (겹치지 않는 궤적을 고름)
+## 반환: 고른 궤적 (라이브러리가 없으면 빈 Dictionary - 호출한 쪽이 물리 굴림으로 대신)
+func play_baked_roll(face_value: int, avoid: Array = []) -> Dictionary:
+	var roll = DiceRollLibrary.pick(face_value, global_position, avoid)
+	if roll.is_empty():
+		return roll
+	_baked_roll = roll
+	_baked_prev_y = global_position.y
+	_baked_prev_vy = 0.0
+	linear_velocity = Vector3.ZERO
+	angular_velocity = Vector3.ZERO
+	freeze_mode = RigidBody3D.FREEZE_MODE_KINEMATIC
+	freeze = true
+	# 궤적끼리는 서로 부딪히지 않으므로 재생 중에는 충돌을 끔
+	set_collision_enabled(false)
+	rolling = true
+	roll_time = 0.0
+	return roll
+
+func _step_baked_roll(delta: float) -> void:
+	global_transform = DiceRollLibrary.sample(_baked_roll, roll_time)
+
+	# 떨어지다 튀어 오르는 순간에 바닥 충돌 사운드
+	var vy = (global_position.y - _baked_prev_y) / delta
+	if _baked_prev_vy < -3.0 and vy >= 0.0:
+		SoundManager.play_random_oneshot("die_on_floor")
+	_baked_prev_y = global_position.y
+	_baked_prev_vy = vy
+
+	if roll_time >= DiceRollLibrary.duration(_baked_roll):
+		_baked_roll = {}
+		freeze = false
+		set_collision_enabled(true)
+		_finish_roll()
+
 func _finish_roll() -> void:
 	if not rolling:
 		return
@@ -5,6 +5,7 @@ var viewport: SubViewport
 var camera: Camera3D
 var model_parent: Node3D
 var light: DirectionalLight3D
+var icon_rect: TextureRect
 
 func _init():
 	custom_minimum_size = Vector2(90, 90)
@@ -21,8 +22,14 @@ func _init():
 	style.corner_radius_bottom_right = 12
 	add_theme_stylebox_override("panel", style)
 
-func _ready():
-	_setup_3d_scene()
+## 미리 렌더한 아이콘 시트의 영역을 그대로 표시 (매 프레임 GPU 비용 없음)
+func _show_static_icon(texture: Texture2D):
+	if not icon_rect:
+		icon_rect = TextureRect.new()
+		icon_rect.expand_mode = TextureRect.EXPAND_IGNORE_SIZE
+		icon_rect.stretch_mode = TextureRect.STRETCH_KEEP_ASPECT_CENTERED
+		add_child(icon_rect)
+	icon_rect.texture = texture
 
 func _setup_3d_scene():
 	var container = SubViewportContainer.new()
@@ -60,7 +67,15 @@ func _setup_3d_scene():
 	camera.environment = env
 
 func setup_dice(color_key: String, type_index: int, face_value: int):
-	if not viewport: await ready
+	if not is_node_ready(): await ready
+
+	# dice_icons.py 시트에 있으면 정적 텍스처, 없을 때만 SubViewport로 직접 렌더
+	var cached_icon = TextureCache.get_dice_icon(type_index, _get_color_key(color_key), face_value)
+	if cached_icon:
+		_show_static_icon(cached_icon)
+		return
+	if not viewport:
+		_setup_3d_scene()
 
 	for child in model_parent.get_children():
 		child.queue_free()
@@ -109,6 +124,10 @@ func _get_local_aabb(node: Node) -> AABB:
 			if child is Node3D: stack.append({"node": child, "transform": t * child.transform})
 	return aabb
 
+func _get_color_key(key: String) -> String:
+	# _get_color_name과 같은 규칙 (알 수 없는 색상은 흰색)
+	return key if key in ["W", "K", "R", "G", "B"] else "W"
+
 func _get_color_name(key: String) -> String:
 	match key:
 		"W": return "white"
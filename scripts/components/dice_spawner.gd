@@ -69,7 +69,15 @@ func draw_dice_data_from_bag(bag: DiceBag, count: int) -> Array:
 	return bag.draw_many_data(count)
 
 func apply_dice_impulse() -> void:
+	var baked_ends: Array = []
 	for dice in dice_nodes:
+		if GameConstants.USE_BAKED_ROLLS:
+			# 결과 면을 먼저 정하고 그 면으로 끝나는 궤적을 재생 (라이브러리가 없으면 물리로)
+			var roll = dice.play_baked_roll(randi_range(1, 6), baked_ends)
+			if not roll.is_empty():
+				baked_ends.append(roll.end)
+				continue
+
 		var impulse = Vector3(
 			randf_range(GameConstants.DICE_IMPULSE_RANGE.x, GameConstants.DICE_IMPULSE_RANGE.y),
 			randf_range(GameConstants.DICE_IMPULSE_Y_RANGE.x, GameConstants.DICE_IMPULSE_Y_RANGE.y),
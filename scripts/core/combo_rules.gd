@@ -68,7 +68,29 @@ const COMBO_DEFINITIONS = [
 # --- 조합 평가 ---
 func eval_combo(dice: Array) -> ComboResult:
 	var res := ComboResult.new()
-	
+
+	# 미리 계산된 표 (combo_table.gd, python -m combo_sim.lookup으로 생성)에서 한 번에 찾기
+	var key := _table_key(dice)
+	if key >= 0:
+		var entry := ComboTable.lookup(key)
+		if entry < 0:
+			res.ok = false
+			res.reason = "정의된 조합이 아님"
+			return res
+		var sum_of_values = 0
+		for d in dice:
+			sum_of_values += d.value
+		res.combo_name = ComboTable.NAMES[entry & 0xFF]
+		res.base_score = entry >> 16
+		res.multiplier = (entry >> 8) & 0xFF
+		res.dice_sum = sum_of_values
+		res.original_base_score = res.base_score
+		res.original_multiplier = res.multiplier
+		res.points = (res.base_score + sum_of_values) * res.multiplier
+		res.ok = true
+		return res
+
+	# 표 범위 밖 (주사위 수가 3~5개가 아니거나 눈이 1~6이 아님) → 정의 순서대로 검사
 	for definition in COMBO_DEFINITIONS:
 		var condition_func = definition["condition"]
 		var params = definition.get("params", [])
@@ -218,6 +240,40 @@ func is_straight(dice: Array, min_length: int) -> bool:
 
 # --- 내부 유틸리티 함수 ---
 
+## 조합 표의 손 키 (표 범위 밖이면 -1)
+## 면별 개수(3비트씩) | faceless 수 << 18 | 색상 비트(1: 모두 같은 색, 2: 모두 다른 색) << 21
+func _table_key(dice: Array) -> int:
+	if dice.size() < ComboTable.MIN_DICE or dice.size() > ComboTable.MAX_DICE:
+		return -1
+
+	var face_key := 0
+	var faceless_count := 0
+	var colors := []
+	var painted := 0 # Prism이 아닌 주사위 수
+	for d in dice:
+		if d.type == 4: # Faceless
+			faceless_count += 1
+		elif d.value >= 1 and d.value <= 6:
+			face_key += 1 << (3 * (d.value - 1))
+		else:
+			return -1
+		if d.type != 8: # Prism
+			painted += 1
+			# _all_different_colors와 같이 근사 비교 (재질에서 읽은 색 등 부동소수 오차)
+			var seen := false
+			for color in colors:
+				if d.color.is_equal_approx(color):
+					seen = true
+					break
+			if not seen:
+				colors.append(d.color)
+
+	var color_bits := 0
+	if colors.size() <= 1: color_bits |= 1
+	if colors.size() == painted: color_bits |= 2
+	return face_key | (faceless_count << 18) | (color_bits << 21)
+
+
 func _get_value_counts(dice: Array) -> Dictionary:
 	var counts = {}
 	for d in dice:
@@ -0,0 +1,275 @@
+# 자동 생성 파일 - 직접 수정하지 마세요.
+#   python -m combo_sim.lookup  (combo_definitions.csv를 바꾸면 다시 생성)
+# ComboRules.eval_combo가 손 키 하나로 조합을 찾는 완전 해시 표입니다.
+#   손 키 = Σ 1 << 3*(눈-1) | faceless 수 << 18 | 색상 비트(1 = 같은 색, 2 = 다른 색) << 21
+#   항목  = -1 (조합 아님) 또는 정의 인덱스 | 배율 << 8 | 기본 점수 << 16
+extends RefCounted
+class_name ComboTable
+
+const SOURCE_HASH := "ebc43b7b9b03461b0d94298e3bc311d9b76d7aa85e596beb1803e8cb39ec3630"
+const MIN_DICE := 3
+const MAX_DICE := 5
+const SEED := 1012618542
+
+const NAMES := PackedStringArray(["Yacht (싱글컬러)", "Yacht (레인보우)", "라지 스트레이트 (싱글컬러)", "라지 스트레이트 (레인보우)", "포카드 (싱글컬러)", "포카드 (레인보우)", "풀하우스 (싱글컬러)", "풀하우스 (레인보우)", "스몰 스트레이트 (싱글컬러)", "스몰 스트레이트 (레인보우)", "트리플 (싱글컬러)", "트리플 (레인보우)", "투페어 (싱글컬러)", "투페어 (레인보우)", "미니 스트레이트 (싱글컬러)", "미니 스트레이트 (레인보우)"])
+
+const DISPLACEMENTS := PackedInt32Array([
+	2, 23, 2, 0, 0, 6, 0, 1, 8, 42, 8, 6, 2, 6, 0, 0,
+	0, 0, 0, 3, 0, 110, 2, 31, 0, 15, 7, 10, 0, 0, 25, 9,
+	14, 14, 3, 7, 1, 6, 6, 129, 2, 135, 33, 3, 2, 0, 0, 8,
+	8, 8, 23, 31, 17, 20, 2, 0, 0, 8, 0, 0, 3, 76, 4, 3,
+	2, 9, 1, 1, 36, 7, 49, 2, 13, 1, 14, 0, 0, 63, 18, 6,
+	60, 2, 0, 174, 8, 40, 0, 6, 5, 10, 5, 41, 0, 6, 0, 4,
+	0, 1, 53, 11, 8, 70, 0, 2, 1, 8, 0, 22, 3, 23, 7, 11,
+	1, 187, 6, 335, 37, 27, 36, 1, 0, 8, 11, 7, 0, 25, 8, 2,
+	26, 3, 0, 7, 166, 5, 4, 23, 59, 0, 16, 9, 0, 9, 140, 46,
+	46, 14, 23, 0, 21, 4, 114, 6, 96, 20, 4, 69, 0, 0, 14, 28,
+	0, 0, 6, 0, 0, 181, 2, 1, 116, 4, 49, 2, 32, 0, 2, 20,
+	177, 0, 167, 37, 6, 1, 4, 53, 14, 15, 6, 4, 0, 2, 6, 0,
+	246, 9, 6, 0, 135, 0, 8, 1, 74, 5, 4, 0, 1, 196, 2, 11,
+	0, 5, 11, 8, 13, 1, 1, 0, 2, 26, 103, 3, 269, 138, 50, 8,
+	12, 1, 0, 0, 33, 3, 3, 0, 0, 0, 2, 5, 55, 6, 57, 23,
+	9, 13, 8, 0, 12, 5, 20, 4, 176, 8, 71, 6, 39, 32, 8, 65,
+	9, 20, 0, 10, 5, 2, 1, 0, 1, 36, 7, 83, 25, 0, 64, 40,
+	91, 0, 8, 6, 0, 0, 0, 76, 135, 20, 5, 0, 1, 2, 0, 0,
+	12, 0, 15, 20, 1, 0, 36, 5, 14, 146, 1, 32, 24, 27, 41, 1,
+	56, 22, 3, 4, 23, 65, 9, 99, 30, 6, 13, 16, 51, 112, 84, 33,
+	7, 103, 10, 1, 0, 473, 344, 5, 55, 91, 32, 2, 0, 21, 7, 7,
+	144, 19, 0, 11, 127, 114, 0, 181, 38, 16, 1, 52, 62, 6, 0, 2,
+	52, 4, 24, 23, 0, 364, 210, 223, 2, 16, 143, 1, 0, 19, 15, 173,
+	11, 45, 2, 38, 11, 16, 0, 27, 2, 29, 0, 1, 5, 0, 12, 0,
+	1, 2, 119, 11, 1, 63, 9, 0, 187, 1, 6, 15, 33, 29, 114, 87,
+	171, 7, 9, 1, 28, 378, 62, 2, 4, 14, 444, 105, 5, 37, 12, 6,
+	140, 3, 106, 0, 19, 42, 455, 391, 1, 31, 150, 0, 6, 0, 5, 54,
+	18, 13, 13, 0, 1, 463, 0, 109, 1, 5, 16, 33, 47, 33, 6, 63,
+	3, 59, 1, 286, 5, 2, 146, 15, 73, 1, 9, 13, 48, 26, 29, 0,
+	10, 222, 130, 68, 0, 0, 20, 49, 1, 20, 28, 27, 1, 0, 0, 29,
+	2, 3, 186, 33, 16, 22, 1, 4, 20, 0, 96, 10, 1, 342, 0, 1,
+	11, 159, 5, 3, 152, 2, 1, 123, 144, 0, 1, 0, 40, 0, 29, 272,
+	0, 393, 410, 2, 111, 26, 92, 0, 480, 105, 0, 433, 13, 8, 0, 891,
+	1, 45, 5, 0, 42, 79, 0, 34, 81, 3, 0, 7, 1, 73, 9, 1,
+	209, 25, 2, 81, 0, 6, 4, 13, 71, 16, 3, 1, 9, 53, 28, 42,
+	13, 0, 3, 3, 22, 0, 3, 35, 27, 363, 2, 17, 73, 133, 292, 9,
+	13, 57, 25, 3, 1, 0, 11, 267, 33, 115, 1, 538, 128, 54, 105, 78,
+	1, 44, 1, 20, 16, 96, 0, 5, 24, 65, 34, 1, 664, 4, 76, 17,
+	45, 245, 6, 170, 56, 97, 0, 182, 1, 15, 2, 5, 161, 326, 0, 42,
+	147, 5, 19, 75, 334, 0, 35, 141, 200, 0, 108, 47, 0, 94, 198, 43,
+	4, 152, 0, 66, 222, 7, 0, 13, 482, 9, 88, 54, 0, 44, 9, 66,
+	158, 50, 12, 2, 98, 42, 14, 0, 0, 573, 62, 62, 13, 50, 70, 0,
+	1, 3, 0, 6, 5, 4, 0, 2, 0, 29, 8, 5, 51, 124, 1, 2,
+	0, 38, 673, 0, 0, 3, 9, 381, 41, 30, 115, 116, 1068, 495, 42, 24,
+	9, 52, 138, 21, 0, 1, 0, 15, 1, 37, 4, 610, 0, 8, 223, 0,
+	63, 193, 4, 401, 84, 95, 2, 13, 38, 641, 46, 18, 932, 270, 1, 310,
+	201, 31, 15, 718, 111, 0, 261, 0, 248, 66, 53, 64, 0, 1945, 1365, 341,
+	172, 253, 41, 161, 124, 21, 68, 40, 86, 6, 18, 170, 1091, 225, 105, 29,
+	1, 19, 1486, 98, 411, 657, 2, 15, 6, 0, 2, 0, 0, 1, 973, 562,
+	192, 345, 0, 53, 224, 9, 0, 0, 82, 200, 189, 615, 2296, 866, 0, 477,
+	24, 0, 0, 52, 139, 73, 259, 38, 117, 60, 0, 40, 0, 2079, 179, 6,
+	267, 0, 382, 15, 490, 492, 647, 1121, 346, 218, 92, 196, 112, 1363, 230, 651,
+	1, 188, 101, 2614, 300, 4, 171, 49, 0, 353, 851, 58, 1, 178, 54, 47,
+	0, 0, 14, 115, 154, 0, 225, 0, 26, 353, 0, 10, 34, 7, 1481, 765,
+	3, 881, 1, 67, 81, 1, 1854, 369, 2134, 381, 5, 1, 1, 0, 41, 272,
+	3, 1428, 34, 667, 0, 0, 23, 9, 122, 1257, 100, 748, 49, 352, 1989, 854,
+	2, 168, 27, 304, 0, 1314, 110, 0, 0, 37, 207, 2, 994, 0, 2, 182,
+	110, 113, 272, 2, 1, 50, 1593, 20, 23, 53, 34, 1, 2329, 49, 136, 91,
+	11, 63, 2554, 3, 65, 0, 2703, 684, 144, 16, 133, 8, 3, 0, 89, 1070,
+	22, 151, 0, 164, 1, 118, 104, 67, 0, 0, 751, 1250, 204, 1455, 305, 13,
+	47, 178, 5, 43, 337, 42, 233, 46
+])
+
+const ENTRIES := PackedInt32Array([
+	-1, -1, 5899526, -1, -1, -1, -1, 7865858, -1, -1, -1, 3277578, -1, -1, -1, 16386560,
+	-1, 1311245, -1, 3933189, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, 3933189,
+	-1, -1, 6554884, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1311245,
+	-1, -1, -1, 4588552, -1, -1, 2622220, -1, 6554884, -1, 2622217, -1, -1, 16386560, -1, -1,
+	5899526, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6554884, -1, -1,
+	2622220, -1, -1, -1, -1, 6554884, 6554884, -1, -1, -1, -1, -1, -1, 6554884, -1, -1,
+	-1, 7865858, 983567, -1, -1, -1, -1, -1, -1, 3277831, -1, -1, 2622220, -1, 6554884, -1,
+	3277831, -1, -1, 6554884, -1, -1, 3277578, 7865858, -1, -1, 2622220, -1, -1, -1, -1, -1,
+	-1, 6554884, -1, -1, 3277831, -1, 9832449, -1, 6554884, -1, -1, -1, 9832449, -1, -1, -1,
+	-1, -1, -1, 5899526, -1, -1, -1, -1, -1, -1, 5899526, -1, -1, 1311245, -1, 6554884,
+	16386560, -1, -1, 3277831, -1, -1, -1, -1, 16386560, -1, 7865858, -1, -1, -1, 2622217, 4588552,
+	-1, -1, -1, -1, 4588552, -1, 5899526, 2622220, -1, -1, 2622220, -1, 1966603, -1, -1, 3277831,
+	-1, -1, 3277831, 5899526, -1, -1, -1, -1, -1, -1, 2622220, -1, 3277831, -1, 1639182, 5899526,
+	-1, -1, 1311245, 4588803, -1, 5899526, 2622220, -1, -1, -1, -1, -1, 2622220, -1, -1, 5899526,
+	-1, -1, 3933189, -1, -1, 3277831, -1, 1639182, 7865858, -1, -1, 5899526, 6554884, -1, -1, -1,
+	-1, -1, -1, 4588552, -1, -1, -1, -1, -1, -1, -1, -1, 16386560, -1, -1, -1,
+	1311245, -1, -1, 16386560, 5899526, 2622217, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831,
+	2622220, -1, -1, -1, -1, -1, 16386560, -1, 2622217, -1, -1, 4588803, -1, -1, 2622220, -1,
+	-1, 2622220, -1, -1, -1, 5899526, -1, -1, -1, 2622220, -1, -1, -1, -1, 5899526, -1,
+	-1, 3277831, 4588803, -1, -1, 3277831, -1, -1, -1, 1966603, -1, -1, 7865858, 1639182, -1, -1,
+	2622220, -1, -1, -1, 9832449, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, -1,
+	3277578, -1, -1, -1, -1, -1, 6554884, -1, -1, -1, -1, -1, -1, -1, 4588803, -1,
+	-1, 9832449, -1, -1, -1, -1, -1, -1, -1, 1639182, -1, -1, -1, -1, -1, 2622217,
+	-1, 5899526, -1, 2622217, -1, 5899526, -1, -1, -1, 5899526, -1, -1, -1, 2622220, -1, -1,
+	-1, -1, -1, -1, -1, -1, 1966603, -1, 4588552, -1, -1, 5899526, -1, -1, -1, 5899526,
+	-1, -1, -1, -1, -1, -1, -1, -1, 1311245, 1639182, 2622220, -1, 3933189, -1, 5899526, 3277831,
+	-1, 5899526, -1, -1, -1, -1, -1, -1, 3277831, -1, 3933189, 6554884, -1, 5899526, -1, -1,
+	5899526, -1, 4588552, -1, -1, -1, -1, -1, 5899526, -1, -1, -1, 5899526, 3277831, -1, 16386560,
+	1639182, -1, -1, -1, 5899526, 16386560, -1, 4588552, -1, 1311245, -1, -1, 16386560, -1, -1, 2622220,
+	-1, 7865858, -1, -1, -1, 5899526, 4588803, -1, 5899526, -1, 3277831, -1, -1, 1311245, -1, -1,
+	-1, -1, 1311245, -1, 5899526, -1, 3277831, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, 2622220, 16386560, -1, -1, -1, 4588552, -1, -1, 3933189, -1, -1,
+	-1, 2622220, -1, -1, 3277831, -1, 9832449, 7865858, -1, -1, -1, -1, 2622220, -1, 4588803, 4588803,
+	-1, -1, 16386560, 3277831, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 16386560,
+	-1, -1, -1, -1, 6554884, -1, -1, 1966603, 5899526, -1, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, 2622220, -1, 3277831, -1, -1, 2622220, 16386560, -1, -1, -1, -1, 3277831,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+	4588803, -1, -1, 3277578, -1, 4588803, -1, 3277831, -1, -1, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, 5899526, 7865858, -1, -1, 5899526, 2622220, -1, 9832449, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, -1, -1, 5899526, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, 2622220, -1, -1, -1, -1, -1, -1, -1,
+	3933189, -1, -1, -1, -1, -1, 5899526, -1, -1, 7865858, -1, 1311245, -1, -1, -1, -1,
+	9832449, -1, -1, -1, 1311245, -1, -1, -1, 1311245, -1, -1, -1, 4588552, -1, -1, -1,
+	3277831, -1, -1, 2622220, -1, -1, -1, -1, -1, -1, -1, -1, 4588803, -1, 5899526, -1,
+	-1, -1, 5899526, -1, 2622220, 1311245, -1, 5899526, 9832449, 5899526, -1, -1, -1, 3277831, -1, 3277831,
+	-1, -1, -1, 16386560, 7865858, -1, -1, -1, -1, 3277831, 1311245, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, 3277831, 1311245, 9832449, -1, -1, -1, 3277831, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4588803, -1, -1, 5899526, -1,
+	4588803, -1, 2622220, -1, 16386560, 7865858, -1, 4588552, 1639182, 2622220, -1, -1, -1, 5899526, -1, -1,
+	-1, -1, -1, 983567, -1, -1, 16386560, -1, -1, -1, 5899526, 5899526, -1, -1, -1, -1,
+	-1, -1, 4588552, -1, -1, -1, -1, 16386560, 983567, 5899526, 16386560, -1, -1, -1, -1, 5899526,
+	-1, 4588803, -1, -1, 1966603, -1, -1, -1, 6554884, -1, -1, -1, 983567, 1966603, 6554884, -1,
+	-1, -1, -1, 7865858, -1, -1, -1, -1, 2622220, -1, -1, -1, -1, 6554884, -1, 5899526,
+	5899526, -1, 16386560, 3277831, -1, 5899526, -1, 1311245, -1, 1311245, 3277831, -1, 4588803, -1, 983567, -1,
+	-1, -1, 3277831, -1, -1, 2622217, -1, -1, -1, 3277831, -1, -1, 4588552, -1, -1, 16386560,
+	7865858, -1, -1, -1, 6554884, -1, 1311245, 3277831, -1, -1, 2622220, -1, -1, -1, 3277578, -1,
+	-1, -1, 3277831, 3277831, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831,
+	5899526, -1, -1, -1, 3933189, -1, -1, -1, 2622220, 5899526, 5899526, 3277831, -1, -1, -1, -1,
+	-1, 3933189, -1, -1, 5899526, -1, -1, -1, 2622220, 4588552, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, 5899526, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+	-1, 3277831, -1, 3277831, 2622220, 16386560, -1, 5899526, -1, 6554884, -1, -1, -1, -1, 4588803, -1,
+	-1, -1, -1, -1, -1, 5899526, -1, 3277831, -1, -1, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, 7865858, -1, -1, -1, 3277831, -1, -1, -1, 3277578, 3933189,
+	-1, 7865858, -1, -1, -1, 4588552, 5899526, -1, -1, -1, -1, -1, -1, -1, 9832449, -1,
+	-1, -1, -1, -1, -1, -1, 6554884, -1, -1, -1, -1, -1, 5899526, -1, -1, -1,
+	-1, 16386560, 4588803, -1, 5899526, -1, -1, -1, -1, -1, -1, -1, 2622220, -1, 2622220, -1,
+	-1, -1, -1, -1, -1, 1639182, -1, -1, 9832449, -1, -1, 5899526, -1, -1, 5899526, -1,
+	-1, -1, -1, 1639182, -1, -1, -1, -1, 1311245, 2622220, -1, -1, -1, 2622220, 2622220, -1,
+	-1, 2622220, 3277578, 2622220, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1311245, -1, -1,
+	-1, -1, 5899526, -1, -1, -1, -1, 9832449, -1, -1, -1, -1, -1, 2622220, -1, -1,
+	-1, 9832449, -1, 3933189, -1, -1, -1, 5899526, -1, 3277578, -1, 3277578, -1, -1, -1, -1,
+	3933189, -1, -1, 16386560, -1, -1, -1, -1, -1, 1966603, -1, 3277578, 5899526, -1, 9832449, -1,
+	-1, -1, 7865858, 4588803, 5899526, 1966603, -1, -1, -1, -1, 5899526, -1, -1, -1, -1, 16386560,
+	-1, 3277831, -1, -1, 3277831, -1, -1, -1, 4588803, -1, -1, -1, -1, -1, -1, 6554884,
+	2622220, -1, -1, -1, 3277831, -1, -1, 3277831, -1, -1, -1, -1, -1, -1, -1, -1,
+	-1, 3277831, -1, 3933189, -1, 1311245, 5899526, -1, 5899526, -1, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526, -1, -1,
+	-1, 7865858, -1, 2622220, 5899526, 4588803, -1, -1, -1, -1, 5899526, -1, -1, 6554884, -1, -1,
+	-1, 2622220, -1, -1, -1, 983567, -1, -1, -1, -1, 4588552, -1, -1, -1, -1, -1,
+	-1, -1, 7865858, -1, -1, -1, -1, 1639182, -1, -1, -1, -1, 4588552, -1, -1, 2622217,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6554884, -1, 16386560, 5899526,
+	-1, 3933189, -1, -1, -1, 5899526, -1, 5899526, -1, -1, -1, 2622220, 983567, 3277831, -1, -1,
+	-1, 5899526, -1, -1, -1, -1, -1, 7865858, -1, -1, 3277578, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, 7865858, -1, -1, -1, -1, 983567, -1, 2622220, 2622220, -1, -1,
+	-1, -1, 3277578, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526, 2622217,
+	-1, -1, -1, 9832449, -1, 1311245, 5899526, 3277831, 1311245, -1, 983567, -1, -1, 6554884, -1, -1,
+	-1, -1, -1, -1, -1, 3277831, -1, -1, -1, 983567, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, 2622220, -1, 7865858, -1, -1, 1311245, -1, -1, -1, -1, 5899526,
+	-1, -1, 2622220, -1, -1, -1, -1, 7865858, 2622217, 5899526, -1, -1, -1, -1, -1, 3277578,
+	-1, 5899526, -1, 4588803, -1, -1, 2622220, 4588552, -1, -1, -1, -1, 3277831, -1, -1, -1,
+	4588803, -1, -1, 3277831, -1, -1, 3277831, -1, -1, 7865858, -1, 5899526, -1, -1, -1, 3277831,
+	-1, 5899526, -1, -1, -1, -1, -1, -1, -1, 9832449, -1, -1, -1, 5899526, -1, -1,
+	-1, 5899526, 6554884, -1, 1311245, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526,
+	-1, -1, 5899526, -1, -1, -1, -1, -1, -1, -1, 7865858, 3277831, -1, -1, 5899526, 2622217,
+	-1, -1, -1, -1, 3277831, -1, 3933189, -1, -1, -1, -1, -1, 3277831, 7865858, 5899526, 5899526,
+	2622220, -1, -1, -1, -1, 16386560, -1, 5899526, -1, -1, -1, 1966603, -1, -1, -1, 3277578,
+	-1, -1, -1, -1, 2622220, -1, -1, -1, 9832449, -1, -1, -1, -1, 5899526, 16386560, 7865858,
+	-1, 5899526, 3277831, -1, 3277578, 4588803, -1, -1, -1, -1, -1, -1, -1, -1, 2622220, -1,
+	1639182, -1, -1, -1, 5899526, 3277578, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1639182,
+	-1, -1, -1, 6554884, 1311245, -1, -1, -1, -1, 5899526, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, 3933189, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526,
+	-1, -1, 3277578, -1, -1, -1, -1, -1, -1, -1, -1, 2622220, -1, -1, 5899526, 1311245,
+	9832449, -1, -1, 9832449, -1, -1, 1639182, -1, 2622220, 5899526, -1, -1, -1, -1, -1, -1,
+	2622220, -1, 5899526, -1, 5899526, -1, -1, -1, -1, -1, -1, 1311245, -1, -1, -1, -1,
+	2622220, 5899526, 5899526, -1, 4588803, -1, -1, 5899526, -1, 2622220, -1, -1, -1, -1, -1, -1,
+	3277831, 5899526, -1, 1311245, -1, -1, -1, -1, -1, -1, 6554884, 3277831, -1, 5899526, -1, -1,
+	-1, -1, -1, -1, 3933189, -1, -1, -1, -1, -1, -1, -1, 2622220, -1, -1, -1,
+	-1, -1, 2622217, 7865858, -1, 5899526, -1, -1, -1, 3277831, -1, -1, -1, -1, -1, 3933189,
+	-1, -1, 4588552, 5899526, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526, -1, -1,
+	-1, 2622217, -1, 3277578, 9832449, -1, -1, -1, 3277578, -1, -1, -1, -1, -1, -1, 4588803,
+	-1, -1, -1, -1, 2622220, -1, -1, -1, 2622220, 3277831, -1, -1, 2622220, 2622220, -1, -1,
+	-1, 2622220, 7865858, 1966603, 2622220, -1, -1, -1, -1, 2622220, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, 1639182, -1, -1, -1, -1, 5899526, -1, -1, -1, -1, 1639182,
+	-1, 2622217, 2622220, -1, 1639182, -1, 7865858, 4588552, 5899526, 5899526, -1, 9832449, 1311245, -1, -1, 1639182,
+	-1, 7865858, -1, -1, 3277831, -1, 2622220, -1, 2622217, -1, 983567, -1, -1, 3277578, -1, -1,
+	-1, 5899526, -1, -1, 5899526, -1, 6554884, 2622220, -1, 4588803, -1, -1, -1, 3277831, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526, -1, -1, -1, -1,
+	5899526, -1, 3277831, 1966603, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4588803, -1, -1,
+	-1, 9832449, -1, 9832449, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, -1,
+	-1, -1, -1, 1311245, -1, -1, -1, -1, 7865858, -1, -1, -1, -1, 6554884, -1, -1,
+	-1, 5899526, -1, -1, -1, -1, -1, 9832449, -1, -1, -1, 3933189, -1, -1, 5899526, -1,
+	3277831, 4588552, -1, -1, -1, -1, -1, 5899526, 4588552, -1, -1, -1, 16386560, -1, -1, -1,
+	2622217, -1, -1, -1, -1, 5899526, 9832449, -1, -1, -1, -1, -1, -1, 1311245, -1, -1,
+	-1, -1, 3277831, -1, -1, -1, -1, -1, -1, -1, 3277831, -1, 7865858, -1, -1, 2622220,
+	-1, -1, -1, 3277831, -1, 16386560, -1, -1, 4588552, -1, -1, -1, -1, 1639182, -1, -1,
+	16386560, 5899526, -1, -1, 7865858, 16386560, -1, -1, -1, 2622217, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, 1966603, -1, -1, -1, 5899526, 5899526, 3277831, -1, -1, 5899526, 3277831,
+	-1, -1, -1, -1, -1, 5899526, -1, 2622217, -1, 5899526, 1311245, -1, -1, -1, -1, -1,
+	-1, -1, -1, 5899526, -1, -1, -1, -1, -1, 16386560, -1, 5899526, -1, 7865858, -1, -1,
+	-1, -1, -1, -1, -1, 4588552, -1, -1, 5899526, -1, 4588552, 4588803, 3277831, -1, 2622220, 1311245,
+	-1, 5899526, -1, -1, -1, -1, 4588803, 6554884, -1, 3277831, 1639182, -1, -1, -1, -1, 3277578,
+	7865858, -1, -1, 9832449, -1, -1, 3277831, -1, -1, -1, -1, -1, -1, 16386560, -1, -1,
+	7865858, 5899526, -1, -1, 5899526, -1, -1, -1, -1, 16386560, -1, -1, -1, -1, -1, -1,
+	-1, -1, -1, 1311245, -1, -1, 4588803, -1, -1, -1, -1, 2622220, -1, 4588552, -1, -1,
+	-1, -1, 3277578, -1, -1, -1, -1, -1, 5899526, -1, -1, 1311245, -1, -1, 2622217, -1,
+	-1, -1, -1, -1, 4588803, -1, -1, -1, -1, -1, -1, 3277831, 4588803, 3277831, 5899526, -1,
+	4588552, -1, -1, -1, -1, -1, -1, -1, 5899526, -1, 9832449, 3277831, -1, 5899526, -1, -1,
+	-1, 3277578, 3277831, -1, -1, -1, 1311245, -1, -1, -1, -1, -1, -1, 1639182, 1639182, 1966603,
+	-1, 3277831, 7865858, 2622220, 1311245, -1, -1, -1, -1, -1, 6554884, -1, -1, 16386560, -1, -1,
+	5899526, -1, -1, -1, -1, 5899526, -1, -1, 5899526, -1, -1, -1, -1, -1, 9832449, -1,
+	-1, 3277831, 3277831, -1, -1, 4588552, -1, 2622220, 3277831, -1, -1, -1, 3933189, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4588552, -1, 5899526, -1,
+	-1, 4588803, 2622220, -1, -1, 7865858, -1, -1, -1, -1, -1, -1, -1, 5899526, 2622220, 2622217,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, -1, 3277578, 3933189, -1,
+	-1, -1, -1, 2622220, 3277578, -1, -1, -1, 4588552, -1, -1, -1, -1, -1, 4588552, 7865858,
+	-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 2622217, -1, -1,
+	-1, -1, 5899526, -1, -1, -1, -1, -1, 4588552, -1, 3277578, 3277831, -1, 1311245, -1, 1966603,
+	-1, -1, -1, 6554884, 7865858, 1966603, 2622217, -1, 5899526, 5899526, -1, 2622220, -1, -1, 5899526, 3277831,
+	-1, 16386560, -1, -1, 5899526, -1, 4588552, -1, -1, -1, -1, -1, -1, -1, 7865858, -1,
+	-1, -1, -1, -1, -1, -1, -1, 3277831, 4588803, 1311245, -1, -1, -1, -1, 2622220, 1311245,
+	5899526, -1, -1, -1, -1, -1, 5899526, 3277831, -1, 5899526, -1, -1, 3277831, -1, -1, 3277578,
+	-1, -1, -1, -1, -1, 5899526, -1, 6554884, -1, -1, -1, -1, 16386560, -1, 2622220, -1,
+	1966603, -1, 1639182, 5899526, 6554884, -1, 5899526, -1, -1, 2622220, -1, 5899526, 983567, -1, 5899526, 5899526,
+	-1, 5899526, -1, -1, 3277578, -1, 3277831, -1, -1, -1, -1, -1, 5899526, -1, -1, -1,
+	4588803, 5899526, -1, -1, -1, -1, -1, 1311245, -1, -1, -1, -1, 16386560, -1, 2622220, -1,
+	-1, -1, 4588803, 3277831, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 5899526, 1639182,
+	2622220, 5899526, -1, -1, -1, 1311245, -1, 3277578, -1, -1, 5899526, 5899526, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, 5899526, -1, 5899526, -1, -1, 7865858, -1, -1,
+	-1, -1, -1, -1, -1, -1, 3277831, -1, -1, -1, 9832449, -1, -1, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, 2622220, -1, -1, 16386560, -1, 5899526, -1, 3277831, -1,
+	-1, -1, 2622220, -1, -1, -1, -1, -1, -1, -1, 7865858, 1311245, -1, -1, 5899526, 1966603,
+	-1, 1966603, -1, -1, -1, -1, -1, -1, -1, -1, -1, 16386560, -1, -1, -1, -1,
+	1639182, -1, 5899526, -1, 5899526, -1, 3277831, -1, 5899526, 2622220, -1, 3277831, -1, -1, -1, -1,
+	-1, -1, 4588803, 5899526, -1, -1, 7865858, 7865858, -1, -1, -1, -1, -1, 7865858, -1, -1,
+	1311245, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 2622220, -1,
+	-1, -1, -1, 3277831, -1, -1, 5899526, -1, -1, -1, 3277831, 3277578, -1, 5899526, -1, -1,
+	2622220, -1, -1, -1, -1, -1, -1, -1, -1, 2622217, 7865858, -1, 5899526, -1, -1, -1,
+	-1, -1, -1, -1, 3277831, -1, 5899526, -1, 5899526, -1, -1, -1, -1, -1, 4588552, -1,
+	-1, -1, 1311245, -1, -1, -1, 5899526, 1311245, 5899526, -1, -1, -1, -1, -1, -1, -1,
+	-1, 4588803, 3933189, -1, -1, -1, 1639182, -1, -1, 2622220, -1, -1, -1, 16386560, -1, 5899526,
+	3277831, 4588803, 5899526, -1, -1, -1, -1, -1, -1, -1, 1639182, -1, -1, -1, -1, 4588803,
+	5899526, -1, -1, -1, -1, 4588552, -1, 4588552, 9832449, -1, -1, 9832449, -1, -1, 6554884, 3277578,
+	-1, -1, -1, -1, -1, -1, 1311245, 3933189, -1, -1, -1, 4588803, -1, -1, 3277831, -1,
+	2622220, 3277831, -1, 4588552, -1, -1, -1, 1966603, -1, -1, -1, -1, -1, -1, 7865858, 5899526,
+	-1, -1, -1, -1, 6554884, -1, -1, -1, 5899526, -1, -1, -1, -1, 5899526, -1, -1,
+	-1, 3277831, 2622220, 5899526, -1, -1, -1, -1, -1, -1, -1, -1, 3277831, 3277831, -1, -1,
+	-1, -1, -1, -1, -1, 3933189, -1, -1, -1, 3277831, -1, -1, -1, -1, 983567, -1,
+	2622217, -1, 3277831, -1, 4588552, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+	5899526, -1, -1, -1, 3933189, -1, -1, -1, -1, 3277831, -1, 5899526, 7865858, -1, -1, -1,
+	-1, -1, -1, -1, -1, -1, -1, -1, 16386560, -1, -1, -1, 4588803, 7865858, -1, -1,
+	7865858, -1, 5899526, -1, -1, -1, 3277831, -1, -1, -1, 2622220, 4588552, 5899526, 3277831, 5899526, 2622220,
+	-1, -1, 5899526, -1, -1, -1, 2622217, -1, -1
+])
+
+
+## 손 키 → 항목 (조합 아니면 -1)
+static func lookup(key: int) -> int:
+	var h := _mix(key ^ SEED)
+	return ENTRIES[(_mix(h) + DISPLACEMENTS[h % DISPLACEMENTS.size()]) % ENTRIES.size()]
+
+
+static func _mix(x: int) -> int:
+	x = (((x >> 16) ^ x) * 0x45D9F3B) & 0xFFFFFFFF
+	x = (((x >> 16) ^ x) * 0x45D9F3B) & 0xFFFFFFFF
+	return (x >> 16) ^ x
@@ -0,0 +1,83 @@
+extends Node
+
+## asset_graph.py가 만든 예열 목록을 시작 화면 동안 백그라운드 스레드로 불러옵니다 (오토로드 AssetPreloader).
+## 단계(first_roll → shop → deferred) 순서로, 앞 단계가 모두 끝나야 다음 단계를 요청합니다.
+## 불러온 리소스는 여기서 참조를 들고 있어서 이후 load(path)가 파싱 없이 캐시에서 바로 돌아옵니다.
+
+const MANIFEST_PATH := "res://assets/preload_manifest.json"
+
+signal tier_finished(tier_name: String)
+signal all_finished
+
+var _tiers: Array = [] # [{ "name": String, "paths": Array }] - 아직 요청하지 않은 단계
+var _current_tier := ""
+var _pending: Array = [] # 요청 후 완료를 기다리는 경로
+var _resources: Dictionary = {} # { path: Resource } - 캐시에 남도록 참조 유지
+var _started_msec := 0
+
+func _ready() -> void:
+	set_process(false)
+	_load_manifest()
+	if not _tiers.is_empty():
+		_started_msec = Time.get_ticks_msec()
+		set_process(true)
+
+func _load_manifest() -> void:
+	if not FileAccess.file_exists(MANIFEST_PATH):
+		return
+	var manifest = JSON.parse_string(FileAccess.get_file_as_string(MANIFEST_PATH))
+	if typeof(manifest) != TYPE_DICTIONARY:
+		push_warning("예열 목록을 읽을 수 없습니다: " + MANIFEST_PATH)
+		return
+	for tier in manifest.get("tiers", []):
+		if not tier.get("warm", true):
+			continue # boot 단계는 시작할 때 이미 로드됨
+		var paths: Array = []
+		for asset in tier.assets:
+			if ResourceLoader.exists(asset.path):
+				paths.append(asset.path)
+		if not paths.is_empty():
+			_tiers.append({ "name": tier.name, "paths": paths })
+
+func _process(_delta: float) -> void:
+	var waiting: Array = []
+	for path in _pending:
+		match ResourceLoader.load_threaded_get_status(path):
+			ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+				waiting.append(path)
+			ResourceLoader.THREAD_LOAD_LOADED:
+				_resources[path] = ResourceLoader.load_threaded_get(path)
+			_:
+				push_warning("예열 실패: " + path)
+	_pending = waiting
+	if not _pending.is_empty():
+		return
+
+	if _current_tier != "":
+		tier_finished.emit(_current_tier)
+		_current_tier = ""
+	if _tiers.is_empty():
+		set_process(false)
+		print("✅ 에셋 예열 완료: %d개, %.1f초" % [_resources.size(), (Time.get_ticks_msec() - _started_msec) / 1000.0])
+		all_finished.emit()
+		return
+
+	var tier = _tiers.pop_front()
+	_current_tier = tier.name
+	for path in tier.paths:
+		if ResourceLoader.has_cached(path):
+			continue # 이미 누가 불러옴 (예: 게임 루트의 효과음)
+		if ResourceLoader.load_threaded_request(path) == OK:
+			_pending.append(path)
+
+## 해당 단계의 예열이 끝났는지 (목록에 없는 단계는 true)
+func is_tier_ready(tier_name: String) -> bool:
+	if _current_tier == tier_name:
+		return false
+	for tier in _tiers:
+		if tier.name == tier_name:
+			return false
+	return true
+
+func is_finished() -> bool:
+	return _tiers.is_empty() and _pending.is_empty()
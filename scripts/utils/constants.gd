@@ -53,6 +53,7 @@ const DICE_IMPULSE_Z_RANGE := Vector2(-10, 10)  # 주사위 쏟을 때 Z축 힘
 const DICE_TORQUE_RANGE := Vector2(-40, 40)  # 주사위 회전력 범위 (추가)
 const DICE_SPAWN_VELOCITY := 15.0  # 생성 시 초기 하향 속도
 const DICE_SETTLEMENT_TIME := 1  # 주사위가 컵 바닥에 정착하는 데 필요한 시간 (초)
+const USE_BAKED_ROLLS := false  # 물리 대신 미리 계산한 굴림 궤적 재생 (dice_trajectories.py, 없으면 물리)
 
 # === 애니메이션 타이밍 ===
 const MOVE_DURATION := 0.5  # 주사위 결과 정렬 시 이동 시간
@@ -1,12 +1,25 @@
 extends Node
 class_name DiceFaceTextureCache
 
+# dice_face_atlas.py로 미리 만든 아틀라스 (없으면 단색 임시 아틀라스)
+const PREBUILT_INDEX_PATH := "res://assets/dice_faces/dice_faces.json"
+# dice_icons.py로 미리 렌더한 아이콘 시트 (없으면 Dice3DIcon이 SubViewport로 직접 그림)
+const ICON_MANIFEST_PATH := "res://assets/dice_icons/dice_icons.json"
+
 var color_atlases: Dictionary = {} # { "W": texture_atlas, "K": texture_atlas, ... }
+var type_atlases: Dictionary = {} # { "0/W": AtlasTexture, "4/R": AtlasTexture, ... }
+var icon_sheet: Texture2D
+var icon_rects: Dictionary = {} # { "0/W/1": Rect2, ... }
+var icon_textures: Dictionary = {} # { "0/W/1": AtlasTexture, ... } - 요청된 것만
 
 func _ready():
 	generate_all_color_atlases()
+	_load_icon_sheet()
 
 func generate_all_color_atlases():
+	if _load_prebuilt_atlases():
+		return
+
 	var pips_texture = DicePipsTexture.get_default_pips_texture()
 	for color_key in DiceBag.COLORS:
 		var body_color = ComboRules.BAG_COLOR_MAP[color_key]
@@ -18,6 +31,59 @@ func generate_all_color_atlases():
 		var atlas_texture = _create_simple_atlas(body_color, pips_color)
 		color_atlases[color_key] = atlas_texture
 
+## 미리 만든 페이지(.mips = 밉맵 전체 RGBA8, zlib)를 읽어 (타입, 색상) 블록별 AtlasTexture를 만듭니다.
+## 블록 안의 면 배치는 dice_face_image.gd의 FACE_RECTS와 같습니다.
+func _load_prebuilt_atlases() -> bool:
+	if not FileAccess.file_exists(PREBUILT_INDEX_PATH):
+		return false
+	var index = JSON.parse_string(FileAccess.get_file_as_string(PREBUILT_INDEX_PATH))
+	if typeof(index) != TYPE_DICTIONARY:
+		push_warning("주사위 면 아틀라스 인덱스를 읽을 수 없습니다: " + PREBUILT_INDEX_PATH)
+		return false
+
+	var base_dir = PREBUILT_INDEX_PATH.get_base_dir()
+	var pages: Dictionary = {}
+	for page_key in index.pages:
+		var page = index.pages[page_key]
+		var compressed = FileAccess.get_file_as_bytes(base_dir.path_join(page.mips))
+		if compressed.is_empty():
+			push_warning("주사위 면 아틀라스 페이지가 없습니다: " + page.mips)
+			return false
+		var data = compressed.decompress(int(page.data_bytes), FileAccess.COMPRESSION_DEFLATE)
+		var image = Image.create_from_data(int(page.size[0]), int(page.size[1]), true, Image.FORMAT_RGBA8, data)
+		pages[page_key] = ImageTexture.create_from_image(image)
+
+	for block_key in index.blocks:
+		var block = index.blocks[block_key]
+		var rect = block.pixel_rect
+		var atlas = AtlasTexture.new()
+		atlas.atlas = pages[block.page]
+		atlas.region = Rect2(rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1])
+		type_atlases[block_key] = atlas
+
+	for color_key in DiceBag.COLORS:
+		color_atlases[color_key] = type_atlases.get("0/" + color_key)
+	return true
+
+## 아이콘 매니페스트의 "타입/색상/면" → 픽셀 사각형 [x, y, w, h]을 읽어 둡니다.
+func _load_icon_sheet() -> bool:
+	if not FileAccess.file_exists(ICON_MANIFEST_PATH):
+		return false
+	var manifest = JSON.parse_string(FileAccess.get_file_as_string(ICON_MANIFEST_PATH))
+	if typeof(manifest) != TYPE_DICTIONARY:
+		push_warning("주사위 아이콘 매니페스트를 읽을 수 없습니다: " + ICON_MANIFEST_PATH)
+		return false
+	var sheet_path = ICON_MANIFEST_PATH.get_base_dir().path_join(manifest.sheet)
+	if not ResourceLoader.exists(sheet_path):
+		push_warning("주사위 아이콘 시트가 없습니다: " + sheet_path)
+		return false
+
+	icon_sheet = load(sheet_path)
+	for icon_key in manifest.icons:
+		var rect = manifest.icons[icon_key]
+		icon_rects[icon_key] = Rect2(rect[0], rect[1], rect[2], rect[3])
+	return true
+
 func _create_simple_atlas(body_color: Color, pips_color: Color) -> Texture2D:
 	# 간단한 색상 텍스처 생성
 	var image = Image.create(100, 100, false, Image.FORMAT_RGBA8)
@@ -28,3 +94,20 @@ func _create_simple_atlas(body_color: Color, pips_color: Color) -> Texture2D:
 
 func get_atlas(color_key: String) -> Texture2D:
 	return color_atlases.get(color_key)
+
+## 특수 타입 주사위 면 아틀라스 (미리 만든 아틀라스가 없으면 색상 아틀라스)
+func get_type_atlas(type_index: int, color_key: String) -> Texture2D:
+	return type_atlases.get("%d/%s" % [type_index, color_key], get_atlas(color_key))
+
+## 미리 렌더한 주사위 아이콘 (시트에 없으면 null)
+func get_dice_icon(type_index: int, color_key: String, face_value: int) -> Texture2D:
+	var icon_key = "%d/%s/%d" % [type_index, color_key, face_value]
+	if icon_textures.has(icon_key):
+		return icon_textures[icon_key]
+	if not icon_rects.has(icon_key):
+		return null
+	var atlas = AtlasTexture.new()
+	atlas.atlas = icon_sheet
+	atlas.region = icon_rects[icon_key]
+	icon_textures[icon_key] = atlas
+	return atlas
@@ -0,0 +1,60 @@
+extends RefCounted
+class_name DiceLod
+
+# dice_lod.py LOD_LEVELS와 같은 값 (glTF extras 메타데이터가 없을 때 이름 접미사로 판별)
+# screen_size: 이 LOD를 쓰기 시작하는 최소 화면 높이 비율
+const LOD_SUFFIXES := ["", "_LOD1", "_LOD2"]
+const LOD_SCREEN_SIZES := [0.25, 0.08, 0.0]
+# 씬 카메라 fov를 따로 지정하지 않았을 때 (Camera3D 기본값)
+const DEFAULT_FOV_DEG := 75.0
+
+## 익스포터가 --lods로 만든 모델(같은 glTF 안의 LOD 노드 3개)에 visibility_range를 설정해서
+## 거리에 따라 한 단계만 보이게 합니다. Godot은 MSFT_lod를 읽지 않으므로 임포트된
+## LOD 노드가 모두 씬에 남는데, 그대로 두면 세 메시가 겹쳐 그려집니다.
+## 반환: 설정한 LOD 노드 수 (LOD 노드가 없는 일반 모델이면 0, 아무것도 바꾸지 않음)
+static func apply_visibility_ranges(model: Node, fov_deg: float = DEFAULT_FOV_DEG) -> int:
+	var meshes: Array[MeshInstance3D] = []
+	_collect_meshes(model, meshes)
+	var levels: Array = []
+	for mesh in meshes:
+		levels.append({"mesh": mesh, "lod": _lod_index(mesh)})
+	if not levels.any(func(level): return level.lod > 0):
+		return 0
+	levels.sort_custom(func(a, b): return a.lod < b.lod)
+
+	# 화면 높이 비율 f → 거리 d = 크기 / (2 · f · tan(fov/2)), 크기는 LOD0 바운드 기준
+	var extent: float = levels[0].mesh.get_aabb().get_longest_axis_size()
+	var tan_half_fov := tan(deg_to_rad(fov_deg) * 0.5)
+	var begin := 0.0
+	for level in levels:
+		var mesh: MeshInstance3D = level.mesh
+		var screen_size := _screen_size(mesh, level.lod)
+		var end := 0.0 # 0 = 끝없음 (가장 낮은 LOD)
+		if screen_size > 0.0:
+			end = extent / (2.0 * screen_size * tan_half_fov)
+		mesh.visibility_range_begin = begin
+		mesh.visibility_range_end = end
+		begin = end
+	return levels.size()
+
+static func _collect_meshes(node: Node, meshes: Array[MeshInstance3D]) -> void:
+	if node is MeshInstance3D:
+		meshes.append(node)
+	for child in node.get_children():
+		_collect_meshes(child, meshes)
+
+# glTF 노드 extras(dice_lod.annotate_gltf)가 메타데이터로 들어왔으면 그 값, 아니면 이름 접미사
+static func _lod_index(node: Node) -> int:
+	var extras = node.get_meta("extras", null)
+	if typeof(extras) == TYPE_DICTIONARY and extras.has("lod"):
+		return int(extras["lod"])
+	for i in range(LOD_SUFFIXES.size() - 1, 0, -1):
+		if String(node.name).ends_with(LOD_SUFFIXES[i]):
+			return i
+	return 0
+
+static func _screen_size(node: Node, lod: int) -> float:
+	var extras = node.get_meta("extras", null)
+	if typeof(extras) == TYPE_DICTIONARY and extras.has("screen_size"):
+		return float(extras["screen_size"])
+	return LOD_SCREEN_SIZES[mini(lod, LOD_SCREEN_SIZES.size() - 1)]
@@ -0,0 +1,117 @@
+class_name DiceRollLibrary
+extends RefCounted
+
+## dice_trajectories.py로 미리 계산한 주사위 굴림 궤적.
+## 결과 면을 먼저 정하고 궤적 하나를 골라 키프레임만 재생하므로 굴리는 동안 물리 연산이 없습니다.
+## 주사위는 큐브라서 어떤 궤적이든 face_remap 회전을 곱하면 원하는 면으로 끝납니다.
+
+const INDEX_PATH := "res://assets/dice_rolls/dice_rolls.json"
+const DATA_PATH := "res://assets/dice_rolls/dice_rolls.bin"
+const KEY_STRIDE := 14 # int16 × 7 (위치 x, y, z, 쿼터니언 x, y, z, w)
+const Y_BLEND_TIME := 0.3 # 시작 높이 차이를 이 시간 동안 궤적 높이로 맞춤
+const MAX_PICK_TRIES := 32
+
+static var _index: Dictionary = {}
+static var _data: PackedByteArray
+static var _loaded := false
+
+static func is_available() -> bool:
+	_ensure_loaded()
+	return not _index.is_empty()
+
+static func _ensure_loaded() -> void:
+	if _loaded:
+		return
+	_loaded = true
+	if not FileAccess.file_exists(INDEX_PATH) or not FileAccess.file_exists(DATA_PATH):
+		return
+	var index = JSON.parse_string(FileAccess.get_file_as_string(INDEX_PATH))
+	if typeof(index) != TYPE_DICTIONARY:
+		push_warning("굴림 궤적 인덱스를 읽을 수 없습니다: " + INDEX_PATH)
+		return
+	_data = FileAccess.get_file_as_bytes(DATA_PATH)
+	_index = index
+
+## face_value 면으로 끝나는 궤적을 고릅니다.
+## start: 주사위의 현재 위치 (컵 안), avoid: 먼저 고른 궤적들의 끝 위치 (멈춘 자리가 겹치지 않게)
+## 반환: { first_key, key_count, remap, offset, end } - 라이브러리가 없으면 빈 Dictionary
+static func pick(face_value: int, start: Vector3, avoid: Array = []) -> Dictionary:
+	if not is_available():
+		return {}
+	# 같은 시작 칸의 궤적이면 결과 면과 관계없이 후보 (remap으로 맞춤)
+	var cell = str(_entry_cell(start))
+	var candidates: Array = []
+	for face in _index.by_face:
+		for id in _index.by_face[face].get(cell, []):
+			candidates.append(int(id))
+	if candidates.is_empty():
+		candidates = range(_index.trajectories.size())
+	if candidates.is_empty():
+		return {}
+	candidates.shuffle()
+
+	var min_gap = float(_index.shape.dice_size) * 1.5
+	var best: Dictionary = {}
+	for i in range(min(candidates.size(), MAX_PICK_TRIES)):
+		var roll = _make_roll(int(candidates[i]), face_value, start)
+		if best.is_empty():
+			best = roll
+		var clear := true
+		for end in avoid:
+			if Vector2(end.x, end.z).distance_to(Vector2(roll.end.x, roll.end.z)) < min_gap:
+				clear = false
+				break
+		if clear:
+			return roll
+	return best
+
+static func _make_roll(id: int, face_value: int, start: Vector3) -> Dictionary:
+	var row = _index.trajectories[id]
+	var first_key = int(row[0])
+	var remap_values = _index.face_remap[str(int(row[2]))][str(face_value)]
+	var offset = start - _key_position(first_key)
+	return {
+		"first_key": first_key,
+		"key_count": int(row[1]),
+		"remap": Quaternion(remap_values[0], remap_values[1], remap_values[2], remap_values[3]),
+		"offset": offset,
+		"end": Vector3(float(row[4]) + offset.x, 0.0, float(row[5]) + offset.z),
+	}
+
+## 궤적의 t초 시점 변환 (키 사이 위치는 선형, 회전은 slerp)
+static func sample(roll: Dictionary, t: float) -> Transform3D:
+	var frame = clampf(t * float(_index.fps), 0.0, float(roll.key_count - 1))
+	var i = int(frame)
+	var j = mini(i + 1, roll.key_count - 1)
+	var s = frame - i
+	var position = _key_position(roll.first_key + i).lerp(_key_position(roll.first_key + j), s)
+	var rotation = _key_rotation(roll.first_key + i).slerp(_key_rotation(roll.first_key + j), s)
+	# 가로 위치는 끝까지 옮기고, 높이 차이는 처음에만 (테이블 높이는 궤적 그대로)
+	var offset: Vector3 = roll.offset
+	position += Vector3(offset.x, offset.y * maxf(0.0, 1.0 - t / Y_BLEND_TIME), offset.z)
+	return Transform3D(Basis(rotation * roll.remap), position)
+
+static func duration(roll: Dictionary) -> float:
+	return float(roll.key_count - 1) / float(_index.fps)
+
+static func _entry_cell(start: Vector3) -> int:
+	var entry = _index.entry
+	var cells = int(entry.cells)
+	var radius = float(entry.radius)
+	var cx = clampi(int(((start.x - float(entry.center[0])) / radius + 1.0) / 2.0 * cells), 0, cells - 1)
+	var cz = clampi(int(((start.z - float(entry.center[2])) / radius + 1.0) / 2.0 * cells), 0, cells - 1)
+	return cz * cells + cx
+
+static func _key_position(key: int) -> Vector3:
+	var at = key * KEY_STRIDE
+	var scale = float(_index.position_scale)
+	return Vector3(_data.decode_s16(at), _data.decode_s16(at + 2), _data.decode_s16(at + 4)) * scale
+
+static func _key_rotation(key: int) -> Quaternion:
+	var at = key * KEY_STRIDE + 6
+	return Quaternion(
+		_data.decode_s16(at) / 32767.0,
+		_data.decode_s16(at + 2) / 32767.0,
+		_data.decode_s16(at + 4) / 32767.0,
+		_data.decode_s16(at + 6) / 32767.0
+	).normalized()